@@ -469,30 +469,58 @@ class Settings(provider_utils.Settings):
 
 PROVIDER_IMPORTS_TEMPLATE = Template(
     """
-from karrio.providers.{{id}}.utils import Settings{% if "rating" in features %}
-from karrio.providers.{{id}}.rate import parse_rate_response, rate_request{% endif %}{% if "shipping" in features %}
-from karrio.providers.{{id}}.shipment import (
-    parse_shipment_cancel_response,
-    parse_shipment_response,
-    shipment_cancel_request,
-    shipment_request,
-){% endif %}{% if "pickup" in features %}
-from karrio.providers.{{id}}.pickup import (
-    parse_pickup_cancel_response,
-    parse_pickup_update_response,
-    parse_pickup_response,
-    pickup_update_request,
-    pickup_cancel_request,
-    pickup_request,
-){% endif %}{% if "tracking" in features %}
-from karrio.providers.{{id}}.tracking import (
-    parse_tracking_response,
-    tracking_request,
-){% endif %}{% if "document" in features %}
-from karrio.providers.{{id}}.document import (
-    parse_document_upload_response,
-    document_upload_request,
-){% endif %}
+import typing
+import karrio.lib as lib
+
+if typing.TYPE_CHECKING:
+    from karrio.providers.{{id}}.utils import Settings{% if "rating" in features %}
+    from karrio.providers.{{id}}.rate import parse_rate_response, rate_request{% endif %}{% if "shipping" in features %}
+    from karrio.providers.{{id}}.shipment import (
+        parse_shipment_cancel_response,
+        parse_shipment_response,
+        shipment_cancel_request,
+        shipment_request,
+    ){% endif %}{% if "pickup" in features %}
+    from karrio.providers.{{id}}.pickup import (
+        parse_pickup_cancel_response,
+        parse_pickup_update_response,
+        parse_pickup_response,
+        pickup_update_request,
+        pickup_cancel_request,
+        pickup_request,
+    ){% endif %}{% if "tracking" in features %}
+    from karrio.providers.{{id}}.tracking import (
+        parse_tracking_response,
+        tracking_request,
+    ){% endif %}{% if "document" in features %}
+    from karrio.providers.{{id}}.document import (
+        parse_document_upload_response,
+        document_upload_request,
+    ){% endif %}
+
+__getattr__, __dir__ = lib.lazy_exports(
+    __name__,
+    {
+        ".utils": ["Settings"],{% if "rating" in features %}
+        ".rate": ["parse_rate_response", "rate_request"],{% endif %}{% if "shipping" in features %}
+        ".shipment": [
+            "parse_shipment_cancel_response",
+            "parse_shipment_response",
+            "shipment_cancel_request",
+            "shipment_request",
+        ],{% endif %}{% if "pickup" in features %}
+        ".pickup": [
+            "parse_pickup_cancel_response",
+            "parse_pickup_update_response",
+            "parse_pickup_response",
+            "pickup_update_request",
+            "pickup_cancel_request",
+            "pickup_request",
+        ],{% endif %}{% if "tracking" in features %}
+        ".tracking": ["parse_tracking_response", "tracking_request"],{% endif %}{% if "document" in features %}
+        ".document": ["parse_document_upload_response", "document_upload_request"],{% endif %}
+    },
+)
 
 """
 )
@@ -0,0 +1,73 @@
+"""Compare the XML responses bundling through a text round trip with the element one.
+
+`legacy` reproduces the previous `to_xml(bundle_xml(...))` path: every
+response is parsed, serialized back then parsed again in the wrapper.
+
+Usage:
+    python benchmarks/bundling.py [--pins 50] [--events 40] [--number 20]
+"""
+import timeit
+import argparse
+from karrio.core.utils import XP
+
+EVENT = """
+        <occurrence>
+            <event-identifier>{index}</event-identifier>
+            <event-date>2023-01-{day:02d}</event-date>
+            <event-time>10:{minute:02d}:00</event-time>
+            <event-time-zone>EST</event-time-zone>
+            <event-description>Item processed at postal facility</event-description>
+            <event-site>MONTREAL</event-site>
+            <event-province>QC</event-province>
+            <event-retail-location-id/>
+            <event-retail-name/>
+        </occurrence>"""
+
+
+def tracking_response(pin: int, events: int) -> str:
+    occurrences = "".join(
+        EVENT.format(index=index, day=index % 28 + 1, minute=index % 60)
+        for index in range(events)
+    )
+
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<tracking-detail xmlns="http://www.canadapost.ca/ws/track-v2">
+    <pin>{pin:016d}</pin>
+    <active-exists>1</active-exists>
+    <archive-exists/>
+    <changed-expected-date/>
+    <destination-postal-id>H2B1A0</destination-postal-id>
+    <expected-delivery-date>2023-01-30</expected-delivery-date>
+    <service-name>Expedited Parcels</service-name>
+    <significant-events>{occurrences}
+    </significant-events>
+</tracking-detail>"""
+
+
+def legacy(responses):
+    return XP.to_xml(XP.bundle_xml(responses))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pins", type=int, default=50)
+    parser.add_argument("--events", type=int, default=40)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    responses = [tracking_response(pin, args.events) for pin in range(args.pins)]
+    size = sum(len(response) for response in responses)
+    cases = dict(
+        legacy=lambda: legacy(responses),
+        bundle_elements=lambda: XP.bundle_elements(responses),
+        parsed=lambda: XP.bundle_elements([XP.to_xml(r) for r in responses]),
+    )
+
+    print(f"{args.pins} responses, {size / 1024:.0f} KiB")
+    for name, case in cases.items():
+        elapsed = timeit.timeit(case, number=args.number) / args.number
+        print(f"{name:16} {elapsed * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Compare the generateDS types build/export with and without the codec fast paths.
+
+A DHL Express DCT (rate) response of `--quotes` quotes is built from its
+parsed element then exported. `legacy` uses a copy of the generated module
+left untouched (the karrio.schemas.dhl_express package is required).
+
+Usage:
+    python benchmarks/codec.py [--quotes 20] [--number 200]
+"""
+import io
+import timeit
+import argparse
+import importlib.util
+import karrio.lib as lib
+from karrio.core.utils import XP
+import dhl_express_lib.dct_response_global_3_0 as dct
+
+QUOTE = """<QtdShp>
+        <OriginServiceArea><FacilityCode>YUL</FacilityCode><ServiceAreaCode>YUL</ServiceAreaCode></OriginServiceArea>
+        <GlobalProductCode>P</GlobalProductCode>
+        <LocalProductCode>P</LocalProductCode>
+        <ProductShortName>EXPRESS WORLDWIDE &amp; MORE</ProductShortName>
+        <PickupDate>2021-05-{day:02d}</PickupDate>
+        <CurrencyCode>CAD</CurrencyCode>
+        <WeightCharge>{index}.50</WeightCharge>
+        <TotalTransitDays>2</TotalTransitDays>
+        <QtdShpExChrg><SpecialServiceType>FF</SpecialServiceType><ChargeValue>1.5</ChargeValue></QtdShpExChrg>
+        <ShippingCharge>{index}.99</ShippingCharge>
+    </QtdShp>"""
+
+
+def rate_response(quotes: int) -> str:
+    shipments = "".join(
+        QUOTE.format(index=index, day=index % 28 + 1) for index in range(quotes)
+    )
+
+    return f"""<res:DCTResponse xmlns:res="http://www.dhl.com">
+<GetQuoteResponse><BkgDetails>{shipments}</BkgDetails></GetQuoteResponse>
+</res:DCTResponse>"""
+
+
+def legacy_module():
+    spec = importlib.util.find_spec(dct.__name__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--quotes", type=int, default=20)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    node = lib.to_element(rate_response(args.quotes))
+    legacy = legacy_module()
+
+    def legacy_build():
+        return legacy.DCTResponse().build(node)
+
+    def legacy_export(response):
+        output = io.StringIO()
+        response.export(output, 0)
+        return output.getvalue()
+
+    built, legacy_built = XP.to_object(dct.DCTResponse, node), legacy_build()
+    assert XP.export(built) == legacy_export(legacy_built)
+
+    cases = dict(
+        build=(legacy_build, lambda: XP.to_object(dct.DCTResponse, node)),
+        export=(lambda: legacy_export(legacy_built), lambda: XP.export(built)),
+    )
+
+    for name, (legacy_case, case) in cases.items():
+        before = timeit.timeit(legacy_case, number=args.number) / args.number
+        after = timeit.timeit(case, number=args.number) / args.number
+        print(
+            f"{name:8} legacy {before * 1000:7.3f} ms    codec {after * 1000:7.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Measure the cold start of `import karrio` and of a first gateway lookup.
+
+Every scenario runs in a fresh interpreter and reports the wall time, the
+carrier extensions imported and the peak memory (RSS) of the process.
+`import_extensions` imports every installed carrier the way gateway
+lookups used to; `manifest` reads the carriers metadata from the cached
+manifest (the first run writes it).
+
+Usage:
+    python benchmarks/cold_start.py [--carrier ups] [--runs 5]
+"""
+import sys
+import json
+import argparse
+import subprocess
+
+SCRIPT = """
+import sys, json, time, resource
+start = time.perf_counter()
+import karrio
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps(dict(
+    elapsed=elapsed,
+    carriers=len({{m.split(".")[2] for m in sys.modules if m.startswith("karrio.mappers.")}}),
+    rss=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+)))
+"""
+
+
+def measure(statement: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(statement=statement)],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+
+    return json.loads(output.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--carrier", default="ups")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    scenarios = {
+        "import karrio": "pass",
+        f"gateway['{args.carrier}']": f"karrio.gateway[{args.carrier!r}]",
+        "manifest": "karrio.gateway.manifest",
+        "import_extensions": "import karrio.references as r; r.import_extensions()",
+    }
+
+    measure("karrio.gateway.manifest")  # write the manifest
+
+    print(f"{'scenario':<22} {'time (s)':>9} {'carriers':>9} {'rss (MB)':>9}")
+    for name, statement in scenarios.items():
+        results = [measure(statement) for _ in range(args.runs)]
+        best = min(results, key=lambda result: result["elapsed"])
+
+        print(
+            f"{name:<22} {best['elapsed']:>9.3f} "
+            f"{best['carriers']:>9} {best['rss']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
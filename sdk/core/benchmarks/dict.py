@@ -0,0 +1,102 @@
+"""Compare the JSON round trip / jstruct converters with the compiled ones.
+
+`legacy` reproduces the previous `DP.to_dict` (jsonify + json.loads) and
+`DP.to_object` (jstruct.utils.instantiate) implementations.
+
+Usage:
+    python benchmarks/dict.py [--number 2000]
+"""
+import json
+import timeit
+import argparse
+import jstruct.utils as jstruct
+
+import karrio.core.models as models
+from karrio.core.utils import DP
+
+SHIPMENT_REQUEST = dict(
+    service="carrier_standard",
+    shipper=dict(
+        company_name="Shipper Inc.",
+        address_line1="125 Church St",
+        city="Moncton",
+        postal_code="E1C4Z8",
+        country_code="CA",
+        state_code="NB",
+    ),
+    recipient=dict(
+        person_name="John Doe",
+        address_line1="5840 Oak St",
+        city="Vancouver",
+        postal_code="V6M2V9",
+        country_code="CA",
+        state_code="BC",
+    ),
+    parcels=[
+        dict(weight=1.5, weight_unit="KG", length=10, width=10, height=10),
+        dict(weight=2.5, weight_unit="KG", length=20, width=10, height=10),
+    ],
+    options=dict(signature_confirmation=True, insurance=100.0),
+    reference="#0001",
+)
+RATES = [
+    dict(
+        carrier_name="carrier",
+        carrier_id="carrier",
+        service=f"service_{index}",
+        currency="CAD",
+        total_charge=10.0 + index,
+        extra_charges=[
+            dict(name="Base charge", amount=9.0, currency="CAD"),
+            dict(name="Fuel surcharge", amount=1.0 + index, currency="CAD"),
+        ],
+        transit_days=index,
+        meta=dict(service_name=f"Service {index}"),
+    )
+    for index in range(10)
+]
+
+
+def legacy_to_dict(entity):
+    return json.loads(
+        DP.jsonify(entity),
+        object_hook=lambda d: {k: v for k, v in d.items() if v not in (None, [], "")},
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    shipment = DP.to_object(models.ShipmentRequest, SHIPMENT_REQUEST)
+    rates = [DP.to_object(models.RateDetails, rate) for rate in RATES]
+
+    cases = dict(
+        to_dict_shipment=(
+            lambda: legacy_to_dict(shipment),
+            lambda: DP.to_dict(shipment),
+        ),
+        to_dict_rates=(
+            lambda: legacy_to_dict(rates),
+            lambda: DP.to_dict(rates),
+        ),
+        to_object_shipment=(
+            lambda: jstruct.instantiate(models.ShipmentRequest, SHIPMENT_REQUEST),
+            lambda: DP.to_object(models.ShipmentRequest, SHIPMENT_REQUEST),
+        ),
+    )
+
+    print(f"{'case':<20} {'legacy (us)':>12} {'compiled (us)':>14} {'speedup':>8}")
+    for name, (legacy, compiled) in cases.items():
+        assert json.dumps(DP.to_dict(legacy())) == json.dumps(DP.to_dict(compiled()))
+        legacy_time = timeit.timeit(legacy, number=args.number) / args.number * 1e6
+        compiled_time = timeit.timeit(compiled, number=args.number) / args.number * 1e6
+        print(
+            f"{name:<20} {legacy_time:>12.1f} {compiled_time:>14.1f} "
+            f"{legacy_time / compiled_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
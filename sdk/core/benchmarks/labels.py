@@ -0,0 +1,98 @@
+"""Compare the labels bundling peak memory and time.
+
+`legacy` reproduces the previous `bundle_base64` path: every label is
+decoded into a fresh buffer, the merged document is written to another
+one and ZPL labels are concatenated string by string. `bytes` bundles the
+labels content (no base64 decoding) and `sink` streams the bundle into a
+temporary file.
+
+Usage:
+    python benchmarks/labels.py [--labels 50] [--format PDF] [--number 5]
+"""
+import io
+import time
+import base64
+import argparse
+import tempfile
+import tracemalloc
+from PIL import Image
+import karrio.lib as lib
+from karrio.core.utils.helpers import PdfMerger
+
+ZPL = "^XA^FO50,50^A0N,50,50^FDLabel {index}^FS^BY3^BCN,100,Y,N,N^FD{index:012d}^FS^XZ"
+
+
+def pdf_label(index: int) -> bytes:
+    image = Image.new("RGB", (1200, 1800), (255, 255, 255))
+    image.paste((index % 255, 0, 0), (100, 100, 600, 300))
+    output = io.BytesIO()
+    image.save(output, format="PDF", dpi=(300, 300))
+    return output.getvalue()
+
+
+def zpl_label(index: int) -> bytes:
+    return (ZPL.format(index=index) * 200).encode("utf-8")
+
+
+def legacy(base64_strings, format):
+    result = io.BytesIO()
+
+    if format == "PDF":
+        merger = PdfMerger(strict=False)
+        for b64_str in base64_strings:
+            buffer = io.BytesIO()
+            buffer.write(base64.b64decode(b64_str))
+            merger.append(buffer)
+        merger.write(result)
+    else:
+        doc = ""
+        for b64_str in base64_strings:
+            doc += f'{base64.b64decode(b64_str).decode("utf-8")}\n'
+        result.write(doc.encode("utf-8"))
+
+    return base64.b64encode(result.getvalue()).decode("utf-8")
+
+
+def sink(contents, format):
+    with tempfile.TemporaryFile() as file:
+        lib.write_bundle(contents, file, format)
+
+
+def measure(case, number: int):
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(number):
+        case()
+    elapsed = (time.perf_counter() - start) / number
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--labels", type=int, default=50)
+    parser.add_argument("--format", default="PDF", choices=["PDF", "ZPL"])
+    parser.add_argument("--number", type=int, default=5)
+    args = parser.parse_args()
+
+    label = pdf_label if args.format == "PDF" else zpl_label
+    contents = [label(index) for index in range(args.labels)]
+    base64_strings = [base64.b64encode(content).decode() for content in contents]
+    cases = dict(
+        legacy=lambda: legacy(base64_strings, args.format),
+        bundle_base64=lambda: lib.bundle_base64(base64_strings, args.format),
+        bytes=lambda: lib.bundle_bytes(contents, args.format),
+        sink=lambda: sink(contents, args.format),
+    )
+
+    size = sum(len(content) for content in contents)
+    print(f"{args.labels} {args.format} labels, {size / 1024:.0f} KiB")
+    for name, case in cases.items():
+        elapsed, peak = measure(case, args.number)
+        print(f"{name:14} {elapsed * 1000:8.2f} ms {peak / 1024:10.0f} KiB peak")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Report the import time and memory of each carrier operation.
+
+Every operation runs in a fresh interpreter that imports the carrier
+extension (`gateway[carrier]`) then resolves the operation request
+function, like a worker only ever rating or tracking would. The schema
+modules column counts the generated modules loaded; `all` resolves every
+operation (the previous eager provider imports).
+
+Usage:
+    python benchmarks/operations.py [--carrier ups --carrier fedex] [--runs 3]
+"""
+import sys
+import json
+import argparse
+import subprocess
+
+OPERATIONS = {
+    "rate": ["rate_request"],
+    "ship": ["shipment_request"],
+    "track": ["tracking_request"],
+    "pickup": ["pickup_request"],
+    "upload": ["document_upload_request"],
+}
+
+SCRIPT = """
+import sys, json, time, resource
+start = time.perf_counter()
+import karrio
+karrio.gateway[{carrier!r}]
+import karrio.providers.{carrier} as provider
+for name in {names!r}:
+    getattr(provider, name)
+elapsed = time.perf_counter() - start
+print(json.dumps(dict(
+    elapsed=elapsed,
+    schemas=len([m for m in sys.modules if m.split(".")[0].endswith("_lib")]),
+    rss=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+)))
+"""
+
+
+def measure(carrier: str, names: list) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT.format(carrier=carrier, names=names)],
+        capture_output=True,
+        text=True,
+    )
+
+    if output.returncode != 0:
+        return None
+
+    return json.loads(output.stdout.splitlines()[-1])
+
+
+def exported(carrier: str) -> list:
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import karrio.providers.{carrier} as p; print(' '.join(dir(p)))",
+        ],
+        capture_output=True,
+        text=True,
+    )
+
+    return output.stdout.split()
+
+
+def main():
+    import karrio.references as references
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--carrier", action="append")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    carriers = args.carrier or sorted(references.discover_extensions().keys())
+
+    print(
+        f"{'carrier':<20} {'operation':<10} {'time (s)':>9} "
+        f"{'schemas':>8} {'rss (MB)':>9}"
+    )
+    for carrier in carriers:
+        names = exported(carrier)
+        operations = {
+            operation: requests
+            for operation, requests in OPERATIONS.items()
+            if all(name in names for name in requests)
+        }
+        operations["all"] = [
+            name for requests in operations.values() for name in requests
+        ]
+
+        for operation, requests in operations.items():
+            results = [measure(carrier, requests) for _ in range(args.runs)]
+            results = [result for result in results if result is not None]
+
+            if len(results) == 0:
+                print(f"{carrier:<20} {operation:<10} {'failed':>9}")
+                continue
+
+            best = min(results, key=lambda result: result["elapsed"])
+            print(
+                f"{carrier:<20} {operation:<10} {best['elapsed']:>9.3f} "
+                f"{best['schemas']:>8} {best['rss']:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Compare `find_element` lookups through native tag iteration with XPath scans.
+
+`legacy` reproduces the previous `XP.find` implementation evaluating
+`.//*[local-name() = $name]` on every lookup. Each run parses a new
+document then looks up every rate and its charges, like a rate parser.
+
+Usage:
+    python benchmarks/parsing.py [--rates 100] [--charges 10] [--number 20]
+"""
+import timeit
+import argparse
+from karrio.core.utils import XP
+
+
+def rate_response(rates: int, charges: int) -> str:
+    surcharges = "".join(
+        f"<Surcharge><Type>FUEL_{index}</Type><Amount>{index}.5</Amount></Surcharge>"
+        for index in range(charges)
+    )
+    details = "".join(
+        f"""<RateReplyDetails xmlns="http://fedex.com/ws/rate/v28">
+            <ServiceType>SERVICE_{rate}</ServiceType>
+            <TotalNetCharge><Amount>{rate}.99</Amount></TotalNetCharge>
+            <Surcharges>{surcharges}</Surcharges>
+        </RateReplyDetails>"""
+        for rate in range(rates)
+    )
+
+    return f"<RateReply><HighestSeverity>SUCCESS</HighestSeverity>{details}</RateReply>"
+
+
+def legacy_find(tag, element):
+    return element.xpath(".//*[local-name() = $name]", name=tag)
+
+
+def parse(response: str, find):
+    document = XP.to_xml(response)
+    find("Notifications", document)
+    find("Fault", document)
+
+    return [
+        (
+            find("ServiceType", detail)[0].text,
+            find("Amount", detail)[0].text,
+            [charge.text for charge in find("Amount", detail)[1:]],
+        )
+        for detail in find("RateReplyDetails", document)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rates", type=int, default=100)
+    parser.add_argument("--charges", type=int, default=10)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    response = rate_response(args.rates, args.charges)
+    assert parse(response, legacy_find) == parse(response, XP.find)
+
+    for name, find in dict(legacy=legacy_find, native=XP.find).items():
+        elapsed = timeit.timeit(lambda: parse(response, find), number=args.number)
+        print(f"{name:10} {elapsed / args.number * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
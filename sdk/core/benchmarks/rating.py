@@ -0,0 +1,82 @@
+"""Measure the universal rating of packages against large rate sheets.
+
+A rate sheet of `--services` services with `--zones` zones each (spread
+over countries, cities and weight brackets) is compiled once then used to
+rate `--packages` packages. NumPy is used to match the packages weight
+brackets when installed.
+
+Usage:
+    python benchmarks/rating.py [--services 5] [--zones 5000] [--packages 50]
+"""
+import time
+import random
+import argparse
+import karrio.lib as lib
+import karrio.core.models as models
+from karrio.universal.providers.rating import RatingMixinSettings, index
+from karrio.universal.mappers.rating_proxy import get_packages_rates
+
+COUNTRIES = ["CA", "US", "FR", "DE", "GB", "NL", "BE", "IT", "ES", "PL"]
+
+
+def rate_sheet(services: int, zones: int) -> RatingMixinSettings:
+    return RatingMixinSettings(
+        carrier_id="benchmark",
+        services=[
+            dict(
+                service_name=f"Service {service}",
+                service_code=f"service_{service}",
+                currency="USD",
+                weight_unit="KG",
+                zones=[
+                    dict(
+                        rate=round(random.uniform(5, 50), 2),
+                        min_weight=float(zone % 10),
+                        max_weight=float(zone % 10 + 1),
+                        cities=[f"city_{zone % 100}"],
+                        country_codes=[random.choice(COUNTRIES)],
+                    )
+                    for zone in range(zones)
+                ],
+            )
+            for service in range(services)
+        ],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--services", type=int, default=5)
+    parser.add_argument("--zones", type=int, default=5000)
+    parser.add_argument("--packages", type=int, default=50)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    random.seed(0)
+    settings = rate_sheet(args.services, args.zones)
+    packages = list(
+        lib.to_packages(
+            [
+                models.Parcel(weight=random.uniform(0.1, 10), weight_unit="KG")
+                for _ in range(args.packages)
+            ]
+        )
+    )
+    recipient = lib.to_address(models.Address(city="city_42", country_code="CA"))
+
+    start = time.perf_counter()
+    settings.rate_sheet
+    compiled = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.runs):
+        get_packages_rates(packages, recipient, recipient, settings)
+    elapsed = (time.perf_counter() - start) / args.runs
+
+    print(f"numpy:         {index.numpy is not None}")
+    print(f"compile (ms):  {compiled * 1000:.2f}")
+    print(f"rate (ms):     {elapsed * 1000:.2f} for {args.packages} packages")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Trace many carrier calls and report the threads and memory the Tracer holds.
+
+Each traced call records a request and its response (every 100th an error)
+the way `lib.request` does. The script reports the live thread count before
+and after, the records retained and the traced allocations still held.
+
+Usage:
+    python benchmarks/tracing.py [--calls 10000] [--sample-rate 0.01] [--body-size 20000]
+"""
+import time
+import uuid
+import argparse
+import threading
+import tracemalloc
+
+from karrio.core.utils import Tracer
+
+
+def run(tracer: Tracer, calls: int, body_size: int):
+    for index in range(calls):
+        body = str(index) * (body_size // len(str(index)))
+        request_id = str(uuid.uuid4())
+        tracer.trace(
+            {"request_id": request_id, "url": "/rates", "data": body}, "request"
+        )
+        if index % 100 == 0:
+            tracer.trace({"request_id": request_id, "error": body}, "error")
+        else:
+            tracer.trace({"request_id": request_id, "response": body}, "response")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=10_000)
+    parser.add_argument("--sample-rate", type=float, default=0.01)
+    parser.add_argument("--body-size", type=int, default=20_000)
+    args = parser.parse_args()
+
+    configurations = dict(
+        default=dict(),
+        sampled=dict(sample_rate=args.sample_rate),
+        truncated=dict(sample_rate=args.sample_rate, max_body_size=1_000),
+    )
+
+    print(
+        f"{'tracer':<10} {'threads':>8} {'records':>8} "
+        f"{'held (MB)':>10} {'time (s)':>9}"
+    )
+    for name, options in configurations.items():
+        tracemalloc.start()
+        threads = threading.active_count()
+        start = time.perf_counter()
+
+        tracer = Tracer(**options)
+        run(tracer, args.calls, args.body_size)
+
+        elapsed = time.perf_counter() - start
+        held, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(
+            f"{name:<10} {threads:>3} -> {threading.active_count():<2} "
+            f"{len(tracer.records):>8} {held / 2**20:>10.1f} {elapsed:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Compare the legacy urllib transport with the pooled keep-alive transport.
+
+A local HTTPS server stands in for a carrier API. For each transport the script
+sends the same requests and reports the TLS handshakes performed and the
+p50/p99 request latency.
+
+Usage:
+    python benchmarks/transport.py [--requests 500] [--threads 4] [--delay-ms 0]
+
+Requires the `openssl` CLI to generate a throwaway self-signed certificate.
+"""
+import os
+import ssl
+import socket
+import time
+import argparse
+import tempfile
+import threading
+import subprocess
+import http.server
+import statistics
+import concurrent.futures as futures
+
+import karrio.lib as lib
+from karrio.core.utils.transport import UrllibTransport, PooledTransport
+
+
+class Server(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    handshakes = 0
+
+    def get_request(self):
+        sock, address = super().get_request()
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        Server.handshakes += 1
+        return sock, address
+
+
+def make_handler(delay: float):
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            time.sleep(delay)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/xml")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def start_server(certdir: str, delay: float) -> Server:
+    cert, key = os.path.join(certdir, "cert.pem"), os.path.join(certdir, "key.pem")
+    command = (
+        f"openssl req -x509 -newkey rsa:2048 -nodes -keyout {key} -out {cert} "
+        "-days 1 -subj /CN=localhost"
+    )
+    subprocess.run(command.split(), check=True, capture_output=True)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+
+    server = Server(("127.0.0.1", 0), make_handler(delay))
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server
+
+
+def run(transport, url: str, requests: int, threads: int):
+    payload = "<RateRequest>" + "<Package>1</Package>" * 50 + "</RateRequest>"
+
+    def send(_):
+        start = time.perf_counter()
+        lib.request(
+            url=url,
+            data=payload,
+            method="POST",
+            headers={"Content-Type": "application/xml"},
+            transport=transport,
+        )
+        return (time.perf_counter() - start) * 1000
+
+    Server.handshakes = 0
+    with futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        latencies = sorted(executor.map(send, range(requests)))
+
+    return dict(
+        handshakes=Server.handshakes,
+        p50=statistics.median(latencies),
+        p99=latencies[int(len(latencies) * 0.99) - 1],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--delay-ms", type=float, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as certdir:
+        server = start_server(certdir, args.delay_ms / 1000)
+        url = f"https://localhost:{server.server_port}/rate"
+
+        pooled = PooledTransport(pool_size=args.threads)
+        results = dict(
+            urllib=run(UrllibTransport(), url, args.requests, args.threads),
+            pooled=run(pooled, url, args.requests, args.threads),
+        )
+        pooled.close()
+        server.shutdown()
+
+    print(f"{'transport':<10} {'handshakes':>10} {'p50 (ms)':>10} {'p99 (ms)':>10}")
+    for name, result in results.items():
+        print(
+            f"{name:<10} {result['handshakes']:>10} "
+            f"{result['p50']:>10.2f} {result['p99']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Measure the units objects created to build the extensions test requests.
+
+The rate and shipment request payloads (the dicts with `parcels`) of every
+extension test module (`tests/<carrier>/**/test_*.py`) are mapped and
+serialized `--runs` times. The units column counts the measurement, items
+and options objects (`Weight`, `Dimension`, `Products`...) constructed by
+one pass over the fixtures of a carrier.
+
+Usage:
+    python benchmarks/units.py [--carrier ups --carrier fedex] [--runs 5]
+"""
+import sys
+import time
+import typing
+import pathlib
+import argparse
+import importlib
+import collections
+import karrio.core.units as units
+import karrio.core.models as models
+
+EXTENSIONS = pathlib.Path(__file__).resolve().parents[2] / "extensions"
+COUNTED = [
+    units.Weight,
+    units.Dimension,
+    units.Volume,
+    units.Girth,
+    units.Products,
+    units.ShippingOptions,
+]
+created: typing.Counter[str] = collections.Counter()
+
+
+def count_instances(cls: type):
+    init = cls.__init__
+
+    def __init__(self, *args, **kwargs):
+        created[cls.__name__] += 1
+        init(self, *args, **kwargs)
+
+    cls.__init__ = __init__
+
+
+def fixtures(carrier: str) -> typing.List[typing.Tuple[typing.Any, typing.Any]]:
+    """Return the (gateway, request) of the carrier test payloads."""
+    for name in [name for name in sys.modules if name.split(".")[0] == "tests"]:
+        del sys.modules[name]
+    sys.path.insert(0, str(EXTENSIONS / carrier))
+
+    requests = []
+    try:
+        for path in sorted((EXTENSIONS / carrier / "tests").glob("**/test_*.py")):
+            name = ".".join(
+                path.relative_to(EXTENSIONS / carrier).with_suffix("").parts
+            )
+            try:
+                module = importlib.import_module(name)
+            except Exception:
+                continue
+
+            for payload in vars(module).values():
+                if not (isinstance(payload, dict) and "parcels" in payload):
+                    continue
+                if "pickup_date" in payload:
+                    continue
+
+                request_type = (
+                    models.ShipmentRequest
+                    if "service" in payload
+                    else models.RateRequest
+                )
+                try:
+                    requests.append((module.gateway, request_type(**payload)))
+                except Exception:
+                    continue
+    finally:
+        sys.path.remove(str(EXTENSIONS / carrier))
+
+    return requests
+
+
+def build(gateway, request) -> bool:
+    try:
+        if isinstance(request, models.RateRequest):
+            gateway.mapper.create_rate_request(request).serialize()
+        else:
+            gateway.mapper.create_shipment_request(request).serialize()
+        return True
+    except Exception:
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--carrier", action="append")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    carriers = args.carrier or sorted(
+        path.name for path in EXTENSIONS.iterdir() if (path / "tests").is_dir()
+    )
+    for cls in COUNTED:
+        count_instances(cls)
+
+    print(f"{'carrier':<20} {'requests':>8} {'units':>8} {'time (ms)':>10}")
+    totals = [0, 0, 0.0]
+    for carrier in carriers:
+        requests = [item for item in fixtures(carrier) if build(*item)]
+        if len(requests) == 0:
+            continue
+
+        created.clear()
+        elapsed = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            for gateway, request in requests:
+                build(gateway, request)
+            elapsed.append(time.perf_counter() - start)
+
+        instances = sum(created.values()) // args.runs
+        best = min(elapsed) * 1000
+        totals = [totals[0] + len(requests), totals[1] + instances, totals[2] + best]
+        print(f"{carrier:<20} {len(requests):>8} {instances:>8} {best:>10.2f}")
+
+    print(f"{'total':<20} {totals[0]:>8} {totals[1]:>8} {totals[2]:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
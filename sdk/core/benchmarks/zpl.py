@@ -0,0 +1,65 @@
+"""Measure the ZPL labels preview rendering time.
+
+`render` draws the labels, `to_pdf` renders and saves them to PDF (the
+cache cleared before every run) and `cached` returns the document of an
+already previewed label. `first` includes the fonts and glyphs loading.
+
+Usage:
+    python benchmarks/zpl.py [--dpmm 8] [--labels 1] [--number 20]
+"""
+import time
+import argparse
+import karrio.addons.zpl as zpl
+
+LABEL = """^XA
+^CF0,40^FO30,30^FDFROM: SHIPPER INC.^FS
+^CFA,30^FO30,90^FD123 MAIN STREET, MONTREAL QC H3Z 2Y7^FS
+^FO20,140^GB770,4,4^FS
+^CF0,60^FO30,170^FDTO: JOHN DOE^FS
+^FO30,250^FB740,3,5,L^A0N,36^FD{index} RECIPIENT ROAD, SUITE 400, VANCOUVER BC V6M 2V9 CANADA^FS
+^FO20,400^GB770,4,4^FS
+^BY3,2,150^FO60,440^BCN,150,Y,N,N,A^FD1Z999AA1{index:010d}^FS
+^FO560,640^BQN,2,5^FDQA,https://karrio.io/tracking/{index}^FS
+^FO30,660^GB480,200,4,B,2^FS
+^FO50,690^FR^A0N,120^FDPKG {index}^FS
+^XZ"""
+
+
+def measure(case, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        case()
+
+    return (time.perf_counter() - start) / number
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dpmm", type=int, default=8)
+    parser.add_argument("--labels", type=int, default=1)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    document = "\n".join(LABEL.format(index=index) for index in range(args.labels))
+
+    def to_pdf(zpl_str: str):
+        zpl.CACHE._entries.clear()
+        zpl.to_pdf(zpl_str, 4, 6, args.dpmm)
+
+    start = time.perf_counter()
+    zpl.to_pdf(document, 4, 6, args.dpmm)
+    print(f"{args.labels} ZPL label(s) at {args.dpmm}dpmm")
+    print(f"{'first':10} {(time.perf_counter() - start) * 1000:8.2f} ms")
+
+    cases = dict(
+        render=lambda: zpl.Renderer(4, 6, args.dpmm).render(document),
+        to_pdf=lambda: to_pdf(document),
+        cached=lambda: zpl.to_pdf(document, 4, 6, args.dpmm),
+    )
+    for name, case in cases.items():
+        case()
+        print(f"{name:10} {measure(case, args.number) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
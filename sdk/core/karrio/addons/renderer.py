@@ -5,7 +5,7 @@ from barcode import Code128
 from lxml.etree import fromstring
 from barcode.writer import ImageWriter
 from PIL import Image, ImageDraw, ImageFont
-from karrio.core.utils import DP, request
+import karrio.addons.zpl as zpl
 
 FONTS_DIR = Path(__file__).resolve().parent / "fonts"
 LINE_SEPARATOR = """
@@ -186,17 +186,8 @@ def render_label(label: str, label_type: str, template_type: str, **kwargs) -> s
         pdf.save(result, label_type, resolution=300)
 
     elif template_type == "ZPL" and label_type == "PDF":
-        width, height = kwargs.get("width"), kwargs.get("height")
-        data = DP.jsonify(dict(file=label))
-        pdf = request(
-            url=f"http://api.labelary.com/v1/printers/12dpmm/labels/{width}x{height}/0/",
-            data=data,
-            headers={"Accept": "application/pdf"},
-            decoder=lambda b: base64.encodebytes(b).decode("utf-8"),
-        )
-
-        # return it as is because it's already a base64 string.
-        return pdf
+        width, height = kwargs.get("width") or 4, kwargs.get("height") or 6
+        result.write(zpl.to_pdf(label, width, height, dpmm=12))
 
     elif template_type == "SVG" and label_type == "ZPL":
         doc = generate_zpl_from_svg_label(label, **kwargs)
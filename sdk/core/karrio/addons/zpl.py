@@ -0,0 +1,831 @@
+"""A local ZPL II renderer for the labels preview.
+
+The labels are rendered to PDF without the labelary web service. The
+commands carrier labels use are supported: text fields and field blocks
+(the printer fonts are approximated with the bundled Oswald fonts), boxes,
+lines, circles and ellipses, Code 128 and QR (with the `karrio[zpl]` extra
+`qrcode` package) barcodes and graphic fields (ASCII hex, compressed or Z64/B64
+encoded, `~DG` stored graphics recalled with `^XG`). The other commands
+(e.g. `^BD` MaxiCode or `^B7` PDF417 barcodes) are ignored.
+
+The rendered documents are cached by label hash.
+"""
+
+import io
+import re
+import zlib
+import math
+import base64
+import typing
+import logging
+import hashlib
+import functools
+import attr
+from pathlib import Path
+from barcode.charsets import code128
+from PIL import Image, ImageDraw, ImageFont, ImageOps
+from karrio.core.utils.caching import MemoryCache
+
+try:
+    import qrcode
+except ImportError:
+    qrcode = None
+
+logger = logging.getLogger(__name__)
+FONTS_DIR = Path(__file__).resolve().parent / "fonts"
+CACHE = MemoryCache(max_size=256)
+
+# the (height, width) in dots of the printer bitmap fonts
+BITMAP_FONTS = dict(
+    A=(9, 5),
+    B=(11, 7),
+    C=(18, 10),
+    D=(18, 10),
+    E=(28, 15),
+    F=(26, 13),
+    G=(60, 40),
+    H=(21, 13),
+)
+ORIENTATIONS = dict(
+    R=Image.Transpose.ROTATE_270,
+    I=Image.Transpose.ROTATE_180,
+    B=Image.Transpose.ROTATE_90,
+)
+# the ASCII hex graphic fields repeat counts (G-Y: 1-19, g-z: 20-400)
+REPEATS = {
+    **{chr(ord("G") + index): index + 1 for index in range(19)},
+    **{chr(ord("g") + index): (index + 1) * 20 for index in range(20)},
+}
+# the printed dots of the (anti-aliased) rendered labels
+THRESHOLD = [0] * 128 + [255] * 128
+BARS = str.maketrans("01", "\x00\xff")
+HEX_DIGITS = set("0123456789ABCDEFabcdef")
+DIGITS = re.compile(r"\d*")
+CODE128_START = dict(A=103, B=104, C=105)
+CODE128_SWITCH = dict(A=101, B=100, C=99)
+CODE128_FNC1 = 102
+CODE128_INVOCATIONS = {">9": "A", ">:": "B", ">;": "C"}
+CODE128_SUBSETS = {">7": "A", ">6": "B", ">5": "C"}
+
+
+@attr.s(auto_attribs=True, frozen=True, cache_hash=True)
+class Font:
+    name: str = "A"
+    height: int = 9
+    width: int = 5
+
+
+@attr.s(auto_attribs=True)
+class Block:
+    width: int = 0
+    lines: int = 1
+    spacing: int = 0
+    justification: str = "L"
+
+
+@attr.s(auto_attribs=True)
+class Field:
+    x: int = 0
+    y: int = 0
+    typeset: bool = False
+    font: typing.Optional[Font] = None
+    orientation: typing.Optional[str] = None
+    block: typing.Optional[Block] = None
+    reverse: bool = False
+    hex_indicator: typing.Optional[str] = None
+    command: typing.Optional[str] = None
+    args: typing.List[str] = attr.Factory(list)
+    data: typing.Optional[str] = None
+
+
+class Renderer:
+    """Render the labels (`^XA`...`^XZ`) of a ZPL document into images.
+
+    :param width: the label width in inches.
+    :param height: the label height in inches.
+    :param dpmm: the printer density in dots per millimeter.
+    """
+
+    def __init__(self, width: float, height: float, dpmm: int = 8):
+        self.dpmm = dpmm
+        self.size = (
+            max(1, round(float(width) * 25.4 * dpmm)),
+            max(1, round(float(height) * 25.4 * dpmm)),
+        )
+        self.font = Font()
+        self.orientation = "N"
+        self.home = (0, 0)
+        self.reverse = False
+        self.barcode = (2, 3.0, 10)
+        self.graphics: typing.Dict[str, Image.Image] = {}
+        self.labels: typing.List[Image.Image] = []
+        self.canvas: typing.Optional[Image.Image] = None
+        self.field = Field()
+
+    def render(self, zpl: str) -> typing.List[Image.Image]:
+        for command, params in commands(zpl):
+            handler = getattr(self, f"_{command}", None)
+
+            if handler is not None:
+                handler(params)
+            elif len(command) == 2 and command[0] == "A":
+                self._font(command[1], params)
+            elif len(command) == 2 and command[0] == "B":
+                self.field.command, self.field.args = command, params.split(",")
+
+        if self.canvas is not None:
+            self._XZ("")
+
+        return self.labels
+
+    # label commands.
+
+    def _XA(self, params: str):
+        self.canvas = Image.new("L", self.size, 255)
+        self.field = Field()
+
+    def _XZ(self, params: str):
+        if self.canvas is None:
+            return
+
+        self._FS("")
+        self.labels.append(self.canvas)
+        self.canvas = None
+
+    def _LH(self, params: str):
+        x, y = _integers(params, 0, 0)
+        self.home = (x, y)
+
+    def _LR(self, params: str):
+        self.reverse = params.strip().upper().startswith("Y")
+
+    def _CF(self, params: str):
+        name, _, sizes = params.partition(",")
+        height, width = _integers(sizes, 0, 0)
+        self.font = _font(name.strip()[:1] or self.font.name, height, width, self.font)
+
+    def _FW(self, params: str):
+        self.orientation = params.strip()[:1].upper() or self.orientation
+
+    def _BY(self, params: str):
+        module, ratio, height = (params.split(",") + ["", "", ""])[:3]
+        self.barcode = (
+            _integer(module, self.barcode[0]),
+            _number(ratio, self.barcode[1]),
+            _integer(height, self.barcode[2]),
+        )
+
+    def _DG(self, params: str):
+        name, total, row, data = (params.split(",", 3) + ["", "", "", ""])[:4]
+        self.graphics[_graphic_name(name)] = graphic_field(
+            data, _integer(row, 1), _integer(total, 0)
+        )
+
+    # field commands.
+
+    def _FO(self, params: str, typeset: bool = False):
+        if self.field.data is not None or self.field.command is not None:
+            self._FS("")
+
+        x, y = _integers(params, 0, 0)
+        self.field.x, self.field.y, self.field.typeset = x, y, typeset
+
+    def _FT(self, params: str):
+        self._FO(params, typeset=True)
+
+    def _FB(self, params: str):
+        width, lines, spacing, justification = (params.split(",") + [""] * 4)[:4]
+        self.field.block = Block(
+            width=_integer(width, 0),
+            lines=max(1, _integer(lines, 1)),
+            spacing=_integer(spacing, 0),
+            justification=justification.strip()[:1].upper() or "L",
+        )
+
+    def _FR(self, params: str):
+        self.field.reverse = True
+
+    def _FH(self, params: str):
+        self.field.hex_indicator = params[:1] or "_"
+
+    def _FD(self, params: str):
+        self.field.data = params
+
+    def _FV(self, params: str):
+        self.field.data = params
+
+    def _GB(self, params: str):
+        self.field.command, self.field.args = "GB", params.split(",")
+
+    def _GC(self, params: str):
+        self.field.command, self.field.args = "GC", params.split(",")
+
+    def _GE(self, params: str):
+        self.field.command, self.field.args = "GE", params.split(",")
+
+    def _GD(self, params: str):
+        self.field.command, self.field.args = "GD", params.split(",")
+
+    def _GF(self, params: str):
+        self.field.command, self.field.args = "GF", params.split(",", 4)
+
+    def _XG(self, params: str):
+        self.field.command, self.field.args = "XG", params.split(",")
+
+    def _FS(self, params: str):
+        field, self.field = self.field, Field()
+
+        if self.canvas is None:
+            return
+
+        if field.data is not None and field.hex_indicator is not None:
+            field.data = _unhex(field.data, field.hex_indicator)
+
+        render = getattr(self, f"_render_{field.command or 'text'}", None)
+        rendered = render(field) if render is not None else None
+
+        if rendered is None:
+            return
+
+        mask, anchor, color = rendered
+        orientation = field.orientation or self.orientation
+
+        if orientation in ORIENTATIONS:
+            mask = mask.transpose(ORIENTATIONS[orientation])
+
+        x, y = field.x + self.home[0], field.y + self.home[1]
+        if field.typeset and orientation not in ORIENTATIONS:
+            y -= anchor
+
+        self._paint(mask, (x, y), field.reverse or self.reverse, color)
+
+    def _font(self, name: str, params: str):
+        orientation, _, sizes = params.partition(",")
+        height, width = _integers(sizes, 0, 0)
+        self.field.font = _font(name, height, width, self.font)
+        self.field.orientation = orientation.strip()[:1].upper() or None
+
+    # fields rendering.
+
+    def _render_text(self, field: Field):
+        if not field.data:
+            return None
+
+        font = field.font or self.font
+        baseline = round(font.height * 0.78)
+        block = field.block
+        measure = lambda text: math.ceil(sum(_glyph(font, char)[0] for char in text))
+        lines = (
+            _wrap(field.data, measure, block.width, block.lines)
+            if block is not None
+            else [field.data]
+        )
+        line_height = font.height + (block.spacing if block is not None else 0)
+        widths = [measure(line) for line in lines]
+        width = block.width if block is not None and block.width > 0 else max(widths)
+        justification = block.justification if block is not None else "L"
+        mask = Image.new(
+            "L",
+            (
+                max(1, width),
+                line_height * (len(lines) - 1) + math.ceil(font.height * 1.1),
+            ),
+            0,
+        )
+
+        for index, (line, line_width) in enumerate(zip(lines, widths)):
+            offset = dict(C=(width - line_width) // 2, R=width - line_width)
+            _draw_text(
+                mask,
+                line,
+                font,
+                offset.get(justification, 0),
+                index * line_height + baseline,
+            )
+
+        return mask, line_height * (len(lines) - 1) + baseline, 0
+
+    def _render_GB(self, field: Field):
+        _width, _height, _thickness, color, rounding = (field.args + [""] * 5)[:5]
+        thickness = max(1, _integer(_thickness, 1))
+        width = max(_integer(_width, thickness), thickness)
+        height = max(_integer(_height, thickness), thickness)
+        radius = min(width, height) * min(8, _integer(rounding, 0)) // 16
+        mask = Image.new("L", (width, height), 0)
+        ImageDraw.Draw(mask).rounded_rectangle(
+            (0, 0, width - 1, height - 1),
+            radius=radius,
+            fill=None if thickness * 2 < min(width, height) else 255,
+            outline=255,
+            width=thickness,
+        )
+
+        return mask, height, _color(color)
+
+    def _render_GC(self, field: Field):
+        diameter, thickness, color = (field.args + [""] * 3)[:3]
+        return self._ellipse(diameter, diameter, thickness, color)
+
+    def _render_GE(self, field: Field):
+        width, height, thickness, color = (field.args + [""] * 4)[:4]
+        return self._ellipse(width, height, thickness, color)
+
+    def _render_GD(self, field: Field):
+        _width, _height, _thickness, color, orientation = (field.args + [""] * 5)[:5]
+        thickness = max(1, _integer(_thickness, 1))
+        width = max(_integer(_width, thickness), thickness)
+        height = max(_integer(_height, thickness), thickness)
+        mask = Image.new("L", (width, height), 0)
+        line = (
+            (0, 0, width - 1, height - 1)
+            if orientation.strip().upper() == "L"
+            else (0, height - 1, width - 1, 0)
+        )
+        ImageDraw.Draw(mask).line(line, fill=255, width=thickness)
+
+        return mask, height, _color(color)
+
+    def _render_GF(self, field: Field):
+        compression, _, total, row, data = (field.args + [""] * 5)[:5]
+        if compression.strip().upper() not in ("", "A"):
+            return None
+
+        mask = graphic_field(data, _integer(row, 1), _integer(total, 0))
+        return mask, mask.height, 0
+
+    def _render_XG(self, field: Field):
+        name, x_factor, y_factor = (field.args + [""] * 3)[:3]
+        mask = self.graphics.get(_graphic_name(name))
+        if mask is None:
+            return None
+
+        mask = mask.resize(
+            (
+                mask.width * max(1, _integer(x_factor, 1)),
+                mask.height * max(1, _integer(y_factor, 1)),
+            ),
+            Image.Resampling.NEAREST,
+        )
+        return mask, mask.height, 0
+
+    def _render_BC(self, field: Field):
+        if not field.data:
+            return None
+
+        orientation, _height, line, _above, _, mode = (field.args + [""] * 6)[:6]
+        module = self.barcode[0]
+        height = _integer(_height, self.barcode[2])
+        values = code128_values(field.data, mode.strip().upper() or "N")
+        modules = code128_modules(values)
+        field.orientation = orientation.strip()[:1].upper() or None
+        bars = _bars(modules, module, height)
+
+        if line.strip().upper().startswith("N"):
+            return bars, height, 0
+
+        font = Font("0", 9 * module, 5 * module)
+        text, _, _ = self._render_text(
+            Field(font=font, data=re.sub(r">[0-9:;<=>]", "", field.data) or " ")
+        )
+        above = _above.strip().upper().startswith("Y")
+        bars_top = text.height + module if above else 0
+        mask = Image.new("L", (bars.width, height + module + text.height), 0)
+        mask.paste(bars, (0, bars_top))
+        mask.paste(
+            text, ((bars.width - text.width) // 2, 0 if above else height + module)
+        )
+
+        return mask, bars_top + height, 0
+
+    def _render_BQ(self, field: Field):
+        if not field.data:
+            return None
+
+        if qrcode is None:
+            logger.warning("QR codes (^BQ) require the `karrio[zpl]` extra, skipping")
+            return None
+
+        _, _, _magnification = (field.args + [""] * 3)[:3]
+        magnification = _integer(_magnification, max(1, round(self.dpmm / 4)))
+        field.orientation = "N"
+        level, text = qrcode_data(field.data)
+        # a fixed mask pattern spares the evaluation of the 8 patterns (still a valid code)
+        code = qrcode.QRCode(
+            border=0, box_size=1, error_correction=level, mask_pattern=0
+        )
+        code.add_data(text)
+        code.make(fit=True)
+        matrix = code.get_matrix()
+        mask = Image.new("L", (len(matrix), len(matrix)), 0)
+        mask.putdata([255 if module else 0 for row in matrix for module in row])
+        mask = mask.resize(
+            (mask.width * magnification, mask.height * magnification),
+            Image.Resampling.NEAREST,
+        )
+
+        return mask, mask.height, 0
+
+    def _ellipse(self, _width: str, _height: str, _thickness: str, color: str):
+        thickness = max(1, _integer(_thickness, 1))
+        width = max(_integer(_width, thickness), thickness)
+        height = max(_integer(_height, thickness), thickness)
+        mask = Image.new("L", (width, height), 0)
+        ImageDraw.Draw(mask).ellipse(
+            (0, 0, width - 1, height - 1), outline=255, width=thickness
+        )
+
+        return mask, height, _color(color)
+
+    def _paint(self, mask: Image.Image, position: tuple, reverse: bool, color: int):
+        box = (*position, position[0] + mask.width, position[1] + mask.height)
+
+        if reverse:
+            self.canvas.paste(ImageOps.invert(self.canvas.crop(box)), box, mask)
+        else:
+            self.canvas.paste(color, box, mask)
+
+
+def to_pdf(zpl: str, width: float, height: float, dpmm: int = 8) -> bytes:
+    """Return the PDF document of the labels of a ZPL document.
+
+    The documents are cached by hash of the ZPL document and label format.
+
+    :param zpl: the ZPL document.
+    :param width: the label width in inches.
+    :param height: the label height in inches.
+    :param dpmm: the printer density in dots per millimeter.
+    """
+    key = hashlib.sha256(
+        f"{width}x{height}/{dpmm}\n{zpl}".encode("utf-8", "surrogatepass")
+    ).hexdigest()
+    content = CACHE.get(key)
+
+    if content is None:
+        labels = Renderer(width, height, dpmm).render(zpl)
+        if len(labels) == 0:
+            raise ValueError("no ZPL label (^XA...^XZ) found in the document")
+
+        output = io.BytesIO()
+        pages = [label.point(THRESHOLD, "1") for label in labels]
+        pages[0].save(
+            output,
+            format="PDF",
+            resolution=dpmm * 25.4,
+            save_all=True,
+            append_images=pages[1:],
+        )
+        content = output.getvalue()
+        CACHE.set(key, content)
+
+    return content
+
+
+def commands(zpl: str) -> typing.Iterator[typing.Tuple[str, str]]:
+    """Return the (command, parameters) of a ZPL document.
+
+    The field data (`^FD`, `^FV`) and comments (`^FX`) end at the next `^`
+    command, the other parameters at the next `^` or `~` command.
+    """
+    index = _next_command(zpl, 0)
+
+    while index < len(zpl):
+        command = zpl[index + 1 : index + 3].upper()
+        start = index + 3
+        index = (
+            _next_command(zpl, start, "^")
+            if command in ("FD", "FV", "FX")
+            else _next_command(zpl, start)
+        )
+
+        yield command, zpl[start:index].replace("\r", "").replace("\n", "")
+
+
+def graphic_field(data: str, row_bytes: int, total: int = 0) -> Image.Image:
+    """Return the mask (255 for printed dots) of a graphic field data.
+
+    :param data: the ASCII hex (with or without ZPL compression) or Z64/B64 data.
+    :param row_bytes: the number of bytes per row.
+    :param total: the total number of bytes (0 for all the data).
+    """
+    row_bytes = max(1, row_bytes)
+    data = data.strip()
+
+    if data[:5].upper() in (":Z64:", ":B64:"):
+        content = base64.b64decode(data[5:].split(":")[0])
+        content = zlib.decompress(content) if data[1] in "Zz" else content
+    else:
+        content = bytes.fromhex("".join(_hex_rows(data, row_bytes)))
+
+    if total > 0:
+        content = content[:total]
+
+    height = max(1, len(content) // row_bytes)
+    content = content[: height * row_bytes].ljust(height * row_bytes, b"\0")
+
+    return Image.frombytes("1", (row_bytes * 8, height), content).convert("L")
+
+
+def code128_values(data: str, mode: str = "N") -> typing.List[int]:
+    """Return the Code 128 symbol values (with the start symbol) of a `^BC` field data.
+
+    The invocation codes (`>;` start C, `>5` switch to C, `>8` FNC1...) are
+    honored in the `N` (no) mode, the `A` (automatic) and `D`/`U` (GS1) modes
+    pick the subsets.
+    """
+    if mode in ("A", "D", "U"):
+        text = re.sub(r">[0-9:;<=>]|[()]", "", data) if mode != "A" else data
+        return _code128_auto(text, gs1=mode != "A")
+
+    subset = CODE128_INVOCATIONS.get(data[:2])
+    index = 0 if subset is None else 2
+    subset = subset or "B"
+    values = [CODE128_START[subset]]
+
+    while index < len(data):
+        code = data[index : index + 2]
+
+        if code in CODE128_SUBSETS:
+            subset = CODE128_SUBSETS[code]
+            values.append(CODE128_SWITCH[subset])
+            index += 2
+            continue
+
+        if code == ">8":
+            values.append(CODE128_FNC1)
+            index += 2
+            continue
+
+        if subset == "C":
+            if len(code) == 2 and code.isdigit():
+                values.append(int(code))
+                index += 2
+                continue
+
+            subset = "B"
+            values.append(CODE128_SWITCH[subset])
+
+        value = _code128_value(data[index], subset)
+        if value is not None:
+            values.append(value)
+
+        index += 1
+
+    return values
+
+
+def code128_modules(values: typing.List[int]) -> str:
+    """Return the modules ("1" bars, "0" spaces) of Code 128 symbol values."""
+    checksum = (values[0] + sum(i * v for i, v in enumerate(values[1:], 1))) % 103
+
+    return (
+        "".join(code128.CODES[value] for value in [*values, checksum])
+        + code128.STOP
+        + "11"
+    )
+
+
+def qrcode_data(data: str) -> typing.Tuple[int, str]:
+    """Return the error correction level and text of a `^BQ` field data (e.g. "QA,text")."""
+    levels = dict(L=1, M=0, Q=3, H=2)  # the qrcode.constants.ERROR_CORRECT_* values
+
+    if len(data) < 3 or data[2] != "," or data[0].upper() not in levels:
+        return levels["M"], data
+
+    level, text = levels[data[0].upper()], data[3:]
+
+    if data[1].upper() == "M" and len(text) > 0:
+        text = text[5:] if text[0].upper() == "B" else text[1:]
+
+    return level, text
+
+
+def _next_command(zpl: str, start: int, prefixes: str = "^~") -> int:
+    indexes = [zpl.find(prefix, start) for prefix in prefixes]
+    return min([index for index in indexes if index >= 0], default=len(zpl))
+
+
+def _code128_auto(text: str, gs1: bool = False) -> typing.List[int]:
+    values: typing.List[int] = [CODE128_START["C"], CODE128_FNC1] if gs1 else []
+    subset = "C" if gs1 else None
+    index = 0
+
+    while index < len(text):
+        digits = len(DIGITS.match(text, index).group())
+        use_c = digits >= 4 or (
+            digits >= 2 and (subset == "C" or index + digits == len(text) == digits)
+        )
+
+        if use_c:
+            end = index + digits - digits % 2
+            if subset != "C":
+                values.append(
+                    CODE128_START["C"] if subset is None else CODE128_SWITCH["C"]
+                )
+                subset = "C"
+
+            values.extend(int(text[i : i + 2]) for i in range(index, end, 2))
+            index = end
+            continue
+
+        if subset != "B":
+            values.append(CODE128_START["B"] if subset is None else CODE128_SWITCH["B"])
+            subset = "B"
+
+        value = _code128_value(text[index], subset)
+        if value is not None:
+            values.append(value)
+
+        index += 1
+
+    return values or [CODE128_START["B"]]
+
+
+def _code128_value(char: str, subset: str) -> typing.Optional[int]:
+    code = ord(char)
+
+    if 32 <= code < (96 if subset == "A" else 128):
+        return code - 32
+
+    if subset == "A" and code < 32:
+        return code + 64
+
+    return None
+
+
+def _bars(modules: str, module: int, height: int) -> Image.Image:
+    row = modules.translate(BARS).encode("latin-1")
+    mask = Image.frombytes("L", (len(modules), 1), row)
+
+    return mask.resize(
+        (len(modules) * max(1, module), max(1, height)), Image.Resampling.NEAREST
+    )
+
+
+def _hex_rows(data: str, row_bytes: int) -> typing.Iterator[str]:
+    width = row_bytes * 2
+    row, previous, count = "", "0" * width, 0
+
+    for char in data:
+        if char in REPEATS:
+            count += REPEATS[char]
+            continue
+
+        if char in (",", "!", ":"):
+            row = (
+                previous
+                if char == ":"
+                else row.ljust(width, "0" if char == "," else "F")
+            )
+        elif char in HEX_DIGITS:
+            row += char * max(1, count)
+        else:
+            continue
+
+        count = 0
+        while len(row) >= width:
+            previous, row = row[:width], row[width:]
+            yield previous
+
+    if row:
+        yield row.ljust(width, "0")
+
+
+def _draw_text(mask: Image.Image, text: str, font: Font, x: int, baseline: int):
+    pen = float(x)
+
+    for char in text:
+        advance, glyph, left, top = _glyph(font, char)
+
+        if glyph is not None:
+            box = (round(pen) + left, baseline + top)
+            mask.paste(255, (*box, box[0] + glyph.width, box[1] + glyph.height), glyph)
+
+        pen += advance
+
+
+@functools.lru_cache(maxsize=4096)
+def _glyph(
+    font: Font, char: str
+) -> typing.Tuple[float, typing.Optional[Image.Image], int, int]:
+    """Return the advance, mask and offsets (from the pen on the baseline) of a glyph.
+
+    The glyphs are rendered once per printer font: measuring and drawing the
+    texts glyph by glyph spares FreeType the layout of every text.
+    """
+    face, scale = _typeface(font)
+    advance = face.getlength(char) * scale
+    left, top, right, bottom = face.getbbox(char, anchor="ls")
+
+    if right <= left or bottom <= top:
+        return advance, None, 0, 0
+
+    mask = Image.new("L", (right - left, bottom - top), 0)
+    ImageDraw.Draw(mask).text((-left, -top), char, font=face, fill=255, anchor="ls")
+
+    if scale != 1:
+        mask = mask.resize(
+            (max(1, round(mask.width * scale)), mask.height),
+            Image.Resampling.BILINEAR,
+        )
+
+    return advance, mask, math.floor(left * scale), top
+
+
+@functools.lru_cache(maxsize=64)
+def _typeface(font: Font) -> typing.Tuple[ImageFont.FreeTypeFont, float]:
+    """Return the typeface approximating a printer font and its horizontal scale."""
+    face = _truetype(font.name not in BITMAP_FONTS, max(1, round(font.height * 0.89)))
+    scale = (
+        font.width * 1.2 / max(1.0, face.getlength("0"))
+        if font.name in BITMAP_FONTS
+        else font.width / max(1, font.height)
+    )
+
+    return face, scale
+
+
+@functools.lru_cache(maxsize=64)
+def _truetype(bold: bool, size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(
+        str(FONTS_DIR / f"Oswald-{'SemiBold' if bold else 'Regular'}.ttf"),
+        size,
+        layout_engine=ImageFont.Layout.BASIC,
+    )
+
+
+def _font(name: str, height: int, width: int, default: Font) -> Font:
+    """Return the font of a `^A`/`^CF` font name and sizes in dots (0 for unset)."""
+    name = name.upper() if name.upper() in BITMAP_FONTS else "0"
+
+    if name in BITMAP_FONTS:
+        base_height, base_width = BITMAP_FONTS[name]
+        height = height or (width * base_height // base_width) or base_height
+        width = width or (height * base_width // base_height)
+    else:
+        height = height or width or default.height
+        width = width or height
+
+    return Font(name, height, width)
+
+
+def _wrap(
+    text: str, measure: typing.Callable[[str], int], width: int, lines: int
+) -> typing.List[str]:
+    wrapped: typing.List[str] = []
+
+    for paragraph in text.split("\\&"):
+        line = ""
+        for word in paragraph.split(" "):
+            candidate = f"{line} {word}" if line else word
+            if width > 0 and line and measure(candidate) > width:
+                wrapped.append(line)
+                line = word
+            else:
+                line = candidate
+
+        wrapped.append(line)
+
+    return wrapped[:lines]
+
+
+def _unhex(data: str, indicator: str) -> str:
+    text = re.sub(
+        re.escape(indicator) + "([0-9A-Fa-f]{2})",
+        lambda match: chr(int(match.group(1), 16)),
+        data,
+    )
+
+    try:
+        return text.encode("latin-1").decode("utf-8")
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        return text
+
+
+def _graphic_name(name: str) -> str:
+    return name.strip().split(":")[-1].upper()
+
+
+def _color(color: str) -> int:
+    return 255 if color.strip().upper() == "W" else 0
+
+
+def _integer(value: str, default: int) -> int:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+def _number(value: str, default: float) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _integers(params: str, *defaults: int) -> typing.List[int]:
+    values = params.split(",")
+    return [
+        _integer(values[index] if index < len(values) else "", default)
+        for index, default in enumerate(defaults)
+    ]
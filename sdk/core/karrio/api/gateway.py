@@ -10,7 +10,8 @@ from karrio.core.utils import DP, Tracer
 from karrio.core.models import Message
 from karrio.core.errors import ShippingSDKError
 from karrio.references import (
-    import_extensions,
+    Registry,
+    load_manifest,
     detect_capabilities,
     detect_proxy_methods,
 )
@@ -144,8 +145,14 @@ class GatewayInitializer:
             raise ShippingSDKError(f"Unknown provider '{key}'")
 
     @property
-    def providers(self):
-        return import_extensions()
+    def providers(self) -> Registry:
+        """The installed providers, each imported the first time it is looked up"""
+        return Registry()
+
+    @property
+    def manifest(self) -> dict:
+        """The installed providers metadata, read without importing them when cached"""
+        return load_manifest()
 
     @staticmethod
     def get_instance() -> "GatewayInitializer":
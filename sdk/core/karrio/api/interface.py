@@ -2,12 +2,15 @@
 
 import attr
 import typing
+import asyncio
 import logging
 import functools
+import contextvars
 import karrio.lib as lib
 import karrio.core.errors as errors
 import karrio.core.models as models
 import karrio.api.gateway as gateway
+from karrio.api.proxy import Proxy
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +48,15 @@ def abort(
     )
 
 
+def aborted(gateway: gateway.Gateway, error: Exception) -> "IDeserialize":
+    """Return the deserializer of a process aborted by an error"""
+
+    def deserialize(*_) -> typing.Any:
+        return abort(typing.cast(errors.ShippingSDKDetailedError, error), gateway)
+
+    return IDeserialize(deserialize)
+
+
 def fail_safe(gateway: gateway.Gateway):
     """Decorate operation and requests calls to enrich any failure context
 
@@ -59,19 +71,112 @@ def fail_safe(gateway: gateway.Gateway):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             try:
-                return func(*args, **kwargs)
+                with lib.connection_context(gateway.settings), lib.deadline_context(
+                    connection_timeout(gateway)
+                ):
+                    return func(*args, **kwargs)
             except Exception as error:
                 logger.exception(error)
 
-                return IDeserialize(
-                    functools.partial(abort, gateway=gateway, error=error)
-                )
+                return aborted(gateway, error)
+
+        return wrapper
+
+    return catcher
+
+
+def fail_safe_async(gateway: gateway.Gateway):
+    """Decorate coroutine operation calls to enrich any failure context
+
+    Args:
+        gateway (gateway.Gateway): The gateway in use
+
+    Returns:
+        Decorator
+    """
+
+    def catcher(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                with lib.connection_context(gateway.settings), lib.deadline_context(
+                    connection_timeout(gateway)
+                ):
+                    return await func(*args, **kwargs)
+            except Exception as error:
+                logger.exception(error)
+
+                return aborted(gateway, error)
 
         return wrapper
 
     return catcher
 
 
+def to_payload(request_type: typing.Type[T], args: typing.Any) -> T:
+    """Return the request `args` as a `request_type` instance.
+
+    Validated requests (see `lib.to_request`) are used as is while dicts and
+    other models are normalized into a new instance.
+    """
+    if isinstance(args, models.validated_type(request_type)):
+        return typing.cast(T, args)
+
+    return lib.to_object(request_type, lib.to_dict(args))
+
+
+def call_proxy(proxy: Proxy, operation: str, request: lib.Serializable):
+    """Call a proxy operation, running its coroutine when only `<operation>_async` is implemented"""
+    method = getattr(proxy, operation)
+    method_async = getattr(proxy, f"{operation}_async", None)
+
+    with lib.operation_context(operation):
+        if method_async is not None and getattr(Proxy, operation, None) is getattr(
+            proxy.__class__, operation
+        ):
+            return lib.run_coroutine(method_async(request))
+
+        return method(request)
+
+
+async def call_proxy_async(proxy: Proxy, operation: str, request: lib.Serializable):
+    """Await a proxy `<operation>_async` coroutine or run the sync operation in an executor"""
+    method_async = getattr(proxy, f"{operation}_async", None)
+
+    with lib.operation_context(operation):
+        if method_async is not None:
+            return await method_async(request)
+
+        return await asyncio.get_running_loop().run_in_executor(
+            None, contextvars.copy_context().run, getattr(proxy, operation), request
+        )
+
+
+def connection_timeout(gateway: gateway.Gateway) -> typing.Optional[float]:
+    """Return the carrier connection requests budget (in seconds) if configured"""
+    return lib.failsafe(lambda: gateway.settings.connection_config.timeout.state)
+
+
+def carrier_name(gateway: gateway.Gateway) -> typing.Optional[str]:
+    """Return the gateway carrier name (its executor carrier queue)."""
+    return getattr(gateway.settings, "carrier_name", None)
+
+
+def timed_out(gateway: gateway.Gateway) -> "IDeserialize":
+    """Return the failure of a gateway that didn't respond within the deadline"""
+    return aborted(gateway, errors.CarrierTimeoutError(gateway.settings.carrier_name))
+
+
+def check_circuit(gateway: gateway.Gateway):
+    """Check that the gateway connection circuit breaker (if any) lets requests through"""
+    if lib.is_circuit_open():
+        return False, aborted(
+            gateway, errors.CarrierUnavailableError(gateway.settings.carrier_name)
+        )
+
+    return True, None
+
+
 def check_operation(gateway: gateway.Gateway, request: str, **kwargs):
     errors = gateway.check(request, **kwargs)
 
@@ -115,27 +220,249 @@ class IDeserialize:
             return result.parse()
         return result
 
+    def resolve(self) -> "IDeserialize":
+        """Execute the response deserialization now and return its (parsed) deserializer"""
+        result = self.parse()
+
+        def deserialize(*_) -> typing.Any:
+            return result
+
+        return IDeserialize(deserialize)
+
+
+@attr.s(auto_attribs=True)
+class IRequest:
+    """A pending carrier request type class"""
+
+    gateway: gateway.Gateway
+    operation: str
+    request: lib.Serializable
+    deserialize: typing.Callable[[lib.Deserializable], typing.Any]
+
+    def send(self) -> IDeserialize:
+        """Send the request through the gateway proxy"""
+        response = call_proxy(self.gateway.proxy, self.operation, self.request)
+
+        return self.deserializer(response)
+
+    async def send_async(self) -> IDeserialize:
+        """Send the request through the gateway proxy without blocking the event loop"""
+        response = await call_proxy_async(
+            self.gateway.proxy, self.operation, self.request
+        )
+
+        return self.deserializer(response)
+
+    def deserializer(self, response: lib.Deserializable) -> IDeserialize:
+        return IDeserialize(
+            fail_safe(self.gateway)(functools.partial(self.deserialize, response))
+        )
+
 
 @attr.s(auto_attribs=True)
 class IRequestFrom:
     """A lazy request (from) type class"""
 
-    action: typing.Callable[[gateway.Gateway], IDeserialize]
+    action: typing.Callable[[gateway.Gateway], typing.Union[IRequest, IDeserialize]]
+
+    def from_(
+        self, gateway: gateway.Gateway, deadline: lib.Deadline = None
+    ) -> IDeserialize:
+        """Execute the request action from the provided gateway
+
+        Args:
+            deadline (Union[Deadline, float]): the requests deadline (or budget in seconds)
+        """
+
+        @fail_safe(gateway)
+        def run():
+            result = self.action(gateway)
+            return result.send() if isinstance(result, IRequest) else result
+
+        with lib.deadline_context(deadline):
+            return run()
+
+    async def from_async(
+        self, gateway: gateway.Gateway, deadline: lib.Deadline = None
+    ) -> IDeserialize:
+        """Execute the request action from the provided gateway in the running event loop"""
+
+        @fail_safe_async(gateway)
+        async def run():
+            result = self.action(gateway)
+            return (
+                (await result.send_async()) if isinstance(result, IRequest) else result
+            )
 
-    def from_(self, gateway: gateway.Gateway) -> IDeserialize:
-        """Execute the request action from the provided gateway"""
-        return fail_safe(gateway)(self.action)(gateway)
+        with lib.deadline_context(deadline):
+            return await run()
 
 
 @attr.s(auto_attribs=True)
 class IRequestFromMany:
-    """A lazy request (from one or many) type class"""
+    """A lazy request (from one or many) type class
+
+    The gateways that don't respond within the deadline (if any) are given up on
+    and return a `CARRIER_TIMEOUT` message while the others' results are kept.
+    Without `combine`, `action` is called once with the list of gateways (as before).
+    """
+
+    action: typing.Callable[..., typing.Union[IRequest, IDeserialize]]
+    combine: typing.Optional[
+        typing.Callable[
+            [typing.List[IDeserialize], typing.List[gateway.Gateway]], IDeserialize
+        ]
+    ] = None
+    parse: typing.Optional[
+        typing.Callable[[IDeserialize, gateway.Gateway], typing.Any]
+    ] = None
+
+    def from_(
+        self,
+        *gateways: gateway.Gateway,
+        deadline: lib.Deadline = None,
+        parse_eagerly: bool = False,
+    ) -> IDeserialize:
+        """Execute the request action(s) from the provided gateway(s)
+
+        Args:
+            deadline (Union[Deadline, float]): the requests deadline (or budget in seconds)
+            parse_eagerly (bool): parse each gateway response on the shared executor as soon
+                as it arrives (overlapping the parsing with the other gateways requests)
+                instead of parsing them all one after another on `.parse()`
+        """
+        if self.combine is None:
+            with lib.deadline_context(deadline):
+                return typing.cast(IDeserialize, self.action(list(gateways)))
+
+        request = IRequestFrom(self.action)
+
+        def fetch(gateway: gateway.Gateway) -> IDeserialize:
+            with lib.connection_context(gateway.settings):
+                deserializable = request.from_(gateway)
+                return deserializable.resolve() if parse_eagerly else deserializable
+
+        with lib.deadline_context(deadline) as _deadline:
+            deserializable_collection = lib.run_asynchronously(
+                fetch,
+                list(gateways),
+                timeout=(_deadline.remaining if _deadline is not None else None),
+                on_timeout=timed_out,
+                carrier=carrier_name,
+            )
+
+        return self.combine(deserializable_collection, list(gateways))
+
+    async def from_async(
+        self,
+        *gateways: gateway.Gateway,
+        deadline: lib.Deadline = None,
+        parse_eagerly: bool = False,
+    ) -> IDeserialize:
+        """Execute the request action(s) concurrently from the provided gateway(s) in the running event loop
+
+        The gateways proxies implementing the `<operation>_async` coroutine are awaited
+        on the event loop while the sync only ones are run in the default executor.
+        With `parse_eagerly`, each gateway response is parsed in the default
+        executor (off the event loop) as soon as it arrives.
+        """
+        if self.combine is None:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, contextvars.copy_context().run, self.from_, *gateways
+            )
+
+        request = IRequestFrom(self.action)
+
+        async def fetch(gateway: gateway.Gateway) -> IDeserialize:
+            deserializable = await request.from_async(gateway)
+            if not parse_eagerly:
+                return deserializable
+
+            return await asyncio.get_running_loop().run_in_executor(
+                None, contextvars.copy_context().run, deserializable.resolve
+            )
 
-    action: typing.Callable[[typing.List[gateway.Gateway]], IDeserialize]
+        with lib.deadline_context(deadline) as _deadline:
+            tasks = [asyncio.ensure_future(fetch(gateway)) for gateway in gateways]
 
-    def from_(self, *gateways: gateway.Gateway) -> IDeserialize:
-        """Execute the request action(s) from the provided gateway(s)"""
-        return self.action(list(gateways))
+        if tasks:
+            await asyncio.wait(
+                tasks, timeout=(_deadline.remaining if _deadline is not None else None)
+            )
+
+        deserializable_collection = [
+            task.result() if task.done() else timed_out(gateway)
+            for task, gateway in zip(tasks, gateways)
+        ]
+        for task in tasks:
+            task.cancel()
+
+        return self.combine(deserializable_collection, list(gateways))
+
+    def stream(
+        self, *gateways: gateway.Gateway, deadline: lib.Deadline = None
+    ) -> typing.Iterator[typing.Any]:
+        """Execute the request action(s) from the provided gateway(s) yielding each parsed result as it completes"""
+        if self.combine is None:
+            return iter([self.from_(*gateways, deadline=deadline).parse()])
+
+        request = IRequestFrom(self.action)
+        _deadline = lib.get_deadline(deadline)
+
+        def run(gateway: gateway.Gateway):
+            with lib.connection_context(gateway.settings):
+                return self._parse(request.from_(gateway, deadline=_deadline), gateway)
+
+        return lib.run_as_completed(
+            run,
+            list(gateways),
+            timeout=(_deadline.remaining if _deadline is not None else None),
+            on_timeout=lambda gateway: self._parse(timed_out(gateway), gateway),
+            carrier=carrier_name,
+        )
+
+    async def stream_async(
+        self, *gateways: gateway.Gateway, deadline: lib.Deadline = None
+    ) -> typing.AsyncIterator[typing.Any]:
+        """Execute the request action(s) concurrently in the running event loop yielding each parsed result as it completes"""
+        if self.combine is None:
+            yield (await self.from_async(*gateways, deadline=deadline)).parse()
+            return
+
+        request = IRequestFrom(self.action)
+        _deadline = lib.get_deadline(deadline)
+
+        async def run(gateway: gateway.Gateway):
+            return self._parse(
+                await request.from_async(gateway, deadline=_deadline), gateway
+            )
+
+        tasks = {asyncio.ensure_future(run(gateway)): gateway for gateway in gateways}
+        pending = set(tasks.keys())
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=(_deadline.remaining if _deadline is not None else None),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    break
+
+                for task in done:
+                    yield task.result()
+
+            for task in pending:
+                yield self._parse(timed_out(tasks[task]), tasks[task])
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _parse(self, deserializable: IDeserialize, gateway: gateway.Gateway):
+        if self.parse is None:
+            return deserializable.parse()
+
+        return self.parse(deserializable, gateway)
 
 
 class Address:
@@ -153,10 +480,10 @@ class Address:
         Returns:
             IRequestFrom: a lazy request dataclass instance
         """
-        logger.debug(f"validate an address. payload: {lib.to_json(args)}")
-        payload = lib.to_object(models.AddressValidationRequest, lib.to_dict(args))
+        lib.log_payload(logger, "validate an address", args)
+        payload = to_payload(models.AddressValidationRequest, args)
 
-        def action(gateway: gateway.Gateway) -> IDeserialize:
+        def action(gateway: gateway.Gateway):
             is_valid, abortion = check_operation(gateway, "validate_address")
             if not is_valid:
                 return abortion
@@ -164,13 +491,13 @@ class Address:
             request: lib.Serializable = (
                 gateway.mapper.create_address_validation_request(payload)
             )
-            response: lib.Deserializable = gateway.proxy.validate_address(request)
-
-            @fail_safe(gateway)
-            def deserialize():
-                return gateway.mapper.parse_address_validation_response(response)
 
-            return IDeserialize(deserialize)
+            return IRequest(
+                gateway,
+                "validate_address",
+                request,
+                gateway.mapper.parse_address_validation_response,
+            )
 
         return IRequestFrom(action)
 
@@ -188,8 +515,8 @@ class Pickup:
         Returns:
             IRequestWith: a lazy request dataclass instance
         """
-        logger.debug(f"book a pickup. payload: {lib.to_json(args)}")
-        payload = lib.to_object(models.PickupRequest, lib.to_dict(args))
+        lib.log_payload(logger, "book a pickup", args)
+        payload = to_payload(models.PickupRequest, args)
 
         def action(gateway: gateway.Gateway):
             is_valid, abortion = check_operation(gateway, "schedule_pickup")
@@ -197,13 +524,13 @@ class Pickup:
                 return abortion
 
             request: lib.Serializable = gateway.mapper.create_pickup_request(payload)
-            response: lib.Deserializable = gateway.proxy.schedule_pickup(request)
 
-            @fail_safe(gateway)
-            def deserialize():
-                return gateway.mapper.parse_pickup_response(response)
-
-            return IDeserialize(deserialize)
+            return IRequest(
+                gateway,
+                "schedule_pickup",
+                request,
+                gateway.mapper.parse_pickup_response,
+            )
 
         return IRequestFrom(action)
 
@@ -217,8 +544,8 @@ class Pickup:
         Returns:
             IRequestFrom: a lazy request dataclass instance
         """
-        logger.debug(f"cancel a pickup. payload: {lib.to_json(args)}")
-        payload = lib.to_object(models.PickupCancelRequest, lib.to_dict(args))
+        lib.log_payload(logger, "cancel a pickup", args)
+        payload = to_payload(models.PickupCancelRequest, args)
 
         def action(gateway: gateway.Gateway):
             is_valid, abortion = check_operation(gateway, "cancel_pickup")
@@ -228,13 +555,13 @@ class Pickup:
             request: lib.Serializable = gateway.mapper.create_cancel_pickup_request(
                 payload
             )
-            response: lib.Deserializable = gateway.proxy.cancel_pickup(request)
-
-            @fail_safe(gateway)
-            def deserialize():
-                return gateway.mapper.parse_cancel_pickup_response(response)
 
-            return IDeserialize(deserialize)
+            return IRequest(
+                gateway,
+                "cancel_pickup",
+                request,
+                gateway.mapper.parse_cancel_pickup_response,
+            )
 
         return IRequestFrom(action)
 
@@ -248,8 +575,8 @@ class Pickup:
         Returns:
             IRequestFrom: a lazy request dataclass instance
         """
-        logger.debug(f"update a pickup. payload: {lib.to_json(args)}")
-        payload = lib.to_object(models.PickupUpdateRequest, lib.to_dict(args))
+        lib.log_payload(logger, "update a pickup", args)
+        payload = to_payload(models.PickupUpdateRequest, args)
 
         def action(gateway: gateway.Gateway):
             is_valid, abortion = check_operation(gateway, "modify_pickup")
@@ -259,13 +586,13 @@ class Pickup:
             request: lib.Serializable = gateway.mapper.create_pickup_update_request(
                 payload
             )
-            response: lib.Deserializable = gateway.proxy.modify_pickup(request)
-
-            @fail_safe(gateway)
-            def deserialize():
-                return gateway.mapper.parse_pickup_update_response(response)
 
-            return IDeserialize(deserialize)
+            return IRequest(
+                gateway,
+                "modify_pickup",
+                request,
+                gateway.mapper.parse_pickup_update_response,
+            )
 
         return IRequestFrom(action)
 
@@ -282,64 +609,64 @@ class Rating:
 
         Returns:
             IRequestFromMany: a lazy request dataclass instance
+
+        Example:
+            for carrier_id, rates, messages in Rating.fetch(request).stream(*gateways):
+                ...
         """
-        logger.debug(f"fetch shipment rates. payload: {lib.to_json(args)}")
-        payload = lib.to_object(models.RateRequest, lib.to_dict(args))
-
-        def action(gateways: typing.List[gateway.Gateway]):
-            def process(gateway: gateway.Gateway):
-                is_valid, abortion = check_operation(
-                    gateway,
-                    "get_rates",
-                    origin_country_code=payload.shipper.country_code,
-                )
-                if not is_valid:
-                    return abortion
+        lib.log_payload(logger, "fetch shipment rates", args)
+        payload = to_payload(models.RateRequest, args)
+
+        def action(gateway: gateway.Gateway):
+            is_valid, abortion = check_operation(
+                gateway,
+                "get_rates",
+                origin_country_code=payload.shipper.country_code,
+            )
+            if not is_valid:
+                return abortion
+
+            # skip mapping the request of a carrier known to be failing
+            is_available, abortion = check_circuit(gateway)
+            if not is_available:
+                return abortion
 
-                request: lib.Serializable = gateway.mapper.create_rate_request(payload)
-                response: lib.Deserializable = gateway.proxy.get_rates(request)
+            request: lib.Serializable = gateway.mapper.create_rate_request(payload)
 
-                @fail_safe(gateway)
-                def deserialize():
-                    return gateway.mapper.parse_rate_response(response)
+            return IRequest(
+                gateway, "get_rates", request, gateway.mapper.parse_rate_response
+            )
 
-                return IDeserialize(deserialize)
+        def parse(deserializable: IDeserialize, gateway: gateway.Gateway):
+            rates, messages = deserializable.parse()
 
-            deserializable_collection: typing.List[
-                IDeserialize
-            ] = lib.run_asynchronously(lambda g: fail_safe(g)(process)(g), gateways)
+            return (
+                gateway.settings.carrier_id,
+                filter_rates(rates or [], gateway),
+                messages,
+            )
 
+        def combine(
+            deserializable_collection: typing.List[IDeserialize],
+            gateways: typing.List[gateway.Gateway],
+        ):
             def flatten(*args):
-                responses = [p.parse() for p in deserializable_collection]
-                flattened_rates = sum(
-                    (
-                        (
-                            (lambda gateway: filter_rates(rates, gateway))(
-                                # find the gateway that matches the carrier_id of the rates
-                                next(
-                                    (
-                                        g
-                                        for g in gateways
-                                        if (
-                                            g.settings.carrier_id == rates[0].carrier_id
-                                        )
-                                    )
-                                )
-                            )
-                            if len(rates) > 0
-                            else rates
-                        )
-                        for rates, _ in responses
-                        if rates is not None
-                    ),
-                    [],
-                )
-                messages = sum((m for _, m in responses), [])
+                # the deserializables are in the same order as their gateways
+                responses = [
+                    parse(deserializable, gateway)
+                    for deserializable, gateway in zip(
+                        deserializable_collection, gateways
+                    )
+                ]
+                flattened_rates = [rate for _, rates, _ in responses for rate in rates]
+                messages = [
+                    message for _, _, messages in responses for message in messages
+                ]
                 return flattened_rates, messages
 
             return IDeserialize(flatten)
 
-        return IRequestFromMany(action)
+        return IRequestFromMany(action, combine, parse)
 
 
 class Shipment:
@@ -356,8 +683,8 @@ class Shipment:
         Returns:
             IRequestWith: a lazy request dataclass instance
         """
-        logger.debug(f"create a shipment. payload: {lib.to_json(args)}")
-        payload = lib.to_object(models.ShipmentRequest, lib.to_dict(args))
+        lib.log_payload(logger, "create a shipment", args)
+        payload = to_payload(models.ShipmentRequest, args)
 
         def action(gateway: gateway.Gateway):
             is_valid, abortion = check_operation(
@@ -369,13 +696,13 @@ class Shipment:
                 return abortion
 
             request: lib.Serializable = gateway.mapper.create_shipment_request(payload)
-            response: lib.Deserializable = gateway.proxy.create_shipment(request)
 
-            @fail_safe(gateway)
-            def deserialize():
-                return gateway.mapper.parse_shipment_response(response)
-
-            return IDeserialize(deserialize)
+            return IRequest(
+                gateway,
+                "create_shipment",
+                request,
+                gateway.mapper.parse_shipment_response,
+            )
 
         return IRequestFrom(action)
 
@@ -389,8 +716,8 @@ class Shipment:
         Returns:
             IRequestFrom: a lazy request dataclass instance
         """
-        logger.debug(f"void a shipment. payload: {lib.to_json(args)}")
-        payload = lib.to_object(models.ShipmentCancelRequest, lib.to_dict(args))
+        lib.log_payload(logger, "void a shipment", args)
+        payload = to_payload(models.ShipmentCancelRequest, args)
 
         def action(gateway: gateway.Gateway):
             is_valid, abortion = check_operation(gateway, "cancel_shipment")
@@ -400,13 +727,13 @@ class Shipment:
             request: lib.Serializable = gateway.mapper.create_cancel_shipment_request(
                 payload
             )
-            response: lib.Deserializable = gateway.proxy.cancel_shipment(request)
 
-            @fail_safe(gateway)
-            def deserialize():
-                return gateway.mapper.parse_cancel_shipment_response(response)
-
-            return IDeserialize(deserialize)
+            return IRequest(
+                gateway,
+                "cancel_shipment",
+                request,
+                gateway.mapper.parse_cancel_shipment_response,
+            )
 
         return IRequestFrom(action)
 
@@ -424,22 +751,19 @@ class Tracking:
         Returns:
             IRequestFrom: a lazy request dataclass instance
         """
-        logger.debug(f"track a shipment. payload: {lib.to_json(args)}")
-        payload = lib.to_object(models.TrackingRequest, lib.to_dict(args))
+        lib.log_payload(logger, "track a shipment", args)
+        payload = to_payload(models.TrackingRequest, args)
 
-        def action(gateway: gateway.Gateway) -> IDeserialize:
+        def action(gateway: gateway.Gateway):
             is_valid, abortion = check_operation(gateway, "get_tracking")
             if not is_valid:
                 return abortion
 
             request: lib.Serializable = gateway.mapper.create_tracking_request(payload)
-            response: lib.Deserializable = gateway.proxy.get_tracking(request)
 
-            @fail_safe(gateway)
-            def deserialize():
-                return gateway.mapper.parse_tracking_response(response)
-
-            return IDeserialize(deserialize)
+            return IRequest(
+                gateway, "get_tracking", request, gateway.mapper.parse_tracking_response
+            )
 
         return IRequestFrom(action)
 
@@ -458,8 +782,8 @@ class Document:
         Returns:
             IRequestWith: a lazy request dataclass instance
         """
-        logger.debug(f"upload a document. payload: {lib.to_json(args)}")
-        payload = lib.to_object(models.DocumentUploadRequest, lib.to_dict(args))
+        lib.log_payload(logger, "upload a document", args)
+        payload = to_payload(models.DocumentUploadRequest, args)
 
         def action(gateway: gateway.Gateway):
             is_valid, abortion = check_operation(
@@ -472,12 +796,12 @@ class Document:
             request: lib.Serializable = gateway.mapper.create_document_upload_request(
                 payload
             )
-            response: lib.Deserializable = gateway.proxy.upload_document(request)
 
-            @fail_safe(gateway)
-            def deserialize():
-                return gateway.mapper.parse_document_upload_response(response)
-
-            return IDeserialize(deserialize)
+            return IRequest(
+                gateway,
+                "upload_document",
+                request,
+                gateway.mapper.parse_document_upload_response,
+            )
 
         return IRequestFrom(action)
@@ -10,7 +10,13 @@ import karrio.core.settings as settings
 
 @attr.s(auto_attribs=True)
 class Proxy(abc.ABC):
-    """Unified Shipping API Proxy (Interface)"""
+    """Unified Shipping API Proxy (Interface)
+
+    Every operation can also be implemented as a coroutine named after it
+    with an `_async` suffix (e.g. `async def get_rates_async`) using `lib.request_async`.
+    The fluent API `from_async` awaits it when defined and otherwise runs
+    the sync operation in an executor.
+    """
 
     settings: settings.Settings
     tracer: lib.Tracer = attr.field(factory=lib.Tracer)
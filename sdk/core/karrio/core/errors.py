@@ -75,6 +75,28 @@ class DestinationNotServicedError(ShippingSDKError):
         super().__init__(f"Destination address '{origin}' is not serviced")
 
 
+class CarrierTimeoutError(ShippingSDKDetailedError):
+    """Raised when a carrier doesn't respond within the request deadline (or timeout)."""
+
+    code = "CARRIER_TIMEOUT"
+
+    def __init__(self, carrier: str = None):
+        super().__init__(
+            f"{carrier or 'The carrier'} didn't respond within the allowed time"
+        )
+
+
+class CarrierUnavailableError(ShippingSDKDetailedError):
+    """Raised when a carrier connection circuit breaker is open (too many recent failures)."""
+
+    code = "CARRIER_UNAVAILABLE"
+
+    def __init__(self, carrier: str = None):
+        super().__init__(
+            f"{carrier or 'The carrier'} is temporarily unavailable, please retry later"
+        )
+
+
 class MultiParcelNotSupportedError(ShippingSDKError):
     """Raised when an origin is not supported by a shipping provider."""
 
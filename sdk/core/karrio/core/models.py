@@ -1,5 +1,6 @@
 """Karrio Unified model definitions module."""
 import attr
+import functools
 from typing import List, Dict, Any, Union
 from jstruct import JList, JStruct, REQUIRED
 
@@ -497,3 +498,35 @@ class DocumentUploadDetails:
     documents: List[DocumentDetails] = JList[DocumentDetails]
     meta: dict = None
     id: str = None
+
+
+class Validated:
+    """Mixin of the frozen request types holding an already validated request.
+
+    The fluent interface (`karrio.Rating.fetch(...)`...) uses their instances
+    as is instead of normalizing a copy of the request.
+    """
+
+    __slots__ = ()
+
+
+def validated_type(request_type: type) -> type:
+    """Return the frozen `Validated` subclass of a request type."""
+    return _validated_type(request_type)
+
+
+@functools.lru_cache(maxsize=None)
+def _validated_type(request_type: type) -> type:
+    if issubclass(request_type, Validated):
+        return request_type
+
+    return attr.s(frozen=True)(
+        type(
+            f"Validated{request_type.__name__}",
+            (request_type, Validated),
+            dict(
+                __module__=request_type.__module__,
+                __annotations__=dict(request_type.__annotations__),
+            ),
+        )
+    )
@@ -176,9 +176,63 @@ class CarrierCapabilities(utils.Enum):
         return None
 
 
+def conversion(compute: typing.Callable[[typing.Any], typing.Any]) -> property:
+    """A measurement property computed once per (immutable) instance."""
+    name = compute.__name__
+
+    @functools.wraps(compute)
+    def convert(self):
+        try:
+            return self._conversions[name]
+        except KeyError:
+            return self._conversions.setdefault(name, compute(self))
+
+    return property(convert)
+
+
+def derived(*inputs: typing.Callable[[typing.Any], typing.Any]):
+    """A property cached until the (mutable) values it is computed from change."""
+
+    def decorator(compute: typing.Callable[[typing.Any], typing.Any]) -> property:
+        name = compute.__name__
+
+        @functools.wraps(compute)
+        def get(self):
+            key = tuple(read(self) for read in inputs)
+            cached = self._derived.get(name)
+
+            if cached is None or cached[0] != key:
+                cached = self._derived[name] = (key, compute(self))
+
+            return cached[1]
+
+        return property(get)
+
+    return decorator
+
+
+def _item_weight(product: "Product"):
+    return (product.item.weight, product.item.weight_unit)
+
+
+def _parcel_weight(package: "Package"):
+    return (package.parcel.weight, package.parcel.weight_unit)
+
+
+def _parcel_dimensions(package: "Package"):
+    parcel = package.parcel
+    return (parcel.width, parcel.height, parcel.length, parcel.dimension_unit)
+
+
+def _parcel_items(package: "Package"):
+    return tuple(id(item) for item in package.parcel.items or [])
+
+
 class Dimension:
     """The dimension common processing helper"""
 
+    __slots__ = ("_value", "_unit", "_min_in", "_min_cm", "_quant", "_conversions")
+
     def __init__(
         self,
         value: float,
@@ -192,6 +246,7 @@ class Dimension:
         self._min_in = options.min_in
         self._min_cm = options.min_cm
         self._quant = options.quant
+        self._conversions: typing.Dict[str, typing.Optional[float]] = {}
 
     def __getitem__(self, item):
         return getattr(self, item)
@@ -209,14 +264,14 @@ class Dimension:
 
         return self._unit.value
 
-    @property
+    @conversion
     def value(self):
         if self._unit is None or self._value is None:
             return None
 
         return self.__getattribute__(str(self._unit.name))
 
-    @property
+    @conversion
     def CM(self):
         if self._unit is None or self._value is None:
             return None
@@ -225,7 +280,7 @@ class Dimension:
         else:
             return self._compute(self._value, self._min_cm)
 
-    @property
+    @conversion
     def IN(self):
         if self._unit is None or self._value is None:
             return None
@@ -234,7 +289,7 @@ class Dimension:
         else:
             return self._compute(self._value, self._min_in)
 
-    @property
+    @conversion
     def M(self):
         if self._unit is None or self._value is None:
             return None
@@ -248,21 +303,24 @@ class Dimension:
 class Volume:
     """The volume common processing helper"""
 
+    __slots__ = ("_side1", "_side2", "_side3", "_conversions")
+
     def __init__(
         self, side1: Dimension = None, side2: Dimension = None, side3: Dimension = None
     ):
         self._side1 = side1
         self._side2 = side2
         self._side3 = side3
+        self._conversions: typing.Dict[str, typing.Optional[float]] = {}
 
-    @property
+    @conversion
     def value(self):
         if not any([self._side1.value, self._side2.value, self._side3.value]):
             return None
 
         return utils.NF.decimal(self._side1.M * self._side2.M * self._side3.M)
 
-    @property
+    @conversion
     def cubic_meter(self):
         if self.value is None:
             return None
@@ -272,14 +330,17 @@ class Volume:
 class Girth:
     """The girth common processing helper"""
 
+    __slots__ = ("_side1", "_side2", "_side3", "_conversions")
+
     def __init__(
         self, side1: Dimension = None, side2: Dimension = None, side3: Dimension = None
     ):
         self._side1 = side1
         self._side2 = side2
         self._side3 = side3
+        self._conversions: typing.Dict[str, typing.Optional[float]] = {}
 
-    @property
+    @conversion
     def value(self):
         sides = [self._side1.CM, self._side2.CM, self._side3.CM]
         if not any(sides):
@@ -293,6 +354,16 @@ class Girth:
 class Weight:
     """The weight common processing helper"""
 
+    __slots__ = (
+        "_value",
+        "_unit",
+        "_min_lb",
+        "_min_kg",
+        "_min_oz",
+        "_quant",
+        "_conversions",
+    )
+
     def __init__(
         self,
         value: float,
@@ -307,6 +378,7 @@ class Weight:
         self._min_kg = options.min_kg
         self._min_oz = options.min_oz
         self._quant = options.quant
+        self._conversions: typing.Dict[str, typing.Optional[float]] = {}
 
     def __getitem__(self, item):
         return getattr(self, item)
@@ -324,14 +396,14 @@ class Weight:
 
         return self._unit.value
 
-    @property
+    @conversion
     def value(self) -> typing.Optional[float]:
         if self._unit is None or self._value is None:
             return None
 
         return self.__getattribute__(str(self._unit.name))
 
-    @property
+    @conversion
     def KG(self) -> typing.Optional[float]:
         if self._unit is None or self._value is None:
             return None
@@ -342,7 +414,7 @@ class Weight:
 
         return None
 
-    @property
+    @conversion
     def LB(self) -> typing.Optional[float]:
         if self._unit is None or self._value is None:
             return None
@@ -353,7 +425,7 @@ class Weight:
 
         return None
 
-    @property
+    @conversion
     def OZ(self) -> typing.Optional[float]:
         if self._unit is None or self._value is None:
             return None
@@ -378,6 +450,7 @@ class Product(models.Commodity):
     ):
         self.item = item
         self._weight_unit: str = weight_unit or item.weight_unit or "LB"
+        self._derived: dict = {}
 
     def __getitem__(self, item):
         return getattr(self.item, item, None)
@@ -389,7 +462,7 @@ class Product(models.Commodity):
     def weight_unit(self):
         return self._weight_unit
 
-    @property
+    @derived(_item_weight)
     def weight(self):
         if self.item.weight is None:
             return None
@@ -452,6 +525,7 @@ class Package:
     ):
         self.parcel: models.Parcel = parcel
         self.preset: PackagePreset = template or PackagePreset()
+        self._derived: dict = {}
 
         self._options: "ShippingOptions" = ShippingOptions(
             {**parcel.options, **getattr(options, "content", {})},
@@ -501,31 +575,31 @@ class Package:
     def packaging_type(self):
         return self.parcel.packaging_type or self.preset.packaging_type
 
-    @property
+    @derived(_parcel_weight)
     def weight(self) -> Weight:
         return self._compute_weight(self.parcel.weight or self.preset.weight)
 
-    @property
+    @derived(_parcel_dimensions)
     def width(self) -> Dimension:
         return self._compute_dimension(self.preset.width or self.parcel.width)
 
-    @property
+    @derived(_parcel_dimensions)
     def height(self) -> Dimension:
         return self._compute_dimension(self.preset.height or self.parcel.height)
 
-    @property
+    @derived(_parcel_dimensions)
     def length(self) -> Dimension:
         return self._compute_dimension(self.preset.length or self.parcel.length)
 
-    @property
+    @derived(_parcel_dimensions)
     def girth(self) -> Girth:
         return Girth(self.width, self.length, self.height)
 
-    @property
+    @derived(_parcel_dimensions)
     def volume(self) -> Volume:
         return Volume(self.width, self.length, self.height)
 
-    @property
+    @derived(_parcel_dimensions)
     def thickness(self) -> Dimension:
         return self._compute_dimension(self.preset.thickness)
 
@@ -555,7 +629,7 @@ class Package:
     def options(self) -> "ShippingOptions":
         return self._options
 
-    @property
+    @derived(_parcel_items)
     def items(self) -> Products:
         _items = self.parcel.items or []
 
@@ -590,6 +664,7 @@ class Packages(typing.Iterable[Package]):
         self._required = required
         self._max_weight = max_weight
         self._package_option_type = package_option_type
+        self._derived: dict = {}
 
         self.validate()
 
@@ -635,7 +710,7 @@ class Packages(typing.Iterable[Package]):
 
         return presets[parcel.package_preset].value
 
-    @property
+    @derived(lambda packages: tuple(pkg.weight for pkg in packages))
     def weight(self) -> Weight:
         unit, _ = self.compatible_units
         value = sum(
@@ -670,8 +745,9 @@ class Packages(typing.Iterable[Package]):
 
         return description
 
-    @property
+    @functools.cached_property
     def options(self) -> "ShippingOptions":
+        # the packages options are read once (on construction) from the parcels
         def merge_options(acc, pkg) -> dict:
             """Merge package options into one
             if an item exists in one and is of type int or float,
@@ -710,7 +786,7 @@ class Packages(typing.Iterable[Package]):
         _weight_unit, _ = self._compatible_units
         return _weight_unit.value
 
-    @property
+    @derived(lambda packages: tuple(pkg.items for pkg in packages))
     def items(self) -> Products:
         _weight_unit, _ = self.compatible_units
         _items: typing.List[models.Commodity] = functools.reduce(
@@ -774,6 +850,27 @@ class Packages(typing.Iterable[Package]):
         )
 
 
+@functools.lru_cache(maxsize=None)
+def _option_map(
+    option_type: typing.Optional[typing.Type[utils.Enum]],
+    base_option_type: typing.Type[utils.Enum],
+) -> typing.Dict[str, typing.Tuple[str, typing.Any]]:
+    """The option keys mapped to their (name, definition) once per option types.
+
+    Carrier options (and their aliases) are stored under their name and take
+    precedence over the base options that are stored under the given key.
+    """
+    base_options = {
+        key: (key, member.value) for key, member in base_option_type.__members__.items()
+    }
+    carrier_options = {
+        key: (member.name, member.value)
+        for key, member in getattr(option_type, "__members__", {}).items()
+    }
+
+    return {**base_options, **carrier_options}
+
+
 class Options:
     """The options common processing helper"""
 
@@ -785,16 +882,12 @@ class Options:
         base_option_type: typing.Type[utils.Enum] = utils.Enum,
     ):
         option_values: typing.Dict[str, utils.OptionEnum] = {}
+        option_map = _option_map(option_type, base_option_type)
 
         for key, val in options.items():
-            if option_type is not None and key in option_type:
-                _val = option_type[key].value(val)
-                _key = option_type[key].name
-                option_values[_key] = _val
-            elif key in base_option_type and key:
-                _val = base_option_type[key].value(val)
-                _key = key
-                option_values[key] = _val
+            if key in option_map:
+                _key, _option = option_map[key]
+                option_values[_key] = _option(val)
 
         self._options = option_values
         self._option_list = self._filter(
@@ -1021,6 +1114,7 @@ class ConnectionConfigOption(utils.Enum):
     default_currency = utils.OptionEnum("default_currency")
     shipping_options = utils.OptionEnum("shipping_options", list)
     shipping_services = utils.OptionEnum("shipping_services", list)
+    timeout = utils.OptionEnum("timeout", float)
 
 
 class ConnectionConfigOptions(Options):
@@ -1049,6 +1143,10 @@ class ConnectionConfigOptions(Options):
     def shipping_services(self) -> utils.OptionEnum:
         return self[ConnectionConfigOption.shipping_services.name]
 
+    @property
+    def timeout(self) -> utils.OptionEnum:
+        return self[ConnectionConfigOption.timeout.name]
+
 
 class Services:
     """The services common processing helper"""
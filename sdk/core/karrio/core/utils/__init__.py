@@ -6,8 +6,44 @@ from karrio.core.utils.number import NUMBERFORMAT as NF
 from karrio.core.utils.datetime import DATEFORMAT as DF
 from karrio.core.utils.xml import XMLPARSER as XP, Element
 from karrio.core.utils.serializable import Serializable, Deserializable
-from karrio.core.utils.pipeline import Pipeline, Job
+from karrio.core.utils.pipeline import Pipeline, Job, Stage
 from karrio.core.utils.enum import Enum, Flag, OptionEnum, svcEnum
 from karrio.core.utils.tracing import Tracer, Record, Trace
 from karrio.core.utils.transformer import to_multi_piece_rates, to_multi_piece_shipment
-from karrio.core.utils.caching import Cache
+from karrio.core.utils.log import Payload, log_payload
+from karrio.core.utils.caching import Cache, AbstractCache, MemoryCache
+from karrio.core.utils.transport import (
+    AbstractTransport,
+    AbstractAsyncTransport,
+    UrllibTransport,
+    PooledTransport,
+    AsyncPooledTransport,
+    connection_context,
+    operation_context,
+    get_transport,
+    set_transport,
+    get_async_transport,
+    set_async_transport,
+)
+from karrio.core.utils.deadline import (
+    Deadline,
+    deadline_context,
+    get_deadline,
+    to_deadline,
+)
+from karrio.core.utils.resilience import (
+    CircuitBreaker,
+    RetryPolicy,
+    get_breaker,
+    set_breaker,
+    is_circuit_open,
+    get_retry_policy,
+    set_retry_policy,
+)
+from karrio.core.utils.executor import (
+    Executor,
+    ExecutorStats,
+    get_executor,
+    set_executor,
+    run_coroutine,
+)
@@ -1,55 +1,209 @@
+import attr
+import time
 import typing
+import threading
+import collections
 import concurrent.futures as futures
 
+DEFAULT_TIMEOUT = 86400
+DEFAULT_MAX_SIZE = 1000
+
 
 class AbstractCache:
+    """The cache backend protocol (e.g. `django.core.cache.cache`)."""
+
     def get(self, key: str):
         pass
 
     def set(self, key: str, value: typing.Any, **kwargs):
         pass
 
+    def delete(self, key: str):
+        pass
+
+
+@attr.s(auto_attribs=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    loads: int = 0
+    shared_loads: int = 0
+    evictions: int = 0
+
+    def increment(self, **counters):
+        for name, value in counters.items():
+            setattr(self, name, getattr(self, name) + value)
+
+
+class MemoryCache(AbstractCache):
+    """A thread safe LRU cache of `max_size` entries expiring after their timeout (in seconds)."""
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self.stats = CacheStats()
+        self._entries: typing.OrderedDict[
+            str, typing.Tuple[typing.Any, typing.Optional[float]]
+        ] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str):
+        with self._lock:
+            value, expires_at = self._entries.get(key, (None, None))
+
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                value = None
+
+            if value is None:
+                self.stats.increment(misses=1)
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats.increment(hits=1)
+
+            return value
+
+    def set(self, key: str, value: typing.Any, timeout: int = None, **kwargs):
+        expires_at = None if timeout is None else time.monotonic() + timeout
+
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats.increment(evictions=1)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+
 
 class Cache:
-    def __init__(self, cache: typing.Optional[AbstractCache] = None, **kwargs) -> None:
+    """The karrio (carrier settings) cache.
+
+    Values live in an in-process LRU (`max_size` entries, per key timeout)
+    written through to the system `cache` backend when one is provided.
+    Values missing in-process are read from the backend.
+
+    Setting a callable (e.g. a login) runs it once per key at a time:
+    concurrent `set`s (or `get_or_set`s) of the same key wait for the running
+    call and share its result instead of calling it again.
+    """
+
+    def __init__(
+        self,
+        cache: typing.Optional[AbstractCache] = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+        **kwargs,
+    ) -> None:
         self._cache = cache  # system cache
-        self._values: typing.Dict[str, futures.Future] = {}  # shallow cache
+        self._values = MemoryCache(max_size)  # shallow cache
+        self._flights: typing.Dict[str, futures.Future] = {}
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
 
         for key, value in kwargs.items():
             self.set(key, value)
 
     def get(self, key: str):
-        _value = self._values.get(key)
-        _cache_value = None if self._cache is None else self._cache.get(key)
-        _result = None
-
-        if _value is not None:
-            _result = _value.result()
-
-        if self._cache is not None and _cache_value is not None:
-            _result = _cache_value
+        flight = self._flights.get(key)
+        _result = flight.result() if flight is not None else self._values.get(key)
 
         # sync value in shallow cache if it only exist in the cache
-        if _value is None and _cache_value is not None:
-            self.set(key, _cache_value)
+        if _result is None and self._cache is not None:
+            _result = self._cache.get(key)
+
+            if _result is not None:
+                self._remember(key, _result, DEFAULT_TIMEOUT)
 
-        # sync value in cache if it only exist shallow cache
-        if _cache_value is None and _value is not None and self._cache is not None:
-            self._cache.set(key, _cache_value)
+        with self._lock:
+            self.stats.increment(
+                **(dict(hits=1) if _result is not None else dict(misses=1))
+            )
 
         return _result
 
-    def set(self, key: str, value: typing.Any, timeout: int = 86400):
-        def _save():
-            if isinstance(value, typing.Callable):
-                return value()
+    def set(self, key: str, value: typing.Any, timeout: int = DEFAULT_TIMEOUT):
+        if callable(value):
+            return self._load(key, value, timeout)
 
-            return value
+        self._save(key, value, timeout)
+
+        return value
+
+    def get_or_set(
+        self, key: str, value: typing.Any, timeout: int = DEFAULT_TIMEOUT
+    ) -> typing.Any:
+        """Return the cached value or set it (computing it once if callable)."""
+        _result = self.get(key)
+
+        if _result is not None:
+            return _result
+
+        if callable(value):
+            return self._load(key, value, timeout, reuse=True)
+
+        return self.set(key, value, timeout)
+
+    def delete(self, key: str):
+        self._values.delete(key)
+
+        if self._cache is not None:
+            self._cache.delete(key)
 
-        executor = futures.ThreadPoolExecutor(max_workers=1)
-        promise = executor.submit(_save)
-        self._values.update({key: promise})
+    def _remember(self, key: str, value: typing.Any, timeout: int):
+        self._values.set(key, value, timeout=timeout)
+
+        with self._lock:
+            self.stats.evictions = self._values.stats.evictions
+
+    def _save(self, key: str, value: typing.Any, timeout: int):
+        self._remember(key, value, timeout)
 
         # set value in cache if it exist
         if self._cache is not None:
-            promise.add_done_callback(lambda _: self._cache.set(key, _.result(), timeout=timeout))
+            self._cache.set(key, value, timeout=timeout)
+
+    def _load(
+        self,
+        key: str,
+        loader: typing.Callable[[], typing.Any],
+        timeout: int,
+        reuse: bool = False,
+    ):
+        with self._lock:
+            flight = self._flights.get(key)
+
+            if flight is not None:
+                self.stats.increment(shared_loads=1)
+            else:
+                self._flights[key] = futures.Future()
+
+        if flight is not None:
+            return flight.result()
+
+        flight = self._flights[key]
+        try:
+            # a concurrent caller may have loaded the value in the meantime
+            value = self._values.get(key) if reuse else None
+
+            if value is None:
+                value = loader()
+                self._save(key, value, timeout)
+
+                with self._lock:
+                    self.stats.increment(loads=1)
+
+            flight.set_result(value)
+
+            return value
+        except BaseException as error:
+            flight.set_exception(error)
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
@@ -0,0 +1,202 @@
+"""Fast paths for the generateDS schema types build and export.
+
+The generated modules resolve their support functions (`Tag_pattern_`,
+`showIndent`, `quote_xml`, `gds_parse_date`...) at call time for every node
+they build or export. They are replaced once per module by equivalent
+implementations: element tags are split without the regex (and cached),
+indentations precomputed, texts without markup characters returned as is and
+ISO dates parsed without `strptime`, so the produced objects and XML texts
+are unchanged.
+
+Only the modules of the `GENERATED_PACKAGES` whose header carries the marker
+of a `GENERATEDS_VERSIONS` release are patched: these releases all emit the
+same support functions.
+"""
+
+import re
+import sys
+import typing
+import datetime
+import threading
+
+MAX_TAGS = 4096
+TAG_PATTERN = r"({.*})?(.*)"
+INDENTS = ["    " * level for level in range(32)]
+ISO_DATE = re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII)
+ISO_DATETIME = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}", re.ASCII)
+GENERATEDS_MARKER = re.compile(r"by generateDS\.py version (\d+)\.(\d+)\.\d+")
+GENERATEDS_VERSIONS = ((2, 35), (2, 41))
+GENERATED_PACKAGES = [
+    "pysoap",
+    "aramex_lib",
+    "canadapost_lib",
+    "canpar_lib",
+    "dhl_express_lib",
+    "dhl_poland_lib",
+    "dpdhl_lib",
+    "eshipper_lib",
+    "fedex_lib",
+    "freightcom_lib",
+    "purolator_lib",
+    "tnt_lib",
+    "ups_lib",
+    "usps_lib",
+]
+
+_lock = threading.Lock()
+_accelerated: typing.Set[str] = set()
+
+
+class TagMatch:
+    """The `({.*})?(.*)` match of an element tag: its (namespace, local name) groups."""
+
+    __slots__ = ("_groups",)
+
+    def __init__(self, tag: str):
+        namespace, closed, name = tag.rpartition("}")
+        self._groups = (
+            (f"{namespace}}}", name) if closed and namespace[:1] == "{" else (None, tag)
+        )
+
+    def groups(self, default=None):
+        return tuple(default if group is None else group for group in self._groups)
+
+
+class TagPattern:
+    """A `Tag_pattern_` drop-in splitting the (cached) element tags without the regex."""
+
+    def __init__(self, pattern: typing.Pattern):
+        self.pattern = pattern
+        self.matches: typing.Dict[typing.Any, typing.Any] = {}
+
+    def match(self, tag, *args):
+        # (lxml comments and processing instructions tags are not strings)
+        if args or type(tag) is not str or "\n" in tag:
+            return self.pattern.match(tag, *args)
+
+        match = self.matches.get(tag)
+
+        if match is None:
+            match = TagMatch(tag)
+
+            if len(self.matches) < MAX_TAGS:
+                self.matches[tag] = match
+
+        return match
+
+    def __getattr__(self, name: str):
+        return getattr(self.pattern, name)
+
+
+def accelerate(element_type: typing.Any):
+    """Install the fast paths in the generated module of `element_type` (and its siblings).
+
+    Nothing is patched unless the module belongs to one of the `GENERATED_PACKAGES`
+    and was generated by one of the `GENERATEDS_VERSIONS`.
+    """
+    module_name = getattr(element_type, "__module__", None)
+
+    if module_name is None or module_name in _accelerated:
+        return
+
+    package = module_name.split(".")[0]
+    if package not in GENERATED_PACKAGES:
+        return
+
+    with _lock:
+        modules = [
+            (name, module)
+            for name, module in list(sys.modules.items())
+            if name == module_name or name.startswith(f"{package}.")
+        ]
+
+        for name, module in modules:
+            if name not in _accelerated and module is not None:
+                if is_generated(module):
+                    _install(vars(module))
+                _accelerated.add(name)
+
+        _accelerated.add(module_name)
+
+
+def is_generated(module: typing.Any) -> bool:
+    """Whether the module header carries the marker of a supported generateDS release."""
+    try:
+        with open(module.__file__, encoding="utf-8", errors="replace") as source:
+            marker = GENERATEDS_MARKER.search(source.read(1024))
+    except (AttributeError, TypeError, OSError):
+        return False
+
+    if marker is None:
+        return False
+
+    first, last = GENERATEDS_VERSIONS
+    return first <= (int(marker.group(1)), int(marker.group(2))) <= last
+
+
+def _install(namespace: dict):
+    pattern = namespace.get("Tag_pattern_")
+    if isinstance(pattern, re.Pattern) and pattern.pattern == TAG_PATTERN:
+        namespace["Tag_pattern_"] = TagPattern(pattern)
+
+    if callable(namespace.get("showIndent")):
+        namespace["showIndent"] = show_indent
+
+    if callable(namespace.get("quote_xml")):
+        namespace["quote_xml"] = _quote_xml(namespace["quote_xml"])
+
+    generated = namespace.get("GeneratedsSuper")
+    parsers = [
+        ("gds_parse_date", _parse_date),
+        ("gds_parse_datetime", _parse_datetime),
+    ]
+    for name, fast_path in parsers:
+        parser = vars(generated).get(name) if isinstance(generated, type) else None
+
+        if isinstance(parser, classmethod):
+            setattr(generated, name, classmethod(fast_path(parser.__func__)))
+
+
+def show_indent(outfile, level, pretty_print=True):
+    if pretty_print and level > 0:
+        outfile.write(INDENTS[level] if level < len(INDENTS) else "    " * level)
+
+
+def _quote_xml(quote_xml: typing.Callable[[typing.Any], str]):
+    def fast_quote_xml(inStr):
+        # exactly `str` only: enum members must be formatted by the generated code
+        if type(inStr) is str and not ("&" in inStr or "<" in inStr or ">" in inStr):
+            return inStr
+
+        return quote_xml(inStr)
+
+    return fast_quote_xml
+
+
+def _parse_date(parse_date: typing.Callable):
+    def fast_parse_date(cls, input_data):
+        if type(input_data) is str and ISO_DATE.fullmatch(input_data):
+            return datetime.date(
+                int(input_data[:4]), int(input_data[5:7]), int(input_data[8:10])
+            )
+
+        return parse_date(cls, input_data)
+
+    return fast_parse_date
+
+
+def _parse_datetime(parse_datetime: typing.Callable):
+    def fast_parse_datetime(cls, input_data):
+        if type(input_data) is str and ISO_DATETIME.fullmatch(input_data):
+            return datetime.datetime(
+                int(input_data[:4]),
+                int(input_data[5:7]),
+                int(input_data[8:10]),
+                int(input_data[11:13]),
+                int(input_data[14:16]),
+                int(input_data[17:19]),
+            )
+
+        return parse_datetime(cls, input_data)
+
+    return fast_parse_datetime
@@ -0,0 +1,88 @@
+"""Karrio request deadline (time budget) definitions."""
+
+import attr
+import time
+import typing
+import contextlib
+import contextvars
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class Deadline:
+    """The point in time (monotonic clock) by which carrier requests must complete.
+
+    Example:
+        Deadline.after(5)  # a 5 seconds budget
+    """
+
+    expires_at: float
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        return cls(expires_at=time.monotonic() + seconds)
+
+    @property
+    def remaining(self) -> float:
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining <= 0
+
+
+DEADLINE: contextvars.ContextVar = contextvars.ContextVar(
+    "karrio_deadline", default=None
+)
+
+
+def to_deadline(
+    value: typing.Union[Deadline, float, int, None]
+) -> typing.Optional[Deadline]:
+    """Return a deadline from a budget in seconds (or a deadline)."""
+    if value is None or isinstance(value, Deadline):
+        return value
+
+    return Deadline.after(float(value))
+
+
+def get_deadline(
+    value: typing.Union[Deadline, float, int, None] = None
+) -> typing.Optional[Deadline]:
+    """Return the deadline in effect: the earliest of the current one and `value` (if any)."""
+    deadline = to_deadline(value)
+    current = DEADLINE.get()
+
+    if deadline is None or (current is not None and current <= deadline):
+        return current
+
+    return deadline
+
+
+@contextlib.contextmanager
+def deadline_context(value: typing.Union[Deadline, float, int, None]):
+    """Bind a deadline (or a budget in seconds) to every request sent within the block.
+
+    A deadline never extends the one already in effect: the earliest applies.
+    """
+    token = DEADLINE.set(get_deadline(value))
+    try:
+        yield DEADLINE.get()
+    finally:
+        DEADLINE.reset(token)
+
+
+def request_timeout(timeout: typing.Optional[float] = None) -> typing.Optional[float]:
+    """Return the timeout of a request sent now: its own `timeout` capped by the deadline.
+
+    Raises:
+        TimeoutError: if the deadline already expired
+    """
+    deadline = DEADLINE.get()
+
+    if deadline is None:
+        return timeout
+
+    if deadline.expired:
+        raise TimeoutError("the request deadline expired before it was sent")
+
+    return deadline.remaining if timeout is None else min(timeout, deadline.remaining)
@@ -2,9 +2,12 @@ import enum
 import attr
 import json
 import types
-import jstruct.utils as jstruct
-from typing import Union, Any, TypeVar, Callable, Type, Optional
+import typing
+import logging
+import functools
+from typing import Union, Any, TypeVar, Callable, Type, Optional, Dict, Tuple
 
+logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
@@ -19,7 +22,7 @@ class DICTPARSE:
 
         def _parser(item):
             if attr.has(item):
-                if isinstance(item, Callable) and hasattr(item, "__name__"):
+                if callable(item) and hasattr(item, "__name__"):
                     return item.__name__
                 return attr.asdict(item)
             if isinstance(item, types.FunctionType):
@@ -50,18 +53,18 @@ class DICTPARSE:
         :return: a dictionary.
         """
         _clear_empty = clear_empty is not False
-        return json.loads(
-            (
-                DICTPARSE.jsonify(entity)
-                if not isinstance(entity, (str, bytes))
-                else entity
-            ),
-            object_hook=lambda d: {
-                k: v
-                for k, v in d.items()
-                if (v not in (None, [], "") if _clear_empty else True)
-            },
-        )
+
+        if isinstance(entity, (str, bytes)):
+            return json.loads(
+                entity,
+                object_hook=lambda d: {
+                    k: v
+                    for k, v in d.items()
+                    if (v not in (None, [], "") if _clear_empty else True)
+                },
+            )
+
+        return _to_builtin(entity, _clear_empty)
 
     @staticmethod
     def to_object(object_type: Type[T], data: dict = None) -> Optional[T]:
@@ -74,5 +77,210 @@ class DICTPARSE:
         if data is None or object_type is None:
             return None
 
-        entity: object_type = jstruct.instantiate(object_type, data)  # type: ignore
+        entity: object_type = _instantiate(object_type, data)  # type: ignore
         return entity
+
+
+# -----------------------------------------------------------
+# to_dict: a direct walk producing what a `json.loads(jsonify(entity))`
+# round trip returns (sorted keys, JSON compatible values).
+# -----------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=None)
+def _attrs_fields(cls: type) -> Optional[Tuple[str, ...]]:
+    """Return the sorted attrs field names of a class (None if not an attrs class)."""
+    if getattr(cls, "__attrs_attrs__", None) is None:
+        return None
+
+    return tuple(sorted(field.name for field in attr.fields(cls)))
+
+
+def _to_builtin(value: Any, clear_empty: bool, in_attrs: bool = False) -> Any:
+    _type = value.__class__
+
+    if value is None or _type is str or _type is int or _type is float:
+        return value
+    if _type is bool:
+        return value
+    if _type is list or _type is tuple:
+        return [_to_builtin(item, clear_empty, in_attrs) for item in value]
+    if _type is dict:
+        return _dict_to_builtin(value, clear_empty, in_attrs)
+
+    if in_attrs:
+        fields = _attrs_fields(_type)
+        if fields is not None:
+            return _attrs_to_builtin(value, fields, clear_empty)
+
+    if isinstance(value, str):
+        return str.__str__(value)
+    if isinstance(value, int):
+        return int.__int__(value)
+    if isinstance(value, float):
+        return float.__float__(value)
+    if isinstance(value, (list, tuple)) or (
+        in_attrs and isinstance(value, (set, frozenset))
+    ):
+        return [_to_builtin(item, clear_empty, in_attrs) for item in value]
+    if isinstance(value, dict):
+        return _dict_to_builtin(value, clear_empty, in_attrs)
+
+    return _default_to_builtin(value, clear_empty)
+
+
+def _default_to_builtin(item: Any, clear_empty: bool) -> Any:
+    """Mirror `DICTPARSE.jsonify` handling of non JSON native values."""
+    if getattr(item, "__attrs_attrs__", None) is not None:
+        if callable(item) and hasattr(item, "__name__"):
+            return item.__name__
+        return _attrs_to_builtin(item, _attrs_fields(item.__class__), clear_empty)
+    if isinstance(item, types.FunctionType):
+        return None
+    if isinstance(item, type):
+        return str(item)
+    if callable(item):
+        return str(item)
+    if isinstance(item, enum.Enum):
+        return _to_builtin(item.value, clear_empty)
+    if hasattr(item, "__dict__"):
+        return _to_builtin(item.__dict__, clear_empty)
+
+    raise ValueError("Circular reference detected")
+
+
+def _attrs_to_builtin(
+    entity: Any, fields: Tuple[str, ...], clear_empty: bool
+) -> Dict[str, Any]:
+    result = {
+        name: _to_builtin(getattr(entity, name), clear_empty, True) for name in fields
+    }
+
+    return _clear(result) if clear_empty else result
+
+
+def _dict_to_builtin(value: dict, clear_empty: bool, in_attrs: bool) -> dict:
+    result = {
+        _key_to_builtin(key): _to_builtin(item, clear_empty, in_attrs)
+        for key, item in sorted(value.items())
+    }
+
+    return _clear(result) if clear_empty else result
+
+
+def _key_to_builtin(key: Any) -> str:
+    if isinstance(key, str):
+        return str.__str__(key)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        return json.dumps(float.__float__(key))
+
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {key.__class__.__name__}"
+    )
+
+
+def _clear(result: dict) -> dict:
+    return {
+        key: value
+        for key, value in result.items()
+        if not (value is None or value == [] or value == "")
+    }
+
+
+# -----------------------------------------------------------
+# to_object: `jstruct` instantiation with the nested struct types of each
+# class resolved once from its fields annotations.
+# -----------------------------------------------------------
+
+
+@functools.lru_cache(maxsize=None)
+def _object_plan(cls: type) -> Tuple[frozenset, Dict[str, Callable]]:
+    """Return the supported argument names of a class and the builders of its nested structs."""
+    annotations = frozenset(getattr(cls, "__annotations__", {}))
+    fields = attr.fields_dict(cls) if attr.has(cls) else {}
+    hints = _field_types(cls) if any(fields) else {}
+    builders = {
+        name: builder
+        for name, field in fields.items()
+        if name in annotations and _is_jstruct_converter(field.converter)
+        for builder in [_nested_builder(hints.get(name, field.type))]
+        if builder is not None
+    }
+
+    return annotations, builders
+
+
+def _field_types(cls: type) -> Dict[str, Any]:
+    try:
+        return typing.get_type_hints(cls)
+    except Exception:
+        return {}
+
+
+def _is_jstruct_converter(converter: Any) -> bool:
+    return (getattr(converter, "__module__", None) or "").split(".")[0] == "jstruct"
+
+
+def _nested_builder(field_type: Any) -> Optional[Callable]:
+    """Return a builder for the attrs struct type(s) a field is annotated with.
+
+    Only the `X`, `Optional[X]`, `List[X]` and `Dict[K, X]` shapes are resolved: any
+    other annotation returns None and leaves the field to its jstruct converter.
+    """
+    origin, args = typing.get_origin(field_type), typing.get_args(field_type)
+
+    if origin is Union:
+        members = [arg for arg in args if arg is not type(None)]
+        return _nested_builder(members[0]) if len(members) == 1 else None
+
+    if origin is list and len(args) == 1 and attr.has(args[0]):
+        class_ = args[0]
+        return lambda value: [
+            _instantiate(class_, item) if isinstance(item, dict) else item
+            for item in (value if isinstance(value, list) else [value])
+        ]
+
+    if origin is dict and len(args) == 2 and attr.has(args[1]):
+        key_type, value_type = args
+        convert_key = key_type if key_type in (str, int, float) else (lambda key: key)
+        return lambda value: {
+            convert_key(key): (
+                _instantiate(value_type, item) if isinstance(item, dict) else item
+            )
+            for key, item in value.items()
+        }
+
+    if origin is None and isinstance(field_type, type) and attr.has(field_type):
+        class_ = field_type
+        return lambda value: (
+            _instantiate(class_, value) if isinstance(value, dict) else value
+        )
+
+    return None
+
+
+def _instantiate(cls: type, data: dict) -> Any:
+    annotations, builders = _object_plan(cls)
+    supported_args = {}
+    unsupported_args = {}
+
+    for key, value in data.items():
+        if key not in annotations:
+            unsupported_args[key] = value
+        elif key in builders:
+            supported_args[key] = builders[key](value)
+        else:
+            supported_args[key] = value
+
+    if any(unsupported_args.items()):
+        logger.warning(f"unknown arguments {unsupported_args}")
+
+    return cls(**supported_args)
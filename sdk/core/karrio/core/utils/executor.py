@@ -0,0 +1,387 @@
+"""Karrio shared task executor definitions."""
+
+import attr
+import time
+import asyncio
+import atexit
+import typing
+import logging
+import threading
+import contextvars
+import collections
+import concurrent.futures as futures
+from karrio.core.utils.transport import CONTEXT
+
+logger = logging.getLogger(__name__)
+
+T = typing.TypeVar("T")
+MAX_WORKERS = 64
+CARRIER_MAX_WORKERS = 10
+
+
+@attr.s(auto_attribs=True)
+class ExecutorStats:
+    submitted: int = 0
+    started: int = 0
+    completed: int = 0
+    failed: int = 0
+    cancelled: int = 0
+    inlined: int = 0
+    queued: int = 0
+    running: int = 0
+    wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+    @property
+    def average_wait_time(self) -> float:
+        return self.wait_time / self.started if self.started else 0.0
+
+    def increment(self, **counters):
+        for name, value in counters.items():
+            setattr(self, name, getattr(self, name) + value)
+
+
+@attr.s(auto_attribs=True, eq=False)
+class _Lane:
+    limit: int
+    running: int = 0
+    pending: typing.Deque["_Task"] = attr.Factory(collections.deque)
+    stats: ExecutorStats = attr.Factory(ExecutorStats)
+
+
+@attr.s(auto_attribs=True, eq=False)
+class _Task:
+    function: typing.Callable
+    item: typing.Any
+    lane: _Lane
+    context: contextvars.Context = attr.Factory(contextvars.copy_context)
+    future: futures.Future = attr.Factory(futures.Future)
+    queued_at: float = attr.Factory(time.monotonic)
+
+
+class Executor:
+    """A process wide thread executor bounding the tasks run concurrently.
+
+    Tasks are queued per carrier (from the connection context they are
+    submitted in) and only started while both the global `max_workers` cap and
+    the carrier cap (`carrier_limits[carrier_name]` or `carrier_max_workers`)
+    allow it. Tasks submitted outside of a carrier connection context only
+    count against the global cap.
+
+    A task that fans out more tasks (e.g. a rate request over many gateways
+    where each proxy tracks parcels concurrently) runs the ones still queued
+    itself instead of holding a worker idle, so nesting can't deadlock.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = MAX_WORKERS,
+        carrier_max_workers: int = CARRIER_MAX_WORKERS,
+        carrier_limits: typing.Dict[str, int] = None,
+    ):
+        self.max_workers = max_workers
+        self.carrier_max_workers = carrier_max_workers
+        self.carrier_limits = carrier_limits or {}
+        self.stats = ExecutorStats()
+        self._lanes: typing.Dict[typing.Optional[str], _Lane] = {}
+        self._running = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._local = threading.local()
+        self._pool = futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="karrio"
+        )
+
+    @property
+    def carrier_stats(self) -> typing.Dict[str, ExecutorStats]:
+        with self._lock:
+            return {
+                name: attr.evolve(lane.stats)
+                for name, lane in self._lanes.items()
+                if name is not None
+            }
+
+    def submit(self, function: typing.Callable, item: typing.Any) -> futures.Future:
+        """Schedule `function(item)` in the caller's context and return its future."""
+        return self._submit(function, item).future
+
+    def map(
+        self,
+        function: typing.Callable,
+        sequence: typing.Iterable,
+        max_workers: int = None,
+        ordered: bool = True,
+        carrier: typing.Callable[[typing.Any], typing.Optional[str]] = None,
+    ) -> typing.List:
+        """Return the results of `function` applied to every item of the sequence.
+
+        :param max_workers: the number of items of this call allowed in flight at once.
+        :param ordered: return the results in the sequence order (or completion order).
+        :param carrier: the carrier (queue) of each item instead of the caller's one.
+        """
+        items = list(sequence)
+        results: typing.List = [None] * len(items) if ordered else []
+
+        for index, result in self.as_completed(
+            function, items, max_workers, carrier=carrier
+        ):
+            if ordered:
+                results[index] = result
+            else:
+                results.append(result)
+
+        return results
+
+    def as_completed(
+        self,
+        function: typing.Callable,
+        sequence: typing.Iterable,
+        max_workers: int = None,
+        timeout: float = None,
+        carrier: typing.Callable[[typing.Any], typing.Optional[str]] = None,
+    ) -> typing.Iterator[typing.Tuple[int, typing.Any]]:
+        """Yield the `(index, result)` of `function` applied to every item as they complete.
+
+        The items still queued are cancelled when the iteration stops early.
+
+        :param max_workers: the number of items of this call allowed in flight at once.
+        :param timeout: stop (without the pending items results) after that many seconds.
+        :param carrier: the carrier (queue) of each item instead of the caller's one.
+        """
+        expires_at = None if timeout is None else time.monotonic() + timeout
+        items = list(sequence)
+        items_iterator = iter(enumerate(items))
+        limit = max_workers or len(items)
+        tasks: typing.Dict[futures.Future, typing.Tuple[int, _Task]] = {}
+
+        def fill():
+            for index, item in items_iterator:
+                task = self._submit(
+                    function, item, None if carrier is None else carrier(item)
+                )
+                tasks[task.future] = (index, task)
+                if len(tasks) >= limit:
+                    break
+
+        try:
+            fill()
+            while any(tasks):
+                if getattr(self._local, "worker", False):
+                    task = self._steal([task for _, task in tasks.values()])
+                    if task is not None:
+                        self._execute(task, inlined=1)
+
+                done, _ = futures.wait(
+                    tasks.keys(),
+                    timeout=(
+                        None
+                        if expires_at is None
+                        else max(expires_at - time.monotonic(), 0)
+                    ),
+                    return_when=futures.FIRST_COMPLETED,
+                )
+                if not any(done):
+                    return
+
+                for future in done:
+                    index, _ = tasks.pop(future)
+                    yield index, future.result()
+                fill()
+        finally:
+            for future in tasks:
+                future.cancel()
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        """Stop accepting tasks; optionally cancel the queued ones and wait for the rest."""
+        with self._lock:
+            self._closed = True
+
+            if cancel_futures:
+                for lane in self._lanes.values():
+                    while any(lane.pending):
+                        lane.pending.popleft().future.cancel()
+                        self._count(lane, queued=-1, cancelled=1)
+
+            if wait:
+                self._idle.wait_for(self._drained)
+
+            if self._drained():
+                self._pool.shutdown(wait=wait)
+
+    def _submit(
+        self,
+        function: typing.Callable,
+        item: typing.Any,
+        carrier_name: typing.Optional[str] = None,
+    ) -> _Task:
+        carrier_name = carrier_name or CONTEXT.get().carrier_name
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("cannot schedule new tasks after shutdown")
+
+            task = _Task(function, item, self._lane(carrier_name))
+            task.lane.pending.append(task)
+            self._count(task.lane, submitted=1, queued=1)
+            self._dispatch()
+
+        return task
+
+    def _lane(self, carrier_name: typing.Optional[str]) -> _Lane:
+        if carrier_name not in self._lanes:
+            self._lanes[carrier_name] = _Lane(
+                limit=(
+                    self.max_workers
+                    if carrier_name is None
+                    else self.carrier_limits.get(carrier_name, self.carrier_max_workers)
+                )
+            )
+
+        return self._lanes[carrier_name]
+
+    def _count(self, lane: _Lane, **counters):
+        self.stats.increment(**counters)
+        lane.stats.increment(**counters)
+
+    def _drained(self) -> bool:
+        return self._running == 0 and not any(
+            any(lane.pending) for lane in self._lanes.values()
+        )
+
+    def _dispatch(self):
+        """Start the queued tasks the caps allow (the lock must be held)."""
+        for lane in self._lanes.values():
+            while (
+                any(lane.pending)
+                and lane.running < lane.limit
+                and self._running < self.max_workers
+            ):
+                task = lane.pending.popleft()
+                lane.running += 1
+                self._running += 1
+
+                try:
+                    self._pool.submit(self._run, task)
+                except RuntimeError as error:
+                    lane.running -= 1
+                    self._running -= 1
+                    self._count(lane, queued=-1, failed=1)
+                    task.future.set_exception(error)
+
+    def _steal(self, tasks: typing.List[_Task]) -> typing.Optional[_Task]:
+        with self._lock:
+            for task in tasks:
+                if task in task.lane.pending:
+                    task.lane.pending.remove(task)
+                    return task
+
+        return None
+
+    def _run(self, task: _Task):
+        self._local.worker = True
+
+        try:
+            self._execute(task)
+        finally:
+            with self._lock:
+                task.lane.running -= 1
+                self._running -= 1
+                self._dispatch()
+
+                if self._drained():
+                    self._idle.notify_all()
+                    if self._closed:
+                        self._pool.shutdown(wait=False)
+
+    def _execute(self, task: _Task, inlined: int = 0):
+        if not task.future.set_running_or_notify_cancel():
+            with self._lock:
+                self._count(task.lane, queued=-1, cancelled=1)
+            return
+
+        wait_time = time.monotonic() - task.queued_at
+        with self._lock:
+            self._count(
+                task.lane,
+                queued=-1,
+                running=1,
+                started=1,
+                inlined=inlined,
+                wait_time=wait_time,
+            )
+            for stats in (self.stats, task.lane.stats):
+                stats.max_wait_time = max(stats.max_wait_time, wait_time)
+
+        try:
+            result = task.context.run(task.function, task.item)
+        except BaseException as error:
+            task.future.set_exception(error)
+            outcome = dict(failed=1)
+        else:
+            task.future.set_result(result)
+            outcome = dict(completed=1)
+
+        with self._lock:
+            self._count(task.lane, running=-1, **outcome)
+
+
+_executor: typing.Optional[Executor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> Executor:
+    """Return the process wide executor used by `lib.run_concurently` and `lib.run_asynchronously`."""
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = Executor()
+
+    return _executor
+
+
+def set_executor(executor: Executor) -> Executor:
+    """Replace the process wide executor, gracefully shutting down the previous one."""
+    global _executor
+
+    with _executor_lock:
+        previous, _executor = _executor, executor
+
+    if previous is not None and previous is not executor:
+        previous.shutdown(wait=True)
+
+    return executor
+
+
+_loop: typing.Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: typing.Optional[threading.Thread] = None
+
+
+def run_coroutine(coroutine: typing.Coroutine[typing.Any, typing.Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code and return its result.
+
+    The coroutine runs (with the caller context variables) on a dedicated event
+    loop thread, so this can be called from a thread already running a loop.
+    """
+    global _loop, _loop_thread
+
+    with _executor_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(
+                target=_loop.run_forever, name="karrio-coroutines", daemon=True
+            )
+            _loop_thread.start()
+
+    if threading.current_thread() is _loop_thread:
+        coroutine.close()
+        raise RuntimeError("run_coroutine cannot wait on its own event loop thread")
+
+    return asyncio.run_coroutine_threadsafe(coroutine, _loop).result()
+
+
+@atexit.register
+def _shutdown_executor():
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
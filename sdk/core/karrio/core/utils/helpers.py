@@ -1,18 +1,44 @@
 import io
 import re
+import sys
+import time
 import ssl
 import uuid
 import string
-import base64
 import asyncio
+import base64
 import logging
+import importlib
 import urllib.parse
 from PyPDF2 import PdfMerger
 from PIL import Image, ImageFile
 from urllib.error import HTTPError
-from urllib.request import urlopen, Request
-from typing import List, TypeVar, Callable, Optional, Any, cast
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.request import Request
+from typing import (
+    List,
+    Dict,
+    TypeVar,
+    Callable,
+    Optional,
+    Any,
+    Iterator,
+    Tuple,
+    Union,
+    Sequence,
+    BinaryIO,
+    cast,
+)
+import karrio.core.errors as errors
+from karrio.core.utils.executor import get_executor
+from karrio.core.utils.deadline import request_timeout
+from karrio.core.utils.resilience import Call, get_breaker, get_retry_policy
+from karrio.core.utils.transport import (
+    CONTEXT,
+    AbstractTransport,
+    AbstractAsyncTransport,
+    get_transport,
+    get_async_transport,
+)
 
 logger = logging.getLogger(__name__)
 ssl._create_default_https_context = ssl._create_unverified_context
@@ -21,6 +47,7 @@ T = TypeVar("T")
 S = TypeVar("S")
 NEW_LINE = """
 """
+Document = Union[str, bytes, bytearray, memoryview]  # base64 string or raw content
 
 
 def identity(value: Any) -> Any:
@@ -44,47 +71,72 @@ def to_buffer(encoded_file: str, **kwargs) -> io.BytesIO:
     return buffer
 
 
-def image_to_pdf(image_str: str, rotate: int = None, resize: dict = None) -> str:
-    buffer = to_buffer(image_str)
-    _image = Image.open(buffer)
+def document_content(document: Document) -> Union[bytes, memoryview]:
+    """Return the raw content of a document (a base64 string or bytes-like content)."""
+    if isinstance(document, str):
+        return base64.b64decode(document)
+
+    if isinstance(document, bytes):
+        return document
+
+    return memoryview(document)
+
+
+def document_base64(document: Document) -> str:
+    """Return the base64 string of a document (a base64 string or bytes-like content)."""
+    if isinstance(document, str):
+        return document
 
-    image = (
-        _image.rotate(rotate, Image.NEAREST, expand=True)
+    return base64.b64encode(document).decode("utf-8")
+
+
+def image_to_pdf_bytes(
+    image: Document, rotate: int = None, resize: dict = None
+) -> bytes:
+    source = Image.open(io.BytesIO(document_content(image)))
+
+    _image = (
+        source.rotate(rotate, Image.NEAREST, expand=True)
         if rotate is not None
-        else _image
+        else source
     )
 
     if resize is not None:
-        img = image.copy()
+        img = _image.copy()
         wpercent = resize["width"] / float(img.size[0])
         hsize = int((float(img.size[1]) * float(wpercent)))
-        image = img.resize((resize["width"], hsize), Image.Resampling.LANCZOS)
+        _image = img.resize((resize["width"], hsize), Image.Resampling.LANCZOS)
 
     if resize is not None:
-        img = image.copy()
-        image = img.resize((resize["width"], resize["height"]), Image.ANTIALIAS)
+        img = _image.copy()
+        _image = img.resize((resize["width"], resize["height"]), Image.ANTIALIAS)
 
     new_buffer = io.BytesIO()
-    image.save(new_buffer, format="PDF", dpi=(300, 300))
+    _image.save(new_buffer, format="PDF", dpi=(300, 300))
+
+    return new_buffer.getvalue()
+
 
-    return base64.b64encode(new_buffer.getvalue()).decode("utf-8")
+def image_to_pdf(image_str: Document, rotate: int = None, resize: dict = None) -> str:
+    content = image_to_pdf_bytes(image_str, rotate=rotate, resize=resize)
 
+    return base64.b64encode(content).decode("utf-8")
 
-def bundle_pdfs(base64_strings: List[str]) -> PdfMerger:
+
+def bundle_pdfs(documents: Sequence[Document]) -> PdfMerger:
     merger = PdfMerger(strict=False)
 
-    for b64_str in base64_strings:
-        buffer = to_buffer(b64_str)
-        merger.append(buffer)
+    for document in documents:
+        # BytesIO shares the (bytes) content instead of copying it
+        merger.append(io.BytesIO(document_content(document)))
 
     return merger
 
 
-def bundle_imgs(base64_strings: List[str]) -> Image:
-    image_buffers = [
-        io.BytesIO(base64.b64decode(b64_str)) for b64_str in base64_strings
+def bundle_imgs(documents: Sequence[Document]) -> Image:
+    images = [
+        Image.open(io.BytesIO(document_content(document))) for document in documents
     ]
-    images = [Image.open(buffer) for buffer in image_buffers]
     widths, heights = zip(*(i.size for i in images))
 
     max_width = max(widths)
@@ -100,46 +152,53 @@ def bundle_imgs(base64_strings: List[str]) -> Image:
     return image
 
 
-def bundle_zpls(base64_strings: List[str]) -> str:
-    doc = ""
-    for b64_str in base64_strings:
-        doc += f'{base64.b64decode(b64_str).decode("utf-8")}{NEW_LINE}'
-
-    return doc
-
+def bundle_zpls(documents: Sequence[Document]) -> str:
+    return "".join(
+        f'{bytes(document_content(document)).decode("utf-8")}{NEW_LINE}'
+        for document in documents
+    )
 
-def bundle_base64(base64_strings: List[str], format: str = "PDF") -> str:
-    """Return a base64 string from a list of base64 strings."""
-    result = io.BytesIO()
 
+def write_bundle(
+    documents: Sequence[Document], sink: BinaryIO, format: str = "PDF"
+) -> BinaryIO:
+    """Write the bundle of a list of documents (base64 strings or bytes) into a file-like sink."""
     if format == "PDF":
-        pdf_buffer = bundle_pdfs(base64_strings)
-        pdf_buffer.write(result)
+        merger = bundle_pdfs(documents)
+        merger.write(sink)
+        merger.close()
 
     elif "ZPL" in format:
-        content = bundle_zpls(base64_strings)
-        result.write(content.encode("utf-8"))
+        for document in documents:
+            sink.write(document_content(document))
+            sink.write(NEW_LINE.encode("utf-8"))
 
     else:
-        image = bundle_imgs(base64_strings)
-        image.save(result, format)
+        image = bundle_imgs(documents)
+        image.save(sink, format)
+
+    return sink
 
-    return base64.b64encode(result.getvalue()).decode("utf-8")
 
+def bundle_bytes(documents: Sequence[Document], format: str = "PDF") -> bytes:
+    """Return the bundle content of a list of documents (base64 strings or bytes)."""
+    return cast(io.BytesIO, write_bundle(documents, io.BytesIO(), format)).getvalue()
 
-def zpl_to_pdf(zpl_str: str, width: int, height: int, dpmm: int = 12) -> str:
-    """Return a PDF base64 string from a ZPL string."""
-    import karrio.lib as lib
 
-    data = lib.to_json(dict(file=base64.b64decode(zpl_str).decode("utf-8")))
-    doc = request(
-        url=f"http://api.labelary.com/v1/printers/{dpmm}dpmm/labels/{width}x{height}/",
-        data=data,
-        headers={"Accept": "application/pdf"},
-        decoder=lambda b: base64.encodebytes(b).decode("utf-8"),
+def bundle_base64(base64_strings: Sequence[Document], format: str = "PDF") -> str:
+    """Return a base64 string from a list of base64 strings (or documents bytes)."""
+    return base64.b64encode(bundle_bytes(base64_strings, format)).decode("utf-8")
+
+
+def zpl_to_pdf(zpl_str: Document, width: int, height: int, dpmm: int = 12) -> str:
+    """Return a PDF base64 string from a ZPL document (rendered locally and cached)."""
+    import karrio.addons.zpl as zpl
+
+    content = zpl.to_pdf(
+        decode_bytes(bytes(document_content(zpl_str))), width, height, dpmm=dpmm
     )
 
-    return doc
+    return base64.b64encode(content).decode("utf-8")
 
 
 def decode_bytes(byte):
@@ -220,28 +279,133 @@ def process_error(
     return _error
 
 
+def is_timeout(error: Exception) -> bool:
+    return isinstance(error, (TimeoutError, asyncio.TimeoutError)) or isinstance(
+        getattr(error, "reason", None), TimeoutError
+    )
+
+
+def request_method(**kwargs) -> str:
+    return kwargs.get("method") or ("POST" if "data" in kwargs else "GET")
+
+
+def process_timeout(
+    request_id: str,
+    error: Exception,
+    trace: Callable[[Any, str], Any] = None,
+) -> errors.CarrierTimeoutError:
+    logger.error(error, exc_info=False)
+    _error = errors.CarrierTimeoutError(CONTEXT.get().carrier_name)
+
+    if trace:
+        trace({"request_id": request_id, "error": f"{_error}"}, "error")
+
+    return _error
+
+
 def request(
     decoder: Callable = decode_bytes,
     on_error: Callable[[HTTPError], str] = None,
     trace: Callable[[Any, str], Any] = None,
+    transport: AbstractTransport = None,
+    timeout: float = None,
     **kwargs,
 ) -> str:
     """Return an HTTP response body.
 
     make a http request (wrapper around Request method from built in urllib)
+    sent through the process wide (pooled keep-alive) transport by default.
+    the `timeout` (in seconds) is capped by the deadline in effect (see `deadline_context`)
+    and a `CarrierTimeoutError` is raised when it is exceeded.
+    idempotent requests are retried following the process wide retry policy (if any) and
+    a `CarrierUnavailableError` is raised while the connection circuit breaker is open.
     """
 
     _request_id = str(uuid.uuid4())
+    _call = Call(request_method(**kwargs), get_breaker(), get_retry_policy())
     logger.debug(f"sending request ({_request_id})...")
 
-    try:
-        _request = process_request(_request_id, trace, **kwargs)
+    while True:
+        try:
+            _timeout = request_timeout(timeout)
+            _call.start()
+            _request = process_request(_request_id, trace, **kwargs)
+            _content = (transport or get_transport()).send(_request, timeout=_timeout)
+
+        except HTTPError as e:
+            _delay = _call.completed(e)
+            if _delay is None:
+                _response = process_error(
+                    _request_id, e, on_error=on_error, trace=trace
+                )
+                break
+
+        except OSError as e:  # connection errors (URLError) and timeouts
+            _delay = _call.completed(e)
+            if _delay is None:
+                if not is_timeout(e):
+                    raise
+
+                raise process_timeout(_request_id, e, trace=trace) from e
+
+        else:
+            _call.completed()
+            _response = process_response(_request_id, _content, decoder, trace=trace)
+            break
+
+        time.sleep(_delay)
+
+    return _response
+
+
+async def request_async(
+    decoder: Callable = decode_bytes,
+    on_error: Callable[[HTTPError], str] = None,
+    trace: Callable[[Any, str], Any] = None,
+    transport: AbstractAsyncTransport = None,
+    timeout: float = None,
+    **kwargs,
+) -> str:
+    """Return an HTTP response body.
 
-        with urlopen(_request) as f:
-            _response = process_response(_request_id, f.read(), decoder, trace=trace)
+    the asyncio counterpart of `request`: no thread is held while waiting for the response.
+    """
 
-    except HTTPError as e:
-        _response = process_error(_request_id, e, on_error=on_error, trace=trace)
+    _request_id = str(uuid.uuid4())
+    _call = Call(request_method(**kwargs), get_breaker(), get_retry_policy())
+    logger.debug(f"sending request ({_request_id})...")
+
+    while True:
+        try:
+            _timeout = request_timeout(timeout)
+            _call.start()
+            _request = process_request(_request_id, trace, **kwargs)
+            _content = await (transport or get_async_transport()).send(
+                _request, timeout=_timeout
+            )
+
+        except HTTPError as e:
+            _delay = _call.completed(e)
+            if _delay is None:
+                _response = process_error(
+                    _request_id, e, on_error=on_error, trace=trace
+                )
+                break
+
+        except (OSError, asyncio.TimeoutError) as e:
+            _delay = _call.completed(e)
+            if _delay is None:
+                if not is_timeout(e):
+                    raise
+
+                raise process_timeout(_request_id, e, trace=trace) from e
+
+        else:
+            _call.completed()
+            _response = process_response(_request_id, _content, decoder, trace=trace)
+            break
+
+        await asyncio.sleep(_delay)
 
     return _response
 
@@ -249,28 +413,157 @@ def request(
 def exec_parrallel(
     function: Callable, sequence: List[S], max_workers: int = None
 ) -> List[T]:
-    """Return a list of result for function execution on each element of the sequence."""
-    workers = len(sequence) or max_workers or 2
-    with ThreadPoolExecutor(max_workers=workers) as executor:
-        requests = {executor.submit(function, item): item for item in sequence}
-        return [response.result() for response in as_completed(requests)]
+    """Return a list of result for function execution on each element of the sequence.
+
+    the results are returned in completion order and `max_workers` (when set) caps the
+    number of elements in flight for this call on top of the shared executor caps.
+    """
+    return get_executor().map(
+        function, sequence, max_workers=max_workers, ordered=False
+    )
+
+
+def exec_async(
+    action: Callable,
+    sequence: List[S],
+    timeout: float = None,
+    on_timeout: Callable[[S], T] = None,
+    carrier: Callable[[S], Optional[str]] = None,
+) -> List[T]:
+    """Return a list of result for action execution on each element of the sequence (in order).
+
+    the elements not completed within `timeout` seconds get `on_timeout(element)` as result
+    and `carrier(element)` (when set) is the executor carrier queue of each element.
+    """
+    items = list(sequence)
+
+    if timeout is None:
+        return cast(List[T], get_executor().map(action, items, carrier=carrier))
+
+    results = dict(
+        get_executor().as_completed(action, items, timeout=timeout, carrier=carrier)
+    )
+
+    return [
+        results[index] if index in results else cast(Callable, on_timeout)(item)
+        for index, item in enumerate(items)
+    ]
+
+
+def exec_as_completed(
+    action: Callable,
+    sequence: List[S],
+    timeout: float = None,
+    on_timeout: Callable[[S], T] = None,
+    carrier: Callable[[S], Optional[str]] = None,
+) -> Iterator[T]:
+    """Yield the result of action execution on each element of the sequence as soon as it completes.
+
+    the elements not completed within `timeout` seconds yield `on_timeout(element)` last
+    and `carrier(element)` (when set) is the executor carrier queue of each element.
+    """
+    items = list(sequence)
+    completed = set()
+
+    for index, result in get_executor().as_completed(
+        action, items, timeout=timeout, carrier=carrier
+    ):
+        completed.add(index)
+        yield result
+
+    for index, item in enumerate(items):
+        if index not in completed:
+            yield cast(Callable, on_timeout)(item)
+
+
+def exec_multi_piece(
+    children: List[S],
+    submit: Callable[[S], T],
+    master: T = None,
+    failed: Callable[[T], bool] = None,
+    cancel: Callable[[T], Any] = None,
+    max_workers: int = None,
+) -> List[T]:
+    """Return the master response followed by its child packages responses (in order).
+
+    the children are submitted concurrently (`max_workers` caps this call on top of
+    the shared executor carrier caps) once the master package was created.
+    when a child fails (`submit` raises, `failed(response)` is true or raises), the
+    successful children then the master are cancelled with `cancel(response)` and only
+    the failed responses are returned (or the first error raised) so the shipment isn't
+    reported as created.
+    """
+
+    def attempt(child: S) -> Tuple[Optional[T], bool, Optional[Exception]]:
+        try:
+            response = submit(child)
+        except Exception as error:
+            return None, True, error
+
+        try:
+            return response, failed is not None and bool(failed(response)), None
+        except Exception as error:
+            logger.warning(f"failed to check a child package response: {error}")
+            return response, True, None
+
+    outcomes = get_executor().map(attempt, children, max_workers=max_workers)
+    exceptions = [error for _, _, error in outcomes if error is not None]
+    failures = [
+        response
+        for response, is_failed, error in outcomes
+        if is_failed and error is None
+    ]
+    succeeded = [response for response, is_failed, _ in outcomes if not is_failed]
+    master_responses = [] if master is None else [master]
 
+    if len(exceptions) == 0 and len(failures) == 0:
+        return master_responses + succeeded
 
-def exec_async(action: Callable, sequence: List[S]) -> List[T]:
-    async def run_tasks(loop):
-        return await asyncio.gather(
-            *[loop.run_in_executor(None, lambda: action(args)) for args in sequence]
+    logger.warning(
+        f"{len(exceptions) + len(failures)} child packages failed, "
+        f"cancelling the {len(succeeded)} others"
+    )
+
+    if cancel is not None:
+        warning = "failed to cancel a child package: $error"
+        get_executor().map(
+            lambda response: failsafe(lambda: cancel(response), warning),
+            succeeded,
+            max_workers=max_workers,
         )
+        for response in master_responses:
+            failsafe(lambda: cancel(response), "failed to cancel the master: $error")
+
+    if len(exceptions) > 0:
+        raise exceptions[0]
+
+    return failures
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, List[str]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Return a package `__getattr__` and `__dir__` importing its exported names on first access.
+
+    `exports` maps the (relative) modules to the names they export so that
+    a module (and the schemas it imports) is only loaded when one of its
+    names is used.
+    """
+    modules = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        if name not in modules:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(modules[name], package), name)
+        setattr(sys.modules[package], name, value)
 
-    def run_loop():
-        loop = asyncio.new_event_loop()
-        result = loop.run_until_complete(run_tasks(loop))
-        loop.close()
+        return value
 
-        return result
+    def __dir__() -> List[str]:
+        return sorted({*vars(sys.modules[package]), *modules})
 
-    result = ThreadPoolExecutor().submit(run_loop).result()
-    return cast(List[T], result)
+    return __getattr__, __dir__
 
 
 class Location:
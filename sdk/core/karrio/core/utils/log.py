@@ -1,4 +1,25 @@
+import re
+import json
+import typing
 import logging
+from lxml import etree
+from karrio.core.utils.dict import DICTPARSE
+
+REDACTED = "********"
+MAX_PAYLOAD_SIZE = 10_000
+SENSITIVE_KEYS = [
+    "password",
+    "passwd",
+    "secret",
+    "token",
+    "api_key",
+    "apikey",
+    "access_key",
+    "access_license_number",
+    "authorization",
+    "meter_number",
+    "user_key",
+]
 
 
 def init_log(debug: bool = None, level: int = None):
@@ -13,3 +34,132 @@ def init_log(debug: bool = None, level: int = None):
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         datefmt="%d-%b-%y %H:%M:%S",
     )
+
+
+class Payload:
+    """A payload rendered (redacted and truncated) only when a log record is formatted.
+
+    Example:
+        logger.debug("rate request: %s", Payload(request))
+    """
+
+    __slots__ = ("value", "max_size", "redact")
+
+    def __init__(
+        self,
+        value: typing.Any,
+        max_size: typing.Optional[int] = None,
+        redact: bool = True,
+    ) -> None:
+        self.value = value
+        self.max_size = max_size
+        self.redact = redact
+
+    def __str__(self) -> str:
+        return self.render()
+
+    def render(self) -> str:
+        max_size = MAX_PAYLOAD_SIZE if self.max_size is None else self.max_size
+        content = (
+            redact_text(to_text(self.value)) if self.redact else to_text(self.value)
+        )
+
+        if max_size and len(content) > max_size:
+            return f"{content[:max_size]}... [{len(content) - max_size} characters truncated]"
+
+        return content
+
+
+def log_payload(
+    logger: logging.Logger,
+    message: str,
+    payload: typing.Any,
+    level: int = logging.DEBUG,
+    **kwargs,
+):
+    """Log a message with its payload, rendering the payload only if a handler emits it.
+
+    The payload is also attached to the record as `record.payload` for structured handlers.
+    """
+    if not logger.isEnabledFor(level):
+        return
+
+    _payload = Payload(payload, **kwargs)
+    logger.log(
+        level, "%s. payload: %s", message, _payload, extra=dict(payload=_payload)
+    )
+
+
+def to_text(value: typing.Any) -> str:
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+
+    if isinstance(value, str):
+        return value
+
+    if etree.iselement(value):
+        return to_text(etree.tostring(value))
+
+    if isinstance(value, list) and any(etree.iselement(item) for item in value):
+        return "".join(to_text(item) for item in value)
+
+    try:
+        return json.dumps(
+            redact_dict(DICTPARSE.to_dict(value, clear_empty=False)), default=str
+        )
+    except Exception:
+        return str(value)
+
+
+def is_sensitive(key: typing.Any) -> bool:
+    _key = str(key).lower().replace("-", "_")
+    return any(sensitive in _key for sensitive in SENSITIVE_KEYS)
+
+
+def redact_dict(value: typing.Any) -> typing.Any:
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if is_sensitive(key) else redact_dict(item)
+            for key, item in value.items()
+        }
+
+    if isinstance(value, list):
+        return [redact_dict(item) for item in value]
+
+    return value
+
+
+def redact_text(text: str) -> str:
+    """Redact sensitive values from JSON, XML and form encoded payloads."""
+    return _sensitive_pattern().sub(_redact_match, text)
+
+
+def _redact_match(match: typing.Match) -> str:
+    groups = match.groupdict()
+
+    if groups["xml_tag"] is not None:
+        return f"<{groups['xml_tag']}>{REDACTED}</{groups['xml_tag']}>"
+
+    if groups["json_key"] is not None:
+        return f'"{groups["json_key"]}": "{REDACTED}"'
+
+    return f"{groups['form_key']}={REDACTED}"
+
+
+_patterns: typing.Dict[typing.Tuple[str, ...], typing.Pattern] = {}
+
+
+def _sensitive_pattern() -> typing.Pattern:
+    key = tuple(SENSITIVE_KEYS)
+
+    if key not in _patterns:
+        names = "|".join(re.escape(name) for name in key)
+        word = rf"[\w:.-]*(?:{names})[\w.-]*"
+        _patterns[key] = re.compile(
+            rf"<(?P<xml_tag>{word})(?:\s[^>]*)?>[^<]*</(?P=xml_tag)>"
+            rf'|"(?P<json_key>{word})"\s*:\s*"(?:[^"\\]|\\.)*"'
+            rf"|\b(?P<form_key>{word})=[^&\s]*",
+            re.IGNORECASE,
+        )
+
+    return _patterns[key]
@@ -1,7 +1,8 @@
 import logging
 from functools import reduce
 from collections import OrderedDict
-from typing import Callable, TypeVar, Any, Generic, List, Tuple, Dict
+from typing import Callable, TypeVar, Any, Generic, List, Tuple, Dict, Union
+from karrio.core.utils.executor import get_executor
 
 logger = logging.getLogger(__name__)
 T = TypeVar("T")
@@ -16,27 +17,161 @@ class Job:
             self.__setattr__(name, value)
 
 
-Step = Callable[[Any], Job]
-Steps = Dict[str, Step]
+Step = Callable[..., Union[Job, List[Job]]]
 Process = Callable[[Job], Any]
 
 
+class Stage:
+    """A pipeline step that declares the steps it depends on.
+
+    The step is called with the results of the `after` steps (in that order)
+    and may return a list of jobs: they are processed concurrently and the
+    step result is the list of their results.
+
+    Note that the step functions of a wave are called one after another (they
+    only build the jobs): only the processing of their jobs runs concurrently.
+
+    Example:
+        Pipeline(
+            create=lambda *_: Job(id="create", data=...),
+            labels=Stage(lambda created: [Job(id="label", ...)], after=["create"]),
+            manifest=Stage(lambda created: Job(id="manifest", ...), after=["create"]),
+        )
+    """
+
+    def __init__(self, step: Step, after: List[str] = None):
+        self.step = step
+        self.after: List[str] = list(after or [])
+
+    def __call__(self, *results):
+        return self.step(*results)
+
+
+Steps = Dict[str, Union[Step, Stage]]
+
+
 class Pipeline(Generic[T]):
+    """A sequence of steps whose jobs are processed (e.g. sent) in turn.
+
+    A plain step receives the result of the step declared before it while a
+    `Stage` receives the results of the steps it declares. The steps whose
+    dependencies are resolved run concurrently on the shared executor and
+    `apply` returns the results in the steps declaration order.
+    """
+
     def __init__(self, **steps):
         self.steps: Steps = OrderedDict(steps.items())  # type: ignore
 
     def __getitem__(self, step_name):
         return self.steps.get(step_name)
 
+    @property
+    def dependencies(self) -> Dict[str, List[str]]:
+        """Return the steps each step depends on."""
+        names = list(self.steps.keys())
+
+        return {
+            name: (
+                step.after
+                if isinstance(step, Stage)
+                else ([names[index - 1]] if index > 0 else [])
+            )
+            for index, (name, step) in enumerate(self.steps.items())
+        }
+
     def apply(self, process: Process, initial: List[T] = None) -> List[T]:
         if initial is None:
             initial = []
 
+        if not any(isinstance(step, Stage) for step in self.steps.values()):
+            return self._apply_linear(process, initial)
+
+        dependencies = self.dependencies
+        results: Dict[str, Any] = {}
+
+        for wave in self._waves(dependencies):
+            logger.debug(f"run steps {wave}...")
+            jobs = {
+                name: self._call(
+                    name,
+                    [results[dependency] for dependency in dependencies[name]],
+                    initial,
+                )
+                for name in wave
+            }
+            flattened: List[Tuple[str, Job]] = [
+                (name, job)
+                for name, output in jobs.items()
+                for job in (output if isinstance(output, list) else [output])
+            ]
+            outputs = (
+                [process(flattened[0][1])]
+                if len(flattened) == 1
+                else get_executor().map(lambda item: process(item[1]), flattened)
+            )
+
+            for name, output in jobs.items():
+                processed = [
+                    result
+                    for (job_name, _), result in zip(flattened, outputs)
+                    if job_name == name
+                ]
+                results[name] = processed if isinstance(output, list) else processed[0]
+
+        return initial + [results[name] for name in self.steps.keys()]
+
+    def _apply_linear(self, process: Process, initial: List[T]) -> List[T]:
         def run(result: List[T], next_step: Tuple[str, Step]):
             name, step = next_step
             logger.debug(f"run step {name}...")
             last_run_result = result[-1] if len(result) > 0 else None
             job = step(last_run_result)
+
+            if isinstance(job, list):
+                return result + [get_executor().map(process, job)]
+
             return result + [process(job)]
 
         return reduce(run, self.steps.items(), initial)
+
+    def _call(
+        self, name: str, results: List[Any], initial: List[T]
+    ) -> Union[Job, List[Job]]:
+        step = self.steps[name]
+
+        if isinstance(step, Stage):
+            return step(*results)
+
+        # like in a linear pipeline, the first step receives the last initial result
+        if len(results) == 0:
+            return step(initial[-1] if len(initial) > 0 else None)
+
+        return step(results[0])
+
+    def _waves(self, dependencies: Dict[str, List[str]]) -> List[List[str]]:
+        """Group the steps in waves that only depend on the previous waves."""
+        waves: List[List[str]] = []
+        done: Dict[str, bool] = {}
+        pending = list(self.steps.keys())
+
+        for name, after in dependencies.items():
+            unknown = [
+                dependency for dependency in after if dependency not in self.steps
+            ]
+            if any(unknown):
+                raise ValueError(f"step {name} depends on unknown steps {unknown}")
+
+        while any(pending):
+            wave = [
+                name
+                for name in pending
+                if all(done.get(dependency) for dependency in dependencies[name])
+            ]
+            if len(wave) == 0:
+                raise ValueError(f"the steps {pending} have circular dependencies")
+
+            waves.append(wave)
+            done.update({name: True for name in wave})
+            pending = [name for name in pending if name not in wave]
+
+        return waves
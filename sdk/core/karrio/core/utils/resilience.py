@@ -0,0 +1,323 @@
+"""Karrio carrier requests circuit breaker and retry policy definitions."""
+
+import time
+import random
+import typing
+import logging
+import threading
+from urllib.error import HTTPError
+
+import karrio.core.errors as errors
+from karrio.core.utils.caching import AbstractCache, MemoryCache
+from karrio.core.utils.deadline import get_deadline
+from karrio.core.utils.transport import CONTEXT, Context
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+READ_ONLY_OPERATIONS = ("get_rates", "get_tracking", "validate_address")
+
+
+def connection_key(context: Context) -> typing.Optional[str]:
+    """Return the key identifying a carrier connection (if any) in the breaker store."""
+    if context.connection_id is None and context.carrier_id is None:
+        return None
+
+    return f"karrio:breaker:{context.connection_id or f'{context.carrier_name}:{context.carrier_id}'}"
+
+
+def is_failure(error: typing.Optional[Exception]) -> bool:
+    """A carrier failure is a connection error, a timeout or a server (5xx or 429) error."""
+    if error is None:
+        return False
+
+    if isinstance(error, HTTPError):
+        return error.code >= 500 or error.code == 429
+
+    return True
+
+
+class CircuitBreaker:
+    """A per carrier connection circuit breaker.
+
+    The outcome of the last `window_size` requests of a connection is kept. Once
+    at least `min_calls` were made, the circuit opens when the share of failures
+    (or of requests slower than `slow_call_duration` seconds) reaches
+    `error_threshold` (or `slow_call_threshold`). An open circuit rejects requests
+    for `reset_timeout` seconds then lets `half_open_calls` trial requests through:
+    it closes on a success and opens again on a failure.
+
+    The circuits state is kept per process in the `store` (in memory by default).
+    Its updates are read-modify-write under a thread lock, so a store shared
+    across processes (e.g. the django cache) would lose concurrent updates.
+
+    Example:
+        lib.set_breaker(lib.CircuitBreaker(error_threshold=0.5))
+    """
+
+    def __init__(
+        self,
+        store: AbstractCache = None,
+        window_size: int = 20,
+        min_calls: int = 5,
+        error_threshold: float = 0.5,
+        slow_call_duration: float = None,
+        slow_call_threshold: float = 0.5,
+        reset_timeout: float = 30,
+        half_open_calls: int = 1,
+    ) -> None:
+        self.store = store or MemoryCache()
+        self.window_size = window_size
+        self.min_calls = min_calls
+        self.error_threshold = error_threshold
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_threshold = slow_call_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_calls = half_open_calls
+        self._lock = threading.Lock()
+
+    def state(self, key: str) -> str:
+        circuit = self._get(key)
+
+        if circuit["state"] == OPEN and self._elapsed(circuit) >= self.reset_timeout:
+            return HALF_OPEN
+
+        return circuit["state"]
+
+    def is_open(self, key: typing.Optional[str]) -> bool:
+        return key is not None and self.state(key) == OPEN
+
+    def allow(self, key: typing.Optional[str]) -> bool:
+        """Return whether a request can be sent (counting it as a trial if half open)."""
+        if key is None:
+            return True
+
+        with self._lock:
+            circuit = self._get(key)
+
+            if circuit["state"] == CLOSED:
+                return True
+
+            if circuit["state"] == OPEN and self._elapsed(circuit) < self.reset_timeout:
+                return False
+
+            # half open: let a few trial requests through (stale trials are ignored)
+            trials = (
+                circuit["trials"] if self._elapsed(circuit) < self.reset_timeout else 0
+            )
+            if circuit["state"] == HALF_OPEN and trials >= self.half_open_calls:
+                return False
+
+            self._set(
+                key,
+                dict(
+                    circuit,
+                    state=HALF_OPEN,
+                    trials=trials + 1,
+                    changed_at=(
+                        time.time()
+                        if circuit["state"] == OPEN
+                        else circuit["changed_at"]
+                    ),
+                ),
+            )
+            return True
+
+    def record(self, key: typing.Optional[str], failed: bool, duration: float):
+        """Record the outcome of a request and open or close the circuit accordingly."""
+        if key is None:
+            return
+
+        slow = (
+            self.slow_call_duration is not None and duration > self.slow_call_duration
+        )
+
+        with self._lock:
+            circuit = self._get(key)
+
+            if circuit["state"] != CLOSED:
+                self._set(key, self._opened() if failed else self._closed())
+                if failed:
+                    logger.warning(f"circuit opened again for {key}")
+                return
+
+            outcomes = (circuit["outcomes"] + [[failed, slow]])[-self.window_size :]
+            calls = len(outcomes)
+            failures = sum(1 for failure, _ in outcomes if failure)
+            slow_calls = sum(1 for _, slow_call in outcomes if slow_call)
+            should_open = calls >= self.min_calls and (
+                failures / calls >= self.error_threshold
+                or (
+                    self.slow_call_duration is not None
+                    and slow_calls / calls >= self.slow_call_threshold
+                )
+            )
+
+            if should_open:
+                logger.warning(f"circuit opened for {key} ({failures}/{calls} failed)")
+
+            self._set(
+                key, self._opened() if should_open else dict(circuit, outcomes=outcomes)
+            )
+
+    def reset(self, key: str):
+        self.store.delete(key)
+
+    def _get(self, key: str) -> dict:
+        return self.store.get(key) or self._closed()
+
+    def _set(self, key: str, circuit: dict):
+        self.store.set(key, circuit, timeout=None)
+
+    def _elapsed(self, circuit: dict) -> float:
+        return time.time() - circuit["changed_at"]
+
+    def _opened(self) -> dict:
+        return dict(state=OPEN, changed_at=time.time(), trials=0, outcomes=[])
+
+    def _closed(self) -> dict:
+        return dict(state=CLOSED, changed_at=time.time(), trials=0, outcomes=[])
+
+
+class RetryPolicy:
+    """Retry failed carrier requests with an exponential backoff and full jitter.
+
+    Only idempotent requests are retried: requests with an idempotent HTTP method
+    or sent by a read only proxy operation (e.g. `get_rates`). They are retried
+    (at most `max_retries` times) on connection errors, timeouts and the
+    `retry_statuses` HTTP errors, waiting a random delay up to
+    `min(max_backoff, backoff * 2 ** attempt)` seconds that fits the deadline.
+
+    Example:
+        lib.set_retry_policy(lib.RetryPolicy(max_retries=2, backoff=0.2))
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 2,
+        backoff: float = 0.1,
+        max_backoff: float = 2.0,
+        retry_statuses: typing.Sequence[int] = (429, 502, 503, 504),
+        idempotent_methods: typing.Sequence[str] = IDEMPOTENT_METHODS,
+        idempotent_operations: typing.Sequence[str] = READ_ONLY_OPERATIONS,
+    ) -> None:
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_statuses = retry_statuses
+        self.idempotent_methods = idempotent_methods
+        self.idempotent_operations = idempotent_operations
+
+    def is_idempotent(self, method: str) -> bool:
+        return (
+            method.upper() in self.idempotent_methods
+            or CONTEXT.get().operation in self.idempotent_operations
+        )
+
+    def delay(
+        self, method: str, attempt: int, error: Exception
+    ) -> typing.Optional[float]:
+        """Return the seconds to wait before retrying the request (or None not to retry it)."""
+        if attempt >= self.max_retries or not self.is_idempotent(method):
+            return None
+
+        if isinstance(error, HTTPError) and error.code not in self.retry_statuses:
+            return None
+
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+        deadline = get_deadline()
+
+        if deadline is not None and delay >= deadline.remaining:
+            return None
+
+        return delay
+
+
+class Call:
+    """A carrier request attempts bookkeeping with the breaker and retry policy."""
+
+    def __init__(
+        self,
+        method: str,
+        breaker: typing.Optional[CircuitBreaker] = None,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+    ) -> None:
+        self.method = method
+        self.breaker = breaker
+        self.retry_policy = retry_policy
+        self.key = connection_key(CONTEXT.get()) if breaker is not None else None
+        self.attempt = 0
+        self.started_at: typing.Optional[float] = None
+
+    def start(self):
+        """Start an attempt.
+
+        Raises:
+            CarrierUnavailableError: if the carrier connection circuit is open
+        """
+        if self.breaker is not None and not self.breaker.allow(self.key):
+            raise errors.CarrierUnavailableError(CONTEXT.get().carrier_name)
+
+        self.started_at = time.monotonic()
+
+    def completed(self, error: Exception = None) -> typing.Optional[float]:
+        """Record the attempt outcome and return the delay before retrying it (if it should be).
+
+        Nothing is recorded for an attempt that wasn't started (e.g. expired deadline).
+        """
+        started_at, self.started_at = self.started_at, None
+        failed = is_failure(error)
+
+        if started_at is None:
+            return None
+
+        if self.breaker is not None:
+            self.breaker.record(self.key, failed, time.monotonic() - started_at)
+
+        if not failed or self.retry_policy is None:
+            return None
+
+        delay = self.retry_policy.delay(self.method, self.attempt, error)  # type: ignore
+        if delay is not None:
+            self.attempt += 1
+            logger.info(f"retrying request in {delay:.2f}s (attempt {self.attempt})")
+
+        return delay
+
+
+_breaker: typing.Optional[CircuitBreaker] = None
+_retry_policy: typing.Optional[RetryPolicy] = None
+
+
+def get_breaker() -> typing.Optional[CircuitBreaker]:
+    """Return the process wide circuit breaker used by `lib.request` (if any)."""
+    return _breaker
+
+
+def set_breaker(breaker: typing.Optional[CircuitBreaker]):
+    """Replace the process wide circuit breaker used by `lib.request` (None to disable it)."""
+    global _breaker
+    _breaker = breaker
+
+    return breaker
+
+
+def is_circuit_open() -> bool:
+    """Return whether the circuit of the carrier connection in context is open."""
+    return _breaker is not None and _breaker.is_open(connection_key(CONTEXT.get()))
+
+
+def get_retry_policy() -> typing.Optional[RetryPolicy]:
+    """Return the process wide retry policy used by `lib.request` (if any)."""
+    return _retry_policy
+
+
+def set_retry_policy(retry_policy: typing.Optional[RetryPolicy]):
+    """Replace the process wide retry policy used by `lib.request` (None to disable retries)."""
+    global _retry_policy
+    _retry_policy = retry_policy
+
+    return retry_policy
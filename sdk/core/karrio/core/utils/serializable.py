@@ -3,6 +3,7 @@ import typing
 import logging
 
 from karrio.core.utils.helpers import identity
+from karrio.core.utils.log import log_payload
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +19,7 @@ class Serializable(typing.Generic[T]):
 
     def serialize(self) -> T:
         serialized_value = self._serializer(self.value)
-        logger.debug(serialized_value)
+        log_payload(logger, "serialized request", serialized_value)
         return serialized_value
 
     @property
@@ -33,7 +34,7 @@ class Deserializable(typing.Generic[T]):
     _ctx: dict = {}
 
     def deserialize(self) -> T:
-        logger.debug(self.value)
+        log_payload(logger, "deserializing response", self.value)
         return self._deserializer(self.value)
 
     @property
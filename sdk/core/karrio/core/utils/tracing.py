@@ -1,9 +1,12 @@
 import uuid
 import attr
 import time
+import random
 import typing
 import functools
-import concurrent.futures as futures
+import threading
+import collections
+from karrio.core.utils.transport import CONTEXT
 
 Trace = typing.Callable[[typing.Any, str], typing.Any]
 
@@ -15,25 +18,73 @@ class Record:
     timestamp: float
     metadata: dict = {}
 
+
 class Tracer:
-    def __init__(self, id: str = None) -> None:
+    """Keep the latest request, response and error traces of a unit of work.
+
+    Traces are appended to a ring buffer of `max_records` entries and only
+    materialized as `Record` when `records` is read. String values longer than
+    `max_body_size` are truncated when traced.
+
+    Requests are sampled by request id at `sample_rates[operation]` (falling
+    back to `sample_rate`) and their response follows the same decision.
+    Errors are sampled at `error_sample_rate` and bring along the request that
+    caused them even when it wasn't sampled.
+
+    Example:
+        Tracer(sample_rates={"get_rates": 0.01}, max_body_size=100_000)
+    """
+
+    def __init__(
+        self,
+        id: str = None,
+        max_records: typing.Optional[int] = 1000,
+        max_body_size: typing.Optional[int] = None,
+        sample_rate: float = 1.0,
+        sample_rates: typing.Dict[str, float] = None,
+        error_sample_rate: float = 1.0,
+    ) -> None:
         self.id = id or str(uuid.uuid4())
+        self.max_records = max_records
+        self.max_body_size = max_body_size
+        self.sample_rate = sample_rate
+        self.sample_rates = sample_rates or {}
+        self.error_sample_rate = error_sample_rate
         self.inner_context: typing.Dict[str, typing.Any] = {}
-        self.inner_recordings: typing.Dict[futures.Future, dict] = {}
+        self.inner_recordings: typing.Deque[tuple] = collections.deque(
+            maxlen=max_records
+        )
+        self._pending: typing.Dict[str, typing.Optional[tuple]] = {}
+        self._lock = threading.Lock()
 
     def trace(
         self, data: typing.Any, key: str, metadata: dict = {}, format: str = None
     ) -> typing.Any:
-        def _save():
-            return Record(
-                key=key,
-                data={"format": format, **data},
-                timestamp=time.time(),
-                metadata=metadata,
-            )
+        entry = (key, self._truncate(data), time.time(), metadata, format)
+        request_id = data.get("request_id") if isinstance(data, dict) else None
+
+        with self._lock:
+            if request_id is None:
+                if self._sample(self.sample_rate):
+                    self.inner_recordings.append(entry)
+
+            elif key == "request":
+                sampled = self._sample(
+                    self.sample_rates.get(CONTEXT.get().operation, self.sample_rate)
+                )
+                self._hold(request_id, None if sampled else entry)
+                if sampled:
+                    self.inner_recordings.append(entry)
+
+            elif key == "error":
+                request = self._pending.pop(request_id, None)
+                if self._sample(self.error_sample_rate):
+                    if request is not None:
+                        self.inner_recordings.append(request)
+                    self.inner_recordings.append(entry)
 
-        promise = futures.ThreadPoolExecutor(max_workers=1)
-        self.inner_recordings.update({promise.submit(_save): data})
+            elif self._pending.pop(request_id, None) is None:
+                self.inner_recordings.append(entry)
 
         return data
 
@@ -42,7 +93,18 @@ class Tracer:
 
     @property
     def records(self) -> typing.List[Record]:
-        return [rec.result() for rec in futures.as_completed(self.inner_recordings)]
+        with self._lock:
+            entries = list(self.inner_recordings)
+
+        return [
+            Record(
+                key=key,
+                data={"format": format, **data},
+                timestamp=timestamp,
+                metadata=metadata,
+            )
+            for key, data, timestamp, metadata, format in entries
+        ]
 
     @property
     def context(self) -> typing.Dict[str, typing.Any]:
@@ -50,3 +112,27 @@ class Tracer:
 
     def add_context(self, data: typing.Dict[str, typing.Any]):
         self.inner_context.update(data)
+
+    def _sample(self, rate: float) -> bool:
+        return rate >= 1.0 or random.random() < rate
+
+    def _hold(self, request_id: str, entry: typing.Optional[tuple]):
+        """Remember the sampling decision of a request until its response or error."""
+        self._pending[request_id] = entry
+
+        if self.max_records is not None and len(self._pending) > self.max_records:
+            del self._pending[next(iter(self._pending))]
+
+    def _truncate(self, data: typing.Any) -> typing.Any:
+        if self.max_body_size is None or not isinstance(data, dict):
+            return data
+
+        return {
+            name: (
+                f"{value[:self.max_body_size]}..."
+                f"[{len(value) - self.max_body_size} characters truncated]"
+                if isinstance(value, str) and len(value) > self.max_body_size
+                else value
+            )
+            for name, value in data.items()
+        }
@@ -0,0 +1,754 @@
+"""Karrio HTTP transport definitions."""
+
+import io
+import ssl
+import sys
+import attr
+import gzip
+import time
+import zlib
+import queue
+import select
+import socket
+import typing
+import asyncio
+import logging
+import weakref
+import functools
+import threading
+import contextlib
+import contextvars
+import collections
+import http.client
+import email.parser
+import urllib.parse
+import urllib.request
+from urllib.error import HTTPError, URLError
+
+logger = logging.getLogger(__name__)
+
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+MAX_REDIRECTIONS = 10
+USER_AGENT = "Python-urllib/%d.%d" % sys.version_info[:2]
+# the methods a kept-alive connection closed by the server can be retried with:
+# the server may have processed the other ones before closing the connection.
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE")
+# the errors raised on a kept-alive connection the server closed while it was idle.
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class Context:
+    """The carrier connection (and operation) on behalf of which requests are sent."""
+
+    carrier_name: typing.Optional[str] = None
+    carrier_id: typing.Optional[str] = None
+    connection_id: typing.Optional[str] = None
+    operation: typing.Optional[str] = None
+
+
+CONTEXT: contextvars.ContextVar = contextvars.ContextVar(
+    "karrio_transport_context", default=Context()
+)
+
+
+@contextlib.contextmanager
+def connection_context(settings: typing.Any):
+    """Bind the carrier connection settings to every request sent within the block."""
+    token = CONTEXT.set(
+        Context(
+            carrier_name=getattr(settings, "carrier_name", None),
+            carrier_id=getattr(settings, "carrier_id", None),
+            connection_id=getattr(settings, "id", None),
+        )
+    )
+    try:
+        yield
+    finally:
+        CONTEXT.reset(token)
+
+
+@contextlib.contextmanager
+def operation_context(operation: str):
+    """Bind the proxy operation (e.g. "get_rates") to every request sent within the block."""
+    token = CONTEXT.set(attr.evolve(CONTEXT.get(), operation=operation))
+    try:
+        yield
+    finally:
+        CONTEXT.reset(token)
+
+
+@attr.s(auto_attribs=True)
+class TransportStats:
+    requests: int = 0
+    connections: int = 0
+    reused_connections: int = 0
+    handshakes: int = 0
+    resumed_sessions: int = 0
+
+    def increment(self, **counters):
+        for name, value in counters.items():
+            setattr(self, name, getattr(self, name) + value)
+
+
+def prepare_request(request: urllib.request.Request, compress: bool = True):
+    """Return the (method, url, data, headers) urlopen would have sent."""
+    headers = {name.title(): value for name, value in request.header_items()}
+    headers.setdefault("User-Agent", USER_AGENT)
+    data = bytes(request.data) if isinstance(request.data, bytearray) else request.data
+
+    if data is not None:
+        headers.setdefault("Content-Type", "application/x-www-form-urlencoded")
+
+    if compress:
+        headers.setdefault("Accept-Encoding", "gzip, deflate")
+
+    return request.get_method(), request.full_url, data, headers
+
+
+def follow_redirect(
+    url: str, method: str, headers: dict, status: int, response_headers
+) -> typing.Optional[tuple]:
+    """Return the redirected request the same way urllib's redirect handler would."""
+    if status not in REDIRECT_CODES or "location" not in response_headers:
+        return None
+
+    if not (method in ("GET", "HEAD") or (status < 307 and method == "POST")):
+        return None
+
+    return (
+        "HEAD" if method == "HEAD" else "GET",
+        urllib.parse.urljoin(url, response_headers["location"]),
+        None,
+        {
+            key: value
+            for key, value in headers.items()
+            if key.lower() not in ("content-length", "content-type")
+        },
+    )
+
+
+def is_success(status: int) -> bool:
+    """Whether urllib would return the response (instead of raising an HTTPError)."""
+    return 200 <= status < 300
+
+
+def decode_content(content: bytes, encoding: typing.Optional[str]) -> bytes:
+    if not content:
+        return content
+
+    if encoding in ("gzip", "x-gzip"):
+        return gzip.decompress(content)
+
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(content)
+        except zlib.error:
+            return zlib.decompress(content, -zlib.MAX_WBITS)
+
+    return content
+
+
+def uses_proxy(request: urllib.request.Request, proxies: dict) -> bool:
+    return (
+        request.type in proxies and not urllib.request.proxy_bypass(request.host)
+    ) or request.type not in ("http", "https")
+
+
+class AbstractTransport:
+    def send(self, request: urllib.request.Request, timeout: float = None) -> bytes:
+        """Send the request and return the response body.
+
+        Raises:
+            HTTPError: when the server responds with an error status
+        """
+        pass
+
+    def close(self):
+        pass
+
+
+class UrllibTransport(AbstractTransport):
+    """The legacy transport: a new connection is opened for every request."""
+
+    def send(self, request: urllib.request.Request, timeout: float = None) -> bytes:
+        response = (
+            urllib.request.urlopen(request)
+            if timeout is None
+            else urllib.request.urlopen(request, timeout=timeout)
+        )
+
+        with response:
+            return response.read()
+
+
+class _HTTPConnection(http.client.HTTPConnection):
+    def connect(self):
+        http.client.HTTPConnection.connect(self)
+        # kept-alive connections would otherwise wait on delayed ACKs (Nagle).
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+class _HTTPSConnection(http.client.HTTPSConnection):
+    """HTTPS connection that resumes the last TLS session negotiated with the host."""
+
+    def __init__(self, *args, sessions: dict, stats: "TransportStats", **kwargs):
+        super().__init__(*args, **kwargs)
+        self._sessions = sessions
+        self._stats = stats
+
+    def connect(self):
+        _HTTPConnection.connect(self)
+
+        server_hostname = self._tunnel_host or self.host
+        session = self._sessions.get((server_hostname, self.port))
+        self.sock = self._context.wrap_socket(
+            self.sock, server_hostname=server_hostname, session=session
+        )
+        self._stats.increment(
+            handshakes=1, resumed_sessions=int(self.sock.session_reused)
+        )
+
+    def save_session(self):
+        session = getattr(self.sock, "session", None)
+
+        if session is not None:
+            self._sessions[(self._tunnel_host or self.host, self.port)] = session
+
+
+def is_stale(error: Exception) -> bool:
+    """Whether the error is raised by a connection the server closed while it was idle."""
+    return isinstance(getattr(error, "reason", error), STALE_CONNECTION_ERRORS)
+
+
+def is_dropped(connection: http.client.HTTPConnection) -> bool:
+    """Whether an idle connection was closed by the server (its socket is readable)."""
+    if connection.sock is None:
+        return False
+
+    try:
+        return len(select.select([connection.sock], [], [], 0)[0]) > 0
+    except (OSError, ValueError):
+        return True
+
+
+class _Pool:
+    def __init__(self, size: int):
+        self.size = size
+        self.idle: queue.LifoQueue = queue.LifoQueue(maxsize=size)
+
+    def get(self, max_idle: float) -> typing.Optional[http.client.HTTPConnection]:
+        while True:
+            try:
+                connection, released_at = self.idle.get_nowait()
+            except queue.Empty:
+                return None
+
+            if time.monotonic() - released_at < max_idle and not is_dropped(connection):
+                return connection
+
+            connection.close()
+
+    def put(self, connection: http.client.HTTPConnection):
+        try:
+            self.idle.put_nowait((connection, time.monotonic()))
+        except queue.Full:
+            connection.close()
+
+    def clear(self):
+        while True:
+            try:
+                connection, _ = self.idle.get_nowait()
+            except queue.Empty:
+                return
+
+            connection.close()
+
+
+class PooledTransport(AbstractTransport):
+    """Keep-alive transport holding a connection pool per carrier and host.
+
+    Args:
+        pool_size: the number of idle connections kept alive per host.
+        pool_sizes: pool size overrides per carrier name (e.g. {"ups": 20}).
+        max_idle: the number of seconds an idle connection is kept before being discarded.
+        timeout: the default socket timeout in seconds.
+        compress: request gzip/deflate encoded responses when the caller doesn't specify it.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        pool_sizes: typing.Dict[str, int] = None,
+        max_idle: float = 30.0,
+        timeout: float = None,
+        compress: bool = True,
+        ssl_context: ssl.SSLContext = None,
+    ):
+        self.pool_size = pool_size
+        self.pool_sizes = pool_sizes or {}
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self.compress = compress
+        self.stats = TransportStats()
+        self.ssl_context = ssl_context or ssl._create_default_https_context()
+        self.proxies = urllib.request.getproxies()
+        self.fallback = UrllibTransport()
+        self._sessions: typing.Dict[typing.Tuple[str, int], ssl.SSLSession] = {}
+        self._pools: typing.Dict[tuple, _Pool] = {}
+        self._lock = threading.Lock()
+
+    def send(self, request: urllib.request.Request, timeout: float = None) -> bytes:
+        _timeout = timeout if timeout is not None else self.timeout
+
+        if uses_proxy(request, self.proxies):
+            return self.fallback.send(request, timeout=_timeout)
+
+        method, url, data, headers = prepare_request(request, self.compress)
+
+        for _ in range(MAX_REDIRECTIONS + 1):
+            status, reason, response_headers, content = self._send(
+                url, method, data, headers, _timeout
+            )
+            redirection = follow_redirect(
+                url, method, headers, status, response_headers
+            )
+
+            if redirection is None:
+                break
+
+            method, url, data, headers = redirection
+
+        if not is_success(status):
+            raise HTTPError(url, status, reason, response_headers, io.BytesIO(content))
+
+        return content
+
+    def close(self):
+        with self._lock:
+            pools, self._pools = list(self._pools.values()), {}
+
+        for pool in pools:
+            pool.clear()
+
+    def _send(self, url: str, method: str, data, headers: dict, timeout):
+        scheme, netloc, path, query, _ = urllib.parse.urlsplit(url)
+        selector = f"{path or '/'}{'?' + query if query else ''}"
+        pool = self._get_pool(scheme, netloc)
+        connection = pool.get(self.max_idle)
+        reused = connection is not None
+
+        while True:
+            if connection is None:
+                connection = self._create_connection(scheme, netloc, timeout)
+
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+
+            try:
+                try:
+                    connection.request(method, selector, body=data, headers=headers)
+                except OSError as e:
+                    # connection failures are raised the way urlopen raises them.
+                    raise URLError(e) from e
+
+                response = connection.getresponse()
+                content = response.read()
+                break
+            except Exception as e:
+                connection.close()
+                connection = None
+
+                # a kept-alive connection may have been closed by the server: retry once.
+                if not (reused and method in IDEMPOTENT_METHODS and is_stale(e)):
+                    raise
+
+                reused = False
+
+        self.stats.increment(requests=1, reused_connections=int(reused))
+
+        if isinstance(connection, _HTTPSConnection):
+            connection.save_session()
+
+        if response.will_close:
+            connection.close()
+        else:
+            pool.put(connection)
+
+        return (
+            response.status,
+            response.reason,
+            response.headers,
+            decode_content(content, response.headers.get("content-encoding")),
+        )
+
+    def _get_pool(self, scheme: str, netloc: str) -> _Pool:
+        carrier_name = CONTEXT.get().carrier_name
+        key = (carrier_name, scheme, netloc)
+        pool = self._pools.get(key)
+
+        if pool is None:
+            with self._lock:
+                pool = self._pools.setdefault(
+                    key, _Pool(self.pool_sizes.get(carrier_name) or self.pool_size)
+                )
+
+        return pool
+
+    def _create_connection(self, scheme: str, netloc: str, timeout):
+        self.stats.increment(connections=1)
+
+        if scheme == "https":
+            return _HTTPSConnection(
+                netloc,
+                timeout=timeout,
+                context=self.ssl_context,
+                sessions=self._sessions,
+                stats=self.stats,
+            )
+
+        return _HTTPConnection(netloc, timeout=timeout)
+
+
+class AbstractAsyncTransport:
+    async def send(
+        self, request: urllib.request.Request, timeout: float = None
+    ) -> bytes:
+        """Send the request and return the response body without blocking the event loop.
+
+        Raises:
+            HTTPError: when the server responds with an error status
+        """
+        pass
+
+    async def close(self):
+        pass
+
+    def close_all(self):
+        """Close the connections held for every event loop (callable from any thread)."""
+        pass
+
+
+class AsyncPooledTransport(AbstractAsyncTransport):
+    """asyncio keep-alive transport holding a connection pool per event loop, carrier and host.
+
+    Takes the same options as `PooledTransport`.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        pool_sizes: typing.Dict[str, int] = None,
+        max_idle: float = 30.0,
+        timeout: float = None,
+        compress: bool = True,
+        ssl_context: ssl.SSLContext = None,
+    ):
+        self.pool_size = pool_size
+        self.pool_sizes = pool_sizes or {}
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self.compress = compress
+        self.stats = TransportStats()
+        self.ssl_context = ssl_context or ssl._create_default_https_context()
+        self.proxies = urllib.request.getproxies()
+        self.fallback = UrllibTransport()
+        self._pools: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    async def send(
+        self, request: urllib.request.Request, timeout: float = None
+    ) -> bytes:
+        _timeout = timeout if timeout is not None else self.timeout
+
+        if uses_proxy(request, self.proxies):
+            return await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(self.fallback.send, request, _timeout)
+            )
+
+        method, url, data, headers = prepare_request(request, self.compress)
+
+        for _ in range(MAX_REDIRECTIONS + 1):
+            status, reason, response_headers, content = await asyncio.wait_for(
+                self._send(url, method, data, headers), _timeout
+            )
+            redirection = follow_redirect(
+                url, method, headers, status, response_headers
+            )
+
+            if redirection is None:
+                break
+
+            method, url, data, headers = redirection
+
+        if not is_success(status):
+            raise HTTPError(url, status, reason, response_headers, io.BytesIO(content))
+
+        return content
+
+    async def close(self):
+        _close_pools(self._pools.pop(asyncio.get_running_loop(), {}))
+
+    def close_all(self):
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        for loop, pools in list(self._pools.items()):
+            self._pools.pop(loop, None)
+
+            if loop.is_closed():
+                continue
+
+            if loop is running_loop or not loop.is_running():
+                _close_pools(pools)
+            else:
+                loop.call_soon_threadsafe(_close_pools, pools)
+
+    async def _send(self, url: str, method: str, data, headers: dict):
+        parts = urllib.parse.urlsplit(url)
+        selector = f"{parts.path or '/'}{'?' + parts.query if parts.query else ''}"
+        pool = self._get_pool(parts.scheme, parts.netloc)
+        connection = self._acquire(pool)
+        reused = connection is not None
+
+        while True:
+            if connection is None:
+                connection = await self._connect(parts)
+
+            reader, writer = connection
+
+            try:
+                try:
+                    writer.write(
+                        encode_request(method, selector, parts.netloc, headers, data)
+                    )
+                    await writer.drain()
+                except OSError as e:
+                    raise URLError(e) from e
+
+                status, reason, response_headers, content = await read_response(
+                    reader, method
+                )
+                break
+            except BaseException as e:
+                writer.close()
+                connection = None
+
+                # a kept-alive connection may have been closed by the server: retry once.
+                if not (
+                    reused
+                    and method in IDEMPOTENT_METHODS
+                    and isinstance(
+                        getattr(e, "reason", e),
+                        (
+                            asyncio.IncompleteReadError,
+                            http.client.BadStatusLine,
+                            ConnectionError,
+                        ),
+                    )
+                ):
+                    raise
+
+                reused = False
+
+        self.stats.increment(requests=1, reused_connections=int(reused))
+
+        if will_close(response_headers) or len(pool) >= pool.maxlen:
+            writer.close()
+        else:
+            pool.append((reader, writer, time.monotonic()))
+
+        return (
+            status,
+            reason,
+            response_headers,
+            decode_content(content, response_headers.get("content-encoding")),
+        )
+
+    def _get_pool(self, scheme: str, netloc: str) -> collections.deque:
+        carrier_name = CONTEXT.get().carrier_name
+        pools = self._pools.setdefault(asyncio.get_running_loop(), {})
+        key = (carrier_name, scheme, netloc)
+
+        if key not in pools:
+            size = self.pool_sizes.get(carrier_name) or self.pool_size
+            pools[key] = collections.deque(maxlen=size)
+
+        return pools[key]
+
+    def _acquire(self, pool: collections.deque) -> typing.Optional[tuple]:
+        while pool:
+            reader, writer, released_at = pool.pop()
+
+            if (
+                time.monotonic() - released_at < self.max_idle
+                and not writer.is_closing()
+                and not reader.at_eof()
+            ):
+                return reader, writer
+
+            writer.close()
+
+        return None
+
+    async def _connect(self, parts: urllib.parse.SplitResult):
+        is_secure = parts.scheme == "https"
+        self.stats.increment(connections=1, handshakes=int(is_secure))
+
+        try:
+            return await asyncio.open_connection(
+                parts.hostname,
+                parts.port or (443 if is_secure else 80),
+                ssl=(self.ssl_context if is_secure else None),
+                server_hostname=(parts.hostname if is_secure else None),
+            )
+        except OSError as e:
+            # connection failures are raised the way urlopen raises them.
+            raise URLError(e) from e
+
+
+def _close_pools(pools: dict):
+    for pool in pools.values():
+        while pool:
+            _, writer, _ = pool.pop()
+            writer.close()
+
+
+def encode_request(
+    method: str, selector: str, netloc: str, headers: dict, data: bytes = None
+) -> bytes:
+    _headers = {"Host": netloc, **headers}
+
+    if data is not None:
+        _headers["Content-Length"] = str(len(data))
+    elif method in ("POST", "PUT", "PATCH"):
+        _headers["Content-Length"] = "0"
+
+    head = "".join(
+        [
+            f"{method} {selector} HTTP/1.1\r\n",
+            *(f"{name}: {value}\r\n" for name, value in _headers.items()),
+            "\r\n",
+        ]
+    )
+
+    return head.encode("iso-8859-1") + (data or b"")
+
+
+async def read_response(reader: asyncio.StreamReader, method: str):
+    while True:
+        line = await reader.readline()
+        if not line:
+            raise http.client.RemoteDisconnected(
+                "Remote end closed connection without response"
+            )
+
+        version, status, reason = (
+            line.decode("iso-8859-1").rstrip("\r\n").split(" ", 2) + [""]
+        )[:3]
+        if not version.startswith("HTTP/") or not status.isdigit():
+            raise http.client.BadStatusLine(line.decode("iso-8859-1"))
+
+        header_lines = []
+        while True:
+            header_line = await reader.readline()
+            if header_line in (b"\r\n", b"\n", b""):
+                break
+            header_lines.append(header_line)
+
+        headers = email.parser.Parser(_class=http.client.HTTPMessage).parsestr(
+            b"".join(header_lines).decode("iso-8859-1")
+        )
+
+        # skip the informational (100 continue) responses
+        if not 100 <= int(status) < 200:
+            break
+
+    if version != "HTTP/1.1":
+        headers["Connection"] = "close"
+
+    if method == "HEAD" or int(status) in (204, 304):
+        content = b""
+    elif "chunked" in (headers.get("transfer-encoding") or "").lower():
+        content = await read_chunks(reader)
+    elif headers.get("content-length") is not None:
+        content = await reader.readexactly(int(headers["content-length"]))
+    else:
+        content = await reader.read()
+        headers["Connection"] = "close"
+
+    return int(status), reason, headers, content
+
+
+async def read_chunks(reader: asyncio.StreamReader) -> bytes:
+    chunks: typing.List[bytes] = []
+
+    while True:
+        size = int((await reader.readline()).split(b";")[0].strip(), 16)
+
+        if size == 0:
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            return b"".join(chunks)
+
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
+
+
+def will_close(headers) -> bool:
+    return "close" in (headers.get("connection") or "").lower()
+
+
+_transport: typing.Optional[AbstractTransport] = None
+
+
+def get_transport() -> AbstractTransport:
+    """Return the process wide transport used by `lib.request`."""
+    global _transport
+
+    if _transport is None:
+        _transport = PooledTransport()
+
+    return _transport
+
+
+def set_transport(transport: AbstractTransport) -> AbstractTransport:
+    """Replace the process wide transport used by `lib.request`."""
+    global _transport
+
+    previous, _transport = _transport, transport
+    if previous is not None and previous is not transport:
+        previous.close()
+
+    return transport
+
+
+_async_transport: typing.Optional[AbstractAsyncTransport] = None
+
+
+def get_async_transport() -> AbstractAsyncTransport:
+    """Return the process wide transport used by `lib.request_async`."""
+    global _async_transport
+
+    if _async_transport is None:
+        _async_transport = AsyncPooledTransport()
+
+    return _async_transport
+
+
+def set_async_transport(transport: AbstractAsyncTransport) -> AbstractAsyncTransport:
+    """Replace the process wide transport used by `lib.request_async`."""
+    global _async_transport
+
+    previous, _async_transport = _async_transport, transport
+    if previous is not None and previous is not transport:
+        previous.close_all()
+
+    return transport
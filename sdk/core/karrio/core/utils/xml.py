@@ -1,12 +1,14 @@
 """Karrio lxml typing and utilities wrappers"""
 
 import io
+import copy
 import warnings
 from lxml import etree, html
 from xmltodict import parse
 from typing import Any, List, TypeVar, Type, Optional, cast, Union
 from pysoap.envelope import Envelope
 from lxml.etree import _Element
+import karrio.core.utils.codec as codec
 
 T = TypeVar("T")
 
@@ -55,6 +57,7 @@ class XMLPARSER:
         if xml_node is None:
             return None
 
+        codec.accelerate(element_type)
         instance = element_type()
         cast(GenerateDSAbstract, instance).build(xml_node)
         return instance
@@ -66,20 +69,24 @@ class XMLPARSER:
         element_type: Type[Union[T, Element]] = None,
         first: bool = None,
     ):
-        nodes = [*in_element.xpath(".//*[local-name() = $name]", name=tag)]
-        children = [
+        # iterate the (namespace agnostic) tag natively instead of evaluating
+        # `.//*[local-name() = $name]`: much faster on large documents
+        nodes = (
+            node for node in in_element.iter(f"{{*}}{tag}") if node is not in_element
+        )
+        children = (
             (
                 child
                 if element_type is None
-                else XMLPARSER.to_object(element_type, child)
+                else XMLPARSER.to_object(element_type, cast(Element, child))
             )
             for child in nodes
-        ]
+        )
 
         if first is True:
-            return next((c for c in children), None)
+            return next(children, None)
 
-        return children
+        return list(children)
 
     @staticmethod
     def export(typed_xml_element: Union[Type[GenerateDSAbstract], Any], **kwds) -> str:
@@ -90,15 +97,46 @@ class XMLPARSER:
         :param kwds: exporting method arguments
         :return: an XML text
         """
+        codec.accelerate(type(typed_xml_element))
         output = io.StringIO()
         cast(GenerateDSAbstract, typed_xml_element).export(output, 0, **kwds)
         return output.getvalue()
 
+    @staticmethod
+    def bundle_elements(
+        xml_nodes: List[Union[Element, str, bytes, None]], encoding: str = "utf-8"
+    ) -> Element:
+        """Bundle a list of XML elements (or texts) into a single element.
+        => <wrapper>{all the XML trees}</wrapper>
+
+        The texts are parsed once and the parsed elements are appended as is
+        (elements attached to another tree are copied).
+
+        :param xml_nodes: XML elements or texts
+        :return: the wrapper element
+        """
+        wrapper = etree.Element("wrapper")
+
+        for node in xml_nodes:
+            if node is None or node == "" or node == b"":
+                continue
+
+            if not XMLPARSER.iselement(node):
+                wrapper.append(XMLPARSER.to_xml(cast(str, node), encoding))
+            elif cast(Element, node).getparent() is None:
+                wrapper.append(cast(Element, node))
+            else:
+                wrapper.append(copy.deepcopy(cast(Element, node)))
+
+        return cast(Element, wrapper)
+
     @staticmethod
     def bundle_xml(xml_strings: List[str]) -> str:
         """Bundle a list of XML string into a single one.
         => <wrapper>{all the XML trees concatenated}</wrapper>
 
+        Prefer `bundle_elements` when the bundle is to be parsed.
+
         :param xml_strings:
         :return: a bundled XML text containing all the micro XML string
         """
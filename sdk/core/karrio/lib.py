@@ -21,7 +21,26 @@ Element = utils.Element
 Tracer = utils.Tracer
 Trace = utils.Trace
 Cache = utils.Cache
+Payload = utils.Payload
+log_payload = utils.log_payload
+AbstractTransport = utils.AbstractTransport
+PooledTransport = utils.PooledTransport
+AbstractAsyncTransport = utils.AbstractAsyncTransport
+AsyncPooledTransport = utils.AsyncPooledTransport
+connection_context = utils.connection_context
+operation_context = utils.operation_context
+deadline_context = utils.deadline_context
+get_deadline = utils.get_deadline
+to_deadline = utils.to_deadline
+Deadline = utils.Deadline
+CircuitBreaker = utils.CircuitBreaker
+RetryPolicy = utils.RetryPolicy
+get_breaker = utils.get_breaker
+is_circuit_open = utils.is_circuit_open
+get_retry_policy = utils.get_retry_policy
+Executor = utils.Executor
 Job = utils.Job
+Stage = utils.Stage
 OptionEnum = utils.OptionEnum
 Enum = utils.Enum
 Flag = utils.Flag
@@ -237,6 +256,32 @@ def to_object(
     return utils.DP.to_object(object_type, data)
 
 
+def to_request(
+    request_type: typing.Type[T],
+    data: typing.Any,
+) -> T:
+    """Create a validated (frozen) request that the fluent interface uses without copying it.
+
+    Example:
+        request = lib.to_request(models.RateRequest, payload)
+        karrio.Rating.fetch(request).from_(gateway)
+
+    :param request_type: a request type (or subclass) e.g. models.RateRequest.
+    :param data: the request data (dict or model instance).
+    :return: a frozen instance of the `request_type` (validated) subclass.
+    """
+    if isinstance(data, models.validated_type(request_type)):
+        return typing.cast(T, data)
+
+    return typing.cast(
+        T,
+        utils.DP.to_object(
+            models.validated_type(request_type),
+            utils.DP.to_dict(data),
+        ),
+    )
+
+
 def to_dict(
     value: typing.Any,
     clear_empty: bool = None,
@@ -283,24 +328,29 @@ def to_element(
 ) -> utils.Element:
     """Turn a XML text into an (lxml) XML Element.
 
+    Multiple texts (or already parsed elements) are bundled under a
+    `<wrapper>` element without being parsed twice.
+
     :param xml_str:
     :return: Node Element
     """
-    xml_strings: typing.List[str] = functools.reduce(
+    xml_nodes: typing.List[typing.Any] = functools.reduce(
         lambda acc, s: [*acc, *s] if isinstance(s, list) else [*acc, s],
         list(xml_texts),
         [],
     )
 
-    xml_text = (
-        utils.XP.bundle_xml(xml_strings)
-        if len(xml_strings) > 1
-        else next(iter(xml_strings), None)
-    )
+    if len(xml_nodes) > 1:
+        return utils.XP.bundle_elements(xml_nodes, encoding=encoding)
+
+    xml_text = next(iter(xml_nodes), None)
 
     if xml_text is None:
         raise Exception("Cannot parse empty XML text")
 
+    if utils.XP.iselement(xml_text):
+        return xml_text
+
     return utils.XP.to_xml_or_html_element(xml_text, encoding=encoding)
 
 
@@ -557,7 +607,7 @@ def to_packages(
 def run_concurently(
     predicate: typing.Callable,
     sequence: typing.List[S],
-    max_workers: int = 2,
+    max_workers: int = None,
 ) -> typing.List[T]:
     return utils.exec_parrallel(predicate, sequence, max_workers=max_workers)
 
@@ -565,8 +615,99 @@ def run_concurently(
 def run_asynchronously(
     predicate: typing.Callable,
     sequence: typing.List[S],
+    timeout: float = None,
+    on_timeout: typing.Callable[[S], T] = None,
+    carrier: typing.Callable[[S], typing.Optional[str]] = None,
+) -> typing.List[T]:
+    return utils.exec_async(
+        predicate, sequence, timeout=timeout, on_timeout=on_timeout, carrier=carrier
+    )
+
+
+def run_as_completed(
+    predicate: typing.Callable,
+    sequence: typing.List[S],
+    timeout: float = None,
+    on_timeout: typing.Callable[[S], T] = None,
+    carrier: typing.Callable[[S], typing.Optional[str]] = None,
+) -> typing.Iterator[T]:
+    """Yield the predicate result for each element of the sequence as soon as it completes.
+
+    Example:
+        for rates in lib.run_as_completed(fetch_rates, gateways):
+            print(rates)
+
+    :param predicate: the function to run for each element (in the shared executor).
+    :param sequence: the elements to run the predicate for.
+    :param timeout: the seconds after which the elements still running are given up on.
+    :param on_timeout: the result of an element given up on (yielded last).
+    :param carrier: the carrier name of an element (to run it within that carrier's cap).
+    :return: a generator of the results in completion order.
+    """
+    return utils.exec_as_completed(
+        predicate, sequence, timeout=timeout, on_timeout=on_timeout, carrier=carrier
+    )
+
+
+def run_multi_piece(
+    predicate: typing.Callable[[S], T],
+    sequence: typing.List[S],
+    master: T = None,
+    failed: typing.Callable[[T], bool] = None,
+    cancel: typing.Callable[[T], typing.Any] = None,
+    max_workers: int = None,
 ) -> typing.List[T]:
-    return utils.exec_async(predicate, sequence)
+    """Submit the child packages of a master/child shipment concurrently.
+
+    Example:
+        responses = lib.run_multi_piece(
+            lambda child: self._send_request("/ship", lib.Serializable(child)),
+            child_requests,
+            master=master_response,
+            failed=lambda response: "<Error>" in response,
+            cancel=lambda response: self._cancel_package(response),
+        )
+
+    :param predicate: the function submitting a child package (in the shared executor).
+    :param sequence: the child packages requests (sent once the master is created).
+    :param master: the master package response (returned first, cancelled on failures).
+    :param failed: whether a child response is a failure.
+    :param cancel: the function cancelling a created package from its response.
+    :param max_workers: the number of children submitted at once.
+    :return: the master and children responses in order (or the failed ones).
+    """
+    return utils.exec_multi_piece(
+        sequence,
+        predicate,
+        master=master,
+        failed=failed,
+        cancel=cancel,
+        max_workers=max_workers,
+    )
+
+
+def run_coroutine(coroutine: typing.Coroutine[typing.Any, typing.Any, T]) -> T:
+    """Run a coroutine to completion from synchronous code.
+
+    Example:
+        response = lib.run_coroutine(proxy.get_rates_async(request))
+
+    :param coroutine: the coroutine to run (on a dedicated event loop thread).
+    :return: the coroutine result.
+    """
+    return utils.run_coroutine(coroutine)
+
+
+def set_executor(executor: utils.Executor) -> utils.Executor:
+    """Replace the executor shared by `run_concurently` and `run_asynchronously`.
+
+    Example:
+        lib.set_executor(lib.Executor(max_workers=64, carrier_limits={"ups": 20}))
+
+    :param executor: an executor with the global and per carrier concurrency caps.
+    :return: the executor now in use.
+    """
+    return utils.set_executor(executor)
 
 
 # -----------------------------------------------------------
@@ -583,54 +724,207 @@ def request(
     return utils.request(decoder=decoder, on_error=on_error, trace=trace, **kwargs)
 
 
+async def request_async(
+    decoder: typing.Callable = utils.decode_bytes,
+    on_error: typing.Callable = None,
+    trace: typing.Callable[[typing.Any, str], typing.Any] = None,
+    **kwargs,
+) -> str:
+    """Send an HTTP request from a coroutine (same arguments as `request`).
+
+    Example:
+        async def get_rates_async(self, request: lib.Serializable) -> lib.Deserializable:
+            response = await lib.request_async(url=..., data=request.serialize(), method="POST")
+            return lib.Deserializable(response, lib.to_dict)
+    """
+    return await utils.request_async(
+        decoder=decoder, on_error=on_error, trace=trace, **kwargs
+    )
+
+
+def set_transport(
+    transport: utils.AbstractTransport,
+) -> utils.AbstractTransport:
+    """Replace the HTTP transport used by `lib.request` for the whole process.
+
+    Example:
+        lib.set_transport(lib.PooledTransport(pool_size=10, pool_sizes={"ups": 20}))
+
+    :param transport: a transport instance (e.g. PooledTransport, UrllibTransport).
+    :return: the transport now in use.
+    """
+    return utils.set_transport(transport)
+
+
+def set_async_transport(
+    transport: utils.AbstractAsyncTransport,
+) -> utils.AbstractAsyncTransport:
+    """Replace the HTTP transport used by `lib.request_async` for the whole process.
+
+    :param transport: an asyncio transport instance (e.g. AsyncPooledTransport).
+    :return: the transport now in use.
+    """
+    return utils.set_async_transport(transport)
+
+
+def set_breaker(
+    breaker: typing.Optional[utils.CircuitBreaker],
+) -> typing.Optional[utils.CircuitBreaker]:
+    """Replace the per carrier connection circuit breaker used by `lib.request`.
+
+    Example:
+        lib.set_breaker(lib.CircuitBreaker(error_threshold=0.5, reset_timeout=30))
+
+    :param breaker: a circuit breaker (None to disable it).
+    :return: the circuit breaker now in use.
+    """
+    return utils.set_breaker(breaker)
+
+
+def set_retry_policy(
+    retry_policy: typing.Optional[utils.RetryPolicy],
+) -> typing.Optional[utils.RetryPolicy]:
+    """Replace the retry policy of the idempotent requests sent by `lib.request`.
+
+    Example:
+        lib.set_retry_policy(lib.RetryPolicy(max_retries=2, backoff=0.2))
+
+    :param retry_policy: a retry policy (None to disable retries).
+    :return: the retry policy now in use.
+    """
+    return utils.set_retry_policy(retry_policy)
+
+
 # -----------------------------------------------------------
 # image and document processing utility functions.
 # -----------------------------------------------------------
 
 
+def document_content(
+    document: utils.Document,
+) -> typing.Union[bytes, memoryview]:
+    """Return the raw content of a document.
+
+    Example:
+        content = lib.document_content("JVBERi0xLjQK...")  # b"%PDF-1.4..."
+
+    :param document: a base64 string or the (bytes-like) document content.
+    :return: the document bytes (bytes-like contents are not copied).
+    """
+    return utils.document_content(document)
+
+
+def document_base64(
+    document: utils.Document,
+) -> str:
+    """Return the base64 string of a document.
+
+    :param document: a base64 string (returned as is) or the document content.
+    :return: a base64 string.
+    """
+    return utils.document_base64(document)
+
+
 def image_to_pdf(
-    image_str: str,
+    image_str: utils.Document,
     rotate: int = None,
     resize: dict = None,
 ) -> str:
     return utils.image_to_pdf(image_str, rotate=rotate, resize=resize)
 
 
+def image_to_pdf_bytes(
+    image: utils.Document,
+    rotate: int = None,
+    resize: dict = None,
+) -> bytes:
+    """Return the PDF content of an image (without encoding it to base64)."""
+    return utils.image_to_pdf_bytes(image, rotate=rotate, resize=resize)
+
+
 def bundle_pdfs(
-    base64_strings: typing.List[str],
+    base64_strings: typing.Sequence[utils.Document],
 ) -> utils.PdfMerger:
     return utils.bundle_pdfs(base64_strings)
 
 
 def bundle_imgs(
-    base64_strings: typing.List[str],
+    base64_strings: typing.Sequence[utils.Document],
 ) -> utils.Image:
     return utils.bundle_imgs(base64_strings)
 
 
 def bundle_zpls(
-    base64_strings: typing.List[str],
+    base64_strings: typing.Sequence[utils.Document],
 ) -> str:
     return utils.bundle_zpls(base64_strings)
 
 
 def zpl_to_pdf(
-    zpl_str: str,
+    zpl_str: utils.Document,
     width: int,
     height: int,
     dpmm: int = 12,
 ) -> str:
-    """Return a PDF base64 string from a ZPL string."""
+    """Return a PDF base64 string from a ZPL document.
+
+    The labels are rendered locally (see `karrio.addons.zpl`) and the
+    rendered documents cached by label hash.
+
+    Example:
+        pdf_label = lib.zpl_to_pdf(zpl_label_base64, 4, 6, dpmm=8)
+
+    :param zpl_str: the ZPL document base64 string or content.
+    :param width: the label width in inches.
+    :param height: the label height in inches.
+    :param dpmm: the printer density in dots per millimeter.
+    :return: the PDF document base64 string.
+    """
     return utils.zpl_to_pdf(zpl_str, width, height, dpmm=dpmm)
 
 
 def bundle_base64(
-    base64_strings: typing.List[str],
+    base64_strings: typing.Sequence[utils.Document],
     format: str = "PDF",
 ) -> str:
     return utils.bundle_base64(base64_strings, format=format)
 
 
+def bundle_bytes(
+    documents: typing.Sequence[utils.Document],
+    format: str = "PDF",
+) -> bytes:
+    """Return the bundle content of a list of documents.
+
+    Example:
+        content = lib.bundle_bytes([label1_bytes, "label2_base64=="], "PDF")
+
+    :param documents: base64 strings or documents content.
+    :param format: the documents format (PDF, ZPL or an image format).
+    :return: the bundled document bytes.
+    """
+    return utils.bundle_bytes(documents, format=format)
+
+
+def write_bundle(
+    documents: typing.Sequence[utils.Document],
+    sink: typing.BinaryIO,
+    format: str = "PDF",
+) -> typing.BinaryIO:
+    """Write the bundle of a list of documents into a file-like sink.
+
+    Example:
+        with open("labels.pdf", "wb") as file:
+            lib.write_bundle(labels, file, "PDF")
+
+    :param documents: base64 strings or documents content.
+    :param sink: a writable binary file-like object.
+    :param format: the documents format (PDF, ZPL or an image format).
+    :return: the sink.
+    """
+    return utils.write_bundle(documents, sink, format=format)
+
+
 def to_buffer(
     base64_string: str,
     **kwargs,
@@ -658,3 +952,28 @@ def failsafe(callable: typing.Callable[[], T], warning: str = None) -> T:
     don't mind if it fails.
     """
     return utils.failsafe(callable, warning=warning)
+
+
+def lazy_exports(
+    package: str, exports: typing.Dict[str, typing.List[str]]
+) -> typing.Tuple[
+    typing.Callable[[str], typing.Any], typing.Callable[[], typing.List[str]]
+]:
+    """Import the names a package exports from its modules on first access.
+
+    Example:
+        # karrio/providers/<carrier>/__init__.py
+        __getattr__, __dir__ = lib.lazy_exports(
+            __name__,
+            {
+                ".utils": ["Settings"],
+                ".rate": ["parse_rate_response", "rate_request"],
+                ".tracking": ["parse_tracking_response", "tracking_request"],
+            },
+        )
+
+    :param package: the package name (`__name__`).
+    :param exports: the package modules mapped to the names they export.
+    :return: the package module level `__getattr__` and `__dir__` functions.
+    """
+    return utils.lazy_exports(package, exports)
@@ -1,8 +1,12 @@
 """Karrio Interface references."""
+import os
 import attr
-import pydoc
+import json
 import typing
 import pkgutil
+import importlib
+import threading
+import collections.abc
 
 import karrio.lib as lib
 import karrio.mappers as mappers
@@ -14,21 +18,233 @@ PROVIDERS = None
 PROVIDERS_DATA = None
 REFERENCES = None
 
+SNAPSHOT_VERSION = 1
+CACHE_DIR = os.environ.get("KARRIO_CACHE_DIR") or os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "karrio",
+)
+MANIFEST_PATH = os.path.join(CACHE_DIR, "manifest.json")
+REFERENCES_PATH = os.path.join(CACHE_DIR, "references.json")
+
+_EXTENSIONS: typing.Dict[str, metadata.Metadata] = {}
+_DISCOVERED: typing.Tuple[tuple, typing.Dict[str, str]] = ((), {})
+_SNAPSHOTS: typing.Dict[str, typing.Tuple[dict, typing.Any]] = {}
+_lock = threading.RLock()
+
+
+def discover_extensions() -> typing.Dict[str, str]:
+    """Return the installed carrier extensions names and paths without importing them.
+
+    The `karrio.mappers` namespace is only scanned again when its path changes.
+    """
+    global _DISCOVERED
+    paths = tuple(mappers.__path__)
+
+    if _DISCOVERED[0] != paths:
+        _DISCOVERED = (
+            paths,
+            {
+                name: os.path.join(getattr(finder, "path", ""), name)
+                for finder, name, _ in pkgutil.iter_modules(paths)
+            },
+        )
+
+    return _DISCOVERED[1]
+
+
+def import_extension(carrier_name: str) -> metadata.Metadata:
+    """Import a single carrier extension (mapper, proxy and schemas) on first use.
+
+    Raises:
+        KeyError: if no extension is installed under that name
+    """
+    if carrier_name in _EXTENSIONS:
+        return _EXTENSIONS[carrier_name]
+
+    if carrier_name not in discover_extensions():
+        raise KeyError(carrier_name)
+
+    with _lock:
+        if carrier_name not in _EXTENSIONS:
+            module = importlib.import_module(f"{mappers.__name__}.{carrier_name}")
+            _EXTENSIONS[carrier_name] = module.METADATA
+
+    return _EXTENSIONS[carrier_name]
+
 
 def import_extensions() -> typing.Dict[str, metadata.Metadata]:
     global PROVIDERS
-    modules = {
-        name: __import__(f"{mappers.__name__}.{name}", fromlist=[name])
-        for _, name, _ in pkgutil.iter_modules(mappers.__path__)
-    }
 
     PROVIDERS = {
-        carrier_name: module.METADATA for carrier_name, module in modules.items()
+        carrier_name: import_extension(carrier_name)
+        for carrier_name in discover_extensions()
     }
 
     return PROVIDERS
 
 
+class Registry(collections.abc.Mapping):
+    """A read only mapping of the installed carrier extensions importing them on access."""
+
+    def __getitem__(self, carrier_name: str) -> metadata.Metadata:
+        return import_extension(carrier_name)
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(discover_extensions())
+
+    def __len__(self) -> int:
+        return len(discover_extensions())
+
+    def __contains__(self, carrier_name: object) -> bool:
+        return carrier_name in discover_extensions()
+
+
+def load_manifest(path: str = None) -> typing.Dict[str, dict]:
+    """Return the installed carriers metadata (label, capabilities, services, options...).
+
+    The manifest is read from the `path` (`MANIFEST_PATH`) snapshot so that
+    carriers are only imported when the installed extensions changed.
+    """
+    return load_snapshot(path or MANIFEST_PATH, collect_manifest)
+
+
+def load_snapshot(path: str, collect: typing.Callable[[], dict]) -> dict:
+    """Return the read only snapshot of the data collected from the installed extensions.
+
+    The snapshot is loaded once per process (and extensions set) from the `path`
+    file, or collected and written to it when the file is missing or was
+    generated for different extensions (or extension files).
+    """
+    extensions = discover_extensions()
+    cached = _SNAPSHOTS.get(path)
+
+    if cached is not None and cached[0] is extensions:
+        return cached[1]
+
+    with _lock:
+        fingerprint = extensions_fingerprint()
+        content = _read_snapshot(path)
+
+        if content is None or content.get("fingerprint") != fingerprint:
+            content = json.loads(
+                json.dumps(dict(fingerprint=fingerprint, data=collect()))
+            )
+            _write_snapshot(path, content)
+
+        data = freeze(content["data"])
+        _SNAPSHOTS[path] = (extensions, data)
+
+    return data
+
+
+def build_snapshots():
+    """Generate the manifest and references snapshots (e.g. at build time)."""
+    _SNAPSHOTS.clear()
+    load_manifest()
+    collect_references()
+
+
+class FrozenDict(dict):
+    """A read only dict (still serializable as a plain dict)."""
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError(f"'{self.__class__.__name__}' object is immutable")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable  # type: ignore
+    clear = pop = popitem = setdefault = update = _immutable  # type: ignore
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+
+def freeze(value: typing.Any) -> typing.Any:
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+
+    return value
+
+
+def collect_manifest() -> typing.Dict[str, dict]:
+    return {
+        carrier_name: dict(
+            id=metadata.id,
+            label=metadata.label,
+            is_hub=metadata.is_hub,
+            hub_carriers=metadata.hub_carriers,
+            capabilities=detect_capabilities(detect_proxy_methods(metadata.Proxy)),
+            services=(
+                {c.name: c.value for c in list(metadata.services)}  # type: ignore
+                if metadata.services is not None
+                else None
+            ),
+            options=(
+                {c.name: dict(code=c.value.code) for c in list(metadata.options)}  # type: ignore
+                if metadata.options is not None
+                else None
+            ),
+        )
+        for carrier_name, metadata in import_extensions().items()
+    }
+
+
+def extensions_fingerprint() -> str:
+    """Identify the installed extensions (and core units) by their files stats."""
+    files = [units.__file__] + [
+        os.path.join(directory, file)
+        for path in discover_extensions().values()
+        for directory, names in [
+            (path, sorted(os.listdir(path)) if os.path.isdir(path) else []),
+            (_providers_path(path), ["units.py"]),
+        ]
+        for file in names
+        if file.endswith(".py")
+    ]
+    stats = [
+        (file, stat.st_mtime_ns, stat.st_size)
+        for file in files
+        for stat in [_stat(file)]
+        if stat is not None
+    ]
+
+    return lib.to_json(dict(version=SNAPSHOT_VERSION, stats=stats))
+
+
+def _providers_path(mapper_path: str) -> str:
+    # karrio/mappers/<carrier> -> karrio/providers/<carrier>
+    root, name = os.path.split(mapper_path)
+    return os.path.join(os.path.dirname(root), "providers", name)
+
+
+def _stat(file: str) -> typing.Optional[os.stat_result]:
+    try:
+        return os.stat(file)
+    except OSError:
+        return None
+
+
+def _read_snapshot(path: str) -> typing.Optional[dict]:
+    try:
+        with open(path, "r") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_snapshot(path: str, content: dict):
+    # snapshots are only a cache: an unwritable location shouldn't fail lookups
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w") as file:
+            json.dump(content, file)
+        os.replace(temporary, path)
+    except OSError:
+        pass
+
+
 def collect_providers_data() -> typing.Dict[str, dict]:
     global PROVIDERS_DATA
     if PROVIDERS is None:
@@ -56,15 +272,32 @@ def detect_capabilities(proxy_methods: typing.List[str]) -> typing.List[str]:
 
 
 def detect_proxy_methods(proxy_type: object) -> typing.List[str]:
-    return [
+    methods = [
         prop
         for prop in proxy_type.__dict__.keys()
         if "_" not in prop[0] and prop != "settings"
     ]
 
+    # an async operation (e.g. `get_rates_async`) supports the same request as its sync counterpart
+    return list(
+        dict.fromkeys(
+            m[: -len("_async")] if m.endswith("_async") else m for m in methods
+        )
+    )
+
 
 def collect_references() -> dict:
+    """Return the read only references (countries, carriers, services, options...).
+
+    They are loaded from the `REFERENCES_PATH` snapshot and memoized.
+    """
     global REFERENCES
+    REFERENCES = load_snapshot(REFERENCES_PATH, build_references)
+
+    return REFERENCES
+
+
+def build_references() -> dict:
     if PROVIDERS_DATA is None:
         collect_providers_data()
 
@@ -84,7 +317,7 @@ def collect_references() -> dict:
         if mapper.get("connection_configs") is not None
     }
 
-    REFERENCES = {
+    return {
         "countries": {c.name: c.value for c in list(units.Country)},
         "currencies": {c.name: c.value for c in list(units.Currency)},
         "weight_units": {c.name: c.value for c in list(units.WeightUnit)},
@@ -139,10 +372,8 @@ def collect_references() -> dict:
         },
     }
 
-    return REFERENCES
-
 
 def get_carrier_capabilities(carrier_name) -> typing.List[str]:
-    proxy_class = pydoc.locate(f"karrio.mappers.{carrier_name}.Proxy")
+    proxy_class = import_extension(carrier_name).Proxy
     proxy_methods = detect_proxy_methods(proxy_class)
     return detect_capabilities(proxy_methods)
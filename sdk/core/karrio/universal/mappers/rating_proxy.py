@@ -45,20 +45,18 @@ class RatingMixinProxy:
             if s.service_code in _request.services
         ]
 
+        package_rates = get_packages_rates(
+            list(packages),
+            shipper,
+            recipient,
+            self.settings,
+            is_domicile=is_domicile,
+            is_international=is_international,
+            selected_services=selected_services,
+        )
         response: typing.List[typing.Tuple[str, PackageRates]] = [
-            (
-                f'{getattr(pkg, "id", idx)}',
-                get_available_rates(
-                    pkg,
-                    shipper,
-                    recipient,
-                    self.settings,
-                    is_domicile=is_domicile,
-                    is_international=is_international,
-                    selected_services=selected_services,
-                ),
-            )
-            for idx, pkg in enumerate(packages, 1)
+            (f'{getattr(pkg, "id", idx)}', rates)
+            for idx, (pkg, rates) in enumerate(zip(packages, package_rates), 1)
         ]
 
         return utils.Deserializable(response)
@@ -73,11 +71,43 @@ def get_available_rates(
     is_international: bool = None,
     selected_services: typing.List[str] = [],
 ) -> PackageRates:
-    errors: typing.List[models.Message] = []
-    rates: typing.List[models.RateDetails] = []
-    services = [svc for svc in settings.shipping_services if svc.active]
+    return get_packages_rates(
+        [package],
+        shipper,
+        recipient,
+        settings,
+        is_domicile=is_domicile,
+        is_international=is_international,
+        selected_services=selected_services,
+    )[0]
+
+
+def get_packages_rates(
+    packages: typing.List[units.Package],
+    shipper: units.ComputedAddress,
+    recipient: units.ComputedAddress,
+    settings: RatingMixinSettings,
+    is_domicile: bool = None,
+    is_international: bool = None,
+    selected_services: typing.List[str] = [],
+) -> typing.List[PackageRates]:
+    """Return the rates (and errors) of every package from the compiled rate sheet.
+
+    The recipient zones are looked up once per service and the weight brackets
+    of all the packages are matched at once (with NumPy when installed).
+    """
+    results: typing.List[PackageRates] = [([], []) for _ in packages]
+    conversions: typing.Dict[typing.Tuple[int, str, str], float] = {}
+
+    def measure(idx: int, dimension: str, unit: str) -> float:
+        key = (idx, dimension, unit)
+        if key not in conversions:
+            conversions[key] = getattr(packages[idx], dimension)[unit]
+        return conversions[key]
+
+    for service_index in settings.rate_sheet.services:
+        service = service_index.service
 
-    for service in services:
         # Check if service requested
         explicitly_requested = service.service_code in selected_services
         implicitly_requested = len(selected_services or []) == 0
@@ -111,173 +141,148 @@ def get_available_rates(
             explicit_destination_covered or implicit_destination_covered
         )
 
-        # Check if weight and dimensions fit restrictions
-        match_length_requirements = (
-            service.max_length is not None
-            and package.length[service.dimension_unit]
-            <= units.Dimension(service.max_length or 0, service.dimension_unit).value
-        ) or (service.max_length is None)
-        match_height_requirements = (
-            service.max_height is not None
-            and package.height[service.dimension_unit]
-            <= units.Dimension(service.max_height, service.dimension_unit).value
-        ) or (service.max_height is None)
-        match_width_requirements = (
-            service.max_width is not None
-            and package.width[service.dimension_unit]
-            <= units.Dimension(service.max_width, service.dimension_unit).value
-        ) or (service.max_width is None)
-        match_min_weight_requirements = (
-            service.min_weight is not None
-            and package.weight[service.weight_unit]
-            <= units.Weight(service.min_weight, service.weight_unit).value
-        ) or (service.min_weight is None)
-        match_max_weight_requirements = (
-            service.max_weight is not None
-            and package.weight[service.weight_unit]
-            <= units.Weight(service.max_weight, service.weight_unit).value
-        ) or (service.max_weight is None)
-
-        # resolve matching zone
-        selected_zone: typing.Optional[models.ServiceZone] = None
-
-        for zone in service.zones or []:
-            # Check Location inclusion
-            _cover_supported_cities = (
-                zone.cities is not None and recipient.city in zone.cities
-            ) or not any(zone.cities or [])
-            _cover_supported_countries = (
-                zone.cities is not None and recipient.country_code in zone.country_codes
-            ) or not any(zone.country_codes or [])
+        # resolve the zones covering the destination then the packages weight
+        candidates = service_index.locate(recipient.city, recipient.country_code)
+        matching_zones = (
+            service_index.weigh_many(
+                candidates,
+                [
+                    measure(idx, "weight", service.weight_unit)
+                    for idx in range(len(packages))
+                ],
+            )
+            if service_index.has_zone_weights and len(candidates) > 0
+            else [candidates] * len(packages)
+        )
 
+        for idx, (rates, errors) in enumerate(results):
             # Check if weight and dimensions fit restrictions
-            _match_zone_min_weight_requirements = (
-                zone.min_weight is not None
-                and package.weight[service.weight_unit]
-                >= units.Weight(zone.min_weight, service.weight_unit).value
-            ) or (zone.min_weight is None)
-            _match_zone_max_weight_requirements = (
-                zone.max_weight is not None
-                and package.weight[service.weight_unit]
-                <= units.Weight(zone.max_weight, service.weight_unit).value
-            ) or (zone.max_weight is None)
-
-            # Check if best fit zone is selected
-            _best_fit_zone_selected = (
-                selected_zone is not None
-                and selected_zone.rate < zone.rate
-                and (
-                    selected_zone.max_weight < zone.max_weight
-                    or selected_zone.min_weight < zone.min_weight
-                )
+            match_length_requirements = (
+                service_index.max_length is None
+                or measure(idx, "length", service.dimension_unit)
+                <= service_index.max_length
+            )
+            match_height_requirements = (
+                service_index.max_height is None
+                or measure(idx, "height", service.dimension_unit)
+                <= service_index.max_height
+            )
+            match_width_requirements = (
+                service_index.max_width is None
+                or measure(idx, "width", service.dimension_unit)
+                <= service_index.max_width
+            )
+            match_min_weight_requirements = (
+                service_index.min_weight is None
+                or measure(idx, "weight", service.weight_unit)
+                <= service_index.min_weight
+            )
+            match_max_weight_requirements = (
+                service_index.max_weight is None
+                or measure(idx, "weight", service.weight_unit)
+                <= service_index.max_weight
             )
 
-            if (
-                _cover_supported_cities
-                and _cover_supported_countries
-                and _match_zone_min_weight_requirements
-                and _match_zone_max_weight_requirements
-                and _best_fit_zone_selected is False
-            ):
-                selected_zone = zone
+            # resolve matching zone
+            selected_zone = service_index.select(matching_zones[idx])
 
-        # error validations
-        if explicitly_requested and not explicit_destination_covered:
-            errors.append(
-                models.Message(
-                    carrier_id=settings.carrier_id,
-                    carrier_name=settings.carrier_name,
-                    code="destination_not_supported",
-                    message=f"the service {service.service_code} does not cover the requested destination",
+            # error validations
+            if explicitly_requested and not explicit_destination_covered:
+                errors.append(
+                    models.Message(
+                        carrier_id=settings.carrier_id,
+                        carrier_name=settings.carrier_name,
+                        code="destination_not_supported",
+                        message=f"the service {service.service_code} does not cover the requested destination",
+                    )
                 )
-            )
-        if (
-            explicitly_requested
-            and destination_covered
-            and service.max_length is not None
-            and not match_length_requirements
-        ):
-            errors.append(
-                models.Message(
-                    carrier_id=settings.carrier_id,
-                    carrier_name=settings.carrier_name,
-                    code="invalid_dimension",
-                    message=f"length size exceeds service {service.service_code} max length",
+            if (
+                explicitly_requested
+                and destination_covered
+                and service.max_length is not None
+                and not match_length_requirements
+            ):
+                errors.append(
+                    models.Message(
+                        carrier_id=settings.carrier_id,
+                        carrier_name=settings.carrier_name,
+                        code="invalid_dimension",
+                        message=f"length size exceeds service {service.service_code} max length",
+                    )
                 )
-            )
-        if (
-            explicitly_requested
-            and destination_covered
-            and service.max_height is not None
-            and not match_height_requirements
-        ):
-            errors.append(
-                models.Message(
-                    carrier_id=settings.carrier_id,
-                    carrier_name=settings.carrier_name,
-                    code="invalid_dimension",
-                    message=f"height size exceeds service {service.service_code} max height",
+            if (
+                explicitly_requested
+                and destination_covered
+                and service.max_height is not None
+                and not match_height_requirements
+            ):
+                errors.append(
+                    models.Message(
+                        carrier_id=settings.carrier_id,
+                        carrier_name=settings.carrier_name,
+                        code="invalid_dimension",
+                        message=f"height size exceeds service {service.service_code} max height",
+                    )
                 )
-            )
-        if (
-            explicitly_requested
-            and destination_covered
-            and service.max_width is not None
-            and not match_width_requirements
-        ):
-            errors.append(
-                models.Message(
-                    carrier_id=settings.carrier_id,
-                    carrier_name=settings.carrier_name,
-                    code="invalid_dimension",
-                    message=f"the width size exceeds service {service.service_code} max width",
+            if (
+                explicitly_requested
+                and destination_covered
+                and service.max_width is not None
+                and not match_width_requirements
+            ):
+                errors.append(
+                    models.Message(
+                        carrier_id=settings.carrier_id,
+                        carrier_name=settings.carrier_name,
+                        code="invalid_dimension",
+                        message=f"the width size exceeds service {service.service_code} max width",
+                    )
                 )
-            )
-        if (
-            explicitly_requested
-            and destination_covered
-            and service.max_weight is not None
-            and not match_max_weight_requirements
-        ):
-            errors.append(
-                models.Message(
-                    carrier_id=settings.carrier_id,
-                    carrier_name=settings.carrier_name,
-                    code="invalid_weight",
-                    message=f"the weight exceeds service {service.service_code} max weight",
+            if (
+                explicitly_requested
+                and destination_covered
+                and service.max_weight is not None
+                and not match_max_weight_requirements
+            ):
+                errors.append(
+                    models.Message(
+                        carrier_id=settings.carrier_id,
+                        carrier_name=settings.carrier_name,
+                        code="invalid_weight",
+                        message=f"the weight exceeds service {service.service_code} max weight",
+                    )
                 )
-            )
 
-        if (
-            destination_covered
-            and match_length_requirements
-            and match_height_requirements
-            and match_width_requirements
-            and match_min_weight_requirements
-            and match_max_weight_requirements
-            and selected_zone is not None
-        ):
-            carrier_name = getattr(
-                settings,
-                "custom_carrier_name",
-                settings.carrier_name,
-            )
-            transit_days = (
-                service.transit_days
-                if selected_zone.transit_days is None
-                else selected_zone.transit_days
-            )
+            if (
+                destination_covered
+                and match_length_requirements
+                and match_height_requirements
+                and match_width_requirements
+                and match_min_weight_requirements
+                and match_max_weight_requirements
+                and selected_zone is not None
+            ):
+                carrier_name = getattr(
+                    settings,
+                    "custom_carrier_name",
+                    settings.carrier_name,
+                )
+                transit_days = (
+                    service.transit_days
+                    if selected_zone.transit_days is None
+                    else selected_zone.transit_days
+                )
 
-            rates.append(
-                models.RateDetails(
-                    carrier_name=carrier_name,
-                    carrier_id=settings.carrier_id,
-                    service=service.service_code,
-                    currency=service.currency,
-                    transit_days=transit_days,
-                    total_charge=selected_zone.rate,
-                    meta=dict(service_name=service.service_name),
+                rates.append(
+                    models.RateDetails(
+                        carrier_name=carrier_name,
+                        carrier_id=settings.carrier_id,
+                        service=service.service_code,
+                        currency=service.currency,
+                        transit_days=transit_days,
+                        total_charge=selected_zone.rate,
+                        meta=dict(service_name=service.service_name),
+                    )
                 )
-            )
 
-    return rates, errors
+    return results
@@ -0,0 +1,212 @@
+"""Universal rating compiled rate sheet index."""
+
+import attr
+import bisect
+import typing
+import karrio.core.units as units
+import karrio.core.models as models
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional (`karrio[numpy]`): weights are then matched one at a time
+    numpy = None
+
+Zones = typing.Tuple[int, ...]
+UNBOUNDED = float("inf")
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class ServiceIndex:
+    """A service level with its restrictions converted and its zones indexed.
+
+    Zones are looked up by recipient city and country (hash maps) then filtered
+    by weight: their converted lower bounds are sorted so that the zones a weight
+    reaches are found with a bisection.
+    """
+
+    service: models.ServiceLevel
+    zones: typing.Tuple[models.ServiceZone, ...]
+
+    # service restrictions converted in the service units
+    max_length: typing.Optional[float]
+    max_height: typing.Optional[float]
+    max_width: typing.Optional[float]
+    min_weight: typing.Optional[float]
+    max_weight: typing.Optional[float]
+
+    # zones weight brackets (converted in the service weight unit)
+    zone_min_weights: typing.Tuple[float, ...]
+    zone_max_weights: typing.Tuple[float, ...]
+    sorted_min_weights: typing.Tuple[float, ...]
+    min_weight_ranks: typing.Tuple[int, ...]
+    has_zone_weights: bool
+
+    # zones location lookups
+    any_city_zones: typing.FrozenSet[int]
+    city_zones: typing.Dict[str, typing.FrozenSet[int]]
+    any_country_zones: typing.FrozenSet[int]
+    country_zones: typing.Dict[str, typing.FrozenSet[int]]
+
+    @classmethod
+    def compile(cls, service: models.ServiceLevel) -> "ServiceIndex":
+        zones = tuple(service.zones or [])
+        min_weights = tuple(
+            -UNBOUNDED
+            if zone.min_weight is None
+            else units.Weight(zone.min_weight, service.weight_unit).value
+            for zone in zones
+        )
+        max_weights = tuple(
+            UNBOUNDED
+            if zone.max_weight is None
+            else units.Weight(zone.max_weight, service.weight_unit).value
+            for zone in zones
+        )
+        order = sorted(range(len(zones)), key=lambda idx: min_weights[idx])
+        ranks = [0] * len(zones)
+        for rank, idx in enumerate(order):
+            ranks[idx] = rank
+
+        city_zones: typing.Dict[str, typing.Set[int]] = {}
+        country_zones: typing.Dict[str, typing.Set[int]] = {}
+        for idx, zone in enumerate(zones):
+            if any(zone.cities or []):
+                for city in zone.cities:
+                    city_zones.setdefault(city, set()).add(idx)
+
+            # a zone country codes only apply when its cities are set (even empty)
+            if zone.cities is not None and any(zone.country_codes or []):
+                for country_code in zone.country_codes:
+                    country_zones.setdefault(country_code, set()).add(idx)
+
+        return cls(
+            service=service,
+            zones=zones,
+            max_length=convert(units.Dimension, service.max_length, service),
+            max_height=convert(units.Dimension, service.max_height, service),
+            max_width=convert(units.Dimension, service.max_width, service),
+            min_weight=convert(units.Weight, service.min_weight, service),
+            max_weight=convert(units.Weight, service.max_weight, service),
+            zone_min_weights=min_weights,
+            zone_max_weights=max_weights,
+            sorted_min_weights=tuple(min_weights[idx] for idx in order),
+            min_weight_ranks=tuple(ranks),
+            has_zone_weights=any(
+                zone.min_weight is not None or zone.max_weight is not None
+                for zone in zones
+            ),
+            any_city_zones=frozenset(
+                idx for idx, zone in enumerate(zones) if not any(zone.cities or [])
+            ),
+            city_zones={key: frozenset(value) for key, value in city_zones.items()},
+            any_country_zones=frozenset(
+                idx
+                for idx, zone in enumerate(zones)
+                if not any(zone.country_codes or [])
+            ),
+            country_zones={
+                key: frozenset(value) for key, value in country_zones.items()
+            },
+        )
+
+    def locate(self, city: str = None, country_code: str = None) -> Zones:
+        """Return the (sorted) indexes of the zones covering the recipient location."""
+        cities = self.any_city_zones | self.city_zones.get(city, frozenset())
+        countries = self.any_country_zones | self.country_zones.get(
+            country_code, frozenset()
+        )
+
+        return tuple(sorted(cities & countries))
+
+    def weigh(self, candidates: Zones, weight: typing.Optional[float]) -> Zones:
+        """Return the candidate zones whose weight bracket includes `weight`."""
+        if not self.has_zone_weights:
+            return candidates
+
+        cut = bisect.bisect_right(self.sorted_min_weights, weight)
+
+        return tuple(
+            idx
+            for idx in candidates
+            if self.min_weight_ranks[idx] < cut and weight <= self.zone_max_weights[idx]
+        )
+
+    def weigh_many(
+        self, candidates: Zones, weights: typing.List[typing.Optional[float]]
+    ) -> typing.List[Zones]:
+        """Return the candidate zones of each weight (all evaluated at once with NumPy)."""
+        if not self.has_zone_weights or len(candidates) == 0:
+            return [candidates] * len(weights)
+
+        if (
+            numpy is None
+            or len(weights) == 1
+            or any(weight is None for weight in weights)
+        ):
+            return [self.weigh(candidates, weight) for weight in weights]
+
+        zones = numpy.array(candidates)
+        lower = numpy.array([self.zone_min_weights[idx] for idx in candidates])
+        upper = numpy.array([self.zone_max_weights[idx] for idx in candidates])
+        values = numpy.array(weights, dtype=float)[:, None]
+        matches = (values >= lower) & (values <= upper)
+
+        return [tuple(zones[row].tolist()) for row in matches]
+
+    def select(self, candidates: Zones) -> typing.Optional[models.ServiceZone]:
+        """Return the best fit zone among the matching ones.
+
+        A matching zone replaces the selected one unless it is more expensive
+        for a wider weight bracket (the zones are folded in the sheet order).
+        """
+        selected: typing.Optional[models.ServiceZone] = None
+
+        for idx in candidates:
+            zone = self.zones[idx]
+            best_fit_zone_selected = (
+                selected is not None
+                and selected.rate < zone.rate
+                and (
+                    selected.max_weight < zone.max_weight
+                    or selected.min_weight < zone.min_weight
+                )
+            )
+
+            if best_fit_zone_selected is False:
+                selected = zone
+
+        return selected
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class RateSheetIndex:
+    """The active service levels of a rating connection compiled for fast lookups.
+
+    Example:
+        index = RateSheetIndex.compile(settings.shipping_services)
+    """
+
+    services: typing.Tuple[ServiceIndex, ...]
+
+    @classmethod
+    def compile(cls, services: typing.List[models.ServiceLevel]) -> "RateSheetIndex":
+        return cls(
+            services=tuple(
+                ServiceIndex.compile(service)
+                for service in services or []
+                if service.active
+            )
+        )
+
+
+def convert(
+    unit_type: typing.Union[typing.Type[units.Weight], typing.Type[units.Dimension]],
+    value: typing.Optional[float],
+    service: models.ServiceLevel,
+) -> typing.Optional[float]:
+    if value is None:
+        return None
+
+    unit = service.weight_unit if unit_type is units.Weight else service.dimension_unit
+
+    return unit_type(value, unit).value
@@ -1,8 +1,10 @@
 import attr
 import typing
 import jstruct
+import functools
 import karrio.core.models as models
 import karrio.core.settings as settings
+from karrio.universal.providers.rating.index import RateSheetIndex, ServiceIndex
 
 PackageRates = typing.Tuple[
     typing.List[models.RateDetails], typing.List[models.Message]
@@ -19,3 +21,8 @@ class RatingMixinSettings(settings.Settings):
     @property
     def shipping_services(self) -> typing.List[models.ServiceLevel]:
         return self.services
+
+    @functools.cached_property
+    def rate_sheet(self) -> RateSheetIndex:
+        """The shipping services compiled (once per settings) for fast rate lookups."""
+        return RateSheetIndex.compile(self.shipping_services)
@@ -25,6 +25,10 @@ setup(
         "python-barcode",
         "PyPDF2",
     ],
+    extras_require={
+        "numpy": ["numpy"],
+        "zpl": ["qrcode"],
+    },
     classifiers=[
         "Intended Audience :: Developers",
         "Operating System :: OS Independent",
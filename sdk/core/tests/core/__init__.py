@@ -1,2 +1,23 @@
 from .test_universal_rate import *
 from .test_universal_shipment import *
+from .test_transport import *
+from .test_async import *
+from .test_executor import *
+from .test_tracing import *
+from .test_caching import *
+from .test_dict import *
+from .test_log import *
+from .test_references import *
+from .test_streaming import *
+from .test_deadline import *
+from .test_resilience import *
+from .test_pipeline import *
+from .test_multi_piece import *
+from .test_xml import *
+from .test_codec import *
+from .test_lazy_exports import *
+from .test_units import *
+from .test_requests import *
+from .test_parsing import *
+from .test_documents import *
+from .test_zpl import *
@@ -0,0 +1,263 @@
+import gzip
+import time
+import attr
+import asyncio
+import threading
+import unittest
+from unittest.mock import patch
+import http.server
+import urllib.request
+from urllib.error import URLError
+import karrio.lib as lib
+import karrio.core.models as models
+from karrio.api.proxy import Proxy
+from karrio.api.mapper import Mapper
+from karrio.api.gateway import Gateway
+from karrio.api.interface import Rating, call_proxy
+from karrio.core.settings import Settings
+from karrio.core.utils import Tracer
+from karrio.core.utils.transport import (
+    AsyncPooledTransport,
+    get_async_transport,
+    set_async_transport,
+)
+from karrio.references import detect_proxy_methods
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/slow":
+            time.sleep(1)
+            try:
+                return self._respond(200, b"slow")
+            except ConnectionError:
+                return  # the client gave up waiting
+        if self.path == "/error":
+            return self._respond(400, b'{"error": "invalid"}')
+        if self.path == "/gzip":
+            return self._respond(200, gzip.compress(b"zipped"), encoding="gzip")
+        if self.path == "/chunked":
+            self.send_response(200)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for chunk in [b"chun", b"ked"]:
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            return self.wfile.write(b"0\r\n\r\n")
+
+        self._respond(200, f"{self.command} {self.path}".encode())
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self._respond(200, body)
+
+    def _respond(self, status, body, encoding=None):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class ServerTestCase(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+
+class TestAsyncPooledTransport(ServerTestCase):
+    def setUp(self):
+        self.transport = AsyncPooledTransport(pool_size=2)
+
+    async def asyncTearDown(self):
+        await self.transport.close()
+
+    async def test_connection_is_kept_alive(self):
+        responses = [
+            await lib.request_async(url=f"{self.url}/ok", transport=self.transport)
+            for _ in range(5)
+        ]
+
+        self.assertListEqual(responses, ["GET /ok"] * 5)
+        self.assertEqual(self.transport.stats.connections, 1)
+        self.assertEqual(self.transport.stats.reused_connections, 4)
+
+    async def test_concurrent_requests(self):
+        responses = await asyncio.gather(
+            *(
+                lib.request_async(url=f"{self.url}/{index}", transport=self.transport)
+                for index in range(4)
+            )
+        )
+
+        self.assertListEqual(responses, [f"GET /{index}" for index in range(4)])
+
+    async def test_post_request_data(self):
+        response = await lib.request_async(
+            url=f"{self.url}/echo",
+            data='{"key": "value"}',
+            method="POST",
+            transport=self.transport,
+        )
+
+        self.assertEqual(response, '{"key": "value"}')
+
+    async def test_response_decoding(self):
+        zipped = await lib.request_async(
+            url=f"{self.url}/gzip", transport=self.transport
+        )
+        chunked = await lib.request_async(
+            url=f"{self.url}/chunked", transport=self.transport
+        )
+
+        self.assertEqual(zipped, "zipped")
+        self.assertEqual(chunked, "chunked")
+
+    async def test_error_response_is_handled(self):
+        response = await lib.request_async(
+            url=f"{self.url}/error",
+            transport=self.transport,
+            on_error=lambda error: f"{error.code}: {error.read().decode()}",
+        )
+
+        self.assertEqual(response, '400: {"error": "invalid"}')
+
+    async def test_unreachable_host_raises_url_error(self):
+        with self.assertRaises(URLError) as context:
+            await self.transport.send(urllib.request.Request("http://127.0.0.1:1/ok"))
+
+        self.assertIsInstance(context.exception.reason, ConnectionRefusedError)
+
+    async def test_replaced_transport_is_closed(self):
+        previous = get_async_transport()
+        set_async_transport(self.transport)
+        await lib.request_async(url=f"{self.url}/ok")
+        [(_, writer, _)] = next(
+            iter(self.transport._pools[asyncio.get_running_loop()].values())
+        )
+
+        set_async_transport(previous)
+
+        self.assertTrue(writer.is_closing())
+        self.assertEqual(len(self.transport._pools), 0)
+
+
+@attr.s(auto_attribs=True)
+class TestSettings(Settings):
+    url: str = None
+
+    @property
+    def carrier_name(self):
+        return "test"
+
+
+class TestMapper(Mapper):
+    def create_rate_request(self, payload: models.RateRequest) -> lib.Serializable:
+        return lib.Serializable(payload.services[0])
+
+    def parse_rate_response(self, response: lib.Deserializable):
+        rate = models.RateDetails(
+            carrier_name=self.settings.carrier_name,
+            carrier_id=self.settings.carrier_id,
+            service=response.deserialize(),
+        )
+        return [rate], []
+
+
+class SyncProxy(Proxy):
+    def get_rates(self, request: lib.Serializable) -> lib.Deserializable:
+        response = lib.request(url=f"{self.settings.url}/{request.serialize()}")
+        return lib.Deserializable(response)
+
+
+class AsyncProxy(Proxy):
+    async def get_rates_async(self, request: lib.Serializable) -> lib.Deserializable:
+        response = await lib.request_async(
+            url=f"{self.settings.url}/{request.serialize()}"
+        )
+        return lib.Deserializable(response)
+
+
+class TestAsyncInterface(ServerTestCase):
+    def setUp(self):
+        self.gateways = [
+            self.gateway(SyncProxy, "sync"),
+            self.gateway(AsyncProxy, "async"),
+        ]
+
+    def gateway(self, proxy, carrier_id):
+        settings = TestSettings(carrier_id=carrier_id, url=self.url)
+        return Gateway(
+            is_hub=False,
+            proxy=proxy(settings),
+            mapper=TestMapper(settings),
+            tracer=Tracer(),
+            settings=settings,
+        )
+
+    def test_async_proxy_methods_are_detected(self):
+        self.assertIn("get_rates", detect_proxy_methods(AsyncProxy))
+        self.assertEqual(detect_proxy_methods(AsyncProxy).count("get_rates"), 1)
+
+    async def test_fetch_rates_from_async(self):
+        rates, messages = (
+            await Rating.fetch(RateRequestData).from_async(*self.gateways)
+        ).parse()
+
+        self.assertListEqual(messages, [])
+        self.assertListEqual(
+            [(rate.carrier_id, rate.service) for rate in rates],
+            [("sync", "GET /standard"), ("async", "GET /standard")],
+        )
+
+    async def test_async_proxy_is_not_run_in_executor(self):
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, "run_in_executor") as run_in_executor:
+            rates, _ = (
+                await Rating.fetch(RateRequestData).from_async(self.gateways[1])
+            ).parse()
+
+        run_in_executor.assert_not_called()
+        self.assertListEqual([rate.carrier_id for rate in rates], ["async"])
+
+    async def test_call_async_proxy_from_event_loop_thread(self):
+        response = call_proxy(
+            self.gateways[1].proxy, "get_rates", lib.Serializable("standard")
+        )
+
+        self.assertEqual(response.deserialize(), "GET /standard")
+
+    async def test_fetch_rates_from_sync(self):
+        rates, messages = await asyncio.to_thread(
+            lambda: Rating.fetch(RateRequestData).from_(*self.gateways).parse()
+        )
+
+        self.assertListEqual(messages, [])
+        self.assertListEqual(
+            sorted((rate.carrier_id, rate.service) for rate in rates),
+            [("async", "GET /standard"), ("sync", "GET /standard")],
+        )
+
+
+RateRequestData = {
+    "shipper": {"postal_code": "H8Z2Z3", "country_code": "CA"},
+    "recipient": {"postal_code": "H8Z2V4", "country_code": "CA"},
+    "parcels": [{"weight": 1.0, "weight_unit": "KG"}],
+    "services": ["standard"],
+}
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import time
+import threading
+import unittest
+from karrio.core.utils.caching import Cache, AbstractCache, MemoryCache
+
+
+class BackendCache(AbstractCache):
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key: str):
+        return self.values.get(key)
+
+    def set(self, key: str, value, **kwargs):
+        self.values[key] = value
+
+    def delete(self, key: str):
+        self.values.pop(key, None)
+
+
+class TestMemoryCache(unittest.TestCase):
+    def test_lru_eviction(self):
+        cache = MemoryCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.stats.evictions, 1)
+
+    def test_timeout(self):
+        cache = MemoryCache()
+        cache.set("token", "abc", timeout=0.05)
+
+        self.assertEqual(cache.get("token"), "abc")
+        time.sleep(0.06)
+        self.assertIsNone(cache.get("token"))
+        self.assertEqual(len(cache), 0)
+
+
+class TestCache(unittest.TestCase):
+    def test_initial_values(self):
+        cache = Cache(token="abc")
+
+        self.assertEqual(cache.get("token"), "abc")
+        self.assertIsNone(cache.get("missing"))
+        self.assertEqual((cache.stats.hits, cache.stats.misses), (1, 1))
+
+    def test_callable_value(self):
+        cache = Cache()
+        cache.set("auth", lambda: {"token": "abc"})
+
+        self.assertDictEqual(cache.get("auth"), {"token": "abc"})
+        self.assertEqual(cache.stats.loads, 1)
+
+    def test_backend_write_through_and_read_back(self):
+        backend = BackendCache()
+        Cache(cache=backend).set("auth", lambda: {"token": "abc"})
+        cache = Cache(cache=backend)
+
+        self.assertDictEqual(backend.values, {"auth": {"token": "abc"}})
+        self.assertDictEqual(cache.get("auth"), {"token": "abc"})
+        self.assertDictEqual(cache._values.get("auth"), {"token": "abc"})
+
+    def test_concurrent_refresh_logs_in_once(self):
+        cache = Cache(cache=BackendCache())
+        logins = []
+        start = threading.Barrier(8)
+
+        def login():
+            logins.append(1)
+            time.sleep(0.2)
+            return {"token": f"token-{len(logins)}"}
+
+        def refresh(results):
+            start.wait()
+            cache.set("auth", login)
+            results.append(cache.get("auth"))
+
+        results = []
+        threads = [threading.Thread(target=refresh, args=(results,)) for _ in range(8)]
+        [thread.start() for thread in threads]
+        [thread.join() for thread in threads]
+
+        self.assertEqual(len(logins), 1)
+        self.assertListEqual(results, [{"token": "token-1"}] * 8)
+        self.assertEqual(cache.stats.shared_loads, 7)
+
+    def test_get_or_set(self):
+        cache = Cache()
+        calls = []
+
+        def login():
+            calls.append(1)
+            return "abc"
+
+        values = [cache.get_or_set("token", login) for _ in range(3)]
+
+        self.assertListEqual(values, ["abc"] * 3)
+        self.assertEqual(len(calls), 1)
+
+    def test_failed_load_is_not_cached(self):
+        cache = Cache()
+
+        def login():
+            raise ConnectionError("unavailable")
+
+        with self.assertRaises(ConnectionError):
+            cache.set("auth", login)
+
+        self.assertIsNone(cache.get("auth"))
+        self.assertEqual(cache.set("auth", lambda: "abc"), "abc")
+
+
+if __name__ == "__main__":
+    unittest.main()
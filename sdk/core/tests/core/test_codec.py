@@ -0,0 +1,111 @@
+import io
+import sys
+import enum
+import unittest
+import importlib.util
+import karrio.core.utils.codec as codec
+
+TEXTS = ["", "Plain", "A & B", "<b>", "x<![CDATA[<raw & text>]]>y > z", 0, 1.5, None]
+
+
+class Code(str, enum.Enum):
+    express = "EXP"
+
+
+def load_generated_module():
+    """Return an untouched copy of a generateDS module."""
+    spec = importlib.util.find_spec("pysoap.envelope")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+
+class TestGeneratedCodec(unittest.TestCase):
+    def setUp(self):
+        self.generated = load_generated_module()
+        self.accelerated = load_generated_module()
+        codec._install(vars(self.accelerated))
+
+    def test_tag_pattern(self):
+        self.assertIsInstance(self.accelerated.Tag_pattern_, codec.TagPattern)
+
+        for tag in ["{urn:x}Tag", "Tag", "{urn:x}Tag", "{a}b}c", "{open", "x{a}b", ""]:
+            self.assertEqual(
+                self.accelerated.Tag_pattern_.match(tag).groups(),
+                self.generated.Tag_pattern_.match(tag).groups(),
+            )
+
+    def test_show_indent(self):
+        self.assertIs(self.accelerated.showIndent, codec.show_indent)
+
+        for level in [-1, 0, 1, 3, 40]:
+            expected, output = io.StringIO(), io.StringIO()
+            self.generated.showIndent(expected, level)
+            self.accelerated.showIndent(output, level)
+            self.assertEqual(output.getvalue(), expected.getvalue())
+
+    def test_quote_xml(self):
+        self.assertIsNot(self.accelerated.quote_xml, self.generated.quote_xml)
+        self.assertEqual(self.accelerated.quote_xml.__name__, "fast_quote_xml")
+
+        for text in [*TEXTS, Code.express]:
+            self.assertEqual(
+                "%s" % self.accelerated.quote_xml(text),
+                "%s" % self.generated.quote_xml(text),
+            )
+
+    def test_parse_date(self):
+        generated = self.generated.GeneratedsSuper
+        accelerated = self.accelerated.GeneratedsSuper
+        self.assertEqual(accelerated.gds_parse_date.__name__, "fast_parse_date")
+
+        for text in ["2021-05-03", "2021-05-03Z", "2021-05-03+02:00", "2021-5-3"]:
+            self.assertEqual(
+                accelerated.gds_parse_date(text), generated.gds_parse_date(text)
+            )
+
+        with self.assertRaises(ValueError):
+            accelerated.gds_parse_date("2021-02-30")
+
+    def test_parse_datetime(self):
+        generated = self.generated.GeneratedsSuper
+        accelerated = self.accelerated.GeneratedsSuper
+        self.assertEqual(accelerated.gds_parse_datetime.__name__, "fast_parse_datetime")
+
+        for text in [
+            "2021-05-03T10:20:30",
+            "2021-05-03T10:20:30.5",
+            "2021-05-03T10:20:30Z",
+        ]:
+            self.assertEqual(
+                accelerated.gds_parse_datetime(text),
+                generated.gds_parse_datetime(text),
+            )
+
+    def test_only_generated_packages_are_accelerated(self):
+        for name in ["pysoap.codec_test", "custom_schemas.codec_test"]:
+            module = load_generated_module()
+            module.__name__ = name
+            module.Envelope.__module__ = name
+            sys.modules[name] = module
+            self.addCleanup(sys.modules.pop, name)
+            self.addCleanup(codec._accelerated.discard, name)
+
+            codec.accelerate(module.Envelope)
+
+            self.assertEqual(
+                module.showIndent is codec.show_indent,
+                name.startswith("pysoap."),
+            )
+
+    def test_modules_without_the_generateds_marker_are_kept(self):
+        module = load_generated_module()
+        self.assertTrue(codec.is_generated(module))
+
+        module.__file__ = codec.__file__
+        self.assertFalse(codec.is_generated(module))
+
+
+if __name__ == "__main__":
+    unittest.main()
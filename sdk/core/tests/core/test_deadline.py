@@ -0,0 +1,113 @@
+import time
+import asyncio
+import unittest
+import karrio.lib as lib
+from karrio.api.gateway import Gateway
+from karrio.api.interface import Rating
+from karrio.core.utils import Tracer
+from karrio.core.errors import CarrierTimeoutError
+from karrio.core.utils.deadline import request_timeout
+from .test_async import ServerTestCase, TestSettings, TestMapper, SyncProxy
+from .test_streaming import RateRequestData, gateway
+
+
+class TestDeadline(unittest.TestCase):
+    def test_earliest_deadline_applies(self):
+        with lib.deadline_context(10):
+            with lib.deadline_context(60) as deadline:
+                self.assertLessEqual(deadline.remaining, 10)
+                self.assertLessEqual(request_timeout(), 10)
+                self.assertEqual(request_timeout(1), 1)
+
+        self.assertIsNone(lib.get_deadline())
+        self.assertIsNone(request_timeout())
+
+    def test_expired_deadline(self):
+        with lib.deadline_context(0):
+            with self.assertRaises(TimeoutError):
+                request_timeout()
+
+
+class TestRequestDeadline(ServerTestCase):
+    def test_request_timeout(self):
+        with lib.deadline_context(0.2):
+            with self.assertRaises(CarrierTimeoutError) as context:
+                lib.request(url=f"{self.url}/slow")
+
+        self.assertEqual(context.exception.code, "CARRIER_TIMEOUT")
+
+    async def test_async_request_timeout(self):
+        with self.assertRaises(CarrierTimeoutError):
+            await lib.request_async(url=f"{self.url}/slow", timeout=0.2)
+
+
+class TestRatingDeadline(unittest.TestCase):
+    def setUp(self):
+        self.gateways = [gateway("slow", delay=1), gateway("fast", delay=0)]
+
+    def assertPartialRates(self, rates, messages, elapsed):
+        self.assertLess(elapsed, 1)
+        self.assertListEqual([rate.carrier_id for rate in rates], ["fast"])
+        self.assertListEqual(
+            [(message.carrier_id, message.code) for message in messages],
+            [("slow", "CARRIER_TIMEOUT")],
+        )
+
+    def test_partial_rates(self):
+        start = time.perf_counter()
+        rates, messages = (
+            Rating.fetch(RateRequestData).from_(*self.gateways, deadline=0.3).parse()
+        )
+
+        self.assertPartialRates(rates, messages, time.perf_counter() - start)
+
+    def test_partial_rates_async(self):
+        async def fetch():
+            start = time.perf_counter()
+            response = await Rating.fetch(RateRequestData).from_async(
+                *self.gateways, deadline=0.3
+            )
+            return (*response.parse(), time.perf_counter() - start)
+
+        self.assertPartialRates(*asyncio.run(fetch()))
+
+    def test_streamed_partial_rates(self):
+        results = list(
+            Rating.fetch(RateRequestData).stream(*self.gateways, deadline=0.3)
+        )
+
+        self.assertListEqual(
+            [
+                (carrier_id, len(rates), [message.code for message in messages])
+                for carrier_id, rates, messages in results
+            ],
+            [("fast", 1, []), ("slow", 0, ["CARRIER_TIMEOUT"])],
+        )
+
+
+class TestConnectionTimeout(ServerTestCase):
+    def test_connection_timeout(self):
+        settings = TestSettings(
+            carrier_id="slow", url=self.url, config=dict(timeout=0.2)
+        )
+        _gateway = Gateway(
+            is_hub=False,
+            proxy=SyncProxy(settings),
+            mapper=TestMapper(settings),
+            tracer=Tracer(),
+            settings=settings,
+        )
+        rates, messages = (
+            Rating.fetch({**RateRequestData, "services": ["slow"]})
+            .from_(_gateway)
+            .parse()
+        )
+
+        self.assertListEqual(rates, [])
+        self.assertListEqual(
+            [message.code for message in messages], ["CARRIER_TIMEOUT"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import json
+import enum
+import attr
+import typing
+import unittest
+import jstruct.utils as jstruct_utils
+from jstruct import JStruct, JList, JDict
+import karrio.core.models as models
+import karrio.core.utils.dict as dict_utils
+from karrio.core.utils import DP
+
+
+class Unit(str, enum.Enum):
+    KG = "KG"
+
+
+class Level(enum.Enum):
+    high = 2
+
+
+class Plain:
+    def __init__(self):
+        self.name = "plain"
+        self.empty = ""
+
+
+@attr.s(auto_attribs=True)
+class Item:
+    code: str
+    level: Level = Level.high
+    tags: set = attr.Factory(lambda: {"a"})
+
+
+@attr.s(auto_attribs=True)
+class Container:
+    items: typing.List[Item] = JList[Item]
+    item: Item = JStruct[Item]
+    index: typing.Dict[str, Item] = JDict[str, Item, False]
+    plain: Plain = attr.Factory(Plain)
+    unit: Unit = Unit.KG
+    counts: dict = attr.Factory(lambda: {2: "b", 1: "a", 3: None})
+    kind: type = Item
+    extra: typing.Any = None
+
+
+def legacy_to_dict(entity, clear_empty=None):
+    return json.loads(
+        DP.jsonify(entity),
+        object_hook=lambda d: {
+            k: v
+            for k, v in d.items()
+            if (v not in (None, [], "") if clear_empty is not False else True)
+        },
+    )
+
+
+class TestDictParse(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def assertIdentical(self, entity, clear_empty=None):
+        result = DP.to_dict(entity, clear_empty=clear_empty)
+        expected = legacy_to_dict(entity, clear_empty=clear_empty)
+
+        self.assertEqual(json.dumps(result), json.dumps(expected))
+
+    def test_to_dict_matches_json_round_trip(self):
+        container = DP.to_object(
+            Container,
+            dict(
+                items=[dict(code="1"), dict(code="2", level=Level.high)],
+                item=dict(code="3"),
+                index={"x": dict(code="4")},
+                extra=[{"b": Unit.KG, "a": ""}, (1, 2.5, True)],
+            ),
+        )
+
+        self.assertIdentical(container)
+        self.assertIdentical(container, clear_empty=False)
+        self.assertIdentical([container, {"nested": container}, None, "text"])
+
+    def test_to_dict_of_models(self):
+        rate_request = DP.to_object(
+            models.RateRequest,
+            dict(
+                shipper=dict(postal_code="H8Z2Z3", country_code="CA"),
+                recipient=dict(postal_code="H8Z2V4", country_code="CA"),
+                parcels=[dict(weight=1.0, weight_unit="KG", options={"z": 1})],
+                services=["standard"],
+                options={"insurance": 100, "signature": None},
+            ),
+        )
+
+        self.assertIdentical(rate_request)
+        self.assertIdentical(rate_request, clear_empty=False)
+        self.assertListEqual(
+            list(DP.to_dict(rate_request).keys()),
+            ["options", "parcels", "recipient", "services", "shipper"],
+        )
+
+    def test_to_object_matches_jstruct(self):
+        data = dict(
+            shipper=dict(postal_code="H8Z2Z3", country_code="CA", unknown=1),
+            recipient=dict(postal_code="H8Z2V4", country_code="CA"),
+            parcels=dict(weight=1.0),
+        )
+
+        self.assertEqual(
+            DP.to_object(models.RateRequest, data),
+            jstruct_utils.instantiate(models.RateRequest, data),
+        )
+        self.assertIsNone(DP.to_object(models.RateRequest, None))
+
+    def test_to_object_resolves_jstruct_nested_types(self):
+        _, builders = dict_utils._object_plan(Container)
+
+        self.assertSetEqual(set(builders), {"items", "item", "index"})
+        self.assertEqual(builders["item"](dict(code="1")), Item(code="1"))
+        self.assertListEqual(builders["items"](dict(code="1")), [Item(code="1")])
+        self.assertDictEqual(
+            builders["index"]({"x": dict(code="1")}), {"x": Item(code="1")}
+        )
+
+    def test_to_object_falls_back_to_the_jstruct_converter(self):
+        _, builders = dict_utils._object_plan(Loose)
+        loose = DP.to_object(Loose, dict(item=dict(code="1")))
+
+        self.assertDictEqual(builders, {})
+        self.assertEqual(loose.item, Item(code="1"))
+
+
+@attr.s(auto_attribs=True)
+class Loose:
+    item: typing.Any = JStruct[Item]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import io
+import base64
+import unittest
+from PIL import Image
+from PyPDF2 import PdfReader
+import karrio.lib as lib
+
+
+class TestDocumentsBundling(unittest.TestCase):
+    def test_document_content(self):
+        content = bytearray(b"^XA^XZ")
+
+        self.assertEqual(
+            lib.document_content(base64.b64encode(content).decode()), content
+        )
+        self.assertIs(lib.document_content(bytes(content)).__class__, bytes)
+        self.assertIs(lib.document_content(content).obj, content)
+        self.assertEqual(lib.document_base64(content), "XlhBXlha")
+        self.assertEqual(lib.document_base64("XlhBXlha"), "XlhBXlha")
+
+    def test_bundle_zpls(self):
+        labels = [b"^XA^FDone^XZ", base64.b64encode(b"^XA^FDtwo^XZ").decode()]
+
+        self.assertEqual(lib.bundle_zpls(labels), "^XA^FDone^XZ\n^XA^FDtwo^XZ\n")
+        self.assertEqual(
+            lib.bundle_bytes(labels, "ZPL"), b"^XA^FDone^XZ\n^XA^FDtwo^XZ\n"
+        )
+        self.assertEqual(
+            base64.b64decode(lib.bundle_base64(labels, "ZPL")),
+            b"^XA^FDone^XZ\n^XA^FDtwo^XZ\n",
+        )
+
+    def test_bundle_pdfs(self):
+        labels = [pdf_label(), base64.b64encode(pdf_label()).decode()]
+
+        content = lib.bundle_bytes(labels, "PDF")
+        sink = lib.write_bundle(labels, io.BytesIO(), "PDF")
+
+        self.assertEqual(len(PdfReader(io.BytesIO(content)).pages), 2)
+        self.assertEqual(len(PdfReader(sink).pages), 2)
+        self.assertEqual(
+            len(
+                PdfReader(io.BytesIO(base64.b64decode(lib.bundle_base64(labels)))).pages
+            ),
+            2,
+        )
+
+    def test_image_to_pdf_bytes(self):
+        image = io.BytesIO()
+        Image.new("RGB", (20, 10)).save(image, format="PNG")
+
+        content = lib.image_to_pdf_bytes(image.getvalue(), rotate=-90)
+
+        self.assertTrue(content.startswith(b"%PDF"))
+        self.assertTrue(
+            base64.b64decode(
+                lib.image_to_pdf(base64.b64encode(image.getvalue()).decode())
+            ).startswith(b"%PDF")
+        )
+
+
+def pdf_label() -> bytes:
+    output = io.BytesIO()
+    Image.new("RGB", (40, 60), (255, 255, 255)).save(output, format="PDF")
+    return output.getvalue()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import time
+import threading
+import unittest
+from karrio.core.utils.executor import Executor
+from karrio.core.utils.transport import Context, CONTEXT
+
+
+class Probe:
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, item):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+        return item * 2
+
+
+class TestExecutor(unittest.TestCase):
+    def setUp(self):
+        self.executor = Executor(max_workers=4, carrier_max_workers=2)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_map_results_in_order(self):
+        results = self.executor.map(lambda item: item * 2, range(20))
+
+        self.assertListEqual(results, [item * 2 for item in range(20)])
+
+    def test_global_cap(self):
+        probe = Probe()
+        results = self.executor.map(probe, range(20), ordered=False)
+
+        self.assertListEqual(sorted(results), [item * 2 for item in range(20)])
+        self.assertEqual(probe.max_running, 4)
+        self.assertEqual(self.executor.stats.completed, 20)
+        self.assertEqual(self.executor.stats.queued, 0)
+        self.assertEqual(self.executor.stats.running, 0)
+        self.assertGreater(self.executor.stats.max_wait_time, 0)
+
+    def test_carrier_caps(self):
+        executor = Executor(max_workers=16, carrier_limits={"ups": 3})
+        probes = dict(ups=Probe(), canpar=Probe())
+
+        def run(carrier_name):
+            token = CONTEXT.set(Context(carrier_name=carrier_name))
+            executor.map(probes[carrier_name], range(20))
+            CONTEXT.reset(token)
+
+        threads = [threading.Thread(target=run, args=(name,)) for name in probes]
+        [thread.start() for thread in threads]
+        [thread.join() for thread in threads]
+        executor.shutdown()
+
+        self.assertEqual(probes["ups"].max_running, 3)
+        self.assertEqual(probes["canpar"].max_running, 10)
+        self.assertEqual(executor.carrier_stats["ups"].completed, 20)
+
+    def test_items_carrier_caps(self):
+        probe = Probe()
+        results = self.executor.map(probe, range(6), carrier=lambda _: "ups")
+
+        self.assertListEqual(results, [item * 2 for item in range(6)])
+        self.assertEqual(probe.max_running, 2)
+        self.assertEqual(self.executor.carrier_stats["ups"].completed, 6)
+
+    def test_call_max_workers(self):
+        probe = Probe()
+        self.executor.map(probe, range(10), max_workers=1)
+
+        self.assertEqual(probe.max_running, 1)
+
+    def test_nested_fan_out_does_not_deadlock(self):
+        executor = Executor(max_workers=2)
+        results = executor.map(
+            lambda item: sum(executor.map(Probe(0.001), range(item))), range(6)
+        )
+        executor.shutdown()
+
+        self.assertListEqual(results, [sum(range(item)) * 2 for item in range(6)])
+        self.assertGreater(executor.stats.inlined, 0)
+
+    def test_context_is_propagated(self):
+        token = CONTEXT.set(Context(carrier_name="ups"))
+        results = self.executor.map(lambda _: CONTEXT.get().carrier_name, range(3))
+        CONTEXT.reset(token)
+
+        self.assertListEqual(results, ["ups"] * 3)
+
+    def test_error_is_raised(self):
+        def fail(item):
+            raise ValueError(item)
+
+        with self.assertRaises(ValueError):
+            self.executor.map(fail, range(3))
+
+    def test_shutdown(self):
+        executor = Executor(max_workers=1)
+        blocker = threading.Event()
+        running = executor.submit(lambda _: blocker.wait(1), None)
+        queued = executor.submit(lambda item: item, "queued")
+
+        executor.shutdown(wait=False, cancel_futures=True)
+        blocker.set()
+
+        self.assertTrue(running.result())
+        self.assertTrue(queued.cancelled())
+        self.assertEqual(executor.stats.cancelled, 1)
+        with self.assertRaises(RuntimeError):
+            executor.submit(lambda item: item, None)
+
+
+if __name__ == "__main__":
+    unittest.main()
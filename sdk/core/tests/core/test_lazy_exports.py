@@ -0,0 +1,40 @@
+import sys
+import types
+import unittest
+import karrio.lib as lib
+import karrio.core.utils as utils
+
+
+class TestLazyExports(unittest.TestCase):
+    def setUp(self):
+        self.package = types.ModuleType("lazy_exports_package")
+        self.package.__path__ = list(utils.__path__)
+        self.package.__getattr__, self.package.__dir__ = lib.lazy_exports(
+            self.package.__name__, {".codec": ["accelerate", "TagPattern"]}
+        )
+        sys.modules[self.package.__name__] = self.package
+
+    def tearDown(self):
+        for name in [self.package.__name__, f"{self.package.__name__}.codec"]:
+            sys.modules.pop(name, None)
+
+    def test_names_are_imported_on_first_access(self):
+        self.assertNotIn("lazy_exports_package.codec", sys.modules)
+
+        accelerate = self.package.accelerate
+
+        self.assertIn("lazy_exports_package.codec", sys.modules)
+        self.assertEqual(accelerate.__name__, "accelerate")
+        self.assertIs(vars(self.package)["accelerate"], accelerate)
+
+    def test_dir_lists_the_exported_names(self):
+        self.assertIn("TagPattern", dir(self.package))
+        self.assertNotIn("lazy_exports_package.codec", sys.modules)
+
+    def test_unknown_name(self):
+        with self.assertRaises(AttributeError):
+            self.package.unknown
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import logging
+import unittest
+from unittest.mock import patch
+import karrio.lib as lib
+from karrio.core.utils.log import Payload
+
+
+class TestPayloadLogging(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger("karrio.tests.log")
+        self.logger.propagate = False
+        self.disabled = logging.root.manager.disable
+        logging.disable(logging.NOTSET)
+
+    def tearDown(self):
+        logging.disable(self.disabled)
+
+    def test_payload_is_not_rendered_when_disabled(self):
+        self.logger.setLevel(logging.INFO)
+
+        with patch.object(Payload, "render") as render:
+            lib.log_payload(self.logger, "fetch shipment rates", {"a": 1})
+
+        render.assert_not_called()
+
+    def test_payload_is_rendered_when_emitted(self):
+        self.logger.setLevel(logging.DEBUG)
+
+        with self.assertLogs(self.logger, logging.DEBUG) as logs:
+            lib.log_payload(
+                self.logger,
+                "fetch shipment rates",
+                {"services": ["standard"], "api_key": "abc"},
+            )
+
+        self.assertListEqual(
+            logs.output,
+            [
+                "DEBUG:karrio.tests.log:fetch shipment rates. payload: "
+                '{"api_key": "********", "services": ["standard"]}'
+            ],
+        )
+        self.assertIsInstance(logs.records[0].payload, Payload)
+
+    def test_text_redaction(self):
+        payloads = [
+            '{"username": "user", "password": "p@ss"}',
+            "<Auth><v1:Password>p@ss</v1:Password><UserName>user</UserName></Auth>",
+            "grant_type=client_credentials&client_secret=p@ss&scope=all",
+        ]
+
+        self.assertListEqual(
+            [str(Payload(payload)) for payload in payloads],
+            [
+                '{"username": "user", "password": "********"}',
+                "<Auth><v1:Password>********</v1:Password><UserName>user</UserName></Auth>",
+                "grant_type=client_credentials&client_secret=********&scope=all",
+            ],
+        )
+        self.assertEqual(
+            str(Payload('{"password": "p"}', redact=False)), '{"password": "p"}'
+        )
+
+    def test_size_limit(self):
+        self.assertEqual(
+            str(Payload("0123456789", max_size=4)),
+            "0123... [6 characters truncated]",
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
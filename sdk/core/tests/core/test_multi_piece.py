@@ -0,0 +1,66 @@
+import threading
+import unittest
+import karrio.lib as lib
+
+
+class TestMultiPiece(unittest.TestCase):
+    def test_children_are_submitted_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def submit(child: str):
+            barrier.wait()  # all the children must be in flight at once
+            return child.upper()
+
+        responses = lib.run_multi_piece(submit, ["a", "b", "c"], master="M")
+
+        self.assertListEqual(responses, ["M", "A", "B", "C"])
+
+    def test_partial_failure_cancels_created_packages(self):
+        cancelled = []
+
+        responses = lib.run_multi_piece(
+            lambda child: child,
+            ["a", "error", "c"],
+            master="M",
+            failed=lambda response: response == "error",
+            cancel=cancelled.append,
+        )
+
+        self.assertListEqual(responses, ["error"])
+        self.assertListEqual(sorted(cancelled), ["M", "a", "c"])
+
+    def test_failed_check_cancels_created_packages(self):
+        cancelled = []
+
+        def failed(response: str):
+            if response == "b":
+                raise ValueError("unexpected response")
+            return response == "error"
+
+        responses = lib.run_multi_piece(
+            lambda child: child,
+            ["a", "b", "a"],
+            master="M",
+            failed=failed,
+            cancel=cancelled.append,
+        )
+
+        self.assertListEqual(responses, ["b"])
+        self.assertListEqual(sorted(cancelled), ["M", "a", "a"])
+
+    def test_failed_submission_is_raised(self):
+        cancelled = []
+
+        def submit(child: str):
+            if child == "b":
+                raise ConnectionError("carrier unreachable")
+            return child
+
+        with self.assertRaises(ConnectionError):
+            lib.run_multi_piece(submit, ["a", "b"], master="M", cancel=cancelled.append)
+
+        self.assertListEqual(sorted(cancelled), ["M", "a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import time
+import attr
+import asyncio
+import threading
+import unittest
+import karrio.lib as lib
+import karrio.core.models as models
+from karrio.api.proxy import Proxy
+from karrio.api.mapper import Mapper
+from karrio.api.gateway import Gateway
+from karrio.api.interface import Rating
+from karrio.core.settings import Settings
+from karrio.core.utils import Tracer
+
+
+@attr.s(auto_attribs=True)
+class TestSettings(Settings):
+    delay: float = 0.0
+
+    @property
+    def carrier_name(self):
+        return "test"
+
+
+class ThreadMapper(Mapper):
+    def create_rate_request(self, payload: models.RateRequest) -> lib.Serializable:
+        return lib.Serializable(payload)
+
+    def parse_rate_response(self, response: lib.Deserializable):
+        parsed.append(
+            (self.settings.carrier_id, threading.get_ident(), time.monotonic())
+        )
+        rate = models.RateDetails(
+            carrier_name=self.settings.carrier_name,
+            carrier_id=self.settings.carrier_id,
+            service="standard",
+        )
+        return [rate], []
+
+
+class DelayedProxy(Proxy):
+    def get_rates(self, request: lib.Serializable) -> lib.Deserializable:
+        time.sleep(self.settings.delay)
+        received.append((self.settings.carrier_id, time.monotonic()))
+        return lib.Deserializable(None)
+
+
+parsed: list = []
+received: list = []
+
+
+class TestEagerParsing(unittest.TestCase):
+    def setUp(self):
+        parsed.clear()
+        received.clear()
+        self.gateways = [self.gateway("fast", 0.0), self.gateway("slow", 0.2)]
+
+    def gateway(self, carrier_id: str, delay: float):
+        settings = TestSettings(carrier_id=carrier_id, delay=delay)
+        return Gateway(
+            is_hub=False,
+            proxy=DelayedProxy(settings),
+            mapper=ThreadMapper(settings),
+            tracer=Tracer(),
+            settings=settings,
+        )
+
+    def test_responses_are_parsed_as_they_arrive(self):
+        deserializable = Rating.fetch(RateRequestData).from_(
+            *self.gateways, parse_eagerly=True
+        )
+        self.assertEqual(len(parsed), 2)
+
+        rates, messages = deserializable.parse()
+        parsed_at = {carrier_id: at for carrier_id, _, at in parsed}
+        received_at = dict(received)
+
+        self.assertListEqual([rate.carrier_id for rate in rates], ["fast", "slow"])
+        self.assertListEqual(messages, [])
+        self.assertLess(parsed_at["fast"], received_at["slow"])
+        self.assertNotIn(threading.get_ident(), [ident for _, ident, _ in parsed])
+
+    def test_responses_are_parsed_lazily_by_default(self):
+        deserializable = Rating.fetch(RateRequestData).from_(*self.gateways)
+        self.assertListEqual(parsed, [])
+
+        deserializable.parse()
+        self.assertListEqual(
+            [ident for _, ident, _ in parsed], [threading.get_ident()] * 2
+        )
+
+    def test_responses_are_parsed_off_the_event_loop(self):
+        async def fetch():
+            return await Rating.fetch(RateRequestData).from_async(
+                *self.gateways, parse_eagerly=True
+            )
+
+        rates, _ = asyncio.run(fetch()).parse()
+
+        self.assertEqual(len(rates), 2)
+        self.assertNotIn(threading.get_ident(), [ident for _, ident, _ in parsed])
+
+
+RateRequestData = {
+    "shipper": {"postal_code": "H3N1S4", "country_code": "CA"},
+    "recipient": {"postal_code": "89109", "country_code": "US"},
+    "parcels": [{"weight": 1.0, "weight_unit": "KG"}],
+}
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import threading
+import unittest
+import karrio.lib as lib
+
+
+class TestPipeline(unittest.TestCase):
+    def test_linear_pipeline(self):
+        pipeline = lib.Pipeline(
+            first=lambda *_: lib.Job(id="first", data=1),
+            second=lambda result: lib.Job(id="second", data=result + 1),
+        )
+
+        self.assertListEqual(pipeline.apply(lambda job: job.data, [0]), [0, 1, 2])
+
+    def test_linear_step_fan_out(self):
+        pipeline = lib.Pipeline(
+            pieces=lambda *_: [lib.Job(id="piece", data=data) for data in [1, 2]],
+            count=lambda pieces: lib.Job(id="count", data=sum(pieces)),
+        )
+
+        self.assertListEqual(pipeline.apply(lambda job: job.data), [[1, 2], 3])
+
+    def test_independent_steps_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def process(job: lib.Job):
+            if job.id in ["rate", "availability"]:
+                barrier.wait()  # both steps must be in flight at once
+            return job.data
+
+        pipeline = lib.Pipeline(
+            rate=lib.Stage(lambda: lib.Job(id="rate", data=10)),
+            availability=lib.Stage(lambda: lib.Job(id="availability", data=True)),
+            create=lib.Stage(
+                lambda rate, available: lib.Job(id="create", data=(rate, available)),
+                after=["rate", "availability"],
+            ),
+        )
+
+        self.assertListEqual(pipeline.apply(process), [10, True, (10, True)])
+
+    def test_step_fan_out(self):
+        pipeline = lib.Pipeline(
+            create=lambda *_: lib.Job(id="create", data=["a", "b", "c"]),
+            labels=lib.Stage(
+                lambda links: [lib.Job(id="label", data=link) for link in links],
+                after=["create"],
+            ),
+            done=lambda labels: lib.Job(id="done", data=len(labels)),
+        )
+
+        results = pipeline.apply(
+            lambda job: job.data.upper() if job.id == "label" else job.data
+        )
+
+        self.assertListEqual(results, [["a", "b", "c"], ["A", "B", "C"], 3])
+
+    def test_unknown_dependency(self):
+        pipeline = lib.Pipeline(
+            create=lib.Stage(lambda: lib.Job(id="create"), after=["rate"])
+        )
+
+        with self.assertRaises(ValueError):
+            pipeline.apply(lambda job: job.data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+import os
+import sys
+import json
+import tempfile
+import unittest
+import subprocess
+from unittest import mock
+import karrio
+import karrio.references as references
+from karrio.core.errors import ShippingSDKError
+
+
+class TestRegistry(unittest.TestCase):
+    def test_gateway_lookup_imports_a_single_carrier(self):
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, karrio; karrio.gateway['ups']; "
+                "print(sorted({m.split('.')[2] for m in sys.modules "
+                "if m.startswith('karrio.mappers.')}))",
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+
+        self.assertEqual(output.strip(), "['ups']")
+
+    def test_registry(self):
+        self.assertIn("ups", karrio.gateway.providers)
+        self.assertIs(
+            karrio.gateway.providers["ups"], references.import_extension("ups")
+        )
+
+    def test_unknown_provider(self):
+        with self.assertRaises(ShippingSDKError):
+            karrio.gateway["unknown"]
+
+
+class TestManifest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "manifest.json")
+        references._SNAPSHOTS.clear()
+
+    def tearDown(self):
+        self.directory.cleanup()
+        references._SNAPSHOTS.clear()
+
+    def test_manifest_is_cached(self):
+        carriers = {"ups": dict(label="UPS", capabilities=("rating",))}
+
+        with mock.patch.object(references, "extensions_fingerprint", return_value="1"):
+            with mock.patch.object(
+                references, "collect_manifest", return_value=carriers
+            ):
+                self.assertDictEqual(references.load_manifest(self.path), carriers)
+
+            references._SNAPSHOTS.clear()
+
+            # read back from the file without collecting the extensions again
+            with mock.patch.object(
+                references, "collect_manifest", side_effect=AssertionError
+            ):
+                self.assertDictEqual(references.load_manifest(self.path), carriers)
+
+        with open(self.path) as file:
+            self.assertEqual(json.load(file)["fingerprint"], "1")
+
+    def test_manifest_is_refreshed_when_extensions_change(self):
+        with mock.patch.object(references, "extensions_fingerprint", return_value="1"):
+            with mock.patch.object(references, "collect_manifest", return_value={}):
+                references.load_manifest(self.path)
+
+        references._SNAPSHOTS.clear()  # e.g. a new process
+
+        with mock.patch.object(references, "extensions_fingerprint", return_value="2"):
+            with mock.patch.object(
+                references, "collect_manifest", return_value={"ups": {}}
+            ):
+                self.assertDictEqual(references.load_manifest(self.path), {"ups": {}})
+
+
+class TestReferencesSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "references.json")
+        references._SNAPSHOTS.clear()
+
+    def tearDown(self):
+        self.directory.cleanup()
+        references._SNAPSHOTS.clear()
+
+    def test_references_are_memoized_and_read_only(self):
+        build = mock.Mock(return_value={"carriers": {"ups": "UPS"}, "levels": [1]})
+
+        with mock.patch.object(references, "REFERENCES_PATH", self.path):
+            with mock.patch.object(references, "build_references", build):
+                first = references.collect_references()
+                second = references.collect_references()
+
+        build.assert_called_once()
+        self.assertIs(first, second)
+        self.assertEqual(
+            json.dumps(first), '{"carriers": {"ups": "UPS"}, "levels": [1]}'
+        )
+
+        with self.assertRaises(TypeError):
+            first["carriers"]["fedex"] = "FedEx"
+
+
+if __name__ == "__main__":
+    unittest.main()
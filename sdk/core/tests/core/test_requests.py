@@ -0,0 +1,86 @@
+import attr
+import unittest
+import karrio.lib as lib
+import karrio.core.models as models
+from karrio.api.proxy import Proxy
+from karrio.api.mapper import Mapper
+from karrio.api.gateway import Gateway
+from karrio.api.interface import Rating
+from karrio.core.settings import Settings
+from karrio.core.utils import Tracer
+
+
+@attr.s(auto_attribs=True)
+class TestSettings(Settings):
+    @property
+    def carrier_name(self):
+        return "test"
+
+
+class RecordingMapper(Mapper):
+    payloads: list = []
+
+    def create_rate_request(self, payload: models.RateRequest) -> lib.Serializable:
+        self.payloads.append(payload)
+        return lib.Serializable(payload)
+
+    def parse_rate_response(self, response: lib.Deserializable):
+        return [], []
+
+
+class TestProxy(Proxy):
+    def get_rates(self, request: lib.Serializable) -> lib.Deserializable:
+        return lib.Deserializable(None)
+
+
+class TestValidatedRequests(unittest.TestCase):
+    def setUp(self):
+        settings = TestSettings(carrier_id="test")
+        self.mapper = RecordingMapper(settings)
+        self.mapper.payloads = []
+        self.gateway = Gateway(
+            is_hub=False,
+            proxy=TestProxy(settings),
+            mapper=self.mapper,
+            tracer=Tracer(),
+            settings=settings,
+        )
+
+    def test_to_request_normalizes_and_freezes(self):
+        request = lib.to_request(models.RateRequest, RateRequestData)
+
+        self.assertIsInstance(request, models.RateRequest)
+        self.assertIsInstance(request, models.Validated)
+        self.assertIsNone(request.shipper.address_line2)
+        self.assertIs(lib.to_request(models.RateRequest, request), request)
+
+        with self.assertRaises(attr.exceptions.FrozenInstanceError):
+            request.reference = "changed"
+
+    def test_validated_request_is_used_as_is(self):
+        request = lib.to_request(models.RateRequest, RateRequestData)
+
+        Rating.fetch(request).from_(self.gateway).parse()
+
+        self.assertIs(self.mapper.payloads[0], request)
+
+    def test_plain_requests_are_normalized(self):
+        Rating.fetch(RateRequestData).from_(self.gateway).parse()
+        Rating.fetch(models.RateRequest(**RateRequestData)).from_(self.gateway).parse()
+
+        from_dict, from_model = self.mapper.payloads
+        self.assertIs(type(from_dict), models.RateRequest)
+        self.assertEqual(from_dict, from_model)
+        self.assertIsNone(from_model.shipper.address_line2)
+
+
+RateRequestData = {
+    "shipper": {"postal_code": "H3N1S4", "country_code": "CA", "address_line2": ""},
+    "recipient": {"postal_code": "89109", "country_code": "US"},
+    "parcels": [{"weight": 1.0, "weight_unit": "KG"}],
+    "services": ["standard"],
+}
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,186 @@
+import time
+import asyncio
+import unittest
+from unittest import mock
+from urllib.error import HTTPError, URLError
+import karrio.lib as lib
+from karrio.api.interface import Rating
+from karrio.core.errors import CarrierUnavailableError
+from karrio.core.utils.transport import (
+    CONTEXT,
+    AbstractTransport,
+    AbstractAsyncTransport,
+    PooledTransport,
+)
+from karrio.core.utils.resilience import OPEN, HALF_OPEN, CLOSED, connection_key
+from .test_streaming import gateway, RateRequestData
+
+
+class ScriptedTransport(AbstractTransport):
+    """Respond with (or raise) the scripted outcomes in turn."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.requests = []
+
+    def send(self, request, timeout=None):
+        self.requests.append(request.get_method())
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class AsyncScriptedTransport(AbstractAsyncTransport):
+    def __init__(self, *outcomes):
+        self.transport = ScriptedTransport(*outcomes)
+
+    async def send(self, request, timeout=None):
+        return self.transport.send(request, timeout=timeout)
+
+
+def http_error(code: int) -> HTTPError:
+    return HTTPError("http://carrier", code, "error", {}, None)  # type: ignore
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.breaker = lib.CircuitBreaker(min_calls=4, reset_timeout=0.2)
+
+    def test_circuit_opens_on_error_rate(self):
+        for failed in [False, True, False, True]:
+            self.assertTrue(self.breaker.allow("ups"))
+            self.breaker.record("ups", failed, duration=0.1)
+
+        self.assertEqual(self.breaker.state("ups"), OPEN)
+        self.assertFalse(self.breaker.allow("ups"))
+        self.assertEqual(self.breaker.state("fedex"), CLOSED)
+
+    def test_circuit_opens_on_slow_calls(self):
+        breaker = lib.CircuitBreaker(min_calls=2, slow_call_duration=1)
+        breaker.record("ups", False, duration=2)
+        breaker.record("ups", False, duration=3)
+
+        self.assertTrue(breaker.is_open("ups"))
+
+    def test_half_open_trial(self):
+        for _ in range(4):
+            self.breaker.record("ups", True, duration=0.1)
+
+        time.sleep(0.2)
+
+        self.assertEqual(self.breaker.state("ups"), HALF_OPEN)
+        self.assertTrue(self.breaker.allow("ups"))
+        self.assertFalse(self.breaker.allow("ups"))  # a single trial at a time
+
+        self.breaker.record("ups", False, duration=0.1)
+        self.assertEqual(self.breaker.state("ups"), CLOSED)
+
+
+class TestRetries(unittest.TestCase):
+    def setUp(self):
+        lib.set_retry_policy(lib.RetryPolicy(max_retries=2, backoff=0.01))
+
+    def tearDown(self):
+        lib.set_retry_policy(None)
+        lib.set_breaker(None)
+
+    def test_idempotent_request_is_retried(self):
+        transport = ScriptedTransport(http_error(503), URLError("reset"), b"ok")
+
+        with mock.patch("random.uniform", return_value=0) as uniform:
+            response = lib.request(url="http://carrier", transport=transport)
+
+        self.assertEqual(response, "ok")
+        self.assertListEqual(transport.requests, ["GET"] * 3)
+        self.assertListEqual(
+            [call.args for call in uniform.call_args_list], [(0, 0.01), (0, 0.02)]
+        )
+
+    def test_non_idempotent_request_is_not_retried(self):
+        transport = ScriptedTransport(http_error(503), b"ok")
+
+        lib.request(url="http://carrier", data="{}", transport=transport)
+
+        self.assertListEqual(transport.requests, ["POST"])
+
+    def test_read_only_operation_is_retried(self):
+        transport = ScriptedTransport(http_error(503), b"ok")
+
+        with lib.operation_context("get_rates"):
+            response = lib.request(url="http://carrier", data="{}", transport=transport)
+
+        self.assertEqual(response, "ok")
+        self.assertListEqual(transport.requests, ["POST", "POST"])
+
+    def test_client_errors_are_not_retried(self):
+        transport = ScriptedTransport(http_error(400), b"ok")
+
+        lib.request(url="http://carrier", transport=transport, on_error=lambda e: "")
+
+        self.assertListEqual(transport.requests, ["GET"])
+
+    def test_async_request_is_retried(self):
+        transport = AsyncScriptedTransport(http_error(502), b"ok")
+        response = asyncio.run(
+            lib.request_async(url="http://carrier", transport=transport)
+        )
+
+        self.assertEqual(response, "ok")
+
+    def test_open_circuit_rejects_requests(self):
+        lib.set_breaker(lib.CircuitBreaker(min_calls=2))
+        transport = ScriptedTransport(*[http_error(503)] * 3)
+
+        with lib.connection_context(gateway("carrier").settings):
+            # the circuit opens after the 2nd attempt: the last retry is rejected
+            with self.assertRaises(CarrierUnavailableError):
+                lib.request(url="http://carrier", transport=transport)
+
+        self.assertEqual(len(transport.requests), 2)
+
+    def test_connection_errors_are_retried(self):
+        transport = ScriptedTransport(ConnectionResetError("reset"), b"ok")
+        response = lib.request(url="http://carrier", transport=transport)
+
+        self.assertEqual(response, "ok")
+        self.assertListEqual(transport.requests, ["GET", "GET"])
+
+    def test_refused_connections_open_the_circuit(self):
+        lib.set_retry_policy(None)
+        breaker = lib.set_breaker(lib.CircuitBreaker(min_calls=2))
+        transport = PooledTransport()
+
+        with lib.connection_context(gateway("carrier").settings):
+            for _ in range(2):
+                with self.assertRaises(URLError):
+                    lib.request(url="http://127.0.0.1:1/", transport=transport)
+
+            with self.assertRaises(CarrierUnavailableError):
+                lib.request(url="http://127.0.0.1:1/", transport=transport)
+
+            self.assertEqual(breaker.state(connection_key(CONTEXT.get())), OPEN)
+
+
+class TestRatingShortCircuit(unittest.TestCase):
+    def tearDown(self):
+        lib.set_breaker(None)
+
+    def test_open_circuit_carrier_is_skipped(self):
+        breaker = lib.set_breaker(lib.CircuitBreaker(min_calls=1))
+        failing, healthy = gateway("failing"), gateway("healthy")
+
+        with lib.connection_context(failing.settings):
+            breaker.record(connection_key(CONTEXT.get()), True, 0.1)
+
+        rates, messages = Rating.fetch(RateRequestData).from_(failing, healthy).parse()
+
+        self.assertListEqual([rate.carrier_id for rate in rates], ["healthy"])
+        self.assertListEqual(
+            [(message.carrier_id, message.code) for message in messages],
+            [("failing", "CARRIER_UNAVAILABLE")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import time
+import asyncio
+import threading
+import unittest
+import karrio.lib as lib
+from karrio.api.proxy import Proxy
+from karrio.api.gateway import Gateway
+from karrio.api.interface import Rating, IRequestFromMany, IDeserialize
+from karrio.core.utils import Tracer, Executor
+from .test_async import TestSettings, TestMapper
+
+
+class DelayedProxy(Proxy):
+    def get_rates(self, request: lib.Serializable) -> lib.Deserializable:
+        time.sleep(self.settings.config.get("delay", 0))
+        return lib.Deserializable(request.serialize())
+
+    async def get_rates_async(self, request: lib.Serializable) -> lib.Deserializable:
+        await asyncio.sleep(self.settings.config.get("delay", 0))
+        return lib.Deserializable(request.serialize())
+
+
+def gateway(carrier_id: str, **config) -> Gateway:
+    settings = TestSettings(carrier_id=carrier_id, config=config)
+    return Gateway(
+        is_hub=False,
+        proxy=DelayedProxy(settings),
+        mapper=TestMapper(settings),
+        tracer=Tracer(),
+        settings=settings,
+    )
+
+
+class TestRatingStream(unittest.TestCase):
+    def setUp(self):
+        self.gateways = [gateway("slow", delay=0.5), gateway("fast", delay=0)]
+
+    def test_stream_yields_as_carriers_complete(self):
+        start = time.perf_counter()
+        stream = Rating.fetch(RateRequestData).stream(*self.gateways)
+
+        carrier_id, rates, messages = next(stream)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(carrier_id, "fast")
+        self.assertListEqual([rate.service for rate in rates], ["standard"])
+        self.assertListEqual(messages, [])
+        self.assertLess(elapsed, 0.3)
+        self.assertListEqual([carrier_id for carrier_id, *_ in stream], ["slow"])
+
+    def test_stream_async(self):
+        async def collect():
+            return [
+                carrier_id
+                async for carrier_id, *_ in Rating.fetch(RateRequestData).stream_async(
+                    *self.gateways
+                )
+            ]
+
+        self.assertListEqual(asyncio.run(collect()), ["fast", "slow"])
+
+    def test_gateways_list_action(self):
+        request = IRequestFromMany(
+            lambda gateways: IDeserialize(
+                lambda: [gateway.settings.carrier_id for gateway in gateways]
+            )
+        )
+
+        self.assertListEqual(request.from_(*self.gateways).parse(), ["slow", "fast"])
+        self.assertListEqual(list(request.stream(*self.gateways)), [["slow", "fast"]])
+
+    def test_rates_are_filtered_by_their_gateway(self):
+        gateways = [
+            gateway("first", shipping_services=["express"]),
+            gateway("second"),
+        ]
+        rates, messages = Rating.fetch(RateRequestData).from_(*gateways).parse()
+
+        self.assertListEqual(messages, [])
+        self.assertListEqual([rate.carrier_id for rate in rates], ["second"])
+
+    def test_rates_are_fetched_within_the_carrier_cap(self):
+        gateways = [gateway("first", delay=0.2), gateway("second", delay=0.2)]
+        executor = lib.set_executor(Executor(carrier_limits=dict(test=1)))
+        try:
+            rates, _ = Rating.fetch(RateRequestData).from_(*gateways).parse()
+            stats = executor.carrier_stats["test"]
+        finally:
+            lib.set_executor(Executor())
+
+        self.assertEqual(len(rates), 2)
+        self.assertEqual(stats.completed, 2)
+        self.assertGreater(stats.max_wait_time, 0.15)
+
+
+class TestExecutorAsCompleted(unittest.TestCase):
+    def test_closing_cancels_queued_items(self):
+        gate = threading.Event()
+        executor = Executor(max_workers=1)
+        results = executor.as_completed(
+            lambda item: item if item == 0 else gate.wait(), range(10), max_workers=3
+        )
+
+        self.assertEqual(next(results), (0, 0))
+        results.close()
+        gate.set()
+        executor.shutdown()
+
+        self.assertEqual(executor.stats.submitted, 3)
+        self.assertEqual(executor.stats.completed, 2)
+        self.assertEqual(executor.stats.cancelled, 1)
+
+
+RateRequestData = {
+    "shipper": {"postal_code": "H3N1S4", "country_code": "CA"},
+    "recipient": {"postal_code": "89109", "country_code": "US"},
+    "parcels": [{"weight": 1.0, "weight_unit": "KG"}],
+    "services": ["standard"],
+}
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import karrio.lib as lib
+from karrio.core.utils import Tracer
+
+
+def trace_call(tracer: Tracer, request_id: str, error: bool = False):
+    tracer.trace({"request_id": request_id, "url": "/rates", "data": "{}"}, "request")
+    tracer.trace(
+        {"request_id": request_id, **({"error": "!"} if error else {"response": "{}"})},
+        "error" if error else "response",
+    )
+
+
+class TestTracer(unittest.TestCase):
+    def test_records(self):
+        tracer = Tracer()
+        tracer.with_metadata(dict(connection="ups"))(
+            {"request_id": "1", "data": "<xml/>"}, "request", format="xml"
+        )
+
+        [record] = tracer.records
+
+        self.assertEqual(record.key, "request")
+        self.assertDictEqual(
+            record.data, {"format": "xml", "request_id": "1", "data": "<xml/>"}
+        )
+        self.assertDictEqual(record.metadata, {"connection": "ups"})
+
+    def test_ring_buffer(self):
+        tracer = Tracer(max_records=4)
+        for index in range(10):
+            trace_call(tracer, str(index))
+
+        self.assertListEqual(
+            [record.data["request_id"] for record in tracer.records],
+            ["8", "8", "9", "9"],
+        )
+
+    def test_body_truncation(self):
+        tracer = Tracer(max_body_size=5)
+        data = {"request_id": "1", "data": "0123456789"}
+        tracer.trace(data, "request")
+
+        self.assertEqual(data["data"], "0123456789")
+        self.assertEqual(
+            tracer.records[0].data["data"], "01234...[5 characters truncated]"
+        )
+
+    def test_sampling(self):
+        tracer = Tracer(sample_rate=0.0)
+        trace_call(tracer, "ok")
+        trace_call(tracer, "failed", error=True)
+
+        self.assertListEqual(
+            [(record.key, record.data["request_id"]) for record in tracer.records],
+            [("request", "failed"), ("error", "failed")],
+        )
+
+    def test_operation_sampling(self):
+        tracer = Tracer(sample_rates={"get_rates": 0.0})
+        with lib.operation_context("get_rates"):
+            trace_call(tracer, "rate")
+        with lib.operation_context("create_shipment"):
+            trace_call(tracer, "shipment")
+
+        self.assertListEqual(
+            [record.data["request_id"] for record in tracer.records],
+            ["shipment", "shipment"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
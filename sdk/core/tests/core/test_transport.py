@@ -0,0 +1,166 @@
+import gzip
+import threading
+import unittest
+import http.client
+import http.server
+import urllib.request
+from urllib.error import URLError
+import karrio.lib as lib
+from karrio.core.utils.transport import PooledTransport, Context, CONTEXT
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/redirect":
+            return self._respond(302, b"", location="/ok")
+        if self.path == "/error":
+            return self._respond(400, b'{"error": "invalid"}')
+        if self.path == "/gzip":
+            return self._respond(200, gzip.compress(b"zipped"), encoding="gzip")
+
+        self._respond(200, f"{self.command} {self.path}".encode())
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.path == "/redirect":
+            return self._respond(307, b"redirected", location="/ok")
+
+        self._respond(200, body)
+
+    def _respond(self, status, body, location=None, encoding=None):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        if location:
+            self.send_header("Location", location)
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StaleConnection:
+    """A kept-alive connection the server closed while it was idle."""
+
+    sock = None
+    timeout = None
+
+    def request(self, *args, **kwargs):
+        pass
+
+    def getresponse(self):
+        raise http.client.RemoteDisconnected("Remote end closed connection")
+
+    def close(self):
+        pass
+
+
+class TestPooledTransport(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.transport = PooledTransport(pool_size=2)
+
+    def tearDown(self):
+        self.transport.close()
+
+    def test_connection_is_kept_alive(self):
+        responses = [
+            lib.request(url=f"{self.url}/ok", transport=self.transport)
+            for _ in range(5)
+        ]
+
+        self.assertListEqual(responses, ["GET /ok"] * 5)
+        self.assertEqual(self.transport.stats.connections, 1)
+        self.assertEqual(self.transport.stats.reused_connections, 4)
+
+    def test_post_request_data(self):
+        response = lib.request(
+            url=f"{self.url}/echo",
+            data='{"key": "value"}',
+            method="POST",
+            transport=self.transport,
+        )
+
+        self.assertEqual(response, '{"key": "value"}')
+
+    def test_gzip_response_decoding(self):
+        response = lib.request(url=f"{self.url}/gzip", transport=self.transport)
+
+        self.assertEqual(response, "zipped")
+
+    def test_redirect_is_followed(self):
+        response = lib.request(url=f"{self.url}/redirect", transport=self.transport)
+
+        self.assertEqual(response, "GET /ok")
+
+    def test_error_response_is_handled(self):
+        response = lib.request(
+            url=f"{self.url}/error",
+            transport=self.transport,
+            on_error=lambda error: f"{error.code}: {error.read().decode()}",
+        )
+
+        self.assertEqual(response, '400: {"error": "invalid"}')
+
+    def test_post_redirect_is_an_error(self):
+        response = lib.request(
+            url=f"{self.url}/redirect",
+            data="{}",
+            method="POST",
+            transport=self.transport,
+            on_error=lambda error: f"{error.code}: {error.read().decode()}",
+        )
+
+        self.assertEqual(response, "307: redirected")
+
+    def test_stale_connection_retry(self):
+        netloc = self.url.split("://")[1]
+        self.transport._get_pool("http", netloc).put(StaleConnection())
+        response = lib.request(url=f"{self.url}/ok", transport=self.transport)
+
+        self.assertEqual(response, "GET /ok")
+
+        self.transport._get_pool("http", netloc).put(StaleConnection())
+        with self.assertRaises(http.client.RemoteDisconnected):
+            self.transport.send(
+                urllib.request.Request(f"{self.url}/echo", data=b"{}", method="POST")
+            )
+
+    def test_unreachable_host_raises_url_error(self):
+        with self.assertRaises(URLError) as context:
+            self.transport.send(urllib.request.Request("http://127.0.0.1:1/ok"))
+
+        self.assertIsInstance(context.exception.reason, ConnectionRefusedError)
+
+    def test_pool_per_carrier(self):
+        transport = PooledTransport(pool_size=2, pool_sizes={"ups": 5})
+
+        for carrier_name in ["ups", "fedex", "ups"]:
+            token = CONTEXT.set(Context(carrier_name=carrier_name))
+            lib.request(url=f"{self.url}/ok", transport=transport)
+            CONTEXT.reset(token)
+
+        self.assertEqual(transport.stats.connections, 2)
+        self.assertDictEqual(
+            {key[0]: pool.size for key, pool in transport._pools.items()},
+            {"ups": 5, "fedex": 2},
+        )
+        transport.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+import karrio.lib as lib
+import karrio.core.units as units
+import karrio.core.models as models
+
+
+class TestMeasurements(unittest.TestCase):
+    def test_weight_conversions_are_cached(self):
+        weight = units.Weight(2.0, "KG")
+
+        self.assertEqual(weight.LB, 4.41)
+        self.assertIs(weight.LB, weight["LB"])
+        self.assertEqual(weight.value, 2.0)
+        self.assertFalse(hasattr(weight, "__dict__"))
+
+    def test_dimension_conversions_are_cached(self):
+        dimension = units.Dimension(10.0, "IN")
+
+        self.assertEqual(dimension.CM, 25.4)
+        self.assertEqual(dimension.M, 0.25)
+        self.assertIs(dimension.CM, dimension["CM"])
+        self.assertFalse(hasattr(dimension, "__dict__"))
+
+
+class TestPackages(unittest.TestCase):
+    def setUp(self):
+        self.packages = lib.to_packages(
+            [
+                models.Parcel(
+                    weight=1.0,
+                    weight_unit="KG",
+                    width=10,
+                    height=10,
+                    length=10,
+                    dimension_unit="CM",
+                ),
+                models.Parcel(
+                    weight=2.0, weight_unit="KG", options=dict(insurance=50.0)
+                ),
+            ],
+            options=dict(insurance=25.0, signature_confirmation=True),
+        )
+
+    def test_package_measurements_are_computed_once(self):
+        package = self.packages[0]
+
+        self.assertIs(package.weight, package.weight)
+        self.assertIs(package.width, package.width)
+        self.assertEqual(package.weight.KG, 1.0)
+        self.assertEqual(package.girth.value, 40.0)
+        self.assertEqual(package.volume.value, 0.0)
+
+    def test_package_measurements_follow_parcel_changes(self):
+        package = self.packages[0]
+        weight, girth, items = package.weight, package.girth, package.items
+
+        package.parcel.weight = 3.0
+        package.parcel.width = 20
+        package.parcel.height = 20
+        package.parcel.items = [models.Commodity(weight=1.0, weight_unit="KG")]
+
+        self.assertIsNot(package.weight, weight)
+        self.assertEqual(package.weight.KG, 3.0)
+        self.assertEqual(self.packages.weight.KG, 5.0)
+        self.assertIsNot(package.girth, girth)
+        self.assertEqual(package.girth.value, 60.0)
+        self.assertIsNot(package.items, items)
+        self.assertEqual(len(self.packages.items), 1)
+
+    def test_packages_totals(self):
+        self.assertIs(self.packages.weight, self.packages.weight)
+        self.assertEqual(self.packages.weight.KG, 3.0)
+        self.assertDictEqual(
+            self.packages.options.content,
+            {"insurance": 75.0, "signature_confirmation": True},
+        )
+
+
+class TestOptions(unittest.TestCase):
+    def test_carrier_options_take_precedence(self):
+        class Option(lib.Enum):
+            insurance = lib.OptionEnum("INS", float)
+            carrier_insurance = insurance
+
+        options = units.ShippingOptions(
+            dict(carrier_insurance="10", currency="USD", unknown=True), Option
+        )
+
+        self.assertListEqual([key for key, _ in options], ["insurance", "currency"])
+        self.assertEqual(options.insurance.state, 10.0)
+        self.assertEqual(options.insurance.code, "INS")
+        self.assertEqual(options.currency.state, "USD")
+        self.assertNotIn("unknown", options)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,11 @@
 import unittest
+import karrio.lib as lib
 from karrio.core.utils import DP, Serializable
-from karrio.core.models import RateRequest
+from karrio.core.models import RateRequest, Parcel, Address
 from karrio.universal.mappers.rating_proxy import (
     RatingMixinSettings,
     RatingMixinProxy,
+    get_packages_rates,
 )
 from karrio.universal.providers.rating.rate import parse_rate_response
 
@@ -121,10 +123,72 @@ class TestUniversalRating(unittest.TestCase):
         )
 
 
+class TestRateSheetIndex(unittest.TestCase):
+    def setUp(self):
+        self.settings = RatingMixinSettings(**zoned_settings_data)
+
+    def test_rate_sheet_is_compiled_once(self):
+        self.assertIs(self.settings.rate_sheet, self.settings.rate_sheet)
+        self.assertEqual(len(self.settings.rate_sheet.services), 1)
+
+    def test_zone_lookup(self):
+        (service,) = self.settings.rate_sheet.services
+
+        self.assertTupleEqual(service.locate("Montreal", "CA"), (0, 1, 2))
+        self.assertTupleEqual(service.locate("Toronto", "CA"), (1, 2))
+        self.assertTupleEqual(service.locate("Toronto", "US"), (2,))
+        self.assertListEqual(
+            service.weigh_many(service.locate("Montreal", "CA"), [1.0, 4.0, 12.0]),
+            [(0, 1, 2), (1, 2), (2,)],
+        )
+
+    def test_packages_rates(self):
+        packages = lib.to_packages(
+            [Parcel(weight=weight, weight_unit="KG") for weight in [1.0, 4.0]]
+        )
+        recipient = lib.to_address(Address(city="Toronto", country_code="CA"))
+
+        rates = get_packages_rates(list(packages), recipient, recipient, self.settings)
+
+        self.assertListEqual(
+            [[rate.total_charge for rate in rates] for rates, _ in rates],
+            [[12.0], [12.0]],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
 
 
+zoned_settings_data = {
+    "carrier_id": "universal",
+    "services": [
+        {
+            "service_name": "Standard",
+            "service_code": "carrier_standard",
+            "currency": "USD",
+            "weight_unit": "KG",
+            "zones": [
+                {"rate": 8.0, "max_weight": 2.0, "cities": ["Montreal"]},
+                {
+                    "rate": 12.0,
+                    "max_weight": 5.0,
+                    "cities": [],
+                    "country_codes": ["CA"],
+                },
+                {"rate": 20.0, "max_weight": 100.0},
+            ],
+        },
+        {
+            "service_name": "Retired",
+            "service_code": "carrier_retired",
+            "active": False,
+            "zones": [{"rate": 1.0}],
+        },
+    ],
+}
+
+
 settings_data = {
     "carrier_id": "universal",
     "services": [
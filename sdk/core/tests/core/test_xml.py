@@ -0,0 +1,80 @@
+import unittest
+import karrio.lib as lib
+from karrio.core.utils import XP
+
+RESPONSES = [
+    '<?xml version="1.0"?><tracking-detail xmlns="urn:track"><pin>1</pin></tracking-detail>',
+    '<tracking-detail xmlns="urn:track"><pin>2</pin></tracking-detail>',
+]
+
+
+class TestXMLBundling(unittest.TestCase):
+    def test_bundle_elements_matches_bundle_xml(self):
+        bundle = XP.bundle_elements([*RESPONSES, None, ""])
+
+        self.assertEqual(
+            XP.xml_tostring(bundle),
+            XP.xml_tostring(XP.to_xml(XP.bundle_xml(RESPONSES))),
+        )
+
+    def test_bundle_parsed_elements(self):
+        elements = [XP.to_xml(response) for response in RESPONSES]
+        bundle = lib.to_element(elements)
+
+        self.assertEqual(bundle.tag, "wrapper")
+        self.assertIs(bundle[0], elements[0])
+        self.assertListEqual(
+            [pin.text for pin in lib.find_element("pin", bundle)], ["1", "2"]
+        )
+
+    def test_bundle_does_not_detach_elements(self):
+        document = XP.to_xml("<response><pin>1</pin><pin>2</pin></response>")
+        bundle = XP.bundle_elements(lib.find_element("pin", document))
+
+        self.assertEqual(len(bundle), 2)
+        self.assertEqual(len(document), 2)
+
+    def test_deserialize_elements(self):
+        elements = [XP.to_xml(response) for response in RESPONSES]
+        response = lib.Deserializable(elements, lib.to_element).deserialize()
+
+        self.assertEqual(len(lib.find_element("tracking-detail", response)), 2)
+        self.assertIs(lib.to_element(elements[0]), elements[0])
+
+
+DOCUMENT = """<ns:reply xmlns:ns="urn:reply" xmlns:x="urn:other">
+    <!-- rates -->
+    <ns:rate><ns:amount>1</ns:amount><x:amount>2</x:amount></ns:rate>
+    <ns:rate><ns:surcharge><ns:amount>3</ns:amount></ns:surcharge></ns:rate>
+    <ns:amount>4</ns:amount>
+</ns:reply>"""
+
+
+class TestFindElement(unittest.TestCase):
+    def find(self, tag, element):
+        return element.xpath(".//*[local-name() = $name]", name=tag)
+
+    def test_find_matches_xpath(self):
+        document = XP.to_xml(DOCUMENT)
+        elements = [document, *document.iter()]
+
+        for element in elements:
+            for tag in ["reply", "rate", "amount", "surcharge", "missing"]:
+                self.assertListEqual(
+                    lib.find_element(tag, element), self.find(tag, element)
+                )
+
+    def test_find_in_bundle(self):
+        document = XP.to_xml(DOCUMENT)
+        [rate, *_] = lib.find_element("rate", document)
+        lib.find_element("amount", document)
+        bundle = XP.bundle_elements([rate, document])
+
+        self.assertListEqual(
+            [amount.text for amount in lib.find_element("amount", bundle)],
+            ["1", "2", "1", "2", "3", "4"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
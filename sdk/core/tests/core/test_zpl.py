@@ -0,0 +1,130 @@
+import io
+import zlib
+import base64
+import unittest
+from unittest.mock import patch
+from PyPDF2 import PdfReader
+from barcode import Code128
+import karrio.lib as lib
+import karrio.addons.zpl as zpl
+
+LABEL = """
+^XA
+^FX a comment ~ with a tilde.
+^CF0,40
+^FO50,50^FDShipper^FS
+^FO50,120^GB700,4,4^FS
+^FO50,150^FR^GB100,100,100^FS
+^BY3,2,100
+^FO50,300^BCN,100,Y,N,N^FD>;123456789012^FS
+^FO50,500^GFA,8,8,2,FFFF:::^FS
+^FT50,700^A0N,50,50^FH^FDCaf_C3_A9^FS
+^XZ
+"""
+QRCODE_LABEL = "^XA^FO10,10^BQN,2,4^FDQA,karrio^FS^XZ"
+
+
+class TestZPLRendering(unittest.TestCase):
+    def setUp(self):
+        zpl.CACHE._entries.clear()
+
+    def test_commands(self):
+        self.assertListEqual(
+            list(zpl.commands("^XA\n^FO10,20^FDa ~ b^FS~DGR:A.GRF,2,1,FF^XZ")),
+            [
+                ("XA", ""),
+                ("FO", "10,20"),
+                ("FD", "a ~ b"),
+                ("FS", ""),
+                ("DG", "R:A.GRF,2,1,FF"),
+                ("XZ", ""),
+            ],
+        )
+
+    def test_render_label(self):
+        [label] = zpl.Renderer(4, 6, 8).render(LABEL)
+
+        self.assertEqual(label.size, (813, 1219))
+        self.assertEqual(label.getpixel((100, 200)), 0)  # reversed box
+        self.assertEqual(label.getpixel((400, 121)), 0)  # line
+        self.assertEqual(label.getpixel((400, 20)), 255)
+        self.assertEqual(label.crop((50, 500, 66, 504)).getextrema(), (0, 0))
+        self.assertEqual(label.crop((50, 640, 300, 700)).getextrema(), (0, 255))
+
+    def test_render_labels_pages(self):
+        content = zpl.to_pdf(LABEL * 2, 4, 6, 8)
+
+        self.assertTrue(content.startswith(b"%PDF"))
+        self.assertEqual(len(PdfReader(io.BytesIO(content)).pages), 2)
+
+    def test_render_cached_labels(self):
+        content = zpl.to_pdf(LABEL, 4, 6, 8)
+
+        with patch.object(zpl, "Renderer") as renderer:
+            self.assertEqual(zpl.to_pdf(LABEL, 4, 6, 8), content)
+            renderer.assert_not_called()
+
+        self.assertNotEqual(zpl.to_pdf(LABEL, 4, 6, 12), content)
+
+    def test_render_no_label(self):
+        with self.assertRaises(ValueError):
+            zpl.to_pdf("^FO10,10^FDnot a label^FS", 4, 6)
+
+    def test_zpl_to_pdf(self):
+        pdf = lib.zpl_to_pdf(base64.b64encode(LABEL.encode()).decode(), 4, 6, dpmm=8)
+
+        self.assertEqual(base64.b64decode(pdf), zpl.to_pdf(LABEL, 4, 6, 8))
+
+    def test_code128(self):
+        self.assertEqual(
+            zpl.code128_modules(zpl.code128_values("Karrio 123")),
+            "".join(Code128("Karrio 123").build()),
+        )
+        self.assertListEqual(
+            zpl.code128_values(">;1234>6AB"), [105, 12, 34, 100, 33, 34]
+        )
+        self.assertListEqual(
+            zpl.code128_values("AB123456", "A"), [104, 33, 34, 99, 12, 34, 56]
+        )
+        self.assertListEqual(zpl.code128_values("(00)1234", "D"), [105, 102, 0, 12, 34])
+
+    def test_graphic_field(self):
+        mask = zpl.graphic_field("FFFF:,8001", 2)
+        deflated = base64.b64encode(zlib.compress(b"\xff\xff\x80\x01")).decode()
+
+        self.assertEqual(mask.size, (16, 4))
+        self.assertListEqual(
+            [mask.getpixel((0, y)) for y in range(4)], [255, 255, 0, 255]
+        )
+        self.assertListEqual(
+            [mask.getpixel((1, y)) for y in range(4)], [255, 255, 0, 0]
+        )
+        self.assertEqual(zpl.graphic_field("gF", 2).size, (16, 5))
+        self.assertListEqual(
+            list(zpl.graphic_field(f":Z64:{deflated}:a1b2", 2).getdata()),
+            list(zpl.graphic_field("FFFF8001", 2).getdata()),
+        )
+
+    def test_qrcode_requires_the_extra(self):
+        with patch.object(zpl, "qrcode", None), patch.object(
+            zpl.logger, "warning"
+        ) as warning:
+            [blank] = zpl.Renderer(4, 6, 8).render(QRCODE_LABEL)
+
+        self.assertEqual(blank.getextrema(), (255, 255))
+        self.assertIn("karrio[zpl]", warning.call_args[0][0])
+
+    @unittest.skipIf(zpl.qrcode is None, "the karrio[zpl] extra is not installed")
+    def test_qrcode_rendering(self):
+        [image] = zpl.Renderer(4, 6, 8).render(QRCODE_LABEL)
+
+        self.assertNotEqual(image.getextrema(), (255, 255))
+
+    def test_qrcode_data(self):
+        self.assertEqual(zpl.qrcode_data("QA,karrio"), (3, "karrio"))
+        self.assertEqual(zpl.qrcode_data("HM,B0006karrio"), (2, "karrio"))
+        self.assertEqual(zpl.qrcode_data("karrio"), (0, "karrio"))
+
+
+if __name__ == "__main__":
+    unittest.main()
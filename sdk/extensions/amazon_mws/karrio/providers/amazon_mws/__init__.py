@@ -1,11 +1,29 @@
-from karrio.providers.amazon_mws.rate import parse_rate_response, rate_request
-from karrio.providers.amazon_mws.shipment import (
-    parse_shipment_cancel_response,
-    parse_shipment_response,
-    shipment_cancel_request,
-    shipment_request,
-)
-from karrio.providers.amazon_mws.tracking import (
-    parse_tracking_response,
-    tracking_request,
+import typing
+import karrio.lib as lib
+
+if typing.TYPE_CHECKING:
+    from karrio.providers.amazon_mws.rate import parse_rate_response, rate_request
+    from karrio.providers.amazon_mws.shipment import (
+        parse_shipment_cancel_response,
+        parse_shipment_response,
+        shipment_cancel_request,
+        shipment_request,
+    )
+    from karrio.providers.amazon_mws.tracking import (
+        parse_tracking_response,
+        tracking_request,
+    )
+
+__getattr__, __dir__ = lib.lazy_exports(
+    __name__,
+    {
+        ".rate": ["parse_rate_response", "rate_request"],
+        ".shipment": [
+            "parse_shipment_cancel_response",
+            "parse_shipment_response",
+            "shipment_cancel_request",
+            "shipment_request",
+        ],
+        ".tracking": ["parse_tracking_response", "tracking_request"],
+    },
 )
@@ -6,7 +6,7 @@ from karrio.providers.aramex import Settings
 
 
 def parse_error_response(response: Element, settings: Settings) -> List[Message]:
-    errors = response.xpath(".//*[local-name() = $name]", name="Notification")
+    errors = XP.find("Notification", response)
     return [_extract_error(node, settings) for node in errors]
 
 
@@ -17,8 +17,7 @@ def _extract_error(node: Element, settings: Settings) -> Message:
         # context info
         carrier_name=settings.carrier_name,
         carrier_id=settings.carrier_id,
-
         # carrier error info
         code=notification.Code,
-        message=notification.Message
+        message=notification.Message,
     )
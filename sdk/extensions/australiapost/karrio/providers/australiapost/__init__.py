@@ -1,4 +1,21 @@
-from karrio.providers.australiapost.utils import Settings
+import typing
+import karrio.lib as lib
+
+if typing.TYPE_CHECKING:
+    from karrio.providers.australiapost.utils import Settings
+    from karrio.providers.australiapost.tracking import (
+        parse_tracking_response,
+        tracking_request,
+    )
+
+__getattr__, __dir__ = lib.lazy_exports(
+    __name__,
+    {
+        ".utils": ["Settings"],
+        ".tracking": ["parse_tracking_response", "tracking_request"],
+    },
+)
+
 # from karrio.providers.australiapost.rate import parse_rate_response, rate_request
 # from karrio.providers.australiapost.address import (
 #     parse_address_validation_response,
@@ -18,7 +35,3 @@ from karrio.providers.australiapost.utils import Settings
 #     pickup_cancel_request,
 #     pickup_request,
 # )
-from karrio.providers.australiapost.tracking import (
-    parse_tracking_response,
-    tracking_request,
-)
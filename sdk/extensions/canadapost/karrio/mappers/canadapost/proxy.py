@@ -1,11 +1,11 @@
 import base64
 import time
 from typing import List
-from canadapost_lib.rating import mailing_scenario
 from karrio.api.proxy import Proxy as BaseProxy
 from karrio.core.errors import ShippingSDKError
 from karrio.core.utils import (
     request as http,
+    request_async,
     exec_async,
     Serializable,
     Deserializable,
@@ -35,6 +35,22 @@ class Proxy(BaseProxy):
 
         return Deserializable(response, XP.to_xml)
 
+    async def get_rates_async(self, request: Serializable) -> Deserializable:
+        response = await request_async(
+            url=f"{self.settings.server_url}/rs/ship/price",
+            data=request.serialize(),
+            trace=self.trace_as("xml"),
+            method="POST",
+            headers={
+                "Content-Type": "application/vnd.cpc.ship.rate-v4+xml",
+                "Accept": "application/vnd.cpc.ship.rate-v4+xml",
+                "Authorization": f"Basic {self.settings.authorization}",
+                "Accept-language": f"{self.settings.language}-CA",
+            },
+        )
+
+        return Deserializable(response, XP.to_xml)
+
     def get_tracking(self, request: Serializable) -> Deserializable:
         """
         get_tracking make parallel request for each pin
@@ -59,7 +75,7 @@ class Proxy(BaseProxy):
 
         response: List[str] = exec_async(track, request.serialize())
 
-        return Deserializable(XP.bundle_xml(xml_strings=response), XP.to_xml)
+        return Deserializable(response, XP.bundle_elements)
 
     def create_shipment(self, request: Serializable) -> Deserializable:
         def _contract_shipment(job: Job):
@@ -119,7 +135,7 @@ class Proxy(BaseProxy):
         pipeline: Pipeline = request.serialize()
         response = pipeline.apply(process)
 
-        return Deserializable(XP.bundle_xml(response), XP.to_xml)
+        return Deserializable(response, XP.bundle_elements)
 
     def cancel_shipment(self, request: Serializable) -> Deserializable:
         def _request(method: str, shipment_id: str, path: str = "", **kwargs):
@@ -159,7 +175,7 @@ class Proxy(BaseProxy):
 
         pipeline: Pipeline = request.serialize()
         response = pipeline.apply(process)
-        return Deserializable(XP.bundle_xml(response), XP.to_xml)
+        return Deserializable(response, XP.bundle_elements)
 
     def schedule_pickup(self, request: Serializable) -> Deserializable:
         def _availability(job: Job) -> str:
@@ -204,7 +220,7 @@ class Proxy(BaseProxy):
         pipeline: Pipeline = request.serialize()
         response = pipeline.apply(process)
 
-        return Deserializable(XP.bundle_xml(response), XP.to_xml)
+        return Deserializable(response, XP.bundle_elements)
 
     def modify_pickup(self, request: Serializable) -> Deserializable:
         def _get_pickup(job: Job) -> str:
@@ -249,7 +265,7 @@ class Proxy(BaseProxy):
         pipeline: Pipeline = request.serialize()
         response = pipeline.apply(process)
 
-        return Deserializable(XP.bundle_xml(response), XP.to_xml)
+        return Deserializable(response, XP.bundle_elements)
 
     def cancel_pickup(self, request: Serializable) -> Deserializable:
         pickuprequest = request.serialize()
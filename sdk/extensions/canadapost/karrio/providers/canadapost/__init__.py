@@ -1,22 +1,49 @@
-from karrio.providers.canadapost.utils import Settings
-from karrio.providers.canadapost.error import process_error
-from karrio.providers.canadapost.rate import parse_rate_response, rate_request
-from karrio.providers.canadapost.shipment import (
-    parse_shipment_cancel_response,
-    parse_shipment_response,
-    shipment_cancel_request,
-    shipment_request,
-)
-from karrio.providers.canadapost.pickup import (
-    parse_pickup_cancel_response,
-    parse_pickup_update_response,
-    parse_pickup_response,
-    pickup_update_request,
-    pickup_cancel_request,
-    pickup_request,
-)
-from karrio.providers.canadapost.tracking import (
-    parse_tracking_response,
-    tracking_request,
-)
+import typing
+import karrio.lib as lib
 
+if typing.TYPE_CHECKING:
+    from karrio.providers.canadapost.utils import Settings
+    from karrio.providers.canadapost.error import process_error
+    from karrio.providers.canadapost.rate import parse_rate_response, rate_request
+    from karrio.providers.canadapost.shipment import (
+        parse_shipment_cancel_response,
+        parse_shipment_response,
+        shipment_cancel_request,
+        shipment_request,
+    )
+    from karrio.providers.canadapost.pickup import (
+        parse_pickup_cancel_response,
+        parse_pickup_update_response,
+        parse_pickup_response,
+        pickup_update_request,
+        pickup_cancel_request,
+        pickup_request,
+    )
+    from karrio.providers.canadapost.tracking import (
+        parse_tracking_response,
+        tracking_request,
+    )
+
+__getattr__, __dir__ = lib.lazy_exports(
+    __name__,
+    {
+        ".utils": ["Settings"],
+        ".error": ["process_error"],
+        ".rate": ["parse_rate_response", "rate_request"],
+        ".shipment": [
+            "parse_shipment_cancel_response",
+            "parse_shipment_response",
+            "shipment_cancel_request",
+            "shipment_request",
+        ],
+        ".pickup": [
+            "parse_pickup_cancel_response",
+            "parse_pickup_update_response",
+            "parse_pickup_response",
+            "pickup_update_request",
+            "pickup_cancel_request",
+            "pickup_request",
+        ],
+        ".tracking": ["parse_tracking_response", "tracking_request"],
+    },
+)
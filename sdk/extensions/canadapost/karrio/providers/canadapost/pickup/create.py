@@ -197,7 +197,7 @@ def _create_pickup(
 def _get_pickup(
     update_response: str, payload: PickupUpdateRequest, settings: Settings
 ) -> Job:
-    errors = parse_error_response(XP.to_xml(XP.bundle_xml([update_response])), settings)
+    errors = parse_error_response(XP.bundle_elements([update_response]), settings)
     data = (
         None
         if any(errors)
@@ -60,7 +60,7 @@ class Proxy(BaseProxy):
 
         response: List[str] = exec_parrallel(get_tracking, request.serialize())
 
-        return Deserializable(XP.bundle_xml(xml_strings=response), XP.to_xml)
+        return Deserializable(response, XP.bundle_elements)
 
     def create_shipment(self, request: Serializable) -> Deserializable:
         def process(job: Job):
@@ -79,7 +79,7 @@ class Proxy(BaseProxy):
         pipeline: Pipeline = request.serialize()
         response = pipeline.apply(process)
 
-        return Deserializable(XP.bundle_xml(response), XP.to_xml)
+        return Deserializable(response, XP.bundle_elements)
 
     def cancel_shipment(self, request: Serializable) -> Deserializable:
         response = self._send_request(
@@ -116,7 +116,7 @@ class Proxy(BaseProxy):
         pipeline: Pipeline = request.serialize()
         response = pipeline.apply(process)
 
-        return Deserializable(XP.bundle_xml(response), XP.to_xml)
+        return Deserializable(response, XP.bundle_elements)
 
     def cancel_pickup(self, request: Serializable) -> Deserializable:
         response = self._send_request(
@@ -184,7 +184,7 @@ def _get_label(shipment_response: str, settings: provider_utils.Settings) -> lib
     response = lib.to_element(shipment_response)
     shipment = lib.to_object(
         Shipment,
-        next(iter(response.xpath(".//*[local-name() = $name]", name="shipment")), None),
+        next(iter(lib.find_element("shipment", response)), None),
     )
     success = shipment is not None and shipment.id is not None
     data = (
@@ -1,12 +1,31 @@
-from karrio.providers.chronopost.utils import Settings
-from karrio.providers.chronopost.rate import rate_request, parse_rate_response
-from karrio.providers.chronopost.shipment import (
-    parse_shipment_cancel_response,
-    parse_shipment_response,
-    shipment_cancel_request,
-    shipment_request,
-)
-from karrio.providers.chronopost.tracking import (
-    tracking_request,
-    parse_tracking_response,
+import typing
+import karrio.lib as lib
+
+if typing.TYPE_CHECKING:
+    from karrio.providers.chronopost.utils import Settings
+    from karrio.providers.chronopost.rate import rate_request, parse_rate_response
+    from karrio.providers.chronopost.shipment import (
+        parse_shipment_cancel_response,
+        parse_shipment_response,
+        shipment_cancel_request,
+        shipment_request,
+    )
+    from karrio.providers.chronopost.tracking import (
+        tracking_request,
+        parse_tracking_response,
+    )
+
+__getattr__, __dir__ = lib.lazy_exports(
+    __name__,
+    {
+        ".utils": ["Settings"],
+        ".rate": ["rate_request", "parse_rate_response"],
+        ".shipment": [
+            "parse_shipment_cancel_response",
+            "parse_shipment_response",
+            "shipment_cancel_request",
+            "shipment_request",
+        ],
+        ".tracking": ["tracking_request", "parse_tracking_response"],
+    },
 )
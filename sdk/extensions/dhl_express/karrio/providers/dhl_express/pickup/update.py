@@ -35,9 +35,7 @@ def parse_pickup_update_response(
     _response: lib.Deserializable[lib.Element], settings: Settings
 ) -> Tuple[PickupDetails, List[Message]]:
     response = _response.deserialize()
-    successful = (
-        len(response.xpath(".//*[local-name() = $name]", name="ConfirmationNumber")) > 0
-    )
+    successful = len(XP.find("ConfirmationNumber", response)) > 0
     pickup = _extract_pickup(response, settings) if successful else None
     return pickup, parse_error_response(response, settings)
 
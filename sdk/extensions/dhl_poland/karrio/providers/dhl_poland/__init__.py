@@ -1,11 +1,29 @@
-from karrio.providers.dhl_poland.utils import Settings
-from karrio.providers.dhl_poland.shipment import (
-    parse_shipment_cancel_response,
-    parse_shipment_response,
-    shipment_cancel_request,
-    shipment_request,
-)
-from karrio.providers.dhl_poland.tracking import (
-    parse_tracking_response,
-    tracking_request,
+import typing
+import karrio.lib as lib
+
+if typing.TYPE_CHECKING:
+    from karrio.providers.dhl_poland.utils import Settings
+    from karrio.providers.dhl_poland.shipment import (
+        parse_shipment_cancel_response,
+        parse_shipment_response,
+        shipment_cancel_request,
+        shipment_request,
+    )
+    from karrio.providers.dhl_poland.tracking import (
+        parse_tracking_response,
+        tracking_request,
+    )
+
+__getattr__, __dir__ = lib.lazy_exports(
+    __name__,
+    {
+        ".utils": ["Settings"],
+        ".shipment": [
+            "parse_shipment_cancel_response",
+            "parse_shipment_response",
+            "shipment_cancel_request",
+            "shipment_request",
+        ],
+        ".tracking": ["parse_tracking_response", "tracking_request"],
+    },
 )
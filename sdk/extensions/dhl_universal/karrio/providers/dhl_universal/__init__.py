@@ -1,4 +1,21 @@
-from karrio.providers.dhl_universal.utils import Settings
+import typing
+import karrio.lib as lib
+
+if typing.TYPE_CHECKING:
+    from karrio.providers.dhl_universal.utils import Settings
+    from karrio.providers.dhl_universal.tracking import (
+        parse_tracking_response,
+        tracking_request,
+    )
+
+__getattr__, __dir__ = lib.lazy_exports(
+    __name__,
+    {
+        ".utils": ["Settings"],
+        ".tracking": ["parse_tracking_response", "tracking_request"],
+    },
+)
+
 # from karrio.providers.dhl_universal.rate import parse_rate_response, rate_request
 # from karrio.providers.dhl_universal.address import (
 #     parse_address_validation_response,
@@ -18,7 +35,3 @@ from karrio.providers.dhl_universal.utils import Settings
 #     pickup_cancel_request,
 #     pickup_request,
 # )
-from karrio.providers.dhl_universal.tracking import (
-    parse_tracking_response,
-    tracking_request,
-)
@@ -17,23 +17,7 @@ from karrio.core.models import (
     # RateDetails,
     Message,
 )
-from karrio.providers.dicom import (
-    # parse_shipment_cancel_response,
-    # parse_pickup_update_response,
-    # parse_pickup_cancel_response,
-    # parse_shipment_response,
-    parse_tracking_response,
-    # parse_pickup_response,
-    # parse_rate_response,
-    #
-    # shipment_cancel_request,
-    # pickup_update_request,
-    # pickup_cancel_request,
-    tracking_request,
-    # shipment_request,
-    # pickup_request,
-    # rate_request,
-)
+import karrio.providers.dicom as provider
 from karrio.mappers.dicom.settings import Settings
 
 
@@ -46,7 +30,7 @@ class Mapper(BaseMapper):
     #     return rate_request(payload, self.settings)
 
     def create_tracking_request(self, payload: TrackingRequest) -> Serializable:
-        return tracking_request(payload, self.settings)
+        return provider.tracking_request(payload, self.settings)
 
     # def create_shipment_request(
     #     self, payload: ShipmentRequest
@@ -104,4 +88,4 @@ class Mapper(BaseMapper):
     def parse_tracking_response(
         self, response: Deserializable
     ) -> Tuple[List[TrackingDetails], List[Message]]:
-        return parse_tracking_response(response, self.settings)
+        return provider.parse_tracking_response(response, self.settings)
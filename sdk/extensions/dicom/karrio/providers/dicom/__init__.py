@@ -1,3 +1,19 @@
+import typing
+import karrio.lib as lib
+
+if typing.TYPE_CHECKING:
+    from karrio.providers.dicom.tracking import (
+        parse_tracking_response,
+        tracking_request,
+    )
+
+__getattr__, __dir__ = lib.lazy_exports(
+    __name__,
+    {
+        ".tracking": ["parse_tracking_response", "tracking_request"],
+    },
+)
+
 # from karrio.providers.dicom.utils import Settings
 # from karrio.providers.dicom.rate import parse_rate_response, rate_request
 # from karrio.providers.dicom.shipment import (
@@ -14,7 +30,3 @@
 #     pickup_cancel_request,
 #     pickup_request,
 # )
-from karrio.providers.dicom.tracking import (
-    parse_tracking_response,
-    tracking_request,
-)
@@ -1,9 +1,16 @@
-from karrio.providers.dpd.utils import Settings
-from karrio.providers.dpd.shipment import (
-    parse_shipment_response,
-    shipment_request,
-)
-from karrio.providers.dpd.tracking import (
-    parse_tracking_response,
-    tracking_request,
+import typing
+import karrio.lib as lib
+
+if typing.TYPE_CHECKING:
+    from karrio.providers.dpd.utils import Settings
+    from karrio.providers.dpd.shipment import parse_shipment_response, shipment_request
+    from karrio.providers.dpd.tracking import parse_tracking_response, tracking_request
+
+__getattr__, __dir__ = lib.lazy_exports(
+    __name__,
+    {
+        ".utils": ["Settings"],
+        ".shipment": ["parse_shipment_response", "shipment_request"],
+        ".tracking": ["parse_tracking_response", "tracking_request"],
+    },
 )
@@ -1,7 +1,7 @@
-from fedex_lib.ship_service_v26 import TrackingId
-
 import karrio.lib as lib
 import karrio.api.proxy as proxy
+import karrio.core.models as models
+import karrio.providers.fedex as provider
 from karrio.mappers.fedex.settings import Settings
 
 
@@ -17,6 +17,15 @@ class Proxy(proxy.Proxy):
             headers={"Content-Type": "application/xml"},
         )
 
+    async def _send_request_async(self, path: str, request: lib.Serializable) -> str:
+        return await lib.request_async(
+            url=f"{self.settings.server_url}{path}",
+            data=request.serialize(),
+            trace=self.trace_as("xml"),
+            method="POST",
+            headers={"Content-Type": "application/xml"},
+        )
+
     def validate_address(self, request: lib.Serializable) -> lib.Deserializable:
         response = self._send_request("/addressvalidation", request)
 
@@ -27,12 +36,19 @@ class Proxy(proxy.Proxy):
 
         return lib.Deserializable(response, lib.to_element, request.ctx)
 
+    async def get_rates_async(self, request: lib.Serializable) -> lib.Deserializable:
+        response = await self._send_request_async("/rate", request)
+
+        return lib.Deserializable(response, lib.to_element, request.ctx)
+
     def get_tracking(self, request: lib.Serializable) -> lib.Deserializable:
         response = self._send_request("/track", request)
 
         return lib.Deserializable(response, lib.to_element)
 
     def create_shipment(self, request: lib.Serializable) -> lib.Deserializable:
+        from fedex_lib.ship_service_v26 import TrackingId
+
         requests = request.serialize()
         response = self._send_request("/ship", lib.Serializable(requests[0]))
         master_id = lib.find_element(
@@ -40,21 +56,46 @@ class Proxy(proxy.Proxy):
         )
 
         if len(requests) > 1 and master_id is not None:
-            responses = [
-                self._send_request(
-                    "/ship",
-                    lib.Serializable(
-                        request.replace(
-                            "[MASTER_ID_TYPE]", master_id.TrackingIdType
-                        ).replace("[MASTER_TRACKING_ID]", master_id.TrackingNumber),
-                    ),
-                )
-                for request in requests[1:]
-            ]
-            return lib.Deserializable([response, *responses], lib.to_element)
+            responses = lib.run_multi_piece(
+                lambda child: self._send_request("/ship", lib.Serializable(child)),
+                [
+                    request.replace(
+                        "[MASTER_ID_TYPE]", master_id.TrackingIdType
+                    ).replace("[MASTER_TRACKING_ID]", master_id.TrackingNumber)
+                    for request in requests[1:]
+                ],
+                master=response,
+                failed=lambda response: not any(
+                    lib.find_element(
+                        "CompletedPackageDetails", lib.to_element(response)
+                    )
+                ),
+                cancel=lambda response: self._cancel_package(
+                    response, master_id.TrackingIdType
+                ),
+            )
+            return lib.Deserializable(responses, lib.to_element)
 
         return lib.Deserializable(response, lib.to_element)
 
+    def _cancel_package(self, response: str, tracking_type: str) -> str:
+        tracking_ids = lib.find_element("TrackingIds", lib.to_element(response))
+        tracking_number = lib.find_element(
+            "TrackingNumber", tracking_ids[0], first=True
+        )
+
+        return self._send_request(
+            "/ship",
+            provider.shipment_cancel_request(
+                models.ShipmentCancelRequest(
+                    shipment_identifier=tracking_number.text,
+                    service=tracking_type.lower(),
+                    options=dict(deletion_type="DELETE_ONE_PACKAGE"),
+                ),
+                self.settings,
+            ),
+        )
+
     def cancel_shipment(self, request: lib.Serializable) -> lib.Deserializable:
         response = self._send_request("/ship", request)
 
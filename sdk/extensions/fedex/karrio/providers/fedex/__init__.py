@@ -1,28 +1,57 @@
-from karrio.providers.fedex.utils import Settings
-from karrio.providers.fedex.address import (
-    parse_address_validation_response,
-    address_validation_request,
-)
-from karrio.providers.fedex.pickup import (
-    parse_pickup_cancel_response,
-    parse_pickup_update_response,
-    parse_pickup_response,
-    pickup_update_request,
-    pickup_cancel_request,
-    pickup_request,
-)
-from karrio.providers.fedex.tracking import (
-    parse_tracking_response,
-    tracking_request,
-)
-from karrio.providers.fedex.rate import rate_request, parse_rate_response
-from karrio.providers.fedex.shipment import (
-    parse_shipment_cancel_response,
-    parse_shipment_response,
-    shipment_cancel_request,
-    shipment_request,
-)
-from karrio.providers.fedex.document import (
-    parse_document_upload_response,
-    document_upload_request,
+import typing
+import karrio.lib as lib
+
+if typing.TYPE_CHECKING:
+    from karrio.providers.fedex.utils import Settings
+    from karrio.providers.fedex.address import (
+        parse_address_validation_response,
+        address_validation_request,
+    )
+    from karrio.providers.fedex.pickup import (
+        parse_pickup_cancel_response,
+        parse_pickup_update_response,
+        parse_pickup_response,
+        pickup_update_request,
+        pickup_cancel_request,
+        pickup_request,
+    )
+    from karrio.providers.fedex.tracking import (
+        parse_tracking_response,
+        tracking_request,
+    )
+    from karrio.providers.fedex.rate import rate_request, parse_rate_response
+    from karrio.providers.fedex.shipment import (
+        parse_shipment_cancel_response,
+        parse_shipment_response,
+        shipment_cancel_request,
+        shipment_request,
+    )
+    from karrio.providers.fedex.document import (
+        parse_document_upload_response,
+        document_upload_request,
+    )
+
+__getattr__, __dir__ = lib.lazy_exports(
+    __name__,
+    {
+        ".utils": ["Settings"],
+        ".address": ["parse_address_validation_response", "address_validation_request"],
+        ".pickup": [
+            "parse_pickup_cancel_response",
+            "parse_pickup_update_response",
+            "parse_pickup_response",
+            "pickup_update_request",
+            "pickup_cancel_request",
+            "pickup_request",
+        ],
+        ".tracking": ["parse_tracking_response", "tracking_request"],
+        ".rate": ["rate_request", "parse_rate_response"],
+        ".shipment": [
+            "parse_shipment_cancel_response",
+            "parse_shipment_response",
+            "shipment_cancel_request",
+            "shipment_request",
+        ],
+        ".document": ["parse_document_upload_response", "document_upload_request"],
+    },
 )
@@ -1,14 +1,13 @@
 from typing import List, Optional
-from fedex_lib.rate_service_v28 import Notification
 from karrio.core.models import Message
 from karrio.core.utils import Element, extract_fault, XP
 from karrio.providers.fedex.utils import Settings
 
 
 def parse_error_response(response: Element, settings: Settings) -> List[Message]:
-    notifications = response.xpath(
-        ".//*[local-name() = $name]", name="Notifications"
-    ) + response.xpath(".//*[local-name() = $name]", name="Notification")
+    notifications = XP.find("Notifications", response) + XP.find(
+        "Notification", response
+    )
     errors = [_extract_error(node, settings) for node in notifications] + extract_fault(
         response, settings
     )
@@ -16,6 +15,9 @@ def parse_error_response(response: Element, settings: Settings) -> List[Message]
 
 
 def _extract_error(node: Element, settings: Settings) -> Optional[Message]:
+    # imported on use: tracking errors don't need the rate schema loaded.
+    from fedex_lib.rate_service_v28 import Notification
+
     notification = XP.to_object(Notification, node)
     if notification.Severity not in ("SUCCESS", "NOTE"):
         return Message(
@@ -51,11 +51,7 @@ def _cancel_pickup_request(
     response: str, payload: PickupUpdateRequest, settings: Settings
 ):
     reply = next(
-        iter(
-            XP.to_xml(response).xpath(
-                ".//*[local-name() = $name]", name="CreatePickupReply"
-            )
-        ),
+        iter(XP.find("CreatePickupReply", XP.to_xml(response))),
         None,
     )
     new_pickup = XP.to_object(CreatePickupReply, reply)
@@ -17,7 +17,7 @@ def parse_tracking_response(
     settings: provider_utils.Settings,
 ) -> typing.Tuple[typing.List[models.TrackingDetails], typing.List[models.Message]]:
     response = _response.deserialize()
-    track_details = response.xpath(".//*[local-name() = $name]", name="TrackDetails")
+    track_details = lib.find_element("TrackDetails", response)
     tracking_details = [
         _extract_tracking(track_detail_node, settings)
         for track_detail_node in track_details
@@ -124,8 +124,14 @@ def tracking_request(
     options = lib.units.Options(payload.options or {})
 
     request = fedex.TrackRequest(
-        WebAuthenticationDetail=settings.webAuthenticationDetail,
-        ClientDetail=settings.clientDetail,
+        WebAuthenticationDetail=fedex.WebAuthenticationDetail(
+            UserCredential=fedex.WebAuthenticationCredential(
+                Key=settings.user_key, Password=settings.password
+            )
+        ),
+        ClientDetail=fedex.ClientDetail(
+            AccountNumber=settings.account_number, MeterNumber=settings.meter_number
+        ),
         TransactionDetail=fedex.TransactionDetail(
             CustomerTransactionId="Track By Number_v18",
             Localization=fedex.Localization(
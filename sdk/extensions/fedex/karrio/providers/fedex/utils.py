@@ -1,11 +1,9 @@
-from typing import Callable
+from typing import Callable, TYPE_CHECKING
 from karrio.core import Settings as BaseSettings
 from karrio.core.utils import Envelope, apply_namespaceprefix, XP
-from fedex_lib.rate_service_v28 import (
-    WebAuthenticationCredential,
-    WebAuthenticationDetail,
-    ClientDetail,
-)
+
+if TYPE_CHECKING:
+    from fedex_lib.rate_service_v28 import WebAuthenticationDetail, ClientDetail
 
 
 class Settings(BaseSettings):
@@ -34,7 +32,13 @@ class Settings(BaseSettings):
         return "https://www.fedex.com/fedextrack/?trknbr={}"
 
     @property
-    def webAuthenticationDetail(self) -> WebAuthenticationDetail:
+    def webAuthenticationDetail(self) -> "WebAuthenticationDetail":
+        # the rate schema is only loaded by the operations sending these details.
+        from fedex_lib.rate_service_v28 import (
+            WebAuthenticationCredential,
+            WebAuthenticationDetail,
+        )
+
         return WebAuthenticationDetail(
             UserCredential=WebAuthenticationCredential(
                 Key=self.user_key, Password=self.password
@@ -42,7 +46,9 @@ class Settings(BaseSettings):
         )
 
     @property
-    def clientDetail(self) -> ClientDetail:
+    def clientDetail(self) -> "ClientDetail":
+        from fedex_lib.rate_service_v28 import ClientDetail
+
         return ClientDetail(
             AccountNumber=self.account_number, MeterNumber=self.meter_number
         )
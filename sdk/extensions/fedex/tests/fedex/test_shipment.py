@@ -89,6 +89,26 @@ class TestFedExShipment(unittest.TestCase):
                 ParsedMultiPieceShipmentResponse,
             )
 
+    def test_parse_multi_piece_shipment_partial_failure(self):
+        with patch("karrio.mappers.fedex.proxy.lib.request") as mocks:
+            mocks.side_effect = [
+                ShipmentResponseXML,
+                ShipmentErrorResponseXML,
+                ShipmentCancelResponseXML,
+            ]
+            parsed_response = (
+                Shipment.create(self.MultiPieceShipmentRequest).from_(gateway).parse()
+            )
+            cancel_request = mocks.call_args_list[-1][1]["data"]
+
+            self.assertEqual(mocks.call_count, 3)
+            self.assertIn("DELETE_ONE_PACKAGE", cancel_request)
+            self.assertIn("794604790138", cancel_request)
+            self.assertListEqual(
+                DP.to_dict(parsed_response),
+                ParsedShipmentPartialFailureResponse,
+            )
+
     def test_parse_shipment_cancel_response(self):
         with patch("karrio.mappers.fedex.proxy.lib.request") as mock:
             mock.return_value = ShipmentResponseXML
@@ -755,6 +775,18 @@ SecondPieceShipmentRequestXml = """<tns:Envelope xmlns:tns="http://schemas.xmlso
 </tns:Envelope>
 """
 
+ParsedShipmentPartialFailureResponse = [
+    None,
+    [
+        {
+            "carrier_id": "carrier_id",
+            "carrier_name": "fedex",
+            "code": "3058",
+            "message": "Recipient Postal code or routing code is required",
+        }
+    ],
+]
+
 ShipmentResponseXML = """<SOAP-ENV:Envelope xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/">
     <SOAP-ENV:Header/>
     <SOAP-ENV:Body>
@@ -1150,6 +1182,22 @@ ShipmentResponseXML = """<SOAP-ENV:Envelope xmlns:SOAP-ENV="http://schemas.xmlso
 </SOAP-ENV:Envelope>
 """
 
+ShipmentErrorResponseXML = """<SOAP-ENV:Envelope xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/">
+    <SOAP-ENV:Header/>
+    <SOAP-ENV:Body>
+        <ProcessShipmentReply xmlns="http://fedex.com/ws/ship/v26">
+            <HighestSeverity>ERROR</HighestSeverity>
+            <Notifications>
+                <Severity>ERROR</Severity>
+                <Source>ship</Source>
+                <Code>3058</Code>
+                <Message>Recipient Postal code or routing code is required</Message>
+            </Notifications>
+        </ProcessShipmentReply>
+    </SOAP-ENV:Body>
+</SOAP-ENV:Envelope>
+"""
+
 ShipmentCancelRequestXML = """<tns:Envelope xmlns:tns="http://schemas.xmlsoap.org/soap/envelope/" xmlns:v23="http://fedex.com/ws/ship/v23">
     <tns:Body>
         <v23:DeleteShipmentRequest>
@@ -0,0 +1,6 @@
+import karrio.lib as lib
+
+__getattr__, __dir__ = lib.lazy_exports(
+    __name__,
+    {},
+)
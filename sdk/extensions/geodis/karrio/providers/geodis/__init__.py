@@ -1,6 +1,17 @@
+import typing
+import karrio.lib as lib
 
-from karrio.providers.geodis.utils import Settings
-from karrio.providers.geodis.tracking import (
-    parse_tracking_response,
-    tracking_request,
+if typing.TYPE_CHECKING:
+    from karrio.providers.geodis.utils import Settings
+    from karrio.providers.geodis.tracking import (
+        parse_tracking_response,
+        tracking_request,
+    )
+
+__getattr__, __dir__ = lib.lazy_exports(
+    __name__,
+    {
+        ".utils": ["Settings"],
+        ".tracking": ["parse_tracking_response", "tracking_request"],
+    },
 )
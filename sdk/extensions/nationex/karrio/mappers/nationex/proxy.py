@@ -20,6 +20,17 @@ class Proxy(proxy.Proxy):
 
         return lib.Deserializable(response, lib.to_dict)
 
+    async def get_rates_async(self, request: lib.Serializable) -> lib.Deserializable:
+        response = await lib.request_async(
+            url=f"{self.settings.server_url}/Customers/{self.settings.customer_id}/rates",
+            data=request.serialize(),
+            trace=self.trace_as("json"),
+            method="POST",
+            headers={"Authorization": f"Basic {self.settings.authorization}"},
+        )
+
+        return lib.Deserializable(response, lib.to_dict)
+
     def create_shipment(self, request: lib.Serializable) -> lib.Deserializable:
         payload = request.serialize()
         response = lib.request(
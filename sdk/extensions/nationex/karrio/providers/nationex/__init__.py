@@ -1,13 +1,31 @@
+import typing
+import karrio.lib as lib
 
-from karrio.providers.nationex.utils import Settings
-from karrio.providers.nationex.rate import parse_rate_response, rate_request
-from karrio.providers.nationex.shipment import (
-    parse_shipment_cancel_response,
-    parse_shipment_response,
-    shipment_cancel_request,
-    shipment_request,
-)
-from karrio.providers.nationex.tracking import (
-    parse_tracking_response,
-    tracking_request,
+if typing.TYPE_CHECKING:
+    from karrio.providers.nationex.utils import Settings
+    from karrio.providers.nationex.rate import parse_rate_response, rate_request
+    from karrio.providers.nationex.shipment import (
+        parse_shipment_cancel_response,
+        parse_shipment_response,
+        shipment_cancel_request,
+        shipment_request,
+    )
+    from karrio.providers.nationex.tracking import (
+        parse_tracking_response,
+        tracking_request,
+    )
+
+__getattr__, __dir__ = lib.lazy_exports(
+    __name__,
+    {
+        ".utils": ["Settings"],
+        ".rate": ["parse_rate_response", "rate_request"],
+        ".shipment": [
+            "parse_shipment_cancel_response",
+            "parse_shipment_response",
+            "shipment_cancel_request",
+            "shipment_request",
+        ],
+        ".tracking": ["parse_tracking_response", "tracking_request"],
+    },
 )
@@ -71,7 +71,7 @@ class Proxy(BaseProxy):
 
         pipeline: Pipeline = request.serialize()
         response = pipeline.apply(process)
-        return Deserializable(XP.bundle_xml(response), XP.to_xml)
+        return Deserializable(response, XP.bundle_elements)
 
     def cancel_shipment(self, request: Serializable) -> Deserializable:
         response = self._send_request(
@@ -99,7 +99,7 @@ class Proxy(BaseProxy):
         pipeline: Pipeline = request.serialize()
         response = pipeline.apply(process)
 
-        return Deserializable(XP.bundle_xml(response), XP.to_xml)
+        return Deserializable(response, XP.bundle_elements)
 
     def modify_pickup(self, request: Serializable) -> Deserializable:
         def process(job: Job):
@@ -118,7 +118,7 @@ class Proxy(BaseProxy):
         pipeline: Pipeline = request.serialize()
         response = pipeline.apply(process)
 
-        return Deserializable(XP.bundle_xml(response), XP.to_xml)
+        return Deserializable(response, XP.bundle_elements)
 
     def cancel_pickup(self, request: Serializable) -> Deserializable:
         response = self._send_request(
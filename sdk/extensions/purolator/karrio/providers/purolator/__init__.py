@@ -1,23 +1,50 @@
-from karrio.providers.purolator.rate import parse_rate_response, rate_request
-from karrio.providers.purolator.address import (
-    parse_address_validation_response,
-    address_validation_request
-)
-from karrio.providers.purolator.shipment import (
-    parse_shipment_cancel_response,
-    parse_shipment_response,
-    shipment_cancel_request,
-    shipment_request,
-)
-from karrio.providers.purolator.pickup import (
-    parse_pickup_cancel_response,
-    parse_pickup_update_response,
-    parse_pickup_response,
-    pickup_update_request,
-    pickup_cancel_request,
-    pickup_request,
-)
-from karrio.providers.purolator.tracking import (
-    parse_tracking_response,
-    tracking_request,
+import typing
+import karrio.lib as lib
+
+if typing.TYPE_CHECKING:
+    from karrio.providers.purolator.rate import parse_rate_response, rate_request
+    from karrio.providers.purolator.address import (
+        parse_address_validation_response,
+        address_validation_request,
+    )
+    from karrio.providers.purolator.shipment import (
+        parse_shipment_cancel_response,
+        parse_shipment_response,
+        shipment_cancel_request,
+        shipment_request,
+    )
+    from karrio.providers.purolator.pickup import (
+        parse_pickup_cancel_response,
+        parse_pickup_update_response,
+        parse_pickup_response,
+        pickup_update_request,
+        pickup_cancel_request,
+        pickup_request,
+    )
+    from karrio.providers.purolator.tracking import (
+        parse_tracking_response,
+        tracking_request,
+    )
+
+__getattr__, __dir__ = lib.lazy_exports(
+    __name__,
+    {
+        ".rate": ["parse_rate_response", "rate_request"],
+        ".address": ["parse_address_validation_response", "address_validation_request"],
+        ".shipment": [
+            "parse_shipment_cancel_response",
+            "parse_shipment_response",
+            "shipment_cancel_request",
+            "shipment_request",
+        ],
+        ".pickup": [
+            "parse_pickup_cancel_response",
+            "parse_pickup_update_response",
+            "parse_pickup_response",
+            "pickup_update_request",
+            "pickup_cancel_request",
+            "pickup_request",
+        ],
+        ".tracking": ["parse_tracking_response", "tracking_request"],
+    },
 )
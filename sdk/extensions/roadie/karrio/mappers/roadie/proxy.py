@@ -22,6 +22,20 @@ class Proxy(proxy.Proxy):
 
         return lib.Deserializable(response, lib.to_dict)
 
+    async def get_rates_async(self, request: lib.Serializable) -> lib.Deserializable:
+        response = await lib.request_async(
+            url=f"{self.settings.server_url}/v1/estimates",
+            data=request.serialize(),
+            trace=self.trace_as("json"),
+            method="POST",
+            headers={
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {self.settings.api_key}",
+            },
+        )
+
+        return lib.Deserializable(response, lib.to_dict)
+
     def create_shipment(self, request: lib.Serializable) -> lib.Deserializable:
         response = lib.request(
             url=f"{self.settings.server_url}/v1/shipments",
@@ -18,24 +18,7 @@ from karrio.core.models import (
     # RateDetails,
     Message,
 )
-from karrio.providers.sendle import (
-    # parse_address_validation_response,
-    # parse_shipment_cancel_response,
-    # parse_pickup_update_response,
-    # parse_pickup_cancel_response,
-    # parse_shipment_response,
-    parse_tracking_response,
-    # parse_pickup_response,
-    # parse_rate_response,
-    # address_validation_request,
-    # shipment_cancel_request,
-    # pickup_update_request,
-    # pickup_cancel_request,
-    tracking_request,
-    # shipment_request,
-    # pickup_request,
-    # rate_request,
-)
+import karrio.providers.sendle as provider
 from karrio.mappers.sendle.settings import Settings
 
 
@@ -74,7 +57,7 @@ class Mapper(BaseMapper):
     #     return shipment_cancel_request(payload, self.settings)
 
     def create_tracking_request(self, payload: TrackingRequest) -> Serializable:
-        return tracking_request(payload, self.settings)
+        return provider.tracking_request(payload, self.settings)
 
     # def parse_address_validation_response(
     #     self, response: Deserializable
@@ -114,4 +97,4 @@ class Mapper(BaseMapper):
     def parse_tracking_response(
         self, response: Deserializable
     ) -> Tuple[List[TrackingDetails], List[Message]]:
-        return parse_tracking_response(response, self.settings)
+        return provider.parse_tracking_response(response, self.settings)
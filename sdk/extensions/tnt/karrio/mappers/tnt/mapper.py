@@ -10,14 +10,7 @@ from karrio.core.models import (
     RateDetails,
     Message,
 )
-from karrio.providers.tnt import (
-    # parse_shipment_response,
-    parse_tracking_response,
-    # parse_rate_response,
-    tracking_request,
-    # shipment_request,
-    # rate_request,
-)
+import karrio.providers.tnt as provider
 from karrio.mappers.tnt.settings import Settings
 
 
@@ -35,7 +28,7 @@ class Mapper(BaseMapper):
     #     return shipment_request(payload, self.settings)
 
     def create_tracking_request(self, payload: TrackingRequest) -> Serializable:
-        return tracking_request(payload, self.settings)
+        return provider.tracking_request(payload, self.settings)
 
     # def parse_rate_response(
     #     self, response: Deserializable
@@ -50,4 +43,4 @@ class Mapper(BaseMapper):
     def parse_tracking_response(
         self, response: Deserializable
     ) -> Tuple[List[TrackingDetails], List[Message]]:
-        return parse_tracking_response(response, self.settings)
+        return provider.parse_tracking_response(response, self.settings)
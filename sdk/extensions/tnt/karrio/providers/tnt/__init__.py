@@ -1,10 +1,21 @@
-from karrio.providers.tnt.utils import Settings
-from karrio.providers.tnt.rate import parse_rate_response, rate_request
+import typing
+import karrio.lib as lib
+
+if typing.TYPE_CHECKING:
+    from karrio.providers.tnt.utils import Settings
+    from karrio.providers.tnt.rate import parse_rate_response, rate_request
+    from karrio.providers.tnt.tracking import parse_tracking_response, tracking_request
+
+__getattr__, __dir__ = lib.lazy_exports(
+    __name__,
+    {
+        ".utils": ["Settings"],
+        ".rate": ["parse_rate_response", "rate_request"],
+        ".tracking": ["parse_tracking_response", "tracking_request"],
+    },
+)
+
 # from karrio.providers.tnt.shipment import (
 #     parse_shipment_response,
 #     shipment_request,
 # )
-from karrio.providers.tnt.tracking import (
-    parse_tracking_response,
-    tracking_request,
-)
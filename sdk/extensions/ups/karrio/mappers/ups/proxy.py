@@ -16,6 +16,15 @@ class Proxy(proxy.Proxy):
             headers={"Content-Type": "application/xml"},
         )
 
+    async def _send_request_async(self, path: str, request: lib.Serializable) -> str:
+        return await lib.request_async(
+            url=f"{self.settings.server_url}{path}",
+            data=request.serialize(),
+            trace=self.trace_as("xml"),
+            method="POST",
+            headers={"Content-Type": "application/xml"},
+        )
+
     def validate_address(self, request: lib.Serializable) -> lib.Deserializable:
         response = self._send_request("/webservices/AV", request)
 
@@ -26,6 +35,11 @@ class Proxy(proxy.Proxy):
 
         return lib.Deserializable(response, lib.to_element, request.ctx)
 
+    async def get_rates_async(self, request: lib.Serializable) -> lib.Deserializable:
+        response = await self._send_request_async("/webservices/Rate", request)
+
+        return lib.Deserializable(response, lib.to_element, request.ctx)
+
     def create_shipment(self, request: lib.Serializable) -> lib.Deserializable:
         response = self._send_request("/webservices/Ship", request)
 
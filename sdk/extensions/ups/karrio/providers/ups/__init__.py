@@ -1,28 +1,54 @@
-from karrio.providers.ups.utils import Settings
-from karrio.providers.ups.address import (
-    parse_address_validation_response,
-    address_validation_request,
-)
-from karrio.providers.ups.tracking import (
-    parse_tracking_response,
-    tracking_request,
-)
-from karrio.providers.ups.rate import parse_rate_response, rate_request
-from karrio.providers.ups.shipment import (
-    parse_shipment_cancel_response,
-    parse_shipment_response,
-    shipment_cancel_request,
-    shipment_request,
-)
-from karrio.providers.ups.pickup import (
-    parse_pickup_cancel_response,
-    parse_pickup_update_response,
-    parse_pickup_response,
-    pickup_update_request,
-    pickup_cancel_request,
-    pickup_request,
-)
-from karrio.providers.ups.document import (
-    parse_document_upload_response,
-    document_upload_request,
+import typing
+import karrio.lib as lib
+
+if typing.TYPE_CHECKING:
+    from karrio.providers.ups.utils import Settings
+    from karrio.providers.ups.address import (
+        parse_address_validation_response,
+        address_validation_request,
+    )
+    from karrio.providers.ups.tracking import parse_tracking_response, tracking_request
+    from karrio.providers.ups.rate import parse_rate_response, rate_request
+    from karrio.providers.ups.shipment import (
+        parse_shipment_cancel_response,
+        parse_shipment_response,
+        shipment_cancel_request,
+        shipment_request,
+    )
+    from karrio.providers.ups.pickup import (
+        parse_pickup_cancel_response,
+        parse_pickup_update_response,
+        parse_pickup_response,
+        pickup_update_request,
+        pickup_cancel_request,
+        pickup_request,
+    )
+    from karrio.providers.ups.document import (
+        parse_document_upload_response,
+        document_upload_request,
+    )
+
+__getattr__, __dir__ = lib.lazy_exports(
+    __name__,
+    {
+        ".utils": ["Settings"],
+        ".address": ["parse_address_validation_response", "address_validation_request"],
+        ".tracking": ["parse_tracking_response", "tracking_request"],
+        ".rate": ["parse_rate_response", "rate_request"],
+        ".shipment": [
+            "parse_shipment_cancel_response",
+            "parse_shipment_response",
+            "shipment_cancel_request",
+            "shipment_request",
+        ],
+        ".pickup": [
+            "parse_pickup_cancel_response",
+            "parse_pickup_update_response",
+            "parse_pickup_response",
+            "pickup_update_request",
+            "pickup_cancel_request",
+            "pickup_request",
+        ],
+        ".document": ["parse_document_upload_response", "document_upload_request"],
+    },
 )
@@ -45,11 +45,7 @@ def _cancel_pickup_request(
     response: str, payload: PickupUpdateRequest, settings: Settings
 ):
     reply = next(
-        iter(
-            XP.to_xml(response).xpath(
-                ".//*[local-name() = $name]", name="PickupCreationResponse"
-            )
-        ),
+        iter(XP.find("PickupCreationResponse", XP.to_xml(response))),
         None,
     )
     new_pickup = XP.to_object(PickupCreationResponse, reply)
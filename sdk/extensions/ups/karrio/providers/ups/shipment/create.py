@@ -72,9 +72,10 @@ def _process_label(shipment: ups.ShipmentResultsType):
         if "ZPL" in shipment.PackageResults[0].ShippingLabel.ImageFormat.Code
         else "PDF"
     )
+    # the converted labels are kept as bytes and only encoded once bundled
     labels = [
         (
-            lib.image_to_pdf(
+            lib.image_to_pdf_bytes(
                 pkg.ShippingLabel.GraphicImage,
                 rotate=-90,
                 resize=dict(height=1800, width=1200),
@@ -85,7 +86,10 @@ def _process_label(shipment: ups.ShipmentResultsType):
         for pkg in shipment.PackageResults
     ]
 
-    return labels[0] if len(labels) == 1 else lib.bundle_base64(labels, label_type)
+    if len(labels) == 1:
+        return lib.document_base64(labels[0])
+
+    return lib.bundle_base64(labels, label_type)
 
 
 def shipment_request(
@@ -1,3 +1,4 @@
+import asyncio
 import unittest
 from unittest.mock import patch
 from karrio.core.utils import DP
@@ -28,6 +29,13 @@ class TestUPSRating(unittest.TestCase):
         url = http_mock.call_args[1]["url"]
         self.assertEqual(url, f"{gateway.settings.server_url}/webservices/Rate")
 
+    @patch("karrio.mappers.ups.proxy.lib.request_async", return_value="<a></a>")
+    def test_package_get_quotes_async(self, http_mock):
+        asyncio.run(Rating.fetch(self.RateRequest).from_async(gateway))
+
+        url = http_mock.call_args[1]["url"]
+        self.assertEqual(url, f"{gateway.settings.server_url}/webservices/Rate")
+
     def test_parse_package_quote_response(self):
         with patch("karrio.mappers.ups.proxy.lib.request") as mock:
             mock.return_value = RateResponseXML
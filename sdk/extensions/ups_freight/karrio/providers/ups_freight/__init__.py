@@ -1,22 +1,45 @@
-from karrio.providers.ups_freight.utils import Settings
-from karrio.providers.ups_freight.rate import parse_rate_response, rate_request
-from karrio.providers.ups_freight.shipment import (
-    parse_shipment_response,
-    shipment_request,
-)
-from karrio.providers.ups_freight.pickup import (
-    parse_pickup_cancel_response,
-    parse_pickup_update_response,
-    parse_pickup_response,
-    pickup_update_request,
-    pickup_cancel_request,
-    pickup_request,
-)
-from karrio.providers.ups_freight.tracking import (
-    parse_tracking_response,
-    tracking_request,
-)
-from karrio.providers.ups_freight.document import (
-    parse_document_upload_response,
-    document_upload_request,
+import typing
+import karrio.lib as lib
+
+if typing.TYPE_CHECKING:
+    from karrio.providers.ups_freight.utils import Settings
+    from karrio.providers.ups_freight.rate import parse_rate_response, rate_request
+    from karrio.providers.ups_freight.shipment import (
+        parse_shipment_response,
+        shipment_request,
+    )
+    from karrio.providers.ups_freight.pickup import (
+        parse_pickup_cancel_response,
+        parse_pickup_update_response,
+        parse_pickup_response,
+        pickup_update_request,
+        pickup_cancel_request,
+        pickup_request,
+    )
+    from karrio.providers.ups_freight.tracking import (
+        parse_tracking_response,
+        tracking_request,
+    )
+    from karrio.providers.ups_freight.document import (
+        parse_document_upload_response,
+        document_upload_request,
+    )
+
+__getattr__, __dir__ = lib.lazy_exports(
+    __name__,
+    {
+        ".utils": ["Settings"],
+        ".rate": ["parse_rate_response", "rate_request"],
+        ".shipment": ["parse_shipment_response", "shipment_request"],
+        ".pickup": [
+            "parse_pickup_cancel_response",
+            "parse_pickup_update_response",
+            "parse_pickup_response",
+            "pickup_update_request",
+            "pickup_cancel_request",
+            "pickup_request",
+        ],
+        ".tracking": ["parse_tracking_response", "tracking_request"],
+        ".document": ["parse_document_upload_response", "document_upload_request"],
+    },
 )
@@ -6,10 +6,7 @@ from karrio.providers.usps.utils import Settings
 
 
 def parse_error_response(response: Element, settings: Settings) -> List[Message]:
-    error_nodes = (
-        [response] if response.tag == 'Error' else
-        response.xpath(".//*[local-name() = $name]", name="Error")
-    )
+    error_nodes = [response] if response.tag == "Error" else XP.find("Error", response)
     errors = [XP.to_object(Error, node) for node in error_nodes]
 
     return [
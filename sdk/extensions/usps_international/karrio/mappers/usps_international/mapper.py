@@ -16,22 +16,7 @@ from karrio.core.models import (
     RateDetails,
     Message,
 )
-from karrio.providers.usps_international import (
-    parse_shipment_cancel_response,
-    # parse_pickup_update_response,
-    # parse_pickup_cancel_response,
-    parse_shipment_response,
-    parse_tracking_response,
-    # parse_pickup_response,
-    parse_rate_response,
-    shipment_cancel_request,
-    # pickup_update_request,
-    # pickup_cancel_request,
-    tracking_request,
-    shipment_request,
-    # pickup_request,
-    rate_request,
-)
+import karrio.providers.usps_international as provider
 from karrio.mappers.usps_international.settings import Settings
 
 
@@ -39,13 +24,13 @@ class Mapper(BaseMapper):
     settings: Settings
 
     def create_rate_request(self, payload: RateRequest) -> Serializable:
-        return rate_request(payload, self.settings)
+        return provider.rate_request(payload, self.settings)
 
     def create_tracking_request(self, payload: TrackingRequest) -> Serializable:
-        return tracking_request(payload, self.settings)
+        return provider.tracking_request(payload, self.settings)
 
     def create_shipment_request(self, payload: ShipmentRequest) -> Serializable:
-        return shipment_request(payload, self.settings)
+        return provider.shipment_request(payload, self.settings)
 
     # def create_pickup_request(
     #     self, payload: PickupRequest
@@ -65,7 +50,7 @@ class Mapper(BaseMapper):
     def create_cancel_shipment_request(
         self, payload: ShipmentCancelRequest
     ) -> Serializable:
-        return shipment_cancel_request(payload, self.settings)
+        return provider.shipment_cancel_request(payload, self.settings)
 
     # def parse_cancel_pickup_response(
     #     self, response: Deserializable
@@ -75,7 +60,7 @@ class Mapper(BaseMapper):
     def parse_cancel_shipment_response(
         self, response: Deserializable
     ) -> Tuple[ConfirmationDetails, List[Message]]:
-        return parse_shipment_cancel_response(response, self.settings)
+        return provider.parse_shipment_cancel_response(response, self.settings)
 
     # def parse_pickup_response(
     #     self, response: Deserializable
@@ -90,14 +75,14 @@ class Mapper(BaseMapper):
     def parse_rate_response(
         self, response: Deserializable
     ) -> Tuple[List[RateDetails], List[Message]]:
-        return parse_rate_response(response, self.settings)
+        return provider.parse_rate_response(response, self.settings)
 
     def parse_shipment_response(
         self, response: Deserializable
     ) -> Tuple[ShipmentDetails, List[Message]]:
-        return parse_shipment_response(response, self.settings)
+        return provider.parse_shipment_response(response, self.settings)
 
     def parse_tracking_response(
         self, response: Deserializable
     ) -> Tuple[List[TrackingDetails], List[Message]]:
-        return parse_tracking_response(response, self.settings)
+        return provider.parse_tracking_response(response, self.settings)
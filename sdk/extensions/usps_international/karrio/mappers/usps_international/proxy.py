@@ -1,8 +1,13 @@
 import urllib.parse
-from usps_lib.track_field_request import TrackFieldRequest
 
 from karrio.api.proxy import Proxy as BaseProxy
-from karrio.core.utils import Serializable, Deserializable, XP, request as http
+from karrio.core.utils import (
+    Serializable,
+    Deserializable,
+    XP,
+    request as http,
+    request_async,
+)
 from karrio.mappers.usps_international.settings import Settings
 
 
@@ -33,6 +38,18 @@ class Proxy(BaseProxy):
 
         return Deserializable(response, XP.to_xml)
 
+    async def get_rates_async(self, request: Serializable) -> Deserializable:
+        query = urllib.parse.urlencode(
+            {"API": "IntlRateV2", "XML": request.serialize()}
+        )
+        response = await request_async(
+            url=f"{self.settings.server_url}?{query}",
+            trace=self.trace_as("xml"),
+            method="GET",
+        )
+
+        return Deserializable(response, XP.to_xml)
+
     def create_shipment(self, request: Serializable) -> Deserializable:
         tag = request.value.__class__.__name__.replace("Request", "")
         api = f"{tag}Certify" if self.settings.test_mode else tag
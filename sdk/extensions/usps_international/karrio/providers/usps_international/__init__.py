@@ -1,11 +1,38 @@
-from karrio.providers.usps_international.utils import Settings
-from karrio.providers.usps_international.rate import parse_rate_response, rate_request
-from karrio.providers.usps_international.shipment import (
-    parse_shipment_cancel_response,
-    parse_shipment_response,
-    shipment_cancel_request,
-    shipment_request,
+import typing
+import karrio.lib as lib
+
+if typing.TYPE_CHECKING:
+    from karrio.providers.usps_international.utils import Settings
+    from karrio.providers.usps_international.rate import (
+        parse_rate_response,
+        rate_request,
+    )
+    from karrio.providers.usps_international.shipment import (
+        parse_shipment_cancel_response,
+        parse_shipment_response,
+        shipment_cancel_request,
+        shipment_request,
+    )
+    from karrio.providers.usps_international.tracking import (
+        parse_tracking_response,
+        tracking_request,
+    )
+
+__getattr__, __dir__ = lib.lazy_exports(
+    __name__,
+    {
+        ".utils": ["Settings"],
+        ".rate": ["parse_rate_response", "rate_request"],
+        ".shipment": [
+            "parse_shipment_cancel_response",
+            "parse_shipment_response",
+            "shipment_cancel_request",
+            "shipment_request",
+        ],
+        ".tracking": ["parse_tracking_response", "tracking_request"],
+    },
 )
+
 # from karrio.providers.usps_international.pickup import (
 #     parse_pickup_cancel_response,
 #     parse_pickup_update_response,
@@ -14,7 +41,3 @@ from karrio.providers.usps_international.shipment import (
 #     pickup_cancel_request,
 #     pickup_request,
 # )
-from karrio.providers.usps_international.tracking import (
-    parse_tracking_response,
-    tracking_request,
-)
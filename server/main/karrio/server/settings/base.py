@@ -165,6 +165,33 @@ AUDIT_LOGGING = importlib.util.find_spec(  # type:ignore
     "karrio.server.audit"
 ) is not None and config("AUDIT_LOGGING", default=True, cast=bool)
 PERSIST_SDK_TRACING = config("PERSIST_SDK_TRACING", default=True, cast=bool)
+SDK_TRACING_SAMPLE_RATE = config("SDK_TRACING_SAMPLE_RATE", default=1.0, cast=float)
+SDK_TRACING_ERROR_SAMPLE_RATE = config(
+    "SDK_TRACING_ERROR_SAMPLE_RATE", default=1.0, cast=float
+)
+SDK_TRACING_MAX_BODY_SIZE = config("SDK_TRACING_MAX_BODY_SIZE", default=0, cast=int)
+# default time budgets (in seconds) of carrier rating/tracking calls and webhook notifications
+CARRIER_REQUEST_TIMEOUT = config("CARRIER_REQUEST_TIMEOUT", default=30.0, cast=float)
+WEBHOOK_REQUEST_TIMEOUT = config("WEBHOOK_REQUEST_TIMEOUT", default=30.0, cast=float)
+# parse every carrier rates response (on the shared executor) as soon as it arrives
+CARRIER_RESPONSE_EAGER_PARSING = config(
+    "CARRIER_RESPONSE_EAGER_PARSING", default=False, cast=bool
+)
+# carrier connections circuit breaker (opt-in, state kept per process) and retries
+CARRIER_CIRCUIT_BREAKER = config("CARRIER_CIRCUIT_BREAKER", default=False, cast=bool)
+CARRIER_CIRCUIT_BREAKER_ERROR_THRESHOLD = config(
+    "CARRIER_CIRCUIT_BREAKER_ERROR_THRESHOLD", default=0.5, cast=float
+)
+CARRIER_CIRCUIT_BREAKER_MIN_CALLS = config(
+    "CARRIER_CIRCUIT_BREAKER_MIN_CALLS", default=5, cast=int
+)
+CARRIER_CIRCUIT_BREAKER_SLOW_CALL_DURATION = config(
+    "CARRIER_CIRCUIT_BREAKER_SLOW_CALL_DURATION", default=0.0, cast=float
+)
+CARRIER_CIRCUIT_BREAKER_RESET_TIMEOUT = config(
+    "CARRIER_CIRCUIT_BREAKER_RESET_TIMEOUT", default=30.0, cast=float
+)
+CARRIER_REQUEST_RETRIES = config("CARRIER_REQUEST_RETRIES", default=0, cast=int)
 
 
 # Feature flags
@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class CoreConfig(AppConfig):
@@ -8,3 +9,26 @@ class CoreConfig(AppConfig):
         from karrio.server.core.signals import register_signals
 
         register_signals()
+        configure_carrier_requests()
+
+
+def configure_carrier_requests():
+    """Set up the SDK carrier connections circuit breaker and retry policy."""
+    import karrio.lib as lib
+
+    if getattr(settings, "CARRIER_CIRCUIT_BREAKER", False):
+        lib.set_breaker(
+            lib.CircuitBreaker(
+                min_calls=settings.CARRIER_CIRCUIT_BREAKER_MIN_CALLS,
+                error_threshold=settings.CARRIER_CIRCUIT_BREAKER_ERROR_THRESHOLD,
+                slow_call_duration=(
+                    settings.CARRIER_CIRCUIT_BREAKER_SLOW_CALL_DURATION or None
+                ),
+                reset_timeout=settings.CARRIER_CIRCUIT_BREAKER_RESET_TIMEOUT,
+            )
+        )
+
+    if getattr(settings, "CARRIER_REQUEST_RETRIES", 0) > 0:
+        lib.set_retry_policy(
+            lib.RetryPolicy(max_retries=settings.CARRIER_REQUEST_RETRIES)
+        )
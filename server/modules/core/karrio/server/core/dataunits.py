@@ -8,8 +8,6 @@ import karrio.core.units as units
 import karrio.server.providers.models as providers
 
 
-PACKAGE_MAPPERS = references.collect_providers_data()
-
 REFERENCE_MODELS = {
     **references.collect_references(),
     "customs_content_type": {c.name: c.value for c in list(units.CustomsContentType)},
@@ -32,6 +30,14 @@ NON_HUBS_CARRIERS = [
 ]
 
 
+def __getattr__(name: str):
+    # the providers data requires importing every carrier: only load it on use
+    if name == "PACKAGE_MAPPERS":
+        return references.collect_providers_data()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def contextual_metadata(request: Request):
     _host: str = typing.cast(
         str,
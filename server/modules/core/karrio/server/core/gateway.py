@@ -1,6 +1,7 @@
 import uuid
 import typing
 import logging
+import functools
 from datetime import datetime
 
 from django.db.models import Q
@@ -10,6 +11,7 @@ from rest_framework.exceptions import NotFound
 
 import karrio
 import karrio.lib as lib
+import karrio.core.models as models
 import karrio.server.core.utils as utils
 import karrio.server.core.models as core
 import karrio.server.providers.models as providers
@@ -24,6 +26,11 @@ from karrio.server.core import (
 logger = logging.getLogger(__name__)
 
 
+def default_deadline() -> typing.Optional[lib.Deadline]:
+    """Return the default deadline of carrier calls (see `CARRIER_REQUEST_TIMEOUT`)."""
+    return lib.to_deadline(getattr(settings, "CARRIER_REQUEST_TIMEOUT", None))
+
+
 class Carriers:
     @staticmethod
     def list(context=None, **kwargs) -> typing.List[providers.Carrier]:
@@ -173,8 +180,8 @@ class Shipments:
             test_mode=selected_rate.test_mode,
             services=[selected_rate.service],
         )
-        request = lib.to_object(
-            datatypes.ShipmentRequest,
+        request = lib.to_request(
+            models.ShipmentRequest,
             {**lib.to_dict(payload), "service": selected_rate.service},
         )
 
@@ -287,7 +294,9 @@ class Shipments:
         if carrier is None:
             raise NotFound("No active carrier connection found to process the request")
 
-        request = karrio.Shipment.cancel(datatypes.ShipmentCancelRequest(**payload))
+        request = karrio.Shipment.cancel(
+            lib.to_request(models.ShipmentCancelRequest, payload)
+        )
 
         # The request call is wrapped in utils.identity to simplify mocking in tests
         confirmation, messages = (
@@ -319,6 +328,7 @@ class Shipments:
         payload: dict,
         carrier: providers.Carrier = None,
         raise_on_error: bool = True,
+        deadline: typing.Union[lib.Deadline, float] = None,
         **carrier_filters,
     ) -> datatypes.TrackingResponse:
         carrier = carrier or Carriers.first(
@@ -331,13 +341,13 @@ class Shipments:
         if carrier is None:
             raise NotFound("No active carrier connection found to process the request")
 
-        request = karrio.Tracking.fetch(
-            lib.to_object(datatypes.TrackingRequest, payload)
-        )
+        request = karrio.Tracking.fetch(lib.to_request(models.TrackingRequest, payload))
 
         # The request call is wrapped in utils.identity to simplify mocking in tests
         results, messages = utils.identity(
-            lambda: request.from_(carrier.gateway).parse()
+            lambda: request.from_(
+                carrier.gateway, deadline=deadline or default_deadline()
+            ).parse()
         )
 
         if not any(results or []) and (
@@ -417,9 +427,7 @@ class Pickups:
         if carrier is None:
             raise NotFound("No active carrier connection found to process the request")
 
-        request = karrio.Pickup.schedule(
-            datatypes.PickupRequest(**lib.to_dict(payload))
-        )
+        request = karrio.Pickup.schedule(lib.to_request(models.PickupRequest, payload))
 
         # The request call is wrapped in utils.identity to simplify mocking in tests
         pickup, messages = utils.identity(
@@ -459,7 +467,7 @@ class Pickups:
             raise NotFound("No active carrier connection found to process the request")
 
         request = karrio.Pickup.update(
-            datatypes.PickupUpdateRequest(**lib.to_dict(payload))
+            lib.to_request(models.PickupUpdateRequest, payload)
         )
 
         # The request call is wrapped in utils.identity to simplify mocking in tests
@@ -499,7 +507,7 @@ class Pickups:
             raise NotFound("No active carrier connection found to process the request")
 
         request = karrio.Pickup.cancel(
-            datatypes.PickupCancelRequest(**lib.to_dict(payload))
+            lib.to_request(models.PickupCancelRequest, payload)
         )
 
         # The request call is wrapped in utils.identity to simplify mocking in tests
@@ -536,8 +544,69 @@ class Rates:
     def fetch(
         payload: dict,
         carriers: typing.List[providers.Carrier] = None,
+        deadline: typing.Union[lib.Deadline, float] = None,
         **carrier_filters,
     ) -> datatypes.RateResponse:
+        """Fetch rates from the carriers that respond within the `deadline` (or budget in seconds)."""
+        carriers, gateways = Rates.resolve_gateways(
+            payload, carriers, **carrier_filters
+        )
+        request = karrio.Rating.fetch(lib.to_request(models.RateRequest, payload))
+
+        # The request call is wrapped in utils.identity to simplify mocking in tests
+        rates, messages = utils.identity(
+            lambda: request.from_(
+                *gateways,
+                deadline=deadline or default_deadline(),
+                parse_eagerly=getattr(
+                    settings, "CARRIER_RESPONSE_EAGER_PARSING", False
+                ),
+            ).parse()
+        )
+
+        if not any(rates) and any(messages):
+            raise exceptions.APIException(
+                detail=messages,
+                status_code=status.HTTP_424_FAILED_DEPENDENCY,
+            )
+
+        return Rates.format_response(rates, messages, carriers)
+
+    @staticmethod
+    def stream(
+        payload: dict,
+        carriers: typing.List[providers.Carrier] = None,
+        deadline: typing.Union[lib.Deadline, float] = None,
+        **carrier_filters,
+    ) -> typing.Iterator[datatypes.RateResponse]:
+        """Fetch rates yielding a (post processed) response per carrier as soon as it responds."""
+        context = carrier_filters.get("context")
+        carriers, gateways = Rates.resolve_gateways(
+            payload, carriers, **carrier_filters
+        )
+        request = karrio.Rating.fetch(lib.to_request(models.RateRequest, payload))
+
+        # The request call is wrapped in utils.identity to simplify mocking in tests
+        results = utils.identity(
+            lambda: request.stream(*gateways, deadline=deadline or default_deadline())
+        )
+
+        def responses():
+            for _, rates, messages in results:
+                yield functools.reduce(
+                    lambda response, process: process(context, response),
+                    Rates.post_process_functions,
+                    Rates.format_response(rates, messages, carriers),
+                )
+
+        return responses()
+
+    @staticmethod
+    def resolve_gateways(
+        payload: dict,
+        carriers: typing.List[providers.Carrier] = None,
+        **carrier_filters,
+    ) -> typing.Tuple[typing.List[providers.Carrier], list]:
         services = payload.get("services", [])
         carrier_ids = payload.get("carrier_ids", [])
         shipper_country_code = payload["shipper"].get("country_code")
@@ -556,19 +625,20 @@ class Rates:
         if len(gateways) == 0:
             raise NotFound("No active carrier connection found to process the request")
 
-        request = karrio.Rating.fetch(lib.to_object(datatypes.RateRequest, payload))
-
-        # The request call is wrapped in utils.identity to simplify mocking in tests
-        rates, messages = utils.identity(lambda: request.from_(*gateways).parse())
+        return carriers, gateways
 
-        if not any(rates) and any(messages):
-            raise exceptions.APIException(
-                detail=messages,
-                status_code=status.HTTP_424_FAILED_DEPENDENCY,
-            )
+    @staticmethod
+    def format_response(
+        rates: typing.List[datatypes.Rate],
+        messages: typing.List[datatypes.Message],
+        carriers: typing.List[providers.Carrier],
+    ) -> datatypes.RateResponse:
+        carriers_by_id = {}
+        for carrier in carriers:
+            carriers_by_id.setdefault(carrier.carrier_id, carrier)
 
         def process_rate(rate: datatypes.Rate) -> datatypes.Rate:
-            carrier = next((c for c in carriers if c.carrier_id == rate.carrier_id))
+            carrier = carriers_by_id[rate.carrier_id]
             rate_provider = (
                 (rate.meta or {}).get("rate_provider")
                 or getattr(carrier, "custom_carrier_name", None)
@@ -626,7 +696,7 @@ class Documents:
             )
 
         request = karrio.Document.upload(
-            lib.to_object(datatypes.DocumentUploadRequest, payload)
+            lib.to_request(models.DocumentUploadRequest, payload)
         )
 
         # The request is wrapped in utils.identity to simplify mocking in tests.
@@ -34,7 +34,11 @@ class SessionContext:
     def __call__(self, request):
         # Code to be executed for each request before
         # the view (and later middleware) are called.
-        request.tracer = Tracer()
+        request.tracer = Tracer(
+            sample_rate=settings.SDK_TRACING_SAMPLE_RATE,
+            error_sample_rate=settings.SDK_TRACING_ERROR_SAMPLE_RATE,
+            max_body_size=settings.SDK_TRACING_MAX_BODY_SIZE or None,
+        )
         self._threadmap[threading.get_ident()] = request
 
         response = self.get_response(request)
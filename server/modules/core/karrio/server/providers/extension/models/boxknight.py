@@ -1,7 +1,5 @@
 import django.db.models as models
-import django.core.cache as caching
 
-import karrio.lib as lib
 import karrio.server.providers.models.carrier as providers
 
 
@@ -20,7 +18,7 @@ class BoxKnightSettings(providers.Carrier):
 
     @property
     def cache(self):
-        return lib.Cache(cache=caching.cache)
+        return providers.CACHE
 
 
 SETTINGS = BoxKnightSettings
@@ -1,5 +1,4 @@
 import django.db.models as models
-import django.core.cache as caching
 
 import karrio.lib as lib
 import karrio.server.providers.models.carrier as providers
@@ -33,7 +32,7 @@ class DPDSettings(providers.Carrier):
 
     @property
     def cache(self):
-        return lib.Cache(cache=caching.cache)
+        return providers.CACHE
 
 
 SETTINGS = DPDSettings
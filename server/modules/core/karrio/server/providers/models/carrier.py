@@ -3,6 +3,7 @@ import functools
 import django.conf as conf
 import django.forms as forms
 import django.db.models as models
+import django.core.cache as caching
 import django.core.validators as validators
 
 import karrio
@@ -13,6 +14,7 @@ import karrio.api.gateway as gateway
 import karrio.server.core.models as core
 import karrio.server.core.fields as fields
 import karrio.server.core.datatypes as datatypes
+import karrio.server.providers.rate_sheets as rate_sheets
 
 
 COUNTRIES = [(c.name, c.name) for c in units.Country]
@@ -21,6 +23,9 @@ WEIGHT_UNITS = [(c.name, c.name) for c in units.WeightUnit]
 DIMENSION_UNITS = [(c.name, c.name) for c in units.DimensionUnit]
 CAPABILITIES_CHOICES = [(c, c) for c in units.CarrierCapabilities.get_capabilities()]
 
+# The process wide carriers cache (shared so concurrent logins are deduplicated)
+CACHE = lib.Cache(cache=caching.cache)
+
 
 class Manager(models.Manager):
     def get_queryset(self):
@@ -138,7 +143,19 @@ class Carrier(core.OwnedEntity):
         _tracer = getattr(_context, "tracer", utils.Tracer())
         _carrier_name = self.ext
 
-        return karrio.gateway[_carrier_name].create({**self.data.to_dict()}, _tracer)
+        if not hasattr(self.settings, "services"):
+            return karrio.gateway[_carrier_name].create(
+                {**self.data.to_dict()}, _tracer
+            )
+
+        # reuse the connection rate sheet compiled for its current version
+        _version = rate_sheets.get_version(self.settings.id)
+        _gateway = karrio.gateway[_carrier_name].create(
+            {**self.data.to_dict()}, _tracer
+        )
+        rate_sheets.attach(_gateway.settings, self.settings.id, _version)
+
+        return _gateway
 
     @property
     def data(self) -> datatypes.CarrierSettings:
@@ -150,9 +167,7 @@ class Carrier(core.OwnedEntity):
         )
 
         if hasattr(self.settings, "services"):
-            _computed_data.update(
-                services=[forms.model_to_dict(s) for s in self.settings.services.all()]
-            )
+            _computed_data.update(services=rate_sheets.get_services(self.settings))
 
         if hasattr(self.settings, "cache"):
             _computed_data.update(cache=self.settings.cache)
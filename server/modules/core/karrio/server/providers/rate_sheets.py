@@ -0,0 +1,80 @@
+"""Carrier connections rate sheets cache.
+
+The service levels of a connection (e.g. a generic carrier rate sheet) are
+loaded once per version and shared through the django cache, while their
+compiled index (see `RatingMixinSettings.rate_sheet`) is kept per process.
+A connection version stamp changes whenever its settings or service levels
+are saved or deleted (see `karrio.server.providers.signals`).
+"""
+
+import uuid
+import typing
+import logging
+import threading
+import django.forms as forms
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_COMPILED: typing.Dict[str, typing.Tuple[str, typing.Any]] = {}
+
+
+def version_key(connection_id: str) -> str:
+    return f"karrio:rate_sheet:{connection_id}:version"
+
+
+def get_version(connection_id: str) -> str:
+    """Return the connection rate sheet version stamp (created if missing)."""
+    version = cache.get(version_key(connection_id))
+
+    if version is None:
+        cache.add(version_key(connection_id), uuid.uuid4().hex, timeout=None)
+        version = cache.get(version_key(connection_id))
+
+    return version
+
+
+def invalidate(*connection_ids: str):
+    """Stamp a new version on the connections rate sheets (discarding the cached ones)."""
+    for connection_id in connection_ids:
+        cache.set(version_key(connection_id), uuid.uuid4().hex, timeout=None)
+
+        with _lock:
+            _COMPILED.pop(connection_id, None)
+
+    logger.debug(f"rate sheets invalidated for {connection_ids}")
+
+
+def get_services(settings) -> typing.List[dict]:
+    """Return the connection service levels data (loaded once per version)."""
+    key = f"karrio:rate_sheet:{settings.id}:{get_version(settings.id)}:services"
+    services = cache.get(key)
+
+    if services is None:
+        services = [forms.model_to_dict(s) for s in settings.services.all()]
+        cache.set(key, services, timeout=None)
+
+    return services
+
+
+def attach(connection, connection_id: str, version: str) -> typing.Any:
+    """Attach the compiled rate sheet of the connection to its SDK settings.
+
+    The rate sheet is compiled once per process and connection `version`, which
+    must be read before the connection services are loaded: an invalidation
+    happening in between then only causes an extra compilation.
+    """
+    if not hasattr(type(connection), "rate_sheet"):
+        return connection
+
+    with _lock:
+        compiled = _COMPILED.get(connection_id)
+
+        if compiled is None or compiled[0] != version:
+            compiled = (version, connection.rate_sheet)
+            _COMPILED[connection_id] = compiled
+
+    connection.rate_sheet = compiled[1]
+
+    return connection
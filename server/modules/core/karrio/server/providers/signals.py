@@ -1,9 +1,11 @@
 import logging
+from django.db import transaction
 from django.db.models import signals
 
 import karrio.references as ref
 import karrio.server.core.utils as utils
 import karrio.server.providers.models as models
+import karrio.server.providers.rate_sheets as rate_sheets
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +14,15 @@ def register_signals():
     for model in models.MODELS.values():
         signals.post_save.connect(carrier_changed, sender=model)
 
+        if hasattr(model, "services"):
+            signals.post_save.connect(rate_sheet_changed, sender=model)
+            signals.post_delete.connect(rate_sheet_changed, sender=model)
+            signals.m2m_changed.connect(services_changed, sender=model.services.through)
+
+    signals.post_save.connect(service_level_changed, sender=models.ServiceLevel)
+    signals.pre_delete.connect(service_level_deleting, sender=models.ServiceLevel)
+    signals.post_delete.connect(service_level_changed, sender=models.ServiceLevel)
+
     logger.info("karrio.providers signals registered...")
 
 
@@ -29,3 +40,56 @@ def carrier_changed(
         )
         instance.capabilities = ref.get_carrier_capabilities(carrier_name)
         instance.save()
+
+
+def invalidate_rate_sheets(*connection_ids):
+    """Invalidate the connections rate sheets once the changes are committed."""
+    if any(connection_ids):
+        transaction.on_commit(lambda: rate_sheets.invalidate(*connection_ids))
+
+
+def rate_sheet_changed(sender, instance, *args, **kwargs):
+    """Invalidate the rate sheet of a saved or deleted carrier connection."""
+    invalidate_rate_sheets(instance.pk)
+
+
+def services_changed(sender, instance, action, reverse, pk_set, *args, **kwargs):
+    """Invalidate the rate sheets of connections whose services were (un)linked."""
+    if reverse and action == "pre_clear":
+        instance._connections = connections_of(instance)
+        return
+
+    if not action.startswith("post_"):
+        return
+
+    if not reverse:
+        return invalidate_rate_sheets(instance.pk)
+
+    invalidate_rate_sheets(
+        *(
+            getattr(instance, "_connections", [])
+            if action == "post_clear"
+            else pk_set or []
+        )
+    )
+
+
+def service_level_deleting(sender, instance, *args, **kwargs):
+    # the connections links are removed with the service level: collect them first
+    instance._connections = connections_of(instance)
+
+
+def service_level_changed(sender, instance, *args, **kwargs):
+    """Invalidate the rate sheets of the connections using a service level."""
+    invalidate_rate_sheets(
+        *getattr(instance, "_connections", None) or connections_of(instance)
+    )
+
+
+def connections_of(service) -> list:
+    return [
+        pk
+        for model in models.MODELS.values()
+        if hasattr(model, "services")
+        for pk in model.objects.filter(services=service).values_list("pk", flat=True)
+    ]
@@ -1,3 +1,50 @@
 from django.test import TestCase
+from django.contrib.auth import get_user_model
+from karrio.server.providers.models import MODELS, ServiceLevel
 
 # TODO: Write carriers API tests
+
+
+class TestRateSheetCache(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_superuser(
+            "admin@example.com", "test"
+        )
+        self.service = ServiceLevel.objects.create(
+            service_name="Standard",
+            service_code="standard",
+            currency="USD",
+            zones=[{"rate": 10.0}],
+            created_by=self.user,
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.carrier = MODELS["generic"].objects.create(
+                carrier_id="custom",
+                display_name="Custom",
+                custom_carrier_name="custom",
+                created_by=self.user,
+            )
+            self.carrier.services.add(self.service)
+
+    def rates(self):
+        return [
+            [zone.rate for zone in service.zones]
+            for service in self.carrier.gateway.settings.rate_sheet.services
+        ]
+
+    def test_rate_sheet_is_reused(self):
+        rate_sheet = self.carrier.gateway.settings.rate_sheet
+
+        self.assertIs(self.carrier.gateway.settings.rate_sheet, rate_sheet)
+
+    def test_rate_sheet_is_invalidated(self):
+        self.assertListEqual(self.rates(), [[10.0]])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.zones = [{"rate": 12.0}]
+            self.service.save()
+        self.assertListEqual(self.rates(), [[12.0]])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.delete()
+        self.assertListEqual(self.rates(), [])
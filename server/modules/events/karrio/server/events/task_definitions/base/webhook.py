@@ -64,6 +64,7 @@ def notify_subscribers(webhooks: typing.List[models.Webhook], payload: dict):
                     "Content-type": "application/json",
                     "X-Event-Id": webhook.secret,
                 },
+                timeout=getattr(settings, "WEBHOOK_REQUEST_TIMEOUT", None),
             )
         )
 
@@ -19,6 +19,21 @@ class TestRating(APITestCase):
             self.assertEqual(response.status_code, status.HTTP_200_OK)
             self.assertDictEqual(response_data, RATING_RESPONSE)
 
+    def test_stream_shipment_rates(self):
+        url = reverse("karrio.server.proxy:shipment-rates-stream")
+        data = RATING_DATA
+
+        with patch("karrio.server.core.gateway.utils.identity") as mock:
+            mock.return_value = iter([("canadapost", *RETURNED_VALUE)])
+            response = self.client.post(f"{url}", data)
+            lines = b"".join(response).decode().splitlines()
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response["Content-Type"], "application/x-ndjson")
+            self.assertListEqual(
+                [json.loads(line) for line in lines], [RATING_RESPONSE]
+            )
+
 
 RATING_DATA = {
     "shipper": {
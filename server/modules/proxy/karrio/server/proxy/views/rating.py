@@ -1,6 +1,10 @@
+import json
 import logging
+from asgiref.sync import sync_to_async
 from django.urls import path
+from django.http import StreamingHttpResponse
 from rest_framework import status
+from rest_framework.utils.encoders import JSONEncoder
 from rest_framework.request import Request
 from rest_framework.response import Response
 
@@ -53,4 +57,59 @@ class RateViewAPI(APIView):
         return Response(RateResponse(response).data, status=status_code)
 
 
+class RateStreamViewAPI(APIView):
+    throttle_scope = "carrier_request"
+
+    @openapi.extend_schema(
+        tags=["Proxy"],
+        operation_id=f"{ENDPOINT_ID}stream_rates",
+        summary="Stream shipment rates",
+        description=f"""{DESCRIPTIONS}
+        The rates of each carrier are sent as soon as it responds, as newline delimited
+        JSON `RateResponse` objects or, with `Accept: text/event-stream`, as `rates` events.
+        """,
+        responses={
+            200: RateResponse(),
+            400: ErrorResponse(),
+            500: ErrorResponse(),
+        },
+        request=RateRequest(),
+    )
+    def post(self, request: Request):
+        payload = RateRequest.map(data=request.data).data
+        responses = Rates.stream(payload, context=request)
+        is_sse = "text/event-stream" in request.headers.get("Accept", "")
+
+        def render(response) -> str:
+            content = json.dumps(RateResponse(response).data, cls=JSONEncoder)
+
+            return f"event: rates\ndata: {content}\n\n" if is_sse else f"{content}\n"
+
+        async def stream():
+            # each carrier response is awaited in a thread so that the
+            # (asgi) server sends the rates as they come
+            iterator = iter(responses)
+            while True:
+                response = await sync_to_async(next)(iterator, None)
+                if response is None:
+                    break
+                yield render(response)
+
+            if is_sse:
+                yield "event: end\ndata: {}\n\n"
+
+        return StreamingHttpResponse(
+            stream(),
+            content_type="text/event-stream" if is_sse else "application/x-ndjson",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+
 router.urls.append(path("proxy/rates", RateViewAPI.as_view(), name="shipment-rates"))
+router.urls.append(
+    path(
+        "proxy/rates/stream",
+        RateStreamViewAPI.as_view(),
+        name="shipment-rates-stream",
+    )
+)